@@ -369,45 +369,79 @@ class BatchedQueueService(QueueService[T]):
     A queue service that handles a batch of items instead of a single item at a time.
 
     Items will be processed when the batch reaches the configured `_max_batch_size`
-    or after an interval of `_min_interval` seconds (if set).
+    or after an interval of `_min_interval` seconds (if set).  An item that would take
+    a non-empty batch over `_max_batch_size` is held for the next batch.
+
+    If `_min_batch_size` is set, batch sizes adapt to the load on the service: batches
+    are processed as soon as they reach a target size, which starts at
+    `_min_batch_size`, doubles each time a batch fills up while more items are
+    waiting (up to `_max_batch_size`), and otherwise halves.  Items are sent with
+    little delay while the service is idle and in large batches while it is busy.
     """
 
     _max_batch_size: int
+    _min_batch_size: Optional[int] = None
     _min_interval: Optional[float] = None
 
+    def _next_target_size(self, target: int, filled: bool) -> int:
+        if self._min_batch_size is None:
+            return self._max_batch_size
+        if filled:
+            return min(target * 2, self._max_batch_size)
+        return max(target // 2, self._min_batch_size, 1)
+
     async def _main_loop(self):
         done = False
+        held: Optional[tuple[T, int]] = None
+        target = self._next_target_size(self._min_batch_size or 0, filled=False)
 
         while not done:
             batch: list[T] = []
             batch_size = 0
+            filled = False
 
             # Pull items from the queue until we reach the batch size
             deadline = get_deadline(self._min_interval)
-            while batch_size < self._max_batch_size:
-                try:
-                    item = await self._queue_get_thread.submit(
-                        create_call(self._queue.get, timeout=get_timeout(deadline))
-                    ).aresult()
+            while batch_size < target:
+                if held is not None:
+                    (item, item_size), held = held, None
+                else:
+                    try:
+                        item = await self._queue_get_thread.submit(
+                            create_call(self._queue.get, timeout=get_timeout(deadline))
+                        ).aresult()
+                    except queue.Empty:
+                        # Process the batch after `min_interval` even if it is smaller
+                        # than the batch size
+                        break
 
                     if item is None:
                         done = True
+                        self._queue.task_done()
                         break
 
-                    batch.append(item)
-                    batch_size += self._get_size(item)
-                    logger.debug(
-                        "Service %r added item %r to batch (size %s/%s)",
-                        self,
-                        item,
-                        batch_size,
-                        self._max_batch_size,
-                    )
-                except queue.Empty:
-                    # Process the batch after `min_interval` even if it is smaller than
-                    # the batch size
+                    item_size = self._get_size(item)
+
+                if batch and batch_size + item_size > self._max_batch_size:
+                    held = (item, item_size)
+                    filled = True
                     break
 
+                batch.append(item)
+                batch_size += item_size
+                logger.debug(
+                    "Service %r added item %r to batch (size %s/%s)",
+                    self,
+                    item,
+                    batch_size,
+                    target,
+                )
+            else:
+                # only grow the batches while items arrive faster than they are sent
+                filled = not self._queue.empty()
+
+            target = self._next_target_size(target, filled)
+
             if not batch:
                 continue
 
@@ -426,6 +460,9 @@ class BatchedQueueService(QueueService[T]):
                     batch_size,
                     exc_info=log_traceback,
                 )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
     @abc.abstractmethod
     async def _handle_batch(self, items: list[T]) -> None:
@@ -0,0 +1,266 @@
+"""
+Caches that sit in front of result storage.
+
+Result records are looked up in a byte-bounded in-memory LRU cache first, then in a
+local on-disk cache of record files read from remote storage, and finally in the
+result storage itself.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Optional, TypeVar
+
+from cachetools import LRUCache
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# containers are only measured this many levels deep when estimating their size
+_SIZE_ESTIMATE_MAX_DEPTH = 2
+
+# prefix of files being written to the disk cache
+_TEMP_PREFIX = ".tmp-"
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit and miss counts for a cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Estimate the number of bytes of memory held by an object.
+
+    Buffers and objects exposing an integer `nbytes` attribute (such as NumPy arrays)
+    are measured by their data size, and built-in containers are measured a couple of
+    levels deep. Everything else is measured with `sys.getsizeof`.
+    """
+    if isinstance(obj, (bytes, bytearray, str)):
+        return len(obj)
+    if isinstance(obj, memoryview):
+        return obj.nbytes
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(obj)
+    if _depth >= _SIZE_ESTIMATE_MAX_DEPTH:
+        return size
+    if isinstance(obj, dict):
+        size += sum(
+            estimate_size(key, _depth + 1) + estimate_size(value, _depth + 1)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _depth + 1) for item in obj)
+    return size
+
+
+def _estimate_record_size(record: Any) -> int:
+    return max(estimate_size(getattr(record, "result", record)), 1)
+
+
+class SizedLRUCache(LRUCache[K, V]):
+    """
+    An LRU cache bounded by the estimated size of its values in bytes.
+
+    Values larger than the whole cache are not stored. Lookups through `get` are
+    counted in `stats`.
+    """
+
+    def __init__(self, max_bytes: int):
+        super().__init__(maxsize=max_bytes, getsizeof=_estimate_record_size)
+        self.stats = CacheStats()
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if self.getsizeof(value) > self.maxsize:
+            self.pop(key, None)
+            return
+        super().__setitem__(key, value)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        return value
+
+
+class LocalDiskCache:
+    """
+    A cache of files on local disk, bounded by their total size in bytes.
+
+    Entries are stored under a digest of their key and the least recently used
+    entries are removed once the cache grows past `max_bytes`. Files are written to a
+    temporary path and moved into place, so readers never see partial entries and
+    several processes can share a cache directory. Entries are never revalidated, so
+    the cache should only hold files that are not modified once written.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # entry paths and sizes, least recently used first
+        self._entries: Optional[OrderedDict[Path, int]] = None
+        self._total_bytes = 0
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.path / digest[:2] / digest
+
+    def _load_entries(self) -> OrderedDict[Path, int]:
+        """
+        Index existing entries, which may have been written by another process.
+        """
+        if self._entries is None:
+            entries: list[tuple[float, Path, int]] = []
+            if self.path.exists():
+                for entry in self.path.glob("*/*"):
+                    if entry.name.startswith(_TEMP_PREFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, entry, stat.st_size))
+            entries.sort(key=lambda entry: entry[0])
+            self._entries = OrderedDict((path, size) for _, path, size in entries)
+            self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Get the path of the cached file for a key, or `None` if it is not cached.
+        """
+        path = self._entry_path(key)
+        with self._lock:
+            entries = self._load_entries()
+            try:
+                # record the access for other processes sharing the directory
+                os.utime(path)
+                size = path.stat().st_size
+            except FileNotFoundError:
+                pass
+            else:
+                if path in entries:
+                    entries.move_to_end(path)
+                else:
+                    # written by another process sharing the directory
+                    entries[path] = size
+                    self._total_bytes += size
+                    self._evict()
+                self.stats.hits += 1
+                return path
+            self._forget(path)
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, data: bytes) -> Path:
+        """
+        Cache the given bytes for a key.
+        """
+        return self._put(key, lambda file: file.write(data))
+
+    def put_stream(self, key: str, stream: IO[bytes]) -> Path:
+        """
+        Cache the contents of a readable binary stream for a key without reading the
+        whole stream into memory.
+        """
+        return self._put(key, lambda file: shutil.copyfileobj(stream, file))
+
+    def _put(self, key: str, write: Any) -> Path:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=_TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        with self._lock:
+            entries = self._load_entries()
+            self._forget(path)
+            entries[path] = path.stat().st_size
+            self._total_bytes += entries[path]
+            self._evict()
+        return path
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove the cached file for a key, if any.
+        """
+        path = self._entry_path(key)
+        with self._lock:
+            self._load_entries()
+            self._forget(path)
+            _unlink(path)
+
+    def clear(self) -> None:
+        """
+        Remove all cached files.
+        """
+        with self._lock:
+            for path in self._load_entries():
+                _unlink(path)
+            self._entries = OrderedDict()
+            self._total_bytes = 0
+
+    def _forget(self, path: Path) -> None:
+        assert self._entries is not None
+        self._total_bytes -= self._entries.pop(path, 0)
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits in `max_bytes`. The
+        most recently used entry is always kept so that it can be read.
+        """
+        assert self._entries is not None
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            _unlink(path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_entries())
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached files in bytes."""
+        with self._lock:
+            self._load_entries()
+            return self._total_bytes
+
+
+def _unlink(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
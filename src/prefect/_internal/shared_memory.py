@@ -0,0 +1,139 @@
+"""
+Utilities for passing large buffers between processes through shared memory.
+
+Objects are pickled with protocol 5 so that objects exposing out-of-band buffers
+(such as NumPy arrays) hand their memory to a buffer callback instead of copying it
+into the pickle stream. Large buffers are written to `multiprocessing.shared_memory`
+segments and only the segment names travel over the process pipe.
+"""
+
+import os
+import pickle
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, NamedTuple
+
+import cloudpickle  # type: ignore  # no stubs available
+
+# buffers at least this large are placed in shared memory rather than in the pickle
+SHARED_MEMORY_MIN_SIZE = 1024 * 1024
+
+# segments are freed once unlinked on POSIX systems; elsewhere they are freed when the
+# last handle is closed, which could happen before the receiving process opens them
+SHARED_MEMORY_SUPPORTED = os.name == "posix"
+
+
+class SharedMemoryPickle(NamedTuple):
+    """
+    A pickled object whose large buffers are stored in shared memory segments.
+    """
+
+    data: bytes
+    segments: list[tuple[str, int]]
+
+
+class OutOfBandBytes:
+    """
+    Wraps a `bytes` object so that it is pickled as an out-of-band buffer.
+
+    `bytes` are always pickled in-band, so large values must be wrapped to be passed
+    through shared memory. The wrapper unpickles as a plain `bytes` object.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __reduce_ex__(self, protocol: Any) -> tuple[type[bytes], tuple[Any]]:
+        if isinstance(protocol, int) and protocol >= 5:
+            return (bytes, (pickle.PickleBuffer(self.data),))
+        return (bytes, (self.data,))
+
+
+def dump_to_shared_memory(
+    obj: Any, min_size: int = SHARED_MEMORY_MIN_SIZE
+) -> tuple[SharedMemoryPickle, list[SharedMemory]]:
+    """
+    Pickle an object, moving out-of-band buffers of at least `min_size` bytes into
+    shared memory.
+
+    Returns the pickle and the created segments. The caller owns the segments and is
+    responsible for releasing them with `release_segments`.
+    """
+    segments: list[SharedMemory] = []
+    sizes: list[int] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        view = buffer.raw()
+        if not SHARED_MEMORY_SUPPORTED or view.nbytes < min_size:
+            # keep the buffer in-band
+            return True
+        segment = SharedMemory(create=True, size=view.nbytes)
+        segment.buf[: view.nbytes] = view
+        segments.append(segment)
+        sizes.append(view.nbytes)
+        return False
+
+    try:
+        data = cloudpickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)  # type: ignore[reportUnknownMemberType]
+    except BaseException:
+        release_segments(segments, unlink=True)
+        raise
+
+    return (
+        SharedMemoryPickle(
+            data=data,
+            segments=[(segment.name, size) for segment, size in zip(segments, sizes)],
+        ),
+        segments,
+    )
+
+
+def load_from_shared_memory(payload: SharedMemoryPickle, unlink: bool = False) -> Any:
+    """
+    Unpickle an object created by `dump_to_shared_memory`.
+
+    Buffers are copied out of shared memory, so the segments can be released as soon
+    as this returns. If `unlink` is set, the segments are destroyed after loading,
+    including when loading fails.
+    """
+    buffers: list[bytearray] = []
+    remaining = list(payload.segments)
+    try:
+        while remaining:
+            name, size = remaining.pop(0)
+            segment = SharedMemory(name=name)
+            try:
+                # release the view even if copying fails, so the segment can close
+                with segment.buf[:size] as view:
+                    buffers.append(bytearray(view))
+            finally:
+                release_segments([segment], unlink=unlink)
+    finally:
+        if unlink:
+            unlink_segments([name for name, _ in remaining])
+
+    return pickle.loads(payload.data, buffers=buffers)
+
+
+def release_segments(segments: list[SharedMemory], unlink: bool) -> None:
+    """
+    Close shared memory segments, destroying them as well if `unlink` is set.
+    """
+    for segment in segments:
+        segment.close()
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def unlink_segments(names: list[str]) -> None:
+    """
+    Destroy shared memory segments by name, skipping any that no longer exist.
+    """
+    for name in names:
+        try:
+            segment = SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        release_segments([segment], unlink=True)
@@ -1,4 +1,5 @@
 import inspect
+import weakref
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -6,9 +7,9 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional,
 
 from typing_extensions import Self
 
-from prefect.context import TaskRunContext
+from prefect.context import FlowRunContext, TaskRunContext
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import hash_objects
+from prefect.utilities.hashing import hash_objects, structural_hash
 
 if TYPE_CHECKING:
     from prefect.filesystems import WritableFileSystem
@@ -200,10 +201,19 @@ class _None(CachePolicy):
         return other
 
 
+# source hashes keyed on the task function's code object (or class, for callable
+# instances) so that the source is only read and hashed once per task definition
+_task_source_hashes: "weakref.WeakKeyDictionary[Any, str]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 @dataclass
 class TaskSource(CachePolicy):
     """
     Policy for computing a cache key based on the source code of the task.
+
+    The hash is computed once per task function and reused for subsequent runs.
     """
 
     def compute_key(
@@ -215,6 +225,14 @@ class TaskSource(CachePolicy):
     ) -> Optional[str]:
         if not task_ctx:
             return None
+
+        fn = inspect.unwrap(getattr(task_ctx.task, "fn", task_ctx.task))
+        source_key = getattr(fn, "__code__", None) or type(fn)
+        try:
+            return _task_source_hashes[source_key]
+        except (KeyError, TypeError):
+            pass
+
         try:
             lines = inspect.getsource(task_ctx.task)
         except TypeError:
@@ -224,7 +242,13 @@ class TaskSource(CachePolicy):
                 lines = task_ctx.task.fn.__code__.co_code
             else:
                 raise
-        return hash_objects(lines, raise_on_failure=True)
+        key = hash_objects(lines, raise_on_failure=True)
+        try:
+            _task_source_hashes[source_key] = key
+        except TypeError:
+            # the key does not support weak references
+            pass
+        return key
 
 
 @dataclass
@@ -271,6 +295,12 @@ class RunId(CachePolicy):
 class Inputs(CachePolicy):
     """
     Policy that computes a cache key based on a hash of the runtime inputs provided to the task..
+
+    Inputs are hashed structurally with `prefect.utilities.hashing.structural_hash`;
+    use `prefect.utilities.hashing.register_hash_reducer` to control how custom types
+    contribute to the key. Within a flow run, digests of large immutable inputs are
+    memoized so an object shared by many task calls is only hashed once; see
+    `invalidate_input_hash` for opting mutable types in.
     """
 
     exclude: List[str] = field(default_factory=list)
@@ -294,7 +324,9 @@ class Inputs(CachePolicy):
                 hashed_inputs[key] = val
 
         try:
-            return hash_objects(hashed_inputs, raise_on_failure=True)
+            flow_run_context = FlowRunContext.get()
+            memo = flow_run_context.hash_memo if flow_run_context else None
+            return structural_hash(hashed_inputs, memo=memo)
         except HashError as exc:
             msg = (
                 f"{exc}\n\n"
@@ -312,6 +344,19 @@ class Inputs(CachePolicy):
         return Inputs(exclude=self.exclude + [other])
 
 
+def invalidate_input_hash(obj: Any) -> None:
+    """
+    Discard the memoized digest of a task input in the current flow run.
+
+    Call this after mutating an instance of a type registered with
+    `prefect.utilities.hashing.register_hash_memo_type` so that subsequent cache keys
+    reflect the change.
+    """
+    flow_run_context = FlowRunContext.get()
+    if flow_run_context:
+        flow_run_context.hash_memo.invalidate(obj)
+
+
 INPUTS = Inputs()
 NONE = _None()
 TASK_SOURCE = TaskSource()
@@ -1358,6 +1358,7 @@ class PrefectClient(
         work_pool_name: str,
         work_queue_names: Optional[list[str]] = None,
         scheduled_before: Optional[datetime.datetime] = None,
+        wait_seconds: Optional[float] = None,
     ) -> list[WorkerFlowRunResponse]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -1369,6 +1370,8 @@ class PrefectClient(
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            wait_seconds: How long the server should wait for flow runs to be
+                scheduled when there are none to return.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -1379,6 +1382,8 @@ class PrefectClient(
             body["work_queue_names"] = list(work_queue_names)
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
+        if wait_seconds is not None:
+            body["wait_seconds"] = wait_seconds
 
         response = await self._client.post(
             f"/work_pools/{work_pool_name}/get_scheduled_flow_runs",
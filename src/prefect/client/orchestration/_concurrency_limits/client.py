@@ -245,16 +245,35 @@ class ConcurrencyLimitClient(BaseClient):
         slots: int,
         mode: str,
         create_if_missing: bool | None = None,
+        wait_seconds: float | None = None,
     ) -> "Response":
+        """
+        Increment concurrency slots for the specified limits.
+
+        Args:
+            names: A list of limit names for which to increment slots.
+            slots: The number of concurrency slots to acquire.
+            mode: Either "concurrency" or "rate_limit".
+            create_if_missing: Whether to create limits that don't exist.
+            wait_seconds: How long the server should wait for slots to be released
+                before responding that the limits are locked.
+
+        Returns:
+            "Response": The HTTP response from the server.
+        """
+        data: dict[str, Any] = {
+            "names": names,
+            "slots": slots,
+            "mode": mode,
+            "create_if_missing": create_if_missing if create_if_missing else False,
+        }
+        if wait_seconds is not None:
+            data["wait_seconds"] = wait_seconds
+
         return self.request(
             "POST",
             "/v2/concurrency_limits/increment",
-            json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
-                "create_if_missing": create_if_missing if create_if_missing else False,
-            },
+            json=data,
         )
 
     def release_concurrency_slots(
@@ -615,16 +634,35 @@ class ConcurrencyLimitAsyncClient(BaseAsyncClient):
         slots: int,
         mode: str,
         create_if_missing: bool | None = None,
+        wait_seconds: float | None = None,
     ) -> "Response":
+        """
+        Increment concurrency slots for the specified limits.
+
+        Args:
+            names: A list of limit names for which to increment slots.
+            slots: The number of concurrency slots to acquire.
+            mode: Either "concurrency" or "rate_limit".
+            create_if_missing: Whether to create limits that don't exist.
+            wait_seconds: How long the server should wait for slots to be released
+                before responding that the limits are locked.
+
+        Returns:
+            "Response": The HTTP response from the server.
+        """
+        data: dict[str, Any] = {
+            "names": names,
+            "slots": slots,
+            "mode": mode,
+            "create_if_missing": create_if_missing if create_if_missing else False,
+        }
+        if wait_seconds is not None:
+            data["wait_seconds"] = wait_seconds
+
         return await self.request(
             "POST",
             "/v2/concurrency_limits/increment",
-            json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
-                "create_if_missing": create_if_missing if create_if_missing else False,
-            },
+            json=data,
         )
 
     async def release_concurrency_slots(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING, Any, Iterable, Union
 
 from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
@@ -17,18 +18,38 @@ if TYPE_CHECKING:
     from prefect.client.schemas.sorting import LogSort
 
 
+def _encode_logs(logs: Iterable[Union["LogCreate", dict[str, Any], bytes]]) -> bytes:
+    """Encodes logs as a JSON array, reusing any logs that are already encoded"""
+    from prefect.client.schemas.actions import LogCreate
+
+    encoded: list[bytes] = []
+    for log in logs:
+        if isinstance(log, bytes):
+            encoded.append(log)
+        else:
+            if isinstance(log, LogCreate):
+                log = log.model_dump(mode="json")
+            encoded.append(json.dumps(log).encode())
+    return b"[" + b",".join(encoded) + b"]"
+
+
 class LogClient(BaseClient):
-    def create_logs(self, logs: Iterable[Union["LogCreate", dict[str, Any]]]) -> None:
+    def create_logs(
+        self, logs: Iterable[Union["LogCreate", dict[str, Any], bytes]]
+    ) -> None:
         """
         Create logs for a flow or task run
-        """
-        from prefect.client.schemas.actions import LogCreate
 
-        serialized_logs = [
-            log.model_dump(mode="json") if isinstance(log, LogCreate) else log
-            for log in logs
-        ]
-        self.request("POST", "/logs/", json=serialized_logs)
+        Args:
+            logs: An iterable of `LogCreate` objects, already json-compatible dicts, or
+                logs already encoded as JSON
+        """
+        self.request(
+            "POST",
+            "/logs/",
+            content=_encode_logs(logs),
+            headers={"Content-Type": "application/json"},
+        )
 
     def read_logs(
         self,
@@ -56,21 +77,21 @@ class LogClient(BaseClient):
 
 class LogAsyncClient(BaseAsyncClient):
     async def create_logs(
-        self, logs: Iterable[Union["LogCreate", dict[str, Any]]]
+        self, logs: Iterable[Union["LogCreate", dict[str, Any], bytes]]
     ) -> None:
         """
         Create logs for a flow or task run
 
         Args:
-            logs: An iterable of `LogCreate` objects or already json-compatible dicts
+            logs: An iterable of `LogCreate` objects, already json-compatible dicts, or
+                logs already encoded as JSON
         """
-        from prefect.client.schemas.actions import LogCreate
-
-        serialized_logs = [
-            log.model_dump(mode="json") if isinstance(log, LogCreate) else log
-            for log in logs
-        ]
-        await self.request("POST", "/logs/", json=serialized_logs)
+        await self.request(
+            "POST",
+            "/logs/",
+            content=_encode_logs(logs),
+            headers={"Content-Type": "application/json"},
+        )
 
     async def read_logs(
         self,
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Optional
@@ -10,6 +11,7 @@ from typing_extensions import TypeAlias, Unpack
 from prefect._internal.concurrency import logger
 from prefect._internal.concurrency.services import FutureQueueService
 from prefect.client.orchestration import get_client
+from prefect.settings import PREFECT_API_REQUEST_TIMEOUT
 from prefect.utilities.timeout import timeout_async
 
 if TYPE_CHECKING:
@@ -17,6 +19,10 @@ if TYPE_CHECKING:
 
 _Item: TypeAlias = tuple[int, str, Optional[float], Optional[bool], Optional[int]]
 
+# The longest we'll ask the server to hold an acquisition request open while it waits
+# for slots to be released; the server may cap this further
+MAX_SERVER_WAIT_SECONDS = 30.0
+
 
 class ConcurrencySlotAcquisitionService(
     FutureQueueService[Unpack[_Item], httpx.Response]
@@ -40,6 +46,9 @@ class ConcurrencySlotAcquisitionService(
         create_if_missing: Optional[bool] = None,
         max_retries: Optional[int] = None,
     ) -> httpx.Response:
+        deadline = (
+            time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        )
         with timeout_async(seconds=timeout_seconds):
             while True:
                 try:
@@ -48,6 +57,7 @@ class ConcurrencySlotAcquisitionService(
                         slots=slots,
                         mode=mode,
                         create_if_missing=create_if_missing,
+                        wait_seconds=self._wait_seconds(deadline, max_retries),
                     )
                 except httpx.HTTPStatusError as exc:
                     if not exc.response.status_code == status.HTTP_423_LOCKED:
@@ -62,3 +72,18 @@ class ConcurrencySlotAcquisitionService(
                     await asyncio.sleep(retry_after)
                     if max_retries is not None:
                         max_retries -= 1
+
+    def _wait_seconds(
+        self, deadline: Optional[float], max_retries: Optional[int]
+    ) -> float:
+        """How long the server should wait for slots to be released before telling us
+        to retry, leaving room for the request to come back within its timeout"""
+        if max_retries is not None and max_retries <= 0:
+            return 0.0
+
+        wait_seconds = min(
+            MAX_SERVER_WAIT_SECONDS, PREFECT_API_REQUEST_TIMEOUT.value() / 2
+        )
+        if deadline is not None:
+            wait_seconds = min(wait_seconds, deadline - time.monotonic())
+        return max(wait_seconds, 0.0)
@@ -37,6 +37,7 @@ from prefect.settings.legacy import (
 from prefect.states import State
 from prefect.task_runners import TaskRunner
 from prefect.types import DateTime
+from prefect.utilities.hashing import HashMemo
 from prefect.utilities.services import start_client_metrics_server
 
 T = TypeVar("T")
@@ -327,6 +328,7 @@ class EngineContext(RunContext):
         task_run_states: A list of states for task runs created within this flow run
         task_run_results: A mapping of result ids to task run states for this flow run
         flow_run_states: A list of states for flow runs created within this flow run
+        hash_memo: A memo of input digests reused when computing task cache keys
     """
 
     flow: Optional["Flow[Any, Any]"] = None
@@ -353,6 +355,9 @@ class EngineContext(RunContext):
     # Holds the ID of the object returned by the task run and task run state
     task_run_results: dict[int, State] = Field(default_factory=dict)
 
+    # Digests of large task inputs, reused across cache key computations
+    hash_memo: HashMemo = Field(default_factory=HashMemo)
+
     # Events worker to emit events
     events: Optional[EventsWorker] = None
 
@@ -72,6 +72,13 @@ EVENT_WEBSOCKET_CHECKPOINTS = Counter(
 
 logger = get_logger(__name__)
 
+# The websocket subprotocol a client offers when it can send several events in one
+# frame, as a JSON array.  Servers that don't accept it are sent one event per frame.
+EVENT_BATCHES_SUBPROTOCOL = Subprotocol("prefect-event-batches")
+
+# The largest frame of batched events a client will send
+MAX_EVENT_BATCH_FRAME_SIZE = 512 * 1024
+
 
 def http_to_ws(url: str):
     return url.replace("https://", "wss://").replace("http://", "ws://").rstrip("/")
@@ -218,10 +225,27 @@ class EventsClient(abc.ABC):
         finally:
             EVENTS_EMITTED.labels(self.client_name).inc()
 
+    async def emit_many(self, events: List[Event]) -> None:
+        """Emit a batch of events"""
+        if not hasattr(self, "_in_context"):
+            raise TypeError(
+                "Events may only be emitted while this client is being used as a "
+                "context manager"
+            )
+
+        try:
+            return await self._emit_many(events)
+        finally:
+            EVENTS_EMITTED.labels(self.client_name).inc(len(events))
+
     @abc.abstractmethod
     async def _emit(self, event: Event) -> None:  # pragma: no cover
         ...
 
+    async def _emit_many(self, events: List[Event]) -> None:
+        for event in events:
+            await self._emit(event)
+
     async def __aenter__(self) -> Self:
         self._in_context = True
         return self
@@ -322,7 +346,9 @@ class PrefectEventsClient(EventsClient):
             )
 
         self._events_socket_url = events_in_socket_from_api_url(api_url)
-        self._connect = websocket_connect(self._events_socket_url)
+        self._connect = websocket_connect(
+            self._events_socket_url, subprotocols=[EVENT_BATCHES_SUBPROTOCOL]
+        )
         self._websocket = None
         self._reconnection_attempts = reconnection_attempts
         self._unconfirmed_events = []
@@ -375,13 +401,19 @@ class PrefectEventsClient(EventsClient):
         # Clear the unconfirmed events here, because they are going back through emit
         # and will be added again through the normal checkpointing process
         self._unconfirmed_events = []
-        for event in events_to_resend:
-            await self.emit(event)
+        if events_to_resend:
+            await self.emit_many(events_to_resend)
+
+    @property
+    def _sends_batches(self) -> bool:
+        """Whether the server has agreed to receive several events per frame"""
+        assert self._websocket
+        return self._websocket.subprotocol == EVENT_BATCHES_SUBPROTOCOL
 
-    async def _checkpoint(self, event: Event) -> None:
+    async def _checkpoint(self, events: List[Event]) -> None:
         assert self._websocket
 
-        self._unconfirmed_events.append(event)
+        self._unconfirmed_events.extend(events)
 
         unconfirmed_count = len(self._unconfirmed_events)
         if unconfirmed_count < self._checkpoint_every:
@@ -398,6 +430,9 @@ class PrefectEventsClient(EventsClient):
         EVENT_WEBSOCKET_CHECKPOINTS.labels(self.client_name).inc()
 
     async def _emit(self, event: Event) -> None:
+        await self._emit_many([event])
+
+    async def _emit_many(self, events: List[Event]) -> None:
         for i in range(self._reconnection_attempts + 1):
             try:
                 # If we're here and the websocket is None, then we've had a failure in a
@@ -405,13 +440,19 @@ class PrefectEventsClient(EventsClient):
                 #
                 # Otherwise, after the first time through this loop, we're recovering
                 # from a ConnectionClosed, so reconnect now, resending any unconfirmed
-                # events before we send this one.
+                # events before we send these.
                 if not self._websocket or i > 0:
                     await self._reconnect()
                     assert self._websocket
 
-                await self._websocket.send(event.model_dump_json())
-                await self._checkpoint(event)
+                if self._sends_batches:
+                    for frame in _event_batch_frames(events):
+                        await self._websocket.send(frame)
+                else:
+                    for event in events:
+                        await self._websocket.send(event.model_dump_json())
+
+                await self._checkpoint(events)
 
                 return
             except ConnectionClosed:
@@ -454,12 +495,12 @@ class AssertingPassthroughEventsClient(PrefectEventsClient):
         self.events = []
         return events
 
-    async def _emit(self, event: Event) -> None:
-        # actually send the event to the server
-        await super()._emit(event)
+    async def _emit_many(self, events: List[Event]) -> None:
+        # actually send the events to the server
+        await super()._emit_many(events)
 
-        # record the event for inspection
-        self.events.append(event)
+        # record the events for inspection
+        self.events.extend(events)
 
     async def __aenter__(self) -> Self:
         await super().__aenter__()
@@ -495,9 +536,27 @@ class PrefectCloudEventsClient(PrefectEventsClient):
         self._connect = websocket_connect(
             self._events_socket_url,
             extra_headers={"Authorization": f"bearer {api_key}"},
+            subprotocols=[EVENT_BATCHES_SUBPROTOCOL],
         )
 
 
+def _event_batch_frames(events: List[Event]) -> Generator[str, None, None]:
+    """Packs events into JSON arrays of up to `MAX_EVENT_BATCH_FRAME_SIZE`"""
+    batch: List[str] = []
+    size = 2
+    for event in events:
+        event_json = event.model_dump_json()
+        if batch and size + len(event_json) + 1 > MAX_EVENT_BATCH_FRAME_SIZE:
+            yield "[" + ",".join(batch) + "]"
+            batch, size = [], 2
+
+        batch.append(event_json)
+        size += len(event_json) + 1
+
+    if batch:
+        yield "[" + ",".join(batch) + "]"
+
+
 SEEN_EVENTS_SIZE = 500_000
 SEEN_EVENTS_TTL = 120
 
@@ -1,11 +1,12 @@
 from contextlib import asynccontextmanager
 from contextvars import Context, copy_context
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from typing_extensions import Self
 
-from prefect._internal.concurrency.services import QueueService
+from prefect._internal.concurrency.services import BatchedQueueService
+from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_KEY,
     PREFECT_API_URL,
@@ -25,6 +26,8 @@ from .schemas.events import Event
 if TYPE_CHECKING:
     from prefect.client.orchestration import PrefectClient
 
+logger = get_logger(__name__)
+
 
 def should_emit_events() -> bool:
     return (
@@ -50,7 +53,14 @@ def should_emit_events_to_ephemeral_server() -> bool:
     return PREFECT_API_KEY.value() is None
 
 
-class EventsWorker(QueueService[Event]):
+class EventsWorker(BatchedQueueService[Event]):
+    # Events are sent in batches of up to this many, or whatever has arrived within the
+    # interval, so that bursts of events go out in a few frames rather than hundreds.
+    # Batches start small so that events are sent promptly while they are sparse.
+    _max_batch_size = 200
+    _min_batch_size = 1
+    _min_interval = 0.1
+
     def __init__(
         self, client_type: Type[EventsClient], client_options: Tuple[Tuple[str, Any]]
     ):
@@ -75,12 +85,25 @@ class EventsWorker(QueueService[Event]):
         self._context_cache[event.id] = copy_context()
         return event
 
-    async def _handle(self, event: Event):
-        context = self._context_cache.pop(event.id)
-        with temporary_context(context=context):
-            await self.attach_related_resources_from_context(event)
-
-        await self._client.emit(event)
+    async def _handle_batch(self, events: List[Event]):
+        ready: List[Event] = []
+        for event in events:
+            context = self._context_cache.pop(event.id)
+            try:
+                with temporary_context(context=context):
+                    await self.attach_related_resources_from_context(event)
+            except Exception:
+                logger.error(
+                    "Unable to attach related resources to event %s; dropping it",
+                    event.id,
+                    exc_info=True,
+                )
+                continue
+
+            ready.append(event)
+
+        if ready:
+            await self._client.emit_many(ready)
 
     async def attach_related_resources_from_context(self, event: Event):
         if "prefect.resource.lineage-group" in event.resource:
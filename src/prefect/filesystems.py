@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import abc
 import urllib.parse
+from collections import defaultdict
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from shutil import copytree
-from typing import Any, Callable, Dict, Optional
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional
 
 import anyio
 import fsspec
@@ -244,6 +246,50 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         # Leave path stringify to the OS
         return str(path)
 
+    @contextmanager
+    def read_stream(self, path: str) -> Iterator[IO[bytes]]:
+        """
+        Open a file for reading incrementally.
+
+        Yields a binary file object so that large files can be consumed without
+        loading their full contents into memory.
+        """
+        path: Path = self._resolve_path(path)
+
+        if not path.exists():
+            raise ValueError(f"Path {path} does not exist.")
+
+        if not path.is_file():
+            raise ValueError(f"Path {path} is not a file.")
+
+        with open(path, mode="rb") as f:
+            yield f
+
+    @contextmanager
+    def write_stream(self, path: str) -> Iterator[IO[bytes]]:
+        """
+        Open a file for writing incrementally.
+
+        Yields a binary file object. If the write fails, the partially written file
+        is removed.
+        """
+        path: Path = self._resolve_path(path)
+
+        # Construct the path if it does not exist
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        # Check if the file already exists
+        if path.exists() and not path.is_file():
+            raise ValueError(f"Path {path} already exists and is not a file.")
+
+        try:
+            with open(path, mode="wb") as f:
+                yield f
+        except BaseException:
+            with suppress(OSError):
+                path.unlink()
+            raise
+
 
 class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
     """
@@ -392,6 +438,43 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
 
         return content
 
+    def existing_paths(self, paths: Iterable[str]) -> set[str]:
+        """
+        Check which of the given paths exist.
+
+        Paths that share a parent directory are checked by listing the directory
+        once rather than with a request per path.
+
+        Returns:
+            The subset of the given paths that exist.
+        """
+        paths_by_parent: defaultdict[str, defaultdict[str, list[str]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for path in paths:
+            resolved_path = self.filesystem._strip_protocol(self._resolve_path(path))
+            parent = resolved_path.rsplit("/", 1)[0]
+            paths_by_parent[parent][resolved_path].append(path)
+
+        existing: set[str] = set()
+        for parent, paths_in_parent in paths_by_parent.items():
+            if len(paths_in_parent) == 1:
+                ((resolved_path, aliases),) = paths_in_parent.items()
+                if self.filesystem.exists(resolved_path):
+                    existing.update(aliases)
+                continue
+            try:
+                listed = self.filesystem.ls(parent, detail=False)
+            except FileNotFoundError:
+                continue
+            for listed_path in listed:
+                existing.update(
+                    paths_in_parent.get(
+                        self.filesystem._strip_protocol(listed_path), []
+                    )
+                )
+        return existing
+
     @sync_compatible
     async def write_path(self, path: str, content: bytes) -> str:
         path = self._resolve_path(path)
@@ -403,6 +486,40 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
             await run_sync_in_worker_thread(file.write, content)
         return path
 
+    @contextmanager
+    def read_stream(self, path: str) -> Iterator[IO[bytes]]:
+        """
+        Open a file for reading incrementally.
+
+        Yields a binary file object so that large files can be consumed without
+        loading their full contents into memory.
+        """
+        path = self._resolve_path(path)
+
+        with self.filesystem.open(path, "rb") as file:
+            yield file
+
+    @contextmanager
+    def write_stream(self, path: str) -> Iterator[IO[bytes]]:
+        """
+        Open a file for writing incrementally.
+
+        Yields a binary file object; content is uploaded in blocks as it is written.
+        If the write fails, the destination is removed on a best-effort basis.
+        """
+        path = self._resolve_path(path)
+        dirpath = path[: path.rindex("/")]
+
+        self.filesystem.makedirs(dirpath, exist_ok=True)
+
+        try:
+            with self.filesystem.open(path, "wb") as file:
+                yield file
+        except BaseException:
+            with suppress(Exception):
+                self.filesystem.rm(path)
+            raise
+
     @property
     def filesystem(self) -> fsspec.AbstractFileSystem:
         if not self._filesystem:
@@ -522,6 +639,16 @@ class SMB(WritableFileSystem, WritableDeploymentStorage):
     async def write_path(self, path: str, content: bytes) -> str:
         return await self.filesystem.write_path(path=path, content=content)
 
+    @contextmanager
+    def read_stream(self, path: str) -> Iterator[IO[bytes]]:
+        with self.filesystem.read_stream(path) as file:
+            yield file
+
+    @contextmanager
+    def write_stream(self, path: str) -> Iterator[IO[bytes]]:
+        with self.filesystem.write_stream(path) as file:
+            yield file
+
 
 class NullFileSystem(BaseModel):
     """
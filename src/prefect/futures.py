@@ -2,14 +2,16 @@ import abc
 import asyncio
 import concurrent.futures
 import threading
+import time
 import uuid
-from collections.abc import Generator, Iterator
+from collections.abc import Generator, Iterable, Iterator
 from functools import partial
 from typing import Any, Callable, Generic, Optional, Union
 
 from typing_extensions import NamedTuple, Self, TypeVar
 
 from prefect.client.orchestration import get_client
+from prefect.client.schemas.filters import TaskRunFilter, TaskRunFilterId
 from prefect.exceptions import ObjectNotFound
 from prefect.logging.loggers import get_logger, get_run_logger
 from prefect.states import Pending, State
@@ -17,13 +19,15 @@ from prefect.task_runs import TaskRunWaiter
 from prefect.utilities.annotations import quote
 from prefect.utilities.asyncutils import run_coro_as_sync
 from prefect.utilities.collections import StopVisiting, visit_collection
-from prefect.utilities.timeout import timeout as timeout_context
 
 F = TypeVar("F")
 R = TypeVar("R")
 
 logger = get_logger(__name__)
 
+# the number of task run states read from the API in a single request
+STATE_READ_BATCH_SIZE = 200
+
 
 class PrefectFuture(abc.ABC, Generic[R]):
     """
@@ -187,6 +191,14 @@ class PrefectConcurrentFuture(PrefectWrappedFuture[R, concurrent.futures.Future[
         )
 
 
+class PrefectProcessFuture(PrefectConcurrentFuture[R]):
+    """
+    A Prefect future that wraps a concurrent.futures.Future resolving to the final
+    state of a task run executed in a worker process. This future is used when the
+    task run is submitted to a `ProcessPoolTaskRunner`.
+    """
+
+
 class PrefectDistributedFuture(PrefectFuture[R]):
     """
     Represents the result of a computation happening anywhere.
@@ -319,59 +331,209 @@ class PrefectFutureList(list[PrefectFuture[R]], Iterator[PrefectFuture[R]]):
         Raises:
             TimeoutError: If the timeout is reached before all futures complete.
         """
-        try:
-            with timeout_context(timeout):
-                return [
-                    future.result(raise_on_failure=raise_on_failure) for future in self
-                ]
-        except TimeoutError as exc:
-            # timeout came from inside the task
-            if "Scope timed out after {timeout} second(s)." not in str(exc):
-                raise
+        return FutureSet(self).result(
+            timeout=timeout, raise_on_failure=raise_on_failure
+        )
+
+
+class FutureSet(Generic[R]):
+    """
+    A collection of Prefect futures whose completion is tracked through a single
+    shared queue.
+
+    Wrapped futures report completion through their done callbacks and distributed
+    futures through the single event subscription of the `TaskRunWaiter`, so waiting
+    on the set does not poll or block on futures one at a time. The states of
+    distributed futures are read from the API in batches rather than once per future.
+
+    Example:
+        ```python
+        @flow
+        def my_flow():
+            futures = FutureSet(my_task.map(range(100)))
+            for future in futures.as_completed():
+                print(future.result())
+        ```
+    """
+
+    def __init__(self, futures: Iterable[PrefectFuture[R]]):
+        self._futures: list[PrefectFuture[R]] = list(futures)
+        self._unique_futures: list[PrefectFuture[R]] = list(
+            dict.fromkeys(self._futures)
+        )
+        self._done: set[PrefectFuture[R]] = set()
+        # futures in the order they completed, appended to by done callbacks
+        self._completion_queue: list[PrefectFuture[R]] = []
+        self._condition = threading.Condition()
+        self._registered = False
+        self._register_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._unique_futures)
+
+    def __iter__(self) -> Iterator[PrefectFuture[R]]:
+        return iter(self._unique_futures)
+
+    def _mark_done(self, future: PrefectFuture[R]) -> None:
+        with self._condition:
+            if future in self._done:
+                return
+            self._done.add(future)
+            self._completion_queue.append(future)
+            self._condition.notify_all()
+
+    def _register(self) -> None:
+        """
+        Subscribe to the completion of every future in the set. Only done once.
+        """
+        with self._register_lock:
+            if self._registered:
+                return
+            self._registered = True
+
+        distributed: list[PrefectDistributedFuture[R]] = []
+        for future in self._unique_futures:
+            if future._final_state:  # type: ignore[privateUsage]
+                self._mark_done(future)
+            elif isinstance(future, PrefectDistributedFuture):
+                distributed.append(future)
+            else:
+                future.add_done_callback(self._mark_done)
+
+        if not distributed:
+            return
+
+        # Register callbacks before reading states so that a task run finishing
+        # between the two is not missed; futures marked done twice are ignored
+        for future in distributed:
+            TaskRunWaiter.add_done_callback(
+                future.task_run_id, partial(self._mark_done, future)
+            )
+        self._read_final_states(distributed)
+
+    def _read_final_states(self, futures: list["PrefectDistributedFuture[R]"]) -> None:
+        """
+        Read the states of the given distributed futures in batches, setting the final
+        state of, and marking done, every future whose task run has finished.
+        """
+        futures_by_id = {future.task_run_id: future for future in futures}
+        task_run_ids = list(futures_by_id)
+        with get_client(sync_client=True) as client:
+            for i in range(0, len(task_run_ids), STATE_READ_BATCH_SIZE):
+                batch = task_run_ids[i : i + STATE_READ_BATCH_SIZE]
+                task_runs = client.read_task_runs(
+                    task_run_filter=TaskRunFilter(id=TaskRunFilterId(any_=batch)),
+                    limit=len(batch),
+                )
+                for task_run in task_runs:
+                    if task_run.state and task_run.state.is_final():
+                        future = futures_by_id[task_run.id]
+                        future._final_state = task_run.state  # type: ignore[privateUsage]
+                        self._mark_done(future)
+
+    def _resolve_final_states(self, futures: Iterable[PrefectFuture[R]]) -> None:
+        """
+        Set the final states of completed futures, reading the states of distributed
+        futures in batches.
+        """
+        distributed: list[PrefectDistributedFuture[R]] = []
+        for future in futures:
+            if future._final_state:  # type: ignore[privateUsage]
+                continue
+            if isinstance(future, PrefectDistributedFuture):
+                distributed.append(future)
+            else:
+                # the future is done, so this returns immediately
+                future.wait()
+        if distributed:
+            self._read_final_states(distributed)
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Generator[PrefectFuture[R], None]:
+        """
+        Yield the futures in the set as they complete.
+
+        Args:
+            timeout: The maximum number of seconds to wait for all futures to
+                complete. If None, then there is no limit on the wait time.
+
+        Raises:
+            TimeoutError: If the timeout is reached before all futures complete.
+        """
+        self._register()
+        total_futures = len(self._unique_futures)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for index in range(total_futures):
+            with self._condition:
+                while len(self._completion_queue) <= index:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            "%d (of %d) futures unfinished"
+                            % (total_futures - index, total_futures)
+                        )
+                    self._condition.wait(remaining)
+                future = self._completion_queue[index]
+            yield future
+
+    def wait(self, timeout: Optional[float] = None) -> "DoneAndNotDoneFutures[R]":
+        """
+        Wait for the futures in the set to complete.
+
+        Args:
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+
+        Returns:
+            A named 2-tuple of sets of the futures that completed and the futures
+            that had not completed when the wait ended.
+        """
+        self._register()
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: len(self._done) == len(self._unique_futures), timeout=timeout
+            ):
+                logger.debug("Timed out waiting for all futures to complete.")
+            done = set(self._done)
+        self._resolve_final_states(done)
+        return DoneAndNotDoneFutures(done, set(self._unique_futures) - done)
+
+    def result(
+        self,
+        timeout: Optional[float] = None,
+        raise_on_failure: bool = True,
+    ) -> list[R]:
+        """
+        Get the results of all task runs associated with the futures in the set.
+
+        Args:
+            timeout: The maximum number of seconds to wait for all futures to
+                complete.
+            raise_on_failure: If `True`, an exception will be raised if any task run fails.
+
+        Returns:
+            A list of results of the task runs, in the order the futures were given.
+
+        Raises:
+            TimeoutError: If the timeout is reached before all futures complete.
+        """
+        _, not_done = self.wait(timeout=timeout)
+        if not_done:
             raise TimeoutError(
                 f"Timed out waiting for all futures to complete within {timeout} seconds"
-            ) from exc
+            )
+        return [
+            future.result(raise_on_failure=raise_on_failure) for future in self._futures
+        ]
 
 
 def as_completed(
     futures: list[PrefectFuture[R]], timeout: Optional[float] = None
 ) -> Generator[PrefectFuture[R], None]:
-    unique_futures: set[PrefectFuture[R]] = set(futures)
-    total_futures = len(unique_futures)
-    pending = unique_futures
-    try:
-        with timeout_context(timeout):
-            done = {f for f in unique_futures if f._final_state}  # type: ignore[privateUsage]
-            pending = unique_futures - done
-            yield from done
-
-            finished_event = threading.Event()
-            finished_lock = threading.Lock()
-            finished_futures: list[PrefectFuture[R]] = []
-
-            def add_to_done(future: PrefectFuture[R]):
-                with finished_lock:
-                    finished_futures.append(future)
-                    finished_event.set()
-
-            for future in pending:
-                future.add_done_callback(add_to_done)
-
-            while pending:
-                finished_event.wait()
-                with finished_lock:
-                    done = finished_futures
-                    finished_futures = []
-                    finished_event.clear()
-
-                for future in done:
-                    pending.remove(future)
-                    yield future
-
-    except TimeoutError:
-        raise TimeoutError(
-            "%d (of %d) futures unfinished" % (len(pending), total_futures)
-        )
+    yield from FutureSet(futures).as_completed(timeout=timeout)
 
 
 class DoneAndNotDoneFutures(NamedTuple, Generic[R]):
@@ -417,21 +579,7 @@ def wait(
             print(f"Not Done: {len(not_done)}")
         ```
     """
-    _futures = set(futures)
-    done = {f for f in _futures if f._final_state}
-    not_done = _futures - done
-    if len(done) == len(_futures):
-        return DoneAndNotDoneFutures(done, not_done)
-    try:
-        with timeout_context(timeout):
-            for future in not_done.copy():
-                future.wait()
-                done.add(future)
-                not_done.remove(future)
-            return DoneAndNotDoneFutures(done, not_done)
-    except TimeoutError:
-        logger.debug("Timed out waiting for all futures to complete.")
-        return DoneAndNotDoneFutures(done, not_done)
+    return FutureSet(futures).wait(timeout=timeout)
 
 
 def resolve_futures_to_states(
@@ -470,10 +618,8 @@ def resolve_futures_to_states(
         return expr
 
     # Get final states for each future
-    states: list[State] = []
-    for future in futures:
-        future.wait()
-        states.append(future.state)
+    FutureSet(futures).wait()
+    states: list[State] = [future.state for future in futures]
 
     states_by_future = dict(zip(futures, states))
 
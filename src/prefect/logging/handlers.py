@@ -36,21 +36,30 @@ from prefect.settings import (
 
 
 class APILogWorker(BatchedQueueService[Dict[str, Any]]):
+    # Batch sizes are measured in bytes.  Batches start out large enough for the
+    # largest log and grow to `PREFECT_LOGGING_TO_API_BATCH_SIZE` bytes while logs
+    # arrive faster than they are sent.
     @property
-    def _max_batch_size(self):
-        return max(
-            PREFECT_LOGGING_TO_API_BATCH_SIZE.value()
-            - PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
+    def _min_batch_size(self):
+        return min(
             PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
+            PREFECT_LOGGING_TO_API_BATCH_SIZE.value(),
         )
 
+    @property
+    def _max_batch_size(self):
+        return PREFECT_LOGGING_TO_API_BATCH_SIZE.value()
+
     @property
     def _min_interval(self):
         return PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
 
     async def _handle_batch(self, items: List):
         try:
-            await self._client.create_logs(items)
+            # Send the logs as they were encoded when they were measured
+            await self._client.create_logs(
+                [item.get("__payload__") or item for item in items]
+            )
         except Exception as e:
             # Roughly replicate the behavior of the stdlib logger error handling
             if logging.raiseExceptions and sys.stderr:
@@ -78,7 +87,10 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         return super().instance(*settings)
 
     def _get_size(self, item: Dict[str, Any]) -> int:
-        return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
+        payload = item.get("__payload__")
+        if payload is not None:
+            return len(payload)
+        return len(json.dumps(item).encode())
 
 
 class APILogHandler(logging.Handler):
@@ -225,17 +237,20 @@ class APILogHandler(logging.Handler):
             message=self.format(record),
         ).model_dump(mode="json")
 
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
+        payload = log["__payload__"] = self._encode_payload(log)
+        if len(payload) > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
             raise ValueError(
-                f"Log of size {log_size} is greater than the max size of "
+                f"Log of size {len(payload)} is greater than the max size of "
                 f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
             )
 
         return log
 
+    def _encode_payload(self, log: Dict[str, Any]) -> bytes:
+        return json.dumps(log).encode()
+
     def _get_payload_size(self, log: Dict[str, Any]) -> int:
-        return len(json.dumps(log).encode())
+        return len(self._encode_payload(log))
 
 
 class WorkerAPILogHandler(APILogHandler):
@@ -268,10 +283,10 @@ class WorkerAPILogHandler(APILogHandler):
             message=self.format(record),
         ).model_dump(mode="json")
 
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
+        payload = log["__payload__"] = self._encode_payload(log)
+        if len(payload) > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
             raise ValueError(
-                f"Log of size {log_size} is greater than the max size of "
+                f"Log of size {len(payload)} is greater than the max size of "
                 f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
             )
 
@@ -1,11 +1,13 @@
 import inspect
 import os
 import socket
+import struct
 import threading
 import uuid
 from functools import partial
 from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Annotated,
     Any,
@@ -13,6 +15,8 @@ from typing import (
     ClassVar,
     Dict,
     Generic,
+    Iterable,
+    Literal,
     Optional,
     Tuple,
     TypeVar,
@@ -20,13 +24,15 @@ from typing import (
 )
 from uuid import UUID
 
+import anyio
 import pendulum
-from cachetools import LRUCache
+from cachetools import LRUCache, TTLCache
 from pydantic import (
     BaseModel,
     ConfigDict,
     Discriminator,
     Field,
+    PrivateAttr,
     Tag,
     ValidationError,
     model_validator,
@@ -38,6 +44,7 @@ from prefect._experimental.lineage import (
     emit_result_read_event,
     emit_result_write_event,
 )
+from prefect._internal.result_cache import LocalDiskCache, SizedLRUCache
 from prefect.blocks.core import Block
 from prefect.exceptions import (
     ConfigurationError,
@@ -55,7 +62,7 @@ from prefect.serializers import PickleSerializer, Serializer
 from prefect.settings.context import get_current_settings
 from prefect.types import DateTime
 from prefect.utilities.annotations import NotSet
-from prefect.utilities.asyncutils import sync_compatible
+from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 
 if TYPE_CHECKING:
     from prefect import Flow, Task
@@ -64,8 +71,20 @@ if TYPE_CHECKING:
 
 ResultStorage = Union[WritableFileSystem, str]
 ResultSerializer = Union[Serializer, str]
+ResultRecordFormat = Literal["json", "binary"]
 LITERAL_TYPES = {type(None), bool, UUID}
 
+# Binary result records are laid out as a fixed-size header (magic bytes, format
+# version, and the length of the JSON-encoded metadata), followed by the metadata and
+# then the serialized result. The leading null byte can never start a JSON
+# document or a base64 payload, so binary records are unambiguous. Version 1 records
+# store the serializer's text-safe `dumps` output; since version 2 the result is
+# written with `dump_binary`, so e.g. pickles are not base64 encoded.
+_BINARY_RECORD_MAGIC = b"\x00PFRR"
+_BINARY_RECORD_VERSION = 2
+_TEXT_SAFE_BINARY_RECORD_VERSION = 1
+_BINARY_RECORD_HEADER = struct.Struct(">5sBI")
+
 
 def DEFAULT_STORAGE_KEY_FN():
     return uuid.uuid4().hex
@@ -77,6 +96,13 @@ R = TypeVar("R")
 
 _default_storages: Dict[Tuple[str, str], WritableFileSystem] = {}
 
+# the maximum number of concurrent storage requests made by batched lookups
+RESULT_FETCH_CONCURRENCY = 32
+
+# how long the outcome of a prefetched existence check is trusted for
+PREFETCH_TTL_SECONDS = 300
+_local_result_caches: Dict[Tuple[str, int], LocalDiskCache] = {}
+
 
 @sync_compatible
 async def get_default_result_storage() -> WritableFileSystem:
@@ -178,6 +204,14 @@ def get_default_result_serializer() -> Serializer:
     return resolve_serializer(settings.results.default_serializer)
 
 
+def get_default_record_format() -> ResultRecordFormat:
+    """
+    Return the default format for persisted result records.
+    """
+    settings = get_current_settings()
+    return settings.results.record_format
+
+
 def get_default_persist_setting() -> bool:
     """
     Return the default option for result persistence.
@@ -250,8 +284,66 @@ async def _call_explicitly_async_block_method(
 T = TypeVar("T")
 
 
+def _supports_streaming(storage: Any) -> bool:
+    """
+    Check if a storage block can read and write files incrementally.
+    """
+    return callable(getattr(storage, "read_stream", None)) and callable(
+        getattr(storage, "write_stream", None)
+    )
+
+
+async def _read_stream(storage: Any, path: str, reader: Callable[[IO[bytes]], T]) -> T:
+    """
+    Read from a storage block's read stream in a worker thread.
+    """
+
+    def read() -> T:
+        with storage.read_stream(path) as file:
+            return reader(file)
+
+    return await run_sync_in_worker_thread(read)
+
+
+async def _write_stream(
+    storage: Any, path: str, writer: Callable[[IO[bytes]], None]
+) -> None:
+    """
+    Write to a storage block's write stream in a worker thread.
+    """
+
+    def write() -> None:
+        with storage.write_stream(path) as file:
+            writer(file)
+
+    await run_sync_in_worker_thread(write)
+
+
 def default_cache() -> LRUCache[str, "ResultRecord[Any]"]:
-    return LRUCache(maxsize=1000)
+    return SizedLRUCache(
+        max_bytes=get_current_settings().results.memory_cache_max_bytes
+    )
+
+
+def get_local_result_cache() -> Optional[LocalDiskCache]:
+    """
+    Get the local disk cache for result records read from remote storage, or `None`
+    if the cache is disabled.
+    """
+    settings = get_current_settings()
+    max_bytes = settings.results.local_cache_max_bytes
+    path = settings.results.local_cache_path
+    if max_bytes <= 0 or path is None:
+        return None
+
+    cache_key = (str(path), max_bytes)
+    if cache_key not in _local_result_caches:
+        _local_result_caches[cache_key] = LocalDiskCache(path, max_bytes=max_bytes)
+    return _local_result_caches[cache_key]
+
+
+# returned by local cache reads that miss, since a reader may legitimately return None
+_CACHE_MISS = object()
 
 
 def result_storage_discriminator(x: Any) -> str:
@@ -281,6 +373,7 @@ class ResultStore(BaseModel):
         cache_result_in_memory: Whether to cache results in memory.
         serializer: The serializer to use for results.
         storage_key_fn: The function to generate storage keys.
+        record_format: The format used when writing result records to storage.
     """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
@@ -299,6 +392,13 @@ class ResultStore(BaseModel):
     serializer: Serializer = Field(default_factory=get_default_result_serializer)
     storage_key_fn: Callable[[], str] = Field(default=DEFAULT_STORAGE_KEY_FN)
     cache: LRUCache[str, "ResultRecord[Any]"] = Field(default_factory=default_cache)
+    record_format: ResultRecordFormat = Field(default_factory=get_default_record_format)
+
+    # outcomes of existence checks made by `prefetch`, each used by one `exists` call
+    _prefetched_exists: TTLCache[str, bool] = PrivateAttr(
+        default_factory=lambda: TTLCache(maxsize=100_000, ttl=PREFETCH_TTL_SECONDS)
+    )
+    _prefetch_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     @property
     def result_storage_block_id(self) -> Optional[UUID]:
@@ -393,6 +493,17 @@ class ResultStore(BaseModel):
         thread_id = threading.get_ident()
         return f"{hostname}:{pid}:{thread_id}:{thread_name}"
 
+    def _streams_results(self) -> bool:
+        """
+        Check if results are streamed to and from storage.
+
+        Binary records are streamed when the result storage supports it, so large
+        results are never fully materialized as serialized bytes.
+        """
+        return self.record_format == "binary" and _supports_streaming(
+            self.result_storage
+        )
+
     @sync_compatible
     async def _exists(self, key: str) -> bool:
         """
@@ -404,6 +515,11 @@ class ResultStore(BaseModel):
         Returns:
             bool: True if the result record exists, False otherwise.
         """
+        with self._prefetch_lock:
+            prefetched = self._prefetched_exists.pop(key, None)
+        if prefetched is not None:
+            return prefetched
+
         if self.metadata_storage is not None:
             # TODO: Add an `exists` method to commonly used storage blocks
             # so the entire payload doesn't need to be read
@@ -419,13 +535,19 @@ class ResultStore(BaseModel):
                 return False
         else:
             try:
-                content = await _call_explicitly_async_block_method(
-                    self.result_storage, "read_path", (key,), {}
-                )
-                if content is None:
-                    return False
-                record = ResultRecord.deserialize(content)
-                metadata = record.metadata
+                if self._streams_results():
+                    metadata = await _read_stream(
+                        self.result_storage,
+                        key,
+                        ResultRecord.deserialize_metadata_from_stream,
+                    )
+                else:
+                    content = await _call_explicitly_async_block_method(
+                        self.result_storage, "read_path", (key,), {}
+                    )
+                    if content is None:
+                        return False
+                    metadata = ResultRecord.deserialize_metadata(content)
             except Exception:
                 return False
 
@@ -461,6 +583,152 @@ class ResultStore(BaseModel):
         """
         return await self._exists(key=key, _sync=False)
 
+    @sync_compatible
+    async def _exists_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check if result records exist in storage for many keys at once.
+
+        Keys are first filtered by listing the storage, if it supports it, so that only
+        the metadata of records that exist is read. Reads are made concurrently.
+        """
+        keys = list(dict.fromkeys(keys))
+        results = dict.fromkeys(keys, False)
+        if not keys:
+            return results
+
+        if self.result_storage is None:
+            self.result_storage = await get_default_result_storage()
+        storage = (
+            self.metadata_storage
+            if self.metadata_storage is not None
+            else self.result_storage
+        )
+        if callable(getattr(storage, "existing_paths", None)):
+            existing = await run_sync_in_worker_thread(storage.existing_paths, keys)
+            keys = [key for key in keys if key in existing]
+
+        limiter = anyio.CapacityLimiter(RESULT_FETCH_CONCURRENCY)
+
+        async def check(key: str) -> None:
+            async with limiter:
+                results[key] = await self._exists(key=key, _sync=False)
+
+        async with anyio.create_task_group() as tg:
+            for key in keys:
+                tg.start_soon(check, key)
+        return results
+
+    def exists_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check if result records exist in storage for many keys at once.
+
+        Args:
+            keys: The keys to check for the existence of result records.
+
+        Returns:
+            A mapping of each key to True if its result record exists, False otherwise.
+        """
+        return self._exists_many(keys=keys, _sync=True)
+
+    async def aexists_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check if result records exist in storage for many keys at once.
+
+        Args:
+            keys: The keys to check for the existence of result records.
+
+        Returns:
+            A mapping of each key to True if its result record exists, False otherwise.
+        """
+        return await self._exists_many(keys=keys, _sync=False)
+
+    @sync_compatible
+    async def _read_many(
+        self, keys: Iterable[str], holder: str
+    ) -> Dict[str, "ResultRecord[Any]"]:
+        """
+        Read result records from storage for many keys at once, making the reads
+        concurrently.
+        """
+        keys = list(dict.fromkeys(keys))
+        records: Dict[str, ResultRecord[Any]] = {}
+        limiter = anyio.CapacityLimiter(RESULT_FETCH_CONCURRENCY)
+
+        async def read(key: str) -> None:
+            async with limiter:
+                records[key] = await self._read(key=key, holder=holder, _sync=False)
+
+        async with anyio.create_task_group() as tg:
+            for key in keys:
+                tg.start_soon(read, key)
+        return {key: records[key] for key in keys}
+
+    def read_many(
+        self, keys: Iterable[str], holder: Optional[str] = None
+    ) -> Dict[str, "ResultRecord[Any]"]:
+        """
+        Read result records from storage for many keys at once.
+
+        Args:
+            keys: The keys to read the result records from.
+            holder: The holder of the lock if a lock was set on the records.
+
+        Returns:
+            A mapping of each key to its result record.
+        """
+        holder = holder or self.generate_default_holder()
+        return self._read_many(keys=keys, holder=holder, _sync=True)
+
+    async def aread_many(
+        self, keys: Iterable[str], holder: Optional[str] = None
+    ) -> Dict[str, "ResultRecord[Any]"]:
+        """
+        Read result records from storage for many keys at once.
+
+        Args:
+            keys: The keys to read the result records from.
+            holder: The holder of the lock if a lock was set on the records.
+
+        Returns:
+            A mapping of each key to its result record.
+        """
+        holder = holder or self.generate_default_holder()
+        return await self._read_many(keys=keys, holder=holder, _sync=False)
+
+    @sync_compatible
+    async def _prefetch(self, keys: Iterable[str]) -> None:
+        """
+        Check whether result records exist for many keys ahead of their individual
+        lookups.
+
+        The outcome of the existence check for each key is kept so that the next
+        `exists` call for that key does not go to storage. Records themselves are
+        only read when they are needed.
+        """
+        exists = await self._exists_many(keys=keys, _sync=False)
+        with self._prefetch_lock:
+            self._prefetched_exists.update(exists)
+
+    def prefetch(self, keys: Iterable[str]) -> None:
+        """
+        Check whether result records exist for many keys at once, ahead of their
+        individual `exists` calls.
+
+        Args:
+            keys: The keys to look up result records for.
+        """
+        return self._prefetch(keys=keys, _sync=True)
+
+    async def aprefetch(self, keys: Iterable[str]) -> None:
+        """
+        Check whether result records exist for many keys at once, ahead of their
+        individual `exists` calls.
+
+        Args:
+            keys: The keys to look up result records for.
+        """
+        return await self._prefetch(keys=keys, _sync=False)
+
     def _resolved_key_path(self, key: str) -> str:
         if self.result_storage_block_id is None and hasattr(
             self.result_storage, "_resolve_path"
@@ -468,6 +736,110 @@ class ResultStore(BaseModel):
             return str(self.result_storage._resolve_path(key))
         return key
 
+    def _local_cache_key(self, path: str) -> Optional[str]:
+        """
+        Get the key of a result storage path in the local disk cache, or `None` if
+        reads from the result storage are not cached on disk.
+        """
+        storage = self.result_storage
+        if storage is None or isinstance(storage, LocalFileSystem):
+            # local results are already on disk
+            return None
+
+        block_document_id = getattr(storage, "_block_document_id", None)
+        try:
+            if block_document_id is not None:
+                namespace = str(block_document_id)
+            else:
+                namespace = f"{type(storage).__name__}:{storage.model_dump_json()}"
+            if hasattr(storage, "_resolve_path"):
+                # records are written with full paths and read with relative keys
+                path = str(storage._resolve_path(path))
+        except Exception:
+            return None
+        return f"{namespace}:{path}"
+
+    async def _read_result_path(self, path: str) -> Any:
+        """
+        Read the contents of a path in result storage, going through the local disk
+        cache if it is enabled.
+        """
+        local_cache = get_local_result_cache()
+        cache_key = self._local_cache_key(path) if local_cache is not None else None
+        if local_cache is None or cache_key is None:
+            return await _call_explicitly_async_block_method(
+                self.result_storage, "read_path", (path,), {}
+            )
+
+        def read_cached() -> Any:
+            cached_path = local_cache.get(cache_key)
+            if cached_path is None:
+                return _CACHE_MISS
+            try:
+                return cached_path.read_bytes()
+            except FileNotFoundError:
+                # evicted by another process
+                return _CACHE_MISS
+
+        content = await run_sync_in_worker_thread(read_cached)
+        if content is _CACHE_MISS:
+            content = await _call_explicitly_async_block_method(
+                self.result_storage, "read_path", (path,), {}
+            )
+            if content is not None:
+                await run_sync_in_worker_thread(local_cache.put, cache_key, content)
+        return content
+
+    async def _read_result_stream(
+        self, path: str, reader: Callable[[IO[bytes]], T]
+    ) -> T:
+        """
+        Read a path in result storage as a stream, going through the local disk cache
+        if it is enabled.
+
+        On a cache miss the remote file is streamed into the cache and then read from
+        disk, so the file is never fully loaded into memory.
+        """
+        local_cache = get_local_result_cache()
+        cache_key = self._local_cache_key(path) if local_cache is not None else None
+        if local_cache is None or cache_key is None:
+            return await _read_stream(self.result_storage, path, reader)
+
+        def read_cached() -> Any:
+            cached_path = local_cache.get(cache_key)
+            if cached_path is None:
+                return _CACHE_MISS
+            try:
+                with open(cached_path, "rb") as file:
+                    return reader(file)
+            except FileNotFoundError:
+                # evicted by another process
+                return _CACHE_MISS
+
+        result = await run_sync_in_worker_thread(read_cached)
+        if result is not _CACHE_MISS:
+            return result
+
+        cached_path = await _read_stream(
+            self.result_storage, path, partial(local_cache.put_stream, cache_key)
+        )
+
+        def read_local() -> T:
+            with open(cached_path, "rb") as file:
+                return reader(file)
+
+        return await run_sync_in_worker_thread(read_local)
+
+    def _invalidate_local_cache(self, path: str) -> None:
+        """
+        Remove a path in result storage from the local disk cache after it is written.
+        """
+        local_cache = get_local_result_cache()
+        if local_cache is not None:
+            cache_key = self._local_cache_key(path)
+            if cache_key is not None:
+                local_cache.invalidate(cache_key)
+
     @sync_compatible
     async def _read(self, key: str, holder: str) -> "ResultRecord[Any]":
         """
@@ -489,8 +861,8 @@ class ResultStore(BaseModel):
 
         resolved_key_path = self._resolved_key_path(key)
 
-        if resolved_key_path in self.cache:
-            cached_result = self.cache[resolved_key_path]
+        cached_result = self.cache.get(resolved_key_path)
+        if cached_result is not None:
             await emit_result_read_event(self, resolved_key_path, cached=True)
             return cached_result
 
@@ -508,28 +880,35 @@ class ResultStore(BaseModel):
             assert (
                 metadata.storage_key is not None
             ), "Did not find storage key in metadata"
-            result_content = await _call_explicitly_async_block_method(
-                self.result_storage,
-                "read_path",
-                (metadata.storage_key,),
-                {},
-            )
-            result_record: ResultRecord[
-                Any
-            ] = ResultRecord.deserialize_from_result_and_metadata(
-                result=result_content, metadata=metadata_content
-            )
+            if self._streams_results():
+                result_record: ResultRecord[Any] = ResultRecord(
+                    metadata=metadata,
+                    result=await self._read_result_stream(
+                        metadata.storage_key, metadata.serializer.load
+                    ),
+                )
+            else:
+                result_content = await self._read_result_path(metadata.storage_key)
+                result_record: ResultRecord[
+                    Any
+                ] = ResultRecord.deserialize_from_result_and_metadata(
+                    result=result_content, metadata=metadata_content
+                )
             await emit_result_read_event(self, resolved_key_path)
         else:
-            content = await _call_explicitly_async_block_method(
-                self.result_storage,
-                "read_path",
-                (key,),
-                {},
-            )
-            result_record: ResultRecord[Any] = ResultRecord.deserialize(
-                content, backup_serializer=self.serializer
-            )
+            if self._streams_results():
+                result_record: ResultRecord[Any] = await self._read_result_stream(
+                    key,
+                    partial(
+                        ResultRecord.deserialize_from_stream,
+                        backup_serializer=self.serializer,
+                    ),
+                )
+            else:
+                content = await self._read_result_path(key)
+                result_record: ResultRecord[Any] = ResultRecord.deserialize(
+                    content, backup_serializer=self.serializer
+                )
             await emit_result_read_event(self, resolved_key_path)
 
         if self.cache_result_in_memory:
@@ -693,12 +1072,19 @@ class ResultStore(BaseModel):
 
         # If metadata storage is configured, write result and metadata separately
         if self.metadata_storage is not None:
-            await _call_explicitly_async_block_method(
-                self.result_storage,
-                "write_path",
-                (result_record.metadata.storage_key,),
-                {"content": result_record.serialize_result()},
-            )
+            if self._streams_results():
+                await _write_stream(
+                    self.result_storage,
+                    result_record.metadata.storage_key,
+                    result_record.serialize_result_to_stream,
+                )
+            else:
+                await _call_explicitly_async_block_method(
+                    self.result_storage,
+                    "write_path",
+                    (result_record.metadata.storage_key,),
+                    {"content": result_record.serialize_result()},
+                )
             await _call_explicitly_async_block_method(
                 self.metadata_storage,
                 "write_path",
@@ -707,14 +1093,25 @@ class ResultStore(BaseModel):
             )
             await emit_result_write_event(self, result_record.metadata.storage_key)
         # Otherwise, write the result metadata and result together
+        elif self._streams_results():
+            await _write_stream(
+                self.result_storage,
+                result_record.metadata.storage_key,
+                result_record.serialize_to_stream,
+            )
+            await emit_result_write_event(self, result_record.metadata.storage_key)
         else:
             await _call_explicitly_async_block_method(
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize()},
+                {"content": result_record.serialize(format=self.record_format)},
             )
             await emit_result_write_event(self, result_record.metadata.storage_key)
+        self._invalidate_local_cache(result_record.metadata.storage_key)
+        with self._prefetch_lock:
+            self._prefetched_exists.pop(base_key, None)
+            self._prefetched_exists.pop(key, None)
         if self.cache_result_in_memory:
             self.cache[key] = result_record
 
@@ -999,46 +1396,61 @@ class ResultRecord(BaseModel, Generic[R]):
         try:
             data = self.serializer.dumps(self.result)
         except Exception as exc:
-            extra_info = (
-                'You can try a different serializer (e.g. result_serializer="json") '
-                "or disabling persistence (persist_result=False) for this flow or task."
-            )
-            # check if this is a known issue with cloudpickle and pydantic
-            # and add extra information to help the user recover
-
-            if (
-                isinstance(exc, TypeError)
-                and isinstance(self.result, BaseModel)
-                and str(exc).startswith("cannot pickle")
-            ):
-                try:
-                    from IPython import get_ipython
-
-                    if get_ipython() is not None:
-                        extra_info = inspect.cleandoc(
-                            """
-                            This is a known issue in Pydantic that prevents
-                            locally-defined (non-imported) models from being
-                            serialized by cloudpickle in IPython/Jupyter
-                            environments. Please see
-                            https://github.com/pydantic/pydantic/issues/8232 for
-                            more information. To fix the issue, either: (1) move
-                            your Pydantic class definition to an importable
-                            location, (2) use the JSON serializer for your flow
-                            or task (`result_serializer="json"`), or (3)
-                            disable result persistence for your flow or task
-                            (`persist_result=False`).
-                            """
-                        ).replace("\n", " ")
-                except ImportError:
-                    pass
-            raise SerializationError(
-                f"Failed to serialize object of type {type(self.result).__name__!r} with "
-                f"serializer {self.serializer.type!r}. {extra_info}"
-            ) from exc
+            raise self._serialization_error(exc) from exc
 
         return data
 
+    def serialize_result_to_stream(self, file: IO[bytes]) -> None:
+        """
+        Serialize the result into a binary file object.
+
+        Uses the serializer's incremental `dump` so the serialized result does not
+        need to be held in memory in full.
+        """
+        try:
+            self.serializer.dump(self.result, file)
+        except Exception as exc:
+            raise self._serialization_error(exc) from exc
+
+    def _serialization_error(self, exc: Exception) -> SerializationError:
+        extra_info = (
+            'You can try a different serializer (e.g. result_serializer="json") '
+            "or disabling persistence (persist_result=False) for this flow or task."
+        )
+        # check if this is a known issue with cloudpickle and pydantic
+        # and add extra information to help the user recover
+
+        if (
+            isinstance(exc, TypeError)
+            and isinstance(self.result, BaseModel)
+            and str(exc).startswith("cannot pickle")
+        ):
+            try:
+                from IPython import get_ipython
+
+                if get_ipython() is not None:
+                    extra_info = inspect.cleandoc(
+                        """
+                        This is a known issue in Pydantic that prevents
+                        locally-defined (non-imported) models from being
+                        serialized by cloudpickle in IPython/Jupyter
+                        environments. Please see
+                        https://github.com/pydantic/pydantic/issues/8232 for
+                        more information. To fix the issue, either: (1) move
+                        your Pydantic class definition to an importable
+                        location, (2) use the JSON serializer for your flow
+                        or task (`result_serializer="json"`), or (3)
+                        disable result persistence for your flow or task
+                        (`persist_result=False`).
+                        """
+                    ).replace("\n", " ")
+            except ImportError:
+                pass
+        return SerializationError(
+            f"Failed to serialize object of type {type(self.result).__name__!r} with "
+            f"serializer {self.serializer.type!r}. {extra_info}"
+        )
+
     @model_validator(mode="before")
     @classmethod
     def coerce_old_format(cls, value: Any) -> Any:
@@ -1083,29 +1495,142 @@ class ResultRecord(BaseModel, Generic[R]):
     def serialize_metadata(self) -> bytes:
         return self.metadata.dump_bytes()
 
-    def serialize(
-        self,
-    ) -> bytes:
+    def serialize(self, format: ResultRecordFormat = "json") -> bytes:
         """
         Serialize the record to bytes.
 
+        Args:
+            format: The record format to use. "json" embeds the serialized result in a
+                JSON document; "binary" writes a small header and the metadata followed
+                by the result as serialized by the serializer's `dumps_binary`.
+
         Returns:
             bytes: the serialized record
 
         """
+        if format == "binary":
+            try:
+                data = self.serializer.dumps_binary(self.result)
+            except Exception as exc:
+                raise self._serialization_error(exc) from exc
+            return b"".join((self._binary_preamble(), data))
+
         return (
             self.model_copy(update={"result": self.serialize_result()})
             .model_dump_json(serialize_as_any=True)
             .encode()
         )
 
+    def serialize_to_stream(self, file: IO[bytes]) -> None:
+        """
+        Serialize the record into a binary file object using the binary format.
+
+        The result is written incrementally after the record metadata, so the
+        serialized result does not need to be held in memory in full.
+
+        Args:
+            file: a writable binary file object
+        """
+        file.write(self._binary_preamble())
+        try:
+            self.serializer.dump_binary(self.result, file)
+        except Exception as exc:
+            raise self._serialization_error(exc) from exc
+
+    def _binary_preamble(self) -> bytes:
+        """
+        Build the header and metadata that precede the result in a binary record.
+        """
+        metadata = self.serialize_metadata()
+        header = _BINARY_RECORD_HEADER.pack(
+            _BINARY_RECORD_MAGIC, _BINARY_RECORD_VERSION, len(metadata)
+        )
+        return header + metadata
+
+    @staticmethod
+    def _is_binary_record(data: Union[bytes, memoryview]) -> bool:
+        return memoryview(data)[: len(_BINARY_RECORD_MAGIC)] == _BINARY_RECORD_MAGIC
+
+    @staticmethod
+    def _unpack_binary_header(header: Union[bytes, memoryview]) -> Tuple[int, int]:
+        """
+        Validate the header of a binary record and return its version and the length
+        of its metadata.
+        """
+        if len(header) < _BINARY_RECORD_HEADER.size:
+            raise ValueError("Binary result record is truncated.")
+
+        _, version, metadata_length = _BINARY_RECORD_HEADER.unpack_from(header)
+        if version > _BINARY_RECORD_VERSION:
+            raise ValueError(
+                f"Binary result record version {version} is not supported by this "
+                f"version of Prefect (maximum supported: {_BINARY_RECORD_VERSION})."
+            )
+        return version, metadata_length
+
+    @classmethod
+    def _split_binary_record(
+        cls,
+        data: Union[bytes, memoryview],
+    ) -> Optional[Tuple[int, memoryview, memoryview]]:
+        """
+        Split a binary record into its version and views of its metadata and result
+        payload.
+
+        Returns `None` if the data is not a binary record.
+        """
+        if not cls._is_binary_record(data):
+            return None
+
+        view = memoryview(data)
+        version, metadata_length = cls._unpack_binary_header(view)
+        metadata_end = _BINARY_RECORD_HEADER.size + metadata_length
+        if metadata_end > len(view):
+            raise ValueError(
+                "Binary result record is truncated: its header declares "
+                f"{metadata_length} bytes of metadata, but only "
+                f"{len(view) - _BINARY_RECORD_HEADER.size} bytes follow it."
+            )
+        return (
+            version,
+            view[_BINARY_RECORD_HEADER.size : metadata_end],
+            view[metadata_end:],
+        )
+
+    @classmethod
+    def deserialize_metadata(
+        cls, data: Union[bytes, memoryview]
+    ) -> ResultRecordMetadata:
+        """
+        Deserialize only the metadata of a record without loading the result.
+
+        Args:
+            data: the serialized record
+
+        Returns:
+            ResultRecordMetadata: the deserialized metadata
+        """
+        parts = cls._split_binary_record(data)
+        if parts is not None:
+            return ResultRecordMetadata.load_bytes(parts[1].tobytes())
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return cls.model_validate_json(data).metadata
+
     @classmethod
     def deserialize(
-        cls, data: bytes, backup_serializer: Optional[Serializer] = None
+        cls,
+        data: Union[bytes, memoryview],
+        backup_serializer: Optional[Serializer] = None,
     ) -> "ResultRecord[R]":
         """
         Deserialize a record from bytes.
 
+        Both JSON and binary records are supported. Binary records may be provided as
+        a `memoryview` (e.g. over an `mmap`); the result payload is passed to the
+        serializer's `loads_binary` as a view, so serializers that accept buffers
+        (such as pickle) do not copy it.
+
         Args:
             data: the serialized record
             backup_serializer: The serializer to use to deserialize the result record. Only
@@ -1114,6 +1639,18 @@ class ResultRecord(BaseModel, Generic[R]):
         Returns:
             ResultRecord: the deserialized record
         """
+        parts = cls._split_binary_record(data)
+        if parts is not None:
+            version, metadata_view, result_view = parts
+            metadata = ResultRecordMetadata.load_bytes(metadata_view.tobytes())
+            if version == _TEXT_SAFE_BINARY_RECORD_VERSION:
+                result = metadata.serializer.loads(result_view.tobytes())
+            else:
+                result = metadata.serializer.loads_binary(result_view)
+            return cls(metadata=metadata, result=result)
+
+        if isinstance(data, memoryview):
+            data = data.tobytes()
         try:
             instance = cls.model_validate_json(data)
         except ValidationError:
@@ -1131,6 +1668,77 @@ class ResultRecord(BaseModel, Generic[R]):
             instance.result = instance.serializer.loads(instance.result.encode())
         return instance
 
+    @classmethod
+    def deserialize_from_stream(
+        cls, file: IO[bytes], backup_serializer: Optional[Serializer] = None
+    ) -> "ResultRecord[R]":
+        """
+        Deserialize a record from a binary file object.
+
+        Binary records are decoded incrementally with the serializer's `load_binary`;
+        other records are read in full and passed to `deserialize`.
+
+        Args:
+            file: a readable binary file object
+            backup_serializer: The serializer to use to deserialize the result record. Only
+                necessary if the provided data does not specify a serializer.
+
+        Returns:
+            ResultRecord: the deserialized record
+        """
+        loaded = cls._load_metadata_from_stream(file)
+        if isinstance(loaded, bytes):
+            return cls.deserialize(
+                loaded + file.read(), backup_serializer=backup_serializer
+            )
+        version, metadata = loaded
+        if version == _TEXT_SAFE_BINARY_RECORD_VERSION:
+            result = metadata.serializer.load(file)
+        else:
+            result = metadata.serializer.load_binary(file)
+        return cls(metadata=metadata, result=result)
+
+    @classmethod
+    def deserialize_metadata_from_stream(cls, file: IO[bytes]) -> ResultRecordMetadata:
+        """
+        Deserialize only the metadata of a record from a binary file object.
+
+        For binary records, only the header and metadata are read from the file.
+
+        Args:
+            file: a readable binary file object
+
+        Returns:
+            ResultRecordMetadata: the deserialized metadata
+        """
+        loaded = cls._load_metadata_from_stream(file)
+        if isinstance(loaded, bytes):
+            return cls.deserialize_metadata(loaded + file.read())
+        return loaded[1]
+
+    @classmethod
+    def _load_metadata_from_stream(
+        cls, file: IO[bytes]
+    ) -> Union[Tuple[int, ResultRecordMetadata], bytes]:
+        """
+        Read the version and metadata of a binary record from a file object.
+
+        If the file does not contain a binary record, the bytes consumed while
+        checking are returned instead so the caller can fall back to other formats.
+        """
+        header = file.read(_BINARY_RECORD_HEADER.size)
+        if not cls._is_binary_record(header):
+            return header
+        version, metadata_length = cls._unpack_binary_header(header)
+        metadata = file.read(metadata_length)
+        if len(metadata) < metadata_length:
+            raise ValueError(
+                "Binary result record is truncated: its header declares "
+                f"{metadata_length} bytes of metadata, but only {len(metadata)} "
+                "bytes follow it."
+            )
+        return version, ResultRecordMetadata.load_bytes(metadata)
+
     @classmethod
     def deserialize_from_result_and_metadata(
         cls, result: bytes, metadata: bytes
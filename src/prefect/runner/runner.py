@@ -121,6 +121,7 @@ from prefect.utilities.services import (
     start_client_metrics_server,
 )
 from prefect.utilities.slugify import slugify
+from prefect.utilities.warm_processes import WarmProcessPool
 
 if TYPE_CHECKING:
     from prefect.client.schemas.responses import DeploymentResponse
@@ -225,6 +226,7 @@ class Runner:
         self._deployment_storage_map: Dict[UUID, RunnerStorage] = {}
 
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._warm_process_pool: Optional[WarmProcessPool] = None
 
         # Caching
         self._deployment_cache: LRUCache[UUID, "DeploymentResponse"] = LRUCache(
@@ -618,7 +620,7 @@ class Runner:
 
         flow_run_logger.info("Opening process...")
 
-        env = get_current_settings().to_environment_variables(exclude_unset=True)
+        env = self._get_process_environment()
         env.update(
             {
                 **{
@@ -651,14 +653,22 @@ class Runner:
                 await storage.pull_code()
                 setattr(storage, "last_adhoc_pull", datetime.datetime.now())
 
-        process = await run_process(
-            command=command,
-            stream_output=True,
-            task_status=task_status,
-            env=env,
-            **kwargs,
-            cwd=storage.destination if storage else None,
-        )
+        if self._warm_process_pool is not None:
+            process = await self._warm_process_pool.run_process(
+                env=env,
+                cwd=storage.destination if storage else None,
+                stream_output=True,
+                task_status=task_status,
+            )
+        else:
+            process = await run_process(
+                command=command,
+                stream_output=True,
+                task_status=task_status,
+                env=env,
+                **kwargs,
+                cwd=storage.destination if storage else None,
+            )
 
         # Use the pid for display if no name was given
 
@@ -706,6 +716,9 @@ class Runner:
 
         return process.returncode
 
+    def _get_process_environment(self) -> Dict[str, str]:
+        return get_current_settings().to_environment_variables(exclude_unset=True)
+
     async def _kill_process(
         self,
         pid: int,
@@ -1406,6 +1419,23 @@ class Runner:
         if not hasattr(self, "_loops_task_group") or not self._loops_task_group:
             self._loops_task_group: anyio.abc.TaskGroup = anyio.create_task_group()
 
+        settings = get_current_settings()
+        if settings.runner.warm_process_pool_size:
+            # We must add creationflags to a dict so it is only passed as a function
+            # parameter on Windows, because the presence of creationflags causes
+            # errors on Unix even if set to None
+            kwargs: Dict[str, object] = {}
+            if sys.platform == "win32":
+                kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+
+            self._warm_process_pool = WarmProcessPool(
+                size=settings.runner.warm_process_pool_size,
+                preload=sorted(settings.runner.warm_process_preload or []),
+                env={**self._get_process_environment(), **os.environ},
+                **kwargs,
+            )
+            await self._warm_process_pool.__aenter__()
+
         self.started = True
         return self
 
@@ -1418,6 +1448,12 @@ class Runner:
         for scope in self._scheduled_task_scopes:
             scope.cancel()
 
+        # Flow runs already handed to warm processes keep running, but no more
+        # processes will be started for flow runs that haven't been
+        if self._warm_process_pool:
+            await self._warm_process_pool.__aexit__(*exc_info)
+            self._warm_process_pool = None
+
         if self._runs_task_group:
             await self._runs_task_group.__aexit__(*exc_info)
 
@@ -8,11 +8,16 @@ support additional settings for configuration of serialization. These are stored
 the instance so the same settings can be used to load saved objects.
 
 All serializers must implement `dumps` and `loads` which convert objects to bytes and
-bytes to an object respectively.
+bytes to an object respectively. Serializers may also implement `dump` and `load` to
+write to and read from binary file objects incrementally; by default these wrap `dumps`
+and `loads`. The `*_binary` variants are used where the output is stored in a binary
+container rather than embedded in text, and may skip any text-safe encoding such as
+base64; by default they are the same as their text-safe counterparts.
 """
 
 import base64
-from typing import Any, ClassVar, Generic, Optional, Union, overload
+import io
+from typing import IO, Any, ClassVar, Generic, Optional, Union, overload
 
 from pydantic import (
     BaseModel,
@@ -38,6 +43,74 @@ from prefect.utilities.pydantic import custom_pydantic_encoder
 D = TypeVar("D", default=Any)
 
 
+# `base64.encodebytes` emits one line for every 57 bytes of input; encoding in
+# multiples of this size lets chunks be concatenated into the same output
+_BASE64_LINE_INPUT_SIZE = 57
+_BASE64_CHUNK_SIZE = _BASE64_LINE_INPUT_SIZE * 1024
+
+
+class _Base64EncodingWriter(io.RawIOBase):
+    """
+    A writable stream that base64 encodes data before writing it to a wrapped file.
+
+    The output is identical to calling `base64.encodebytes` on all of the data at
+    once. The wrapped file is not closed when this stream is closed.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        data = memoryview(data)
+        self._buffer += data
+        if len(self._buffer) >= _BASE64_CHUNK_SIZE:
+            size = len(self._buffer) - len(self._buffer) % _BASE64_LINE_INPUT_SIZE
+            self._file.write(base64.encodebytes(self._buffer[:size]))
+            del self._buffer[:size]
+        return data.nbytes
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.write(base64.encodebytes(self._buffer))
+            self._buffer.clear()
+        super().close()
+
+
+class _Base64DecodingReader(io.RawIOBase):
+    """
+    A readable stream that decodes base64 data read from a wrapped file.
+
+    The wrapped file is not closed when this stream is closed.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self._undecoded = b""
+        self._decoded = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._decoded:
+            chunk = self._file.read(_BASE64_CHUNK_SIZE)
+            if not chunk:
+                break
+            data = self._undecoded + chunk.replace(b"\n", b"")
+            size = len(data) - len(data) % 4
+            self._decoded += base64.decodebytes(data[:size])
+            self._undecoded = data[size:]
+
+        size = min(len(buffer), len(self._decoded))
+        buffer[:size] = self._decoded[:size]
+        del self._decoded[:size]
+        return size
+
+
 def prefect_json_object_encoder(obj: Any) -> Any:
     """
     `JSONEncoder.default` for encoding objects into JSON with extended type support.
@@ -112,6 +185,48 @@ class Serializer(BaseModel, Generic[D]):
         """Decode the blob of bytes into an object."""
         raise NotImplementedError
 
+    def dump(self, obj: D, file: IO[bytes]) -> None:
+        """
+        Encode the object into a binary file object.
+
+        The output must be readable by `loads`. Serializers that can encode
+        incrementally should override this to avoid building the full blob in memory.
+        """
+        file.write(self.dumps(obj))
+
+    def load(self, file: IO[bytes]) -> D:
+        """
+        Decode an object from a binary file object.
+
+        Serializers that can decode incrementally should override this to avoid
+        reading the full blob into memory.
+        """
+        return self.loads(file.read())
+
+    def dumps_binary(self, obj: D) -> bytes:
+        """
+        Encode the object into a blob of bytes that does not need to be text-safe.
+
+        The output must be readable by `loads_binary`. Defaults to `dumps`.
+        """
+        return self.dumps(obj)
+
+    def loads_binary(self, blob: Union[bytes, memoryview]) -> D:
+        """Decode a blob of bytes written by `dumps_binary` into an object."""
+        return self.loads(bytes(blob))
+
+    def dump_binary(self, obj: D, file: IO[bytes]) -> None:
+        """
+        Encode the object into a binary file object without text-safe encoding.
+
+        The output must be readable by `loads_binary`. Defaults to `dump`.
+        """
+        self.dump(obj, file)
+
+    def load_binary(self, file: IO[bytes]) -> D:
+        """Decode an object written by `dump_binary` from a binary file object."""
+        return self.load(file)
+
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="forbid")
 
     @classmethod
@@ -127,7 +242,8 @@ class PickleSerializer(Serializer[D]):
     - Uses `cloudpickle` by default. See `picklelib` for using alternative libraries.
     - Stores the version of the pickle library to check for compatibility during
         deserialization.
-    - Wraps pickles in base64 for safe transmission.
+    - Wraps pickles in base64 for safe transmission, except in the `*_binary`
+        methods.
     """
 
     type: str = Field(default="pickle", frozen=True)
@@ -148,6 +264,40 @@ class PickleSerializer(Serializer[D]):
         pickler = from_qualified_name(self.picklelib)
         return pickler.loads(base64.decodebytes(blob))
 
+    def dump(self, obj: D, file: IO[bytes]) -> None:
+        pickler = from_qualified_name(self.picklelib)
+        if not callable(getattr(pickler, "dump", None)):
+            return super().dump(obj, file)
+        with _Base64EncodingWriter(file) as writer:
+            pickler.dump(obj, writer)
+
+    def load(self, file: IO[bytes]) -> D:
+        pickler = from_qualified_name(self.picklelib)
+        if not callable(getattr(pickler, "load", None)):
+            return super().load(file)
+        with io.BufferedReader(_Base64DecodingReader(file)) as reader:
+            return pickler.load(reader)
+
+    def dumps_binary(self, obj: D) -> bytes:
+        pickler = from_qualified_name(self.picklelib)
+        return pickler.dumps(obj)
+
+    def loads_binary(self, blob: Union[bytes, memoryview]) -> D:
+        pickler = from_qualified_name(self.picklelib)
+        return pickler.loads(blob)
+
+    def dump_binary(self, obj: D, file: IO[bytes]) -> None:
+        pickler = from_qualified_name(self.picklelib)
+        if not callable(getattr(pickler, "dump", None)):
+            return super().dump_binary(obj, file)
+        pickler.dump(obj, file)
+
+    def load_binary(self, file: IO[bytes]) -> D:
+        pickler = from_qualified_name(self.picklelib)
+        if not callable(getattr(pickler, "load", None)):
+            return super().load_binary(file)
+        return pickler.load(file)
+
 
 class JSONSerializer(Serializer[D]):
     """
@@ -247,6 +397,21 @@ class CompressedSerializer(Serializer[D]):
         uncompressed = compressor.decompress(base64.decodebytes(blob))
         return self.serializer.loads(uncompressed)
 
+    def dumps_binary(self, obj: D) -> bytes:
+        blob = self.serializer.dumps_binary(obj)
+        compressor = from_qualified_name(self.compressionlib)
+        return compressor.compress(blob)
+
+    def loads_binary(self, blob: Union[bytes, memoryview]) -> D:
+        compressor = from_qualified_name(self.compressionlib)
+        return self.serializer.loads_binary(compressor.decompress(blob))
+
+    def dump_binary(self, obj: D, file: IO[bytes]) -> None:
+        file.write(self.dumps_binary(obj))
+
+    def load_binary(self, file: IO[bytes]) -> D:
+        return self.loads_binary(file.read())
+
 
 class CompressedPickleSerializer(CompressedSerializer[D]):
     """
@@ -1,4 +1,5 @@
-from typing import List, Literal, Optional, Union
+import time
+from typing import List, Literal, Optional, Tuple, Union
 from uuid import UUID
 
 from fastapi import Body, Depends, HTTPException, Path, status
@@ -6,10 +7,12 @@ from fastapi import Body, Depends, HTTPException, Path, status
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.api.dependencies import LimitBody
+from prefect.server.concurrency_waiters import ConcurrencySlotWaiters
 from prefect.server.database import PrefectDBInterface, provide_database_interface
 from prefect.server.schemas import actions
 from prefect.server.utilities.schemas import PrefectBaseModel
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import PREFECT_SERVER_API_CONCURRENCY_SLOT_MAX_WAIT_SECONDS
 
 router = PrefectRouter(prefix="/v2/concurrency_limits", tags=["Concurrency Limits V2"])
 
@@ -150,8 +153,87 @@ async def bulk_increment_active_slots(
     names: List[str] = Body(..., min_items=1),
     mode: Literal["concurrency", "rate_limit"] = Body("concurrency"),
     create_if_missing: Optional[bool] = Body(None),
+    wait_seconds: Optional[float] = Body(
+        None,
+        ge=0.0,
+        description=(
+            "How long to wait for slots to be released before responding that the "
+            "limits are locked. Capped by the server's "
+            "`PREFECT_SERVER_API_CONCURRENCY_SLOT_MAX_WAIT_SECONDS` setting."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[MinimalConcurrencyLimitResponse]:
+    deadline = time.monotonic() + min(
+        wait_seconds or 0.0,
+        PREFECT_SERVER_API_CONCURRENCY_SLOT_MAX_WAIT_SECONDS.value(),
+    )
+
+    acquired, limits = await _try_increment_active_slots(
+        db, slots=slots, names=names, mode=mode, create_if_missing=create_if_missing
+    )
+    if acquired:
+        return _minimal_responses(limits)
+
+    active_limits = [limit for limit in limits if bool(limit.active)]
+
+    # Denials are only recorded once per request, no matter how long it waits
+    async with db.session_context(begin_transaction=True) as session:
+        await models.concurrency_limits_v2.bulk_update_denied_slots(
+            session=session,
+            concurrency_limit_ids=[limit.id for limit in active_limits],
+            slots=slots,
+        )
+
+    retry_after = _retry_after(active_limits, slots)
+
+    if time.monotonic() < deadline:
+        with ConcurrencySlotWaiters.waiting(
+            [limit.id for limit in active_limits], slots
+        ) as waiter:
+            while (remaining := deadline - time.monotonic()) > 0:
+                # Slots may also be freed by decay or by another server process, so
+                # don't wait on this process's notifications for longer than the
+                # client would otherwise have waited between retries
+                await waiter.wait(
+                    min(
+                        max(
+                            retry_after,
+                            models.concurrency_limits_v2.MINIMUM_OCCUPANCY_SECONDS_PER_SLOT,
+                        ),
+                        remaining,
+                    )
+                )
+
+                acquired, limits = await _try_increment_active_slots(
+                    db,
+                    slots=slots,
+                    names=names,
+                    mode=mode,
+                    create_if_missing=create_if_missing,
+                )
+                if acquired:
+                    waiter.acquired = True
+                    return _minimal_responses(limits)
+
+                active_limits = [limit for limit in limits if bool(limit.active)]
+                retry_after = _retry_after(active_limits, slots)
+
+    raise HTTPException(
+        status_code=status.HTTP_423_LOCKED,
+        headers={
+            "Retry-After": str(retry_after),
+        },
+    )
+
+
+async def _try_increment_active_slots(
+    db: PrefectDBInterface,
+    slots: int,
+    names: List[str],
+    mode: Literal["concurrency", "rate_limit"],
+    create_if_missing: Optional[bool],
+) -> Tuple[bool, List[schemas.core.ConcurrencyLimitV2]]:
     async with db.session_context(begin_transaction=True) as session:
         limits = [
             schemas.core.ConcurrencyLimitV2.model_validate(limit)
@@ -194,44 +276,39 @@ async def bulk_increment_active_slots(
         if not acquired:
             await session.rollback()
 
-    if acquired:
-        return [
-            MinimalConcurrencyLimitResponse(
-                id=limit.id, name=str(limit.name), limit=limit.limit
-            )
-            for limit in limits
-        ]
-    else:
-        async with db.session_context(begin_transaction=True) as session:
-            await models.concurrency_limits_v2.bulk_update_denied_slots(
-                session=session,
-                concurrency_limit_ids=[limit.id for limit in active_limits],
-                slots=slots,
-            )
+    return acquired, limits
 
-        def num_blocking_slots(limit: schemas.core.ConcurrencyLimitV2) -> float:
-            if limit.slot_decay_per_second > 0.0:
-                return slots + limit.denied_slots
-            else:
-                return (slots + limit.denied_slots) / limit.limit
 
-        blocking_limit = max((limit for limit in active_limits), key=num_blocking_slots)
-        blocking_slots = num_blocking_slots(blocking_limit)
+def _retry_after(
+    active_limits: List[schemas.core.ConcurrencyLimitV2], slots: int
+) -> float:
+    def num_blocking_slots(limit: schemas.core.ConcurrencyLimitV2) -> float:
+        if limit.slot_decay_per_second > 0.0:
+            return slots + limit.denied_slots
+        else:
+            return (slots + limit.denied_slots) / limit.limit
 
-        wait_time_per_slot = (
-            blocking_limit.avg_slot_occupancy_seconds
-            if blocking_limit.slot_decay_per_second == 0.0
-            else (1.0 / blocking_limit.slot_decay_per_second)
-        )
+    blocking_limit = max((limit for limit in active_limits), key=num_blocking_slots)
+    blocking_slots = num_blocking_slots(blocking_limit)
 
-        retry_after = wait_time_per_slot * blocking_slots
+    wait_time_per_slot = (
+        blocking_limit.avg_slot_occupancy_seconds
+        if blocking_limit.slot_decay_per_second == 0.0
+        else (1.0 / blocking_limit.slot_decay_per_second)
+    )
 
-        raise HTTPException(
-            status_code=status.HTTP_423_LOCKED,
-            headers={
-                "Retry-After": str(retry_after),
-            },
+    return wait_time_per_slot * blocking_slots
+
+
+def _minimal_responses(
+    limits: List[schemas.core.ConcurrencyLimitV2],
+) -> List[MinimalConcurrencyLimitResponse]:
+    return [
+        MinimalConcurrencyLimitResponse(
+            id=limit.id, name=str(limit.name), limit=limit.limit
         )
+        for limit in limits
+    ]
 
 
 @router.post("/decrement", status_code=status.HTTP_200_OK)
@@ -259,9 +336,9 @@ async def bulk_decrement_active_slots(
             occupancy_seconds=occupancy_seconds,
         )
 
-    return [
-        MinimalConcurrencyLimitResponse(
-            id=limit.id, name=str(limit.name), limit=limit.limit
-        )
-        for limit in limits
-    ]
+    # Wake the requests that have been waiting longest for the slots just released
+    ConcurrencySlotWaiters.notify(
+        [limit.id for limit in limits if bool(limit.active)], slots
+    )
+
+    return _minimal_responses(limits)
@@ -5,6 +5,7 @@ from fastapi import Response, WebSocket, status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends, Path
 from fastapi.params import Body, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.status import WS_1002_PROTOCOL_ERROR
@@ -39,6 +40,12 @@ logger = get_logger(__name__)
 
 router = PrefectRouter(prefix="/events", tags=["Events"])
 
+# Clients that offer this websocket subprotocol may send several events in one frame,
+# as a JSON array
+EVENT_BATCHES_SUBPROTOCOL = "prefect-event-batches"
+
+_event_batch_adapter: TypeAdapter[List[Event]] = TypeAdapter(List[Event])
+
 
 @router.post("", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
 async def create_events(
@@ -57,13 +64,20 @@ async def create_events(
 async def stream_events_in(websocket: WebSocket) -> None:
     """Open a WebSocket to stream incoming Events"""
 
-    await websocket.accept()
+    offered = websocket.scope.get("subprotocols", [])
+    batches = EVENT_BATCHES_SUBPROTOCOL in offered
+    await websocket.accept(subprotocol=EVENT_BATCHES_SUBPROTOCOL if batches else None)
 
     try:
         async with messaging.create_event_publisher() as publisher:
-            async for event_json in websocket.iter_text():
-                event = Event.model_validate_json(event_json)
-                await publisher.publish_event(event.receive())
+            async for frame in websocket.iter_text():
+                if batches and frame.lstrip().startswith("["):
+                    events = _event_batch_adapter.validate_json(frame)
+                else:
+                    events = [Event.model_validate_json(frame)]
+
+                for event in events:
+                    await publisher.publish_event(event.receive())
     except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:  # pragma: no cover
         pass  # it's fine if a client disconnects either normally or abnormally
 
@@ -5,15 +5,31 @@ Routes for interacting with log objects.
 from typing import List
 
 from fastapi import Body, Depends, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from starlette.requests import Request
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database import PrefectDBInterface, provide_database_interface
+from prefect.server.log_writer import LogWriter
 from prefect.server.utilities.server import PrefectRouter
 
 router = PrefectRouter(prefix="/logs", tags=["Logs"])
 
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+_log_batch_adapter: TypeAdapter[List[schemas.actions.LogCreate]] = TypeAdapter(
+    List[schemas.actions.LogCreate]
+)
+
+_log_batch_schema = {
+    "type": "array",
+    "items": {"$ref": "#/components/schemas/LogCreate"},
+    "title": "Logs",
+}
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_logs(
@@ -26,6 +42,44 @@ async def create_logs(
             await models.logs.create_logs(session=session, logs=batch)
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_CONTENT_TYPE: {
+                    "schema": {"$ref": "#/components/schemas/LogCreate"}
+                },
+                "application/json": {"schema": _log_batch_schema},
+            },
+        }
+    },
+)
+async def create_logs_in_bulk(request: Request) -> None:
+    """
+    Accept logs to be written to the database in the background.
+
+    Logs are sent either as newline-delimited JSON (`application/x-ndjson`), one log
+    per line, or as a JSON array.  The request returns as soon as the logs are
+    validated, unless too many logs are already waiting to be written, in which case
+    it waits for some of them to be written first.
+    """
+    body = await request.body()
+    if request.headers.get("content-type", "").startswith(NDJSON_CONTENT_TYPE):
+        body = b"[" + b",".join(line for line in body.splitlines() if line) + b"]"
+
+    try:
+        logs = _log_batch_adapter.validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+        )
+
+    await LogWriter.instance().put(logs)
+
+
 @router.post("/filter")
 async def read_logs(
     limit: int = dependencies.LimitBody(),
@@ -52,6 +52,7 @@ from prefect.server.events.services.actions import Actions
 from prefect.server.events.services.event_persister import EventPersister
 from prefect.server.events.services.triggers import ProactiveTriggers, ReactiveTriggers
 from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.log_writer import LogWriter
 from prefect.server.services.task_run_recorder import TaskRunRecorder
 from prefect.server.utilities.database import get_dialect
 from prefect.settings import (
@@ -611,9 +612,10 @@ def create_app(
         # don't run services in ephemeral mode
         if not ephemeral:
             if prefect.settings.PREFECT_API_SERVICES_SCHEDULER_ENABLED.value():
-                service_instances.append(services.scheduler.Scheduler())
+                scheduler = services.scheduler.Scheduler()
+                service_instances.append(scheduler)
                 service_instances.append(
-                    services.scheduler.RecentDeploymentsScheduler()
+                    services.scheduler.RecentDeploymentsScheduler(scheduler=scheduler)
                 )
 
             if prefect.settings.PREFECT_API_SERVICES_LATE_RUNS_ENABLED.value():
@@ -673,6 +675,7 @@ def create_app(
                 yield
             finally:
                 await stop_services()
+                await LogWriter.shutdown()
         else:
             yield
 
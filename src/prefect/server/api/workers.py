@@ -2,6 +2,7 @@
 Routes for interacting with work queue objects.
 """
 
+import time
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID, uuid4
 
@@ -30,6 +31,8 @@ from prefect.server.models.work_queues import (
 from prefect.server.models.workers import emit_work_pool_status_event
 from prefect.server.schemas.statuses import WorkQueueStatus
 from prefect.server.utilities.server import PrefectRouter
+from prefect.server.work_queue_waiters import WorkQueueWaiters
+from prefect.settings import PREFECT_SERVER_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS
 from prefect.types import DateTime
 
 if TYPE_CHECKING:
@@ -330,12 +333,27 @@ async def get_scheduled_flow_runs(
         None, description="The minimum time to look for scheduled flow runs"
     ),
     limit: int = dependencies.LimitBody(),
+    wait_seconds: Optional[float] = Body(
+        None,
+        ge=0.0,
+        description=(
+            "How long to wait for flow runs to be scheduled when there are none to "
+            "return. While waiting, `scheduled_before` moves forward with the clock. "
+            "Capped by the server's "
+            "`PREFECT_SERVER_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS` setting."
+        ),
+    ),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.WorkerFlowRunResponse]:
     """
     Load scheduled runs for a worker
     """
+    deadline = time.monotonic() + min(
+        wait_seconds or 0.0,
+        PREFECT_SERVER_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS.value(),
+    )
+
     async with db.session_context() as session:
         work_pool_id = await worker_lookups._get_work_pool_id_from_name(
             session=session, work_pool_name=work_pool_name
@@ -361,15 +379,45 @@ async def get_scheduled_flow_runs(
             ]
             work_queue_ids = [wq.id for wq in work_queues]
 
-    async with db.session_context(begin_transaction=True) as session:
-        queue_response = await models.workers.get_scheduled_flow_runs(
-            session=session,
-            work_pool_ids=[work_pool_id],
-            work_queue_ids=work_queue_ids,
-            scheduled_before=scheduled_before,
-            scheduled_after=scheduled_after,
-            limit=limit,
-        )
+    # Start waiting on the queues before looking for runs, so that runs scheduled in
+    # between still wake this request
+    with WorkQueueWaiters.waiting([wq.id for wq in work_queues]) as waiter:
+        started = pendulum.now("UTC")
+        window = scheduled_before
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                queue_response = await models.workers.get_scheduled_flow_runs(
+                    session=session,
+                    work_pool_ids=[work_pool_id],
+                    work_queue_ids=work_queue_ids,
+                    scheduled_before=window,
+                    scheduled_after=scheduled_after,
+                    limit=limit,
+                )
+                if queue_response or (remaining := deadline - time.monotonic()) <= 0:
+                    break
+
+                # Runs also become due as `scheduled_before` moves forward, which
+                # doesn't wake this request, so wait no longer than until the next one
+                # does. Runs scheduled by other server processes or let through by
+                # changes to concurrency limits are found by the worker's next poll.
+                if window is not None:
+                    next_start_time = (
+                        await models.workers.read_next_scheduled_start_time(
+                            session=session,
+                            work_pool_id=work_pool_id,
+                            work_queue_ids=work_queue_ids,
+                            scheduled_after=window,
+                        )
+                    )
+                    if next_start_time:
+                        remaining = min(
+                            remaining, (next_start_time - window).total_seconds()
+                        )
+
+            await waiter.wait(remaining)
+            if window is not None:
+                window = scheduled_before + (pendulum.now("UTC") - started)
 
     background_tasks.add_task(
         mark_work_queues_ready,
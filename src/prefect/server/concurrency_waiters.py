@@ -0,0 +1,103 @@
+"""
+Implements in-memory, first-come-first-served queues of requests that are waiting for
+slots of global concurrency limits to be released.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Generator, Iterable, List
+from uuid import UUID
+
+
+class SlotWaiter:
+    """A single request waiting for slots on one or more concurrency limits"""
+
+    def __init__(self, limit_ids: Iterable[UUID], slots: int):
+        self.limit_ids: List[UUID] = list(limit_ids)
+        self.slots = slots
+        self.acquired = False
+        self.was_woken = False
+        self._woken = asyncio.Event()
+
+    @property
+    def woken(self) -> bool:
+        return self._woken.is_set()
+
+    def wake(self) -> None:
+        self.was_woken = True
+        self._woken.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Waits until this waiter is woken or the timeout passes, returning whether
+        it was woken"""
+        try:
+            await asyncio.wait_for(self._woken.wait(), timeout=max(timeout, 0.0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._woken.clear()
+
+
+class ConcurrencySlotWaiters:
+    _queues: Dict[UUID, Deque[SlotWaiter]] = {}
+
+    @classmethod
+    def reset(cls) -> None:
+        """A unit testing utility to reset the state of the waiting queues"""
+        cls._queues.clear()
+
+    @classmethod
+    def waiting_on(cls, limit_id: UUID) -> int:
+        """The number of requests waiting on the given concurrency limit"""
+        return len(cls._queues.get(limit_id, ()))
+
+    @classmethod
+    @contextmanager
+    def waiting(
+        cls, limit_ids: Iterable[UUID], slots: int
+    ) -> Generator[SlotWaiter, None, None]:
+        """Places a waiter at the back of the queue of each of the given limits for as
+        long as the context is open.  The waiter keeps its place in line across
+        repeated waits, so that the requests that have waited longest are woken
+        first."""
+        waiter = SlotWaiter(limit_ids, slots)
+        for limit_id in waiter.limit_ids:
+            cls._queues.setdefault(limit_id, deque()).append(waiter)
+
+        try:
+            yield waiter
+        finally:
+            for limit_id in waiter.limit_ids:
+                queue = cls._queues.get(limit_id)
+                if queue is None:
+                    continue
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+                if not queue:
+                    del cls._queues[limit_id]
+
+            # If this waiter was woken for slots it never took, pass them along to the
+            # next waiters in line so they aren't left waiting for their timeouts
+            if waiter.was_woken and not waiter.acquired:
+                cls.notify(waiter.limit_ids, waiter.slots)
+
+    @classmethod
+    def notify(cls, limit_ids: Iterable[UUID], slots: int) -> None:
+        """Wakes the waiters at the front of the queues of the given limits, enough of
+        them to take up the given number of released slots."""
+        for limit_id in limit_ids:
+            queue = cls._queues.get(limit_id)
+            if not queue:
+                continue
+
+            remaining = slots
+            for waiter in queue:
+                if remaining <= 0:
+                    break
+                if not waiter.woken:
+                    waiter.wake()
+                remaining -= waiter.slots
@@ -0,0 +1,33 @@
+"""Add `scheduled_through` to `DeploymentSchedule`
+
+Revision ID: a6357b5072c9
+Revises: 5d03c01be85e
+Create Date: 2024-12-16 10:15:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "a6357b5072c9"
+down_revision = "5d03c01be85e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "deployment_schedule",
+        sa.Column(
+            "scheduled_through",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("deployment_schedule", "scheduled_through")
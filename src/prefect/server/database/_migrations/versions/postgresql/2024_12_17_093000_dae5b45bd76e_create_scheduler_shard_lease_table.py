@@ -0,0 +1,64 @@
+"""Create `scheduler_shard_lease` table
+
+Revision ID: dae5b45bd76e
+Revises: a6357b5072c9
+Create Date: 2024-12-17 09:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "dae5b45bd76e"
+down_revision = "a6357b5072c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "scheduler_shard_lease",
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column(
+            "expiration",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_scheduler_shard_lease")),
+        sa.UniqueConstraint("shard", name=op.f("uq_scheduler_shard_lease__shard")),
+    )
+    op.create_index(
+        op.f("ix_scheduler_shard_lease__updated"),
+        "scheduler_shard_lease",
+        ["updated"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_scheduler_shard_lease__updated"), table_name="scheduler_shard_lease"
+    )
+    op.drop_table("scheduler_shard_lease")
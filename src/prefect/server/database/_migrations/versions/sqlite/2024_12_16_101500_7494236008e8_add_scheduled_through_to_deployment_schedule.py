@@ -0,0 +1,34 @@
+"""Add `scheduled_through` to `DeploymentSchedule`
+
+Revision ID: 7494236008e8
+Revises: a49711513ad4
+Create Date: 2024-12-16 10:15:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "7494236008e8"
+down_revision = "a49711513ad4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("deployment_schedule", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "scheduled_through",
+                prefect.server.utilities.database.Timestamp(timezone=True),
+                nullable=True,
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("deployment_schedule", schema=None) as batch_op:
+        batch_op.drop_column("scheduled_through")
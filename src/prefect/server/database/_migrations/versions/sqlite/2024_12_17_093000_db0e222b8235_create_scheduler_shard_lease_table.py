@@ -0,0 +1,64 @@
+"""Create `scheduler_shard_lease` table
+
+Revision ID: db0e222b8235
+Revises: 7494236008e8
+Create Date: 2024-12-17 09:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "db0e222b8235"
+down_revision = "7494236008e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "scheduler_shard_lease",
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column(
+            "expiration",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_scheduler_shard_lease")),
+        sa.UniqueConstraint("shard", name=op.f("uq_scheduler_shard_lease__shard")),
+    )
+    with op.batch_alter_table("scheduler_shard_lease", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_scheduler_shard_lease__updated"), ["updated"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("scheduler_shard_lease", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_scheduler_shard_lease__updated"))
+
+    op.drop_table("scheduler_shard_lease")
@@ -231,6 +231,11 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A csrf token model"""
         return orm_models.CsrfToken
 
+    @property
+    def SchedulerShardLease(self) -> type[orm_models.SchedulerShardLease]:
+        """A scheduler shard lease model"""
+        return orm_models.SchedulerShardLease
+
     @property
     def WorkQueue(self) -> type[orm_models.WorkQueue]:
         """A work queue model"""
@@ -785,6 +785,10 @@ class DeploymentSchedule(Base):
     active: Mapped[bool] = mapped_column(default=True)
     max_scheduled_runs: Mapped[Optional[int]]
 
+    # the time through which flow runs have been scheduled for this schedule; reset
+    # whenever the schedule or its deployment's scheduled runs change
+    scheduled_through: Mapped[Optional[pendulum.DateTime]]
+
 
 class Deployment(Base):
     """SQLAlchemy model of a deployment."""
@@ -1248,6 +1252,16 @@ class CsrfToken(Base):
     expiration: Mapped[pendulum.DateTime]
 
 
+class SchedulerShardLease(Base):
+    """
+    SQLAlchemy model of a scheduler replica's claim on a shard of deployments.
+    """
+
+    shard: Mapped[int] = mapped_column(unique=True)
+    holder: Mapped[str]
+    expiration: Mapped[pendulum.DateTime]
+
+
 class Automation(Base):
     name: Mapped[str]
     description: Mapped[str] = mapped_column(default="")
@@ -4,25 +4,23 @@ maintains a buffer of events to be processed, aiming to process them in the orde
 occurred causally.
 """
 
-from collections import defaultdict
+import abc
+import importlib
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import (
     List,
-    Mapping,
-    MutableMapping,
     Protocol,
     Union,
+    runtime_checkable,
 )
 from uuid import UUID
 
 import pendulum
-import sqlalchemy as sa
-from cachetools import TTLCache
 
 from prefect.logging import get_logger
-from prefect.server.database import PrefectDBInterface, db_injector
 from prefect.server.events.schemas.events import Event, ReceivedEvent
+from prefect.settings import PREFECT_SERVER_EVENTS_CAUSAL_ORDERING
 
 logger = get_logger(__name__)
 
@@ -54,93 +52,35 @@ class event_handler(Protocol):
         ...  # pragma: no cover
 
 
-class CausalOrdering:
-    _seen_events: Mapping[str, MutableMapping[UUID, bool]] = defaultdict(
-        lambda: TTLCache(maxsize=10000, ttl=SEEN_EXPIRATION.total_seconds())
-    )
-
+class CausalOrdering(abc.ABC):
     scope: str
 
     def __init__(self, scope: str):
         self.scope = scope
 
+    @abc.abstractmethod
     async def event_has_been_seen(self, event: Union[UUID, Event]) -> bool:
-        id = event.id if isinstance(event, Event) else event
-        return self._seen_events[self.scope].get(id, False)
+        """Has this event been processed in this scope recently?"""
 
+    @abc.abstractmethod
     async def record_event_as_seen(self, event: ReceivedEvent) -> None:
-        self._seen_events[self.scope][event.id] = True
+        """Remember that this event has been processed in this scope"""
 
-    @db_injector
-    async def record_follower(
-        self, db: PrefectDBInterface, event: ReceivedEvent
-    ) -> None:
+    @abc.abstractmethod
+    async def record_follower(self, event: ReceivedEvent) -> None:
         """Remember that this event is waiting on another event to arrive"""
-        assert event.follows
-
-        async with db.session_context(begin_transaction=True) as session:
-            await session.execute(
-                sa.insert(db.AutomationEventFollower).values(
-                    scope=self.scope,
-                    leader_event_id=event.follows,
-                    follower_event_id=event.id,
-                    received=event.received,
-                    follower=event,
-                )
-            )
 
-    @db_injector
-    async def forget_follower(
-        self, db: PrefectDBInterface, follower: ReceivedEvent
-    ) -> None:
+    @abc.abstractmethod
+    async def forget_follower(self, follower: ReceivedEvent) -> None:
         """Forget that this event is waiting on another event to arrive"""
-        assert follower.follows
-
-        async with db.session_context(begin_transaction=True) as session:
-            await session.execute(
-                sa.delete(db.AutomationEventFollower).where(
-                    db.AutomationEventFollower.scope == self.scope,
-                    db.AutomationEventFollower.follower_event_id == follower.id,
-                )
-            )
 
-    @db_injector
-    async def get_followers(
-        self, db: PrefectDBInterface, leader: ReceivedEvent
-    ) -> List[ReceivedEvent]:
+    @abc.abstractmethod
+    async def get_followers(self, leader: ReceivedEvent) -> List[ReceivedEvent]:
         """Returns events that were waiting on this leader event to arrive"""
-        async with db.session_context() as session:
-            query = sa.select(db.AutomationEventFollower.follower).where(
-                db.AutomationEventFollower.scope == self.scope,
-                db.AutomationEventFollower.leader_event_id == leader.id,
-            )
-            result = await session.execute(query)
-            followers = result.scalars().all()
-            return sorted(followers, key=lambda e: e.occurred)
 
-    @db_injector
-    async def get_lost_followers(self, db: PrefectDBInterface) -> List[ReceivedEvent]:
+    @abc.abstractmethod
+    async def get_lost_followers(self) -> List[ReceivedEvent]:
         """Returns events that were waiting on a leader event that never arrived"""
-        earlier = pendulum.now("UTC") - PRECEDING_EVENT_LOOKBACK
-
-        async with db.session_context(begin_transaction=True) as session:
-            query = sa.select(db.AutomationEventFollower.follower).where(
-                db.AutomationEventFollower.scope == self.scope,
-                db.AutomationEventFollower.received < earlier,
-            )
-            result = await session.execute(query)
-            followers = result.scalars().all()
-
-            # forget these followers, since they are never going to see their leader event
-
-            await session.execute(
-                sa.delete(db.AutomationEventFollower).where(
-                    db.AutomationEventFollower.scope == self.scope,
-                    db.AutomationEventFollower.received < earlier,
-                )
-            )
-
-            return sorted(followers, key=lambda e: e.occurred)
 
     @asynccontextmanager
     async def preceding_event_confirmed(
@@ -203,3 +143,24 @@ class CausalOrdering:
         # that it has been processed
         if event.follows:
             await self.forget_follower(event)
+
+
+@runtime_checkable
+class CausalOrderingModule(Protocol):
+    CausalOrdering: type[CausalOrdering]
+
+
+def get_causal_ordering(scope: str) -> CausalOrdering:
+    """
+    Creates the causal ordering for the given scope with the application's default
+    settings.
+
+    Args:
+        scope: the name that separates this consumer's ordering from others
+
+    Returns:
+        a new CausalOrdering instance
+    """
+    module = importlib.import_module(PREFECT_SERVER_EVENTS_CAUSAL_ORDERING.value())
+    assert isinstance(module, CausalOrderingModule)
+    return module.CausalOrdering(scope=scope)
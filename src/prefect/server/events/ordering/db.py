@@ -0,0 +1,104 @@
+"""
+A causal ordering that keeps the events it is holding back in the database, where they
+survive restarts of the server.
+"""
+
+from collections import defaultdict
+from typing import List, Mapping, MutableMapping, Union
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from cachetools import TTLCache
+
+from prefect.server.database import PrefectDBInterface, db_injector
+from prefect.server.events.ordering import (
+    PRECEDING_EVENT_LOOKBACK,
+    SEEN_EXPIRATION,
+)
+from prefect.server.events.ordering import CausalOrdering as _CausalOrdering
+from prefect.server.events.schemas.events import Event, ReceivedEvent
+
+
+class CausalOrdering(_CausalOrdering):
+    _seen_events: Mapping[str, MutableMapping[UUID, bool]] = defaultdict(
+        lambda: TTLCache(maxsize=10000, ttl=SEEN_EXPIRATION.total_seconds())
+    )
+
+    async def event_has_been_seen(self, event: Union[UUID, Event]) -> bool:
+        id = event.id if isinstance(event, Event) else event
+        return self._seen_events[self.scope].get(id, False)
+
+    async def record_event_as_seen(self, event: ReceivedEvent) -> None:
+        self._seen_events[self.scope][event.id] = True
+
+    @db_injector
+    async def record_follower(
+        self, db: PrefectDBInterface, event: ReceivedEvent
+    ) -> None:
+        """Remember that this event is waiting on another event to arrive"""
+        assert event.follows
+
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.insert(db.AutomationEventFollower).values(
+                    scope=self.scope,
+                    leader_event_id=event.follows,
+                    follower_event_id=event.id,
+                    received=event.received,
+                    follower=event,
+                )
+            )
+
+    @db_injector
+    async def forget_follower(
+        self, db: PrefectDBInterface, follower: ReceivedEvent
+    ) -> None:
+        """Forget that this event is waiting on another event to arrive"""
+        assert follower.follows
+
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.delete(db.AutomationEventFollower).where(
+                    db.AutomationEventFollower.scope == self.scope,
+                    db.AutomationEventFollower.follower_event_id == follower.id,
+                )
+            )
+
+    @db_injector
+    async def get_followers(
+        self, db: PrefectDBInterface, leader: ReceivedEvent
+    ) -> List[ReceivedEvent]:
+        """Returns events that were waiting on this leader event to arrive"""
+        async with db.session_context() as session:
+            query = sa.select(db.AutomationEventFollower.follower).where(
+                db.AutomationEventFollower.scope == self.scope,
+                db.AutomationEventFollower.leader_event_id == leader.id,
+            )
+            result = await session.execute(query)
+            followers = result.scalars().all()
+            return sorted(followers, key=lambda e: e.occurred)
+
+    @db_injector
+    async def get_lost_followers(self, db: PrefectDBInterface) -> List[ReceivedEvent]:
+        """Returns events that were waiting on a leader event that never arrived"""
+        earlier = pendulum.now("UTC") - PRECEDING_EVENT_LOOKBACK
+
+        async with db.session_context(begin_transaction=True) as session:
+            query = sa.select(db.AutomationEventFollower.follower).where(
+                db.AutomationEventFollower.scope == self.scope,
+                db.AutomationEventFollower.received < earlier,
+            )
+            result = await session.execute(query)
+            followers = result.scalars().all()
+
+            # forget these followers, since they are never going to see their leader event
+
+            await session.execute(
+                sa.delete(db.AutomationEventFollower).where(
+                    db.AutomationEventFollower.scope == self.scope,
+                    db.AutomationEventFollower.received < earlier,
+                )
+            )
+
+            return sorted(followers, key=lambda e: e.occurred)
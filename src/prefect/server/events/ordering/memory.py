@@ -0,0 +1,202 @@
+"""
+A causal ordering that keeps the events it has seen and the events it is holding back
+in memory, so that ordering events costs no database round trips.  Held back events are
+only written to the database once there are more than `MAX_FOLLOWERS_IN_MEMORY` of
+them in a scope.
+
+Events held back in memory are lost if the server stops, and are not seen by other
+server processes, so this ordering is only suitable for a single server process.
+"""
+
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+from typing import Deque, Dict, List, Set, Tuple, Union
+from uuid import UUID
+
+import pendulum
+
+from prefect.logging import get_logger
+from prefect.server.events.ordering import (
+    PRECEDING_EVENT_LOOKBACK,
+    SEEN_EXPIRATION,
+    db,
+)
+from prefect.server.events.ordering import CausalOrdering as _CausalOrdering
+from prefect.server.events.schemas.events import Event, ReceivedEvent
+
+logger = get_logger(__name__)
+
+# How much time each partition of the seen events covers
+SEEN_PARTITION_DURATION = timedelta(minutes=1)
+
+# How many seen events we'll remember per scope before forgetting the oldest early
+MAX_SEEN_EVENTS = 1_000_000
+
+# How many followers we'll hold in memory per scope before writing them to the database
+MAX_FOLLOWERS_IN_MEMORY = 10_000
+
+
+class SeenEvents:
+    """Remembers event IDs for at least `SEEN_EXPIRATION`.  IDs are kept in partitions
+    of `SEEN_PARTITION_DURATION`, so that they expire a partition at a time rather than
+    one by one, and the oldest partitions are only forgotten early if there are more
+    than `max_size` IDs in total."""
+
+    def __init__(self, max_size: int = MAX_SEEN_EVENTS):
+        self.max_size = max_size
+        self._partitions: Deque[Tuple[float, Set[UUID]]] = deque()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, id: UUID) -> bool:
+        self._expire(time.monotonic())
+        return any(id in partition for _, partition in reversed(self._partitions))
+
+    def add(self, id: UUID) -> None:
+        now = time.monotonic()
+        self._expire(now)
+
+        if (
+            not self._partitions
+            or now - self._partitions[-1][0] >= SEEN_PARTITION_DURATION.total_seconds()
+        ):
+            self._partitions.append((now, set()))
+
+        partition = self._partitions[-1][1]
+        if id not in partition:
+            partition.add(id)
+            self._size += 1
+
+        while self._size > self.max_size and len(self._partitions) > 1:
+            _, forgotten = self._partitions.popleft()
+            self._size -= len(forgotten)
+            logger.warning(
+                "Forgetting %s seen events early to stay under %s",
+                len(forgotten),
+                self.max_size,
+            )
+
+    def _expire(self, now: float) -> None:
+        horizon = (
+            now
+            - SEEN_EXPIRATION.total_seconds()
+            - SEEN_PARTITION_DURATION.total_seconds()
+        )
+        while self._partitions and self._partitions[0][0] < horizon:
+            _, expired = self._partitions.popleft()
+            self._size -= len(expired)
+
+
+class CausalOrdering(_CausalOrdering):
+    _seen_events: Dict[str, SeenEvents] = defaultdict(SeenEvents)
+
+    # followers held in memory, by their ID and by the ID of the event they follow
+    _followers: Dict[str, Dict[UUID, ReceivedEvent]] = defaultdict(dict)
+    _waitlist: Dict[str, Dict[UUID, Set[UUID]]] = defaultdict(lambda: defaultdict(set))
+
+    # followers written to the database, by their ID and by the ID of the event they
+    # follow, so that we only go to the database for the events that need it
+    _spilled_followers: Dict[str, Dict[UUID, UUID]] = defaultdict(dict)
+    _spilled_waitlist: Dict[str, Dict[UUID, Set[UUID]]] = defaultdict(
+        lambda: defaultdict(set)
+    )
+
+    def __init__(self, scope: str):
+        super().__init__(scope)
+        self._database = db.CausalOrdering(scope)
+
+    @classmethod
+    def forget_everything(cls) -> None:
+        """Clears the in-memory state of every scope"""
+        for state in (
+            cls._seen_events,
+            cls._followers,
+            cls._waitlist,
+            cls._spilled_followers,
+            cls._spilled_waitlist,
+        ):
+            state.clear()
+
+    async def event_has_been_seen(self, event: Union[UUID, Event]) -> bool:
+        id = event.id if isinstance(event, Event) else event
+        return id in self._seen_events[self.scope]
+
+    async def record_event_as_seen(self, event: ReceivedEvent) -> None:
+        self._seen_events[self.scope].add(event.id)
+
+    async def record_follower(self, event: ReceivedEvent) -> None:
+        """Remember that this event is waiting on another event to arrive"""
+        assert event.follows
+
+        followers = self._followers[self.scope]
+        if len(followers) < MAX_FOLLOWERS_IN_MEMORY:
+            followers[event.id] = event
+            self._waitlist[self.scope][event.follows].add(event.id)
+            return
+
+        await self._database.record_follower(event)
+        self._spilled_followers[self.scope][event.id] = event.follows
+        self._spilled_waitlist[self.scope][event.follows].add(event.id)
+
+    async def forget_follower(self, follower: ReceivedEvent) -> None:
+        """Forget that this event is waiting on another event to arrive"""
+        assert follower.follows
+
+        if self._followers[self.scope].pop(follower.id, None):
+            self._remove_from(self._waitlist, follower.follows, follower.id)
+
+        if leader_id := self._spilled_followers[self.scope].pop(follower.id, None):
+            self._remove_from(self._spilled_waitlist, leader_id, follower.id)
+            await self._database.forget_follower(follower)
+
+    async def get_followers(self, leader: ReceivedEvent) -> List[ReceivedEvent]:
+        """Returns events that were waiting on this leader event to arrive"""
+        followers = self._followers[self.scope]
+        waiting = [
+            followers[id] for id in self._waitlist[self.scope].get(leader.id, ())
+        ]
+
+        if leader.id in self._spilled_waitlist[self.scope]:
+            waiting += await self._database.get_followers(leader)
+
+        return sorted(waiting, key=lambda e: e.occurred)
+
+    async def get_lost_followers(self) -> List[ReceivedEvent]:
+        """Returns events that were waiting on a leader event that never arrived"""
+        earlier = pendulum.now("UTC") - PRECEDING_EVENT_LOOKBACK
+
+        followers = self._followers[self.scope]
+        lost = [
+            follower for follower in followers.values() if follower.received < earlier
+        ]
+
+        # forget these followers, since they are never going to see their leader event
+        for follower in lost:
+            del followers[follower.id]
+            assert follower.follows
+            self._remove_from(self._waitlist, follower.follows, follower.id)
+
+        # this also picks up followers held back by previous runs of the server
+        for follower in await self._database.get_lost_followers():
+            if leader_id := self._spilled_followers[self.scope].pop(follower.id, None):
+                self._remove_from(self._spilled_waitlist, leader_id, follower.id)
+            lost.append(follower)
+
+        return sorted(lost, key=lambda e: e.occurred)
+
+    def _remove_from(
+        self,
+        waitlists: Dict[str, Dict[UUID, Set[UUID]]],
+        leader_id: UUID,
+        follower_id: UUID,
+    ) -> None:
+        waitlist = waitlists[self.scope]
+        waiting = waitlist.get(leader_id)
+        if waiting is None:
+            return
+        waiting.discard(follower_id)
+        if not waiting:
+            del waitlist[leader_id]
@@ -4,12 +4,15 @@ storage as fast as it can.  Never gets tired.
 """
 
 import asyncio
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import AsyncGenerator, List, Optional
+from typing import AsyncGenerator, Deque, List, Optional, Set
 
 import pendulum
 import sqlalchemy as sa
+from prometheus_client import Counter, Gauge
 
 from prefect.logging import get_logger
 from prefect.server.database import provide_database_interface
@@ -20,10 +23,26 @@ from prefect.settings import (
     PREFECT_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE,
     PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL,
     PREFECT_EVENTS_RETENTION_PERIOD,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_CONCURRENCY,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE,
 )
 
 logger = get_logger(__name__)
 
+EVENT_PERSISTER_QUEUE_SIZE = Gauge(
+    "prefect_event_persister_queue_size",
+    "The number of received events waiting to be written to the database",
+)
+EVENT_PERSISTER_LAG = Gauge(
+    "prefect_event_persister_lag_seconds",
+    "The time between receiving and writing the oldest event of the last batch",
+)
+EVENTS_PERSISTED = Counter(
+    "prefect_event_persister_events_persisted",
+    "The number of events written to the database",
+)
+
 
 class EventPersister:
     """A service that persists events to the database as they arrive."""
@@ -54,6 +73,9 @@ class EventPersister:
             flush_every=timedelta(
                 seconds=PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL.value()
             ),
+            max_batch_size=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE.value(),
+            max_queue_size=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE.value(),
+            concurrency=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_CONCURRENCY.value(),
         ) as handler:
             self.consumer_task = asyncio.create_task(self.consumer.run(handler))
             logger.debug("Event persister started")
@@ -83,33 +105,72 @@ async def create_handler(
     batch_size: int = 20,
     flush_every: timedelta = timedelta(seconds=5),
     trim_every: timedelta = timedelta(minutes=15),
+    max_batch_size: int = 1000,
+    max_queue_size: int = 10_000,
+    concurrency: int = 1,
 ) -> AsyncGenerator[MessageHandler, None]:
     """
     Set up a message handler that will accumulate and send events to
     the database every `batch_size` messages, or every `flush_every` interval to flush
     any remaining messages
+
+    At most `max_queue_size` events are held at once; beyond that, the handler waits
+    for events to be written before accepting more, which holds back the consumer
+    from acknowledging further messages. Events are written in batches that grow
+    from `batch_size` up to `max_batch_size` while writes succeed promptly and
+    shrink when they fail or are slow. With a `concurrency` of one, the handler
+    writes events itself once a batch is full; otherwise up to `concurrency` batches
+    are written in the background at once.
     """
     db = provide_database_interface()
 
-    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue()
+    pending: Deque[ReceivedEvent] = deque()
+    has_space = asyncio.Event()
+    has_space.set()
+    writers = asyncio.Semaphore(concurrency)
+    background_flushes: Set[asyncio.Task[None]] = set()
+    current_batch_size = batch_size
 
     async def flush() -> None:
-        logger.debug(f"Persisting {queue.qsize()} events...")
-
-        batch: List[ReceivedEvent] = []
-
-        while queue.qsize() > 0:
-            batch.append(await queue.get())
-
-        try:
-            async with db.session_context() as session:
-                await write_events(session=session, events=batch)
-                await session.commit()
-                logger.debug("Finished persisting events.")
-        except Exception:
-            logger.debug("Error flushing events, restoring to queue", exc_info=True)
-            for event in batch:
-                queue.put_nowait(event)
+        nonlocal current_batch_size
+
+        async with writers:
+            while pending:
+                batch: List[ReceivedEvent] = [
+                    pending.popleft()
+                    for _ in range(min(len(pending), current_batch_size))
+                ]
+                EVENT_PERSISTER_QUEUE_SIZE.set(len(pending))
+                logger.debug(f"Persisting {len(batch)} events...")
+
+                started = time.monotonic()
+                try:
+                    async with db.session_context() as session:
+                        await write_events(session=session, events=batch)
+                        await session.commit()
+                        logger.debug("Finished persisting events.")
+                except Exception:
+                    logger.debug(
+                        "Error flushing events, restoring to queue", exc_info=True
+                    )
+                    pending.extendleft(reversed(batch))
+                    EVENT_PERSISTER_QUEUE_SIZE.set(len(pending))
+                    current_batch_size = max(current_batch_size // 2, 1)
+                    return
+
+                if time.monotonic() - started > flush_every.total_seconds():
+                    current_batch_size = max(current_batch_size // 2, 1)
+                else:
+                    current_batch_size = min(current_batch_size * 2, max_batch_size)
+
+                EVENTS_PERSISTED.inc(len(batch))
+                EVENT_PERSISTER_LAG.set(
+                    (
+                        pendulum.now("UTC") - min(event.received for event in batch)
+                    ).total_seconds()
+                )
+                if len(pending) < max_queue_size:
+                    has_space.set()
 
     async def trim() -> None:
         older_than = pendulum.now("UTC") - PREFECT_EVENTS_RETENTION_PERIOD.value()
@@ -131,7 +192,7 @@ async def create_handler(
         try:
             while True:
                 await asyncio.sleep(flush_every.total_seconds())
-                if queue.qsize():
+                if pending:
                     await flush()
         except asyncio.CancelledError:
             return
@@ -157,10 +218,21 @@ async def create_handler(
             event.resource.get("prefect.resource.id"),
         )
 
-        await queue.put(event)
+        # hold back the consumer until there is room for more events
+        while len(pending) >= max_queue_size:
+            has_space.clear()
+            await has_space.wait()
 
-        if queue.qsize() >= batch_size:
-            await flush()
+        pending.append(event)
+        EVENT_PERSISTER_QUEUE_SIZE.set(len(pending))
+
+        if len(pending) >= batch_size:
+            if concurrency == 1:
+                await flush()
+            elif len(background_flushes) < concurrency:
+                task = asyncio.create_task(flush())
+                background_flushes.add(task)
+                task.add_done_callback(background_flushes.discard)
 
     periodic_flush = asyncio.create_task(flush_periodically())
     periodic_trim = asyncio.create_task(trim_periodically())
@@ -170,5 +242,7 @@ async def create_handler(
     finally:
         periodic_flush.cancel()
         periodic_trim.cancel()
-        if queue.qsize():
+        if background_flushes:
+            await asyncio.gather(*background_flushes)
+        if pending:
             await flush()
@@ -53,4 +53,7 @@ class ProactiveTriggers(LoopService):
         )
 
     async def run_once(self):
+        # buckets are only written by the server running the reactive triggers
+        if not triggers.holds_bucket_writer_lock():
+            return
         await triggers.evaluate_proactive_triggers()
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING, Any, Generator, Optional, Sequence
+from uuid import UUID
 
 import pydantic
 import sqlalchemy as sa
@@ -20,7 +21,7 @@ from prefect.server.events.storage import (
     process_time_based_counts,
     to_page_token,
 )
-from prefect.server.utilities.database import get_dialect
+from prefect.server.utilities.database import copy_rows, get_dialect
 from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
 
 if TYPE_CHECKING:
@@ -247,6 +248,10 @@ async def _write_sqlite_events(
         await session.execute(db.queries.insert(db.EventResource).values(resource_rows))
 
 
+# a per-connection temporary table that batches of events are copied into
+_EVENTS_LOAD_TABLE = "events_load"
+
+
 @db_injector
 async def _write_postgres_events(
     db: PrefectDBInterface, session: AsyncSession, events: list[ReceivedEvent]
@@ -254,33 +259,60 @@ async def _write_postgres_events(
     """
     Write events to the Postgres database.
 
+    Events are copied into a temporary table with `COPY` and then inserted from
+    there, so that a batch of any size is loaded in a few statements rather than in
+    batches limited by the number of query parameters.
+
     Args:
         session: a Postgres events session
         events: the events to insert
     """
-    for batch in _in_safe_batches(events):
-        event_rows = [event.as_database_row() for event in batch]
-        result = await session.scalars(
-            db.queries.insert(db.Event)
-            .on_conflict_do_nothing()
-            .returning(db.Event.id)
-            .values(event_rows)
-        )
-        inserted_event_ids = set(result.all())
+    # an event may be delivered more than once within the same batch, but its
+    # resources must only be copied once
+    unique_events: dict[UUID, ReceivedEvent] = {}
+    for event in events:
+        unique_events.setdefault(event.id, event)
+    events = list(unique_events.values())
 
-        resource_rows: list[dict[str, Any]] = []
-        for event in batch:
-            if event.id not in inserted_event_ids:
-                # if the event wasn't inserted, this means the event was a duplicate, so
-                # we will skip adding its related resources, as they would have been
-                # inserted already
-                continue
-            resource_rows.extend(event.as_database_resource_rows())
+    event_rows = [event.as_database_row() for event in events]
+    event_columns = list(event_rows[0].keys())
 
-        if not resource_rows:
+    await session.execute(
+        sa.text(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {_EVENTS_LOAD_TABLE} "
+            f"(LIKE {db.Event.__tablename__} INCLUDING DEFAULTS)"
+        )
+    )
+    await copy_rows(session, db.Event.__table__, _EVENTS_LOAD_TABLE, event_rows)
+
+    load_table = sa.table(_EVENTS_LOAD_TABLE, *map(sa.column, event_columns))
+    result = await session.scalars(
+        db.queries.insert(db.Event)
+        .from_select(event_columns, sa.select(load_table))
+        .on_conflict_do_nothing()
+        .returning(db.Event.id)
+    )
+    inserted_event_ids = set(result.all())
+    await session.execute(sa.text(f"TRUNCATE {_EVENTS_LOAD_TABLE}"))
+
+    resource_rows: list[dict[str, Any]] = []
+    for event in events:
+        if event.id not in inserted_event_ids:
+            # if the event wasn't inserted, this means the event was a duplicate, so
+            # we will skip adding its related resources, as they would have been
+            # inserted already
             continue
+        resource_rows.extend(event.as_database_resource_rows())
 
-        await session.execute(db.queries.insert(db.EventResource).values(resource_rows))
+    if not resource_rows:
+        return
+
+    await copy_rows(
+        session,
+        db.EventResource.__table__,
+        db.EventResource.__tablename__,
+        resource_rows,
+    )
 
 
 def get_max_query_parameters() -> int:
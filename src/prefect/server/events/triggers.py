@@ -4,15 +4,19 @@ to act on them based on the automations that users have set up.
 """
 
 import asyncio
+from collections import Counter
 from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import timedelta
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
+    Callable,
     Collection,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
 )
 from uuid import UUID
@@ -24,7 +28,11 @@ from typing_extensions import Literal, TypeAlias
 
 from prefect._internal.retries import retry_async_fn
 from prefect.logging import get_logger
-from prefect.server.database import PrefectDBInterface, db_injector
+from prefect.server.database import (
+    PrefectDBInterface,
+    db_injector,
+    provide_database_interface,
+)
 from prefect.server.events import messaging
 from prefect.server.events.actions import ServerActionTypes
 from prefect.server.events.models.automations import (
@@ -41,6 +49,7 @@ from prefect.server.events.ordering import (
     PRECEDING_EVENT_LOOKBACK,
     CausalOrdering,
     EventArrivedEarly,
+    get_causal_ordering,
 )
 from prefect.server.events.schemas.automations import (
     Automation,
@@ -53,8 +62,13 @@ from prefect.server.events.schemas.automations import (
     TriggerState,
 )
 from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.storage.database import get_max_query_parameters
+from prefect.server.utilities.database import get_dialect
 from prefect.server.utilities.messaging import Message, MessageHandler
-from prefect.settings import PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER,
+)
 from prefect.types import DateTime
 
 if TYPE_CHECKING:
@@ -69,6 +83,12 @@ TriggerID: TypeAlias = UUID
 
 AUTOMATION_BUCKET_BATCH_SIZE = 500
 
+# The key of the PostgreSQL advisory lock held by the only process writing buckets
+BUCKET_WRITER_LOCK_KEY = 0x7472696767657273
+
+# How long to wait between attempts to take the bucket writer lock
+BUCKET_WRITER_LOCK_RETRY_SECONDS = 5.0
+
 
 async def evaluate(
     session: AsyncSession,
@@ -622,10 +642,164 @@ async def evaluate_periodically(periodic_granularity: timedelta):
             await asyncio.sleep(periodic_granularity.total_seconds())
 
 
+class PrefixIndex:
+    """Finds the triggers registered under any prefix of a given string"""
+
+    def __init__(self) -> None:
+        self._by_prefix: Dict[str, Set[TriggerID]] = {}
+        self._lengths: Counter[int] = Counter()
+
+    def add(self, prefix: str, trigger_id: TriggerID) -> None:
+        trigger_ids = self._by_prefix.setdefault(prefix, set())
+        if not trigger_ids:
+            self._lengths[len(prefix)] += 1
+        trigger_ids.add(trigger_id)
+
+    def remove(self, prefix: str, trigger_id: TriggerID) -> None:
+        trigger_ids = self._by_prefix.get(prefix)
+        if trigger_ids is None:
+            return
+        trigger_ids.discard(trigger_id)
+        if not trigger_ids:
+            del self._by_prefix[prefix]
+            self._lengths[len(prefix)] -= 1
+            if not self._lengths[len(prefix)]:
+                del self._lengths[len(prefix)]
+
+    def find(self, value: str) -> Set[TriggerID]:
+        # there are only as many lookups as distinct prefix lengths, however many
+        # triggers share them
+        found: Set[TriggerID] = set()
+        for length in self._lengths:
+            if length <= len(value) and (value[:length] in self._by_prefix):
+                found |= self._by_prefix[value[:length]]
+        return found
+
+
+class TriggerIndex:
+    """An index of the loaded event triggers by the event names and resources they
+    could match, used to narrow down the triggers that need to be checked against
+    each event.  The index may return triggers that don't cover an event, but never
+    misses one that does."""
+
+    def __init__(self) -> None:
+        self._order: Dict[TriggerID, int] = {}
+        self._next_order = 0
+
+        self._any_event: Set[TriggerID] = set()
+        self._event_prefixes = PrefixIndex()
+        self._event_keys: Dict[TriggerID, Set[str]] = {}
+
+        self._any_resource: Set[TriggerID] = set()
+        self._resource_values: Dict[Tuple[str, str], Set[TriggerID]] = {}
+        self._resource_prefixes: Dict[str, PrefixIndex] = {}
+        self._resource_labels: Counter[str] = Counter()
+        self._resource_keys: Dict[TriggerID, Tuple[str, List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, trigger: EventTrigger) -> None:
+        self.remove(trigger.id)
+
+        self._order[trigger.id] = self._next_order
+        self._next_order += 1
+
+        if not trigger.expect:
+            self._any_event.add(trigger.id)
+        else:
+            # The trigger's event pattern only needs to match the start of an event
+            # name, so the literal text before any wildcard is a prefix of every
+            # event it could match
+            prefixes = {
+                expected.split("*", 1)[0] for expected in trigger.expect | trigger.after
+            }
+            for prefix in prefixes:
+                self._event_prefixes.add(prefix, trigger.id)
+            self._event_keys[trigger.id] = prefixes
+
+        label_and_values = self._indexable_label(trigger)
+        if not label_and_values:
+            self._any_resource.add(trigger.id)
+            return
+
+        label, values = label_and_values
+        self._resource_labels[label] += 1
+        for value in values:
+            if value.endswith("*"):
+                self._resource_prefixes.setdefault(label, PrefixIndex()).add(
+                    value[:-1], trigger.id
+                )
+            else:
+                self._resource_values.setdefault((label, value), set()).add(trigger.id)
+        self._resource_keys[trigger.id] = label_and_values
+
+    def remove(self, trigger_id: TriggerID) -> None:
+        if self._order.pop(trigger_id, None) is None:
+            return
+
+        self._any_event.discard(trigger_id)
+        for prefix in self._event_keys.pop(trigger_id, ()):
+            self._event_prefixes.remove(prefix, trigger_id)
+
+        self._any_resource.discard(trigger_id)
+        if trigger_id not in self._resource_keys:
+            return
+
+        label, values = self._resource_keys.pop(trigger_id)
+        self._resource_labels[label] -= 1
+        if not self._resource_labels[label]:
+            del self._resource_labels[label]
+        for value in values:
+            if value.endswith("*"):
+                self._resource_prefixes[label].remove(value[:-1], trigger_id)
+            else:
+                trigger_ids = self._resource_values[(label, value)]
+                trigger_ids.discard(trigger_id)
+                if not trigger_ids:
+                    del self._resource_values[(label, value)]
+
+    def candidates(self, event: ReceivedEvent) -> List[TriggerID]:
+        """The triggers that may cover the given event, in the order they were
+        loaded"""
+        by_event = self._any_event | self._event_prefixes.find(event.event)
+        if not by_event:
+            return []
+
+        by_resource = set(self._any_resource)
+        for label in self._resource_labels:
+            value = event.resource.get(label)
+            if value is None:
+                continue
+            by_resource |= self._resource_values.get((label, value), set())
+            if label in self._resource_prefixes:
+                by_resource |= self._resource_prefixes[label].find(value)
+
+        return sorted(by_event & by_resource, key=self._order.__getitem__)
+
+    @staticmethod
+    def _indexable_label(trigger: EventTrigger) -> Optional[Tuple[str, List[str]]]:
+        """Picks a label of the trigger's primary resource to index it by, preferring
+        the resource ID.  Labels with negated values can't be indexed, because they
+        match resources that don't have any of the given values."""
+        indexable: Dict[str, List[str]] = {
+            label: values
+            for label, values in trigger.match.items()
+            if values and not any(value.startswith("!") for value in values)
+        }
+        if not indexable:
+            return None
+        if "prefect.resource.id" in indexable:
+            return "prefect.resource.id", indexable["prefect.resource.id"]
+        label = min(indexable)
+        return label, indexable[label]
+
+
 # The currently loaded automations for this shard, organized both by ID and by
 # account and workspace
 automations_by_id: Dict[UUID, Automation] = {}
 triggers: Dict[TriggerID, EventTrigger] = {}
+trigger_index = TriggerIndex()
 next_proactive_runs: Dict[TriggerID, DateTime] = {}
 
 # This lock governs any changes to the set of loaded automations; any routine that will
@@ -642,7 +816,9 @@ def _automations_lock() -> asyncio.Lock:
 
 
 def find_interested_triggers(event: ReceivedEvent) -> Collection[EventTrigger]:
-    candidates = triggers.values()
+    candidates: Iterable[EventTrigger] = (
+        triggers[trigger_id] for trigger_id in trigger_index.candidates(event)
+    )
     return [trigger for trigger in candidates if trigger.covers(event)]
 
 
@@ -661,6 +837,7 @@ def load_automation(automation: Optional[Automation]):
 
     for trigger in event_triggers:
         triggers[trigger.id] = trigger
+        trigger_index.add(trigger)
         next_proactive_runs.pop(trigger.id, None)
 
 
@@ -669,6 +846,7 @@ def forget_automation(automation_id: UUID):
     if automation := automations_by_id.pop(automation_id, None):
         for trigger in automation.triggers():
             triggers.pop(trigger.id, None)
+            trigger_index.remove(trigger.id)
             next_proactive_runs.pop(trigger.id, None)
 
 
@@ -688,7 +866,8 @@ async def automation_changed(
 
 @db_injector
 async def load_automations(db: PrefectDBInterface, session: AsyncSession):
-    """Loads all automations for the given set of accounts"""
+    """Loads all automations for the given set of accounts, along with the state of
+    their buckets"""
     query = sa.select(db.Automation)
 
     logger.debug("Loading automations")
@@ -701,6 +880,242 @@ async def load_automations(db: PrefectDBInterface, session: AsyncSession):
         "Loaded %s automations with %s triggers", len(automations_by_id), len(triggers)
     )
 
+    await load_buckets(session)
+
+
+BucketKey: TypeAlias = Tuple[AutomationID, TriggerID, Tuple[str, ...]]
+
+
+class BucketCache:
+    """Holds automation buckets in memory so that events can be evaluated without a
+    database round-trip for each bucket they touch.
+
+    Buckets are read from the database the first time they are needed (or all at once
+    when the triggers service starts), after which the cache is the source of truth
+    for them.  New and updated buckets are written back to the database in batches by
+    `flush`, while removed buckets are deleted from the database right away, so that
+    a crash can't cause a trigger to act twice.
+
+    Since `flush` overwrites the buckets in the database, only one process may write
+    buckets at a time; see `bucket_writer_lock`."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[BucketKey, Optional["ORMAutomationBucket"]] = {}
+        self._dirty: Set[BucketKey] = set()
+
+    def __len__(self) -> int:
+        return sum(1 for bucket in self._buckets.values() if bucket is not None)
+
+    def __contains__(self, key: BucketKey) -> bool:
+        return self._buckets.get(key) is not None
+
+    @property
+    def dirty(self) -> int:
+        return len(self._dirty)
+
+    @staticmethod
+    def key(
+        automation_id: AutomationID,
+        trigger_id: TriggerID,
+        bucketing_key: Iterable[str],
+    ) -> BucketKey:
+        return (automation_id, trigger_id, tuple(bucketing_key))
+
+    async def get(self, key: BucketKey) -> Optional["ORMAutomationBucket"]:
+        if key not in self._buckets:
+            # read outside of the caller's transaction, which may go on to write
+            async with automations_session() as session:
+                bucket = await read_bucket_by_trigger_id(session, *key)
+            # another evaluation may have filled this key in while we were reading
+            if key not in self._buckets:
+                self._buckets[key] = _copy_bucket(bucket) if bucket else None
+        return self._buckets[key]
+
+    def put(self, bucket: "ORMAutomationBucket") -> "ORMAutomationBucket":
+        key = self.key(bucket.automation_id, bucket.trigger_id, bucket.bucketing_key)
+        self._buckets[key] = bucket
+        self._dirty.add(key)
+        return bucket
+
+    def forget(self, key: BucketKey) -> None:
+        self._buckets[key] = None
+        self._dirty.discard(key)
+
+    def load(self, buckets: Iterable["ORMAutomationBucket"]) -> None:
+        for bucket in buckets:
+            key = self.key(
+                bucket.automation_id, bucket.trigger_id, bucket.bucketing_key
+            )
+            if key not in self._dirty:
+                self._buckets[key] = _copy_bucket(bucket)
+
+    def evict(self, should_evict: Callable[["ORMAutomationBucket"], bool]) -> None:
+        """Drops clean buckets from memory, along with what we know about buckets
+        that don't exist"""
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if key in self._dirty or (bucket is not None and not should_evict(bucket))
+        }
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._dirty.clear()
+
+    async def flush(self, session: AsyncSession) -> None:
+        """Writes any new or updated buckets to the database"""
+        if not self._dirty:
+            return
+
+        db = provide_database_interface()
+
+        dirty, self._dirty = self._dirty, set()
+        now = pendulum.now("UTC")
+        rows = [
+            {
+                "automation_id": bucket.automation_id,
+                "trigger_id": bucket.trigger_id,
+                "bucketing_key": list(bucket.bucketing_key),
+                "last_event": bucket.last_event,
+                "start": bucket.start,
+                "end": bucket.end,
+                "count": bucket.count,
+                "last_operation": bucket.last_operation,
+                "triggered_at": bucket.triggered_at,
+                "updated": now,
+            }
+            for key in dirty
+            if (bucket := self._buckets.get(key)) is not None
+        ]
+
+        try:
+            # skip the buckets of any automations deleted since they were updated
+            existing = set(
+                (
+                    await session.scalars(
+                        sa.select(db.Automation.id).where(
+                            db.Automation.id.in_({row["automation_id"] for row in rows})
+                        )
+                    )
+                ).all()
+            )
+            rows = [row for row in rows if row["automation_id"] in existing]
+
+            rows_per_insert = max(
+                get_max_query_parameters() // len(db.AutomationBucket.__table__.c), 1
+            )
+            for i in range(0, len(rows), rows_per_insert):
+                insert = db.queries.insert(db.AutomationBucket).values(
+                    rows[i : i + rows_per_insert]
+                )
+                await session.execute(
+                    insert.on_conflict_do_update(
+                        index_elements=[
+                            db.AutomationBucket.automation_id,
+                            db.AutomationBucket.trigger_id,
+                            db.AutomationBucket.bucketing_key,
+                        ],
+                        set_={
+                            column: insert.excluded[column]
+                            for column in (
+                                "last_event",
+                                "start",
+                                "end",
+                                "count",
+                                "last_operation",
+                                "triggered_at",
+                                "updated",
+                            )
+                        },
+                    )
+                )
+        except Exception:
+            self._dirty |= dirty
+            raise
+
+        logger.debug("Flushed %s automation buckets", len(rows))
+
+
+bucket_cache = BucketCache()
+
+
+_holds_bucket_writer_lock = False
+
+
+@asynccontextmanager
+async def bucket_writer_lock() -> AsyncGenerator[None, None]:
+    """Waits until no other process is writing automation buckets, then keeps other
+    processes from writing them until exiting.
+
+    On PostgreSQL, where several servers may share a database, this holds an advisory
+    lock for as long as the context is open.  SQLite databases are only used by a
+    single server, so there is nothing to wait for."""
+    global _holds_bucket_writer_lock
+
+    db = provide_database_interface()
+    engine = await db.engine()
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    async with engine.connect() as connection:
+        lock = sa.select(sa.func.pg_try_advisory_lock(BUCKET_WRITER_LOCK_KEY))
+        waiting = False
+        while not await connection.scalar(lock):
+            await connection.rollback()
+            if not waiting:
+                logger.info(
+                    "Waiting for the triggers service of another server to stop"
+                )
+                waiting = True
+            await asyncio.sleep(BUCKET_WRITER_LOCK_RETRY_SECONDS)
+        # the lock outlives the transaction, which shouldn't be left open
+        await connection.commit()
+
+        _holds_bucket_writer_lock = True
+        try:
+            yield
+        finally:
+            _holds_bucket_writer_lock = False
+            await connection.execute(
+                sa.select(sa.func.pg_advisory_unlock(BUCKET_WRITER_LOCK_KEY))
+            )
+            await connection.commit()
+
+
+def holds_bucket_writer_lock() -> bool:
+    """Whether this process may write automation buckets"""
+    if get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value()).name != "postgresql":
+        return True
+    return _holds_bucket_writer_lock
+
+
+@db_injector
+def _copy_bucket(
+    db: PrefectDBInterface, bucket: "ORMAutomationBucket"
+) -> "ORMAutomationBucket":
+    """Copies a bucket read from the database so that it can outlive its session"""
+    return db.AutomationBucket(
+        automation_id=bucket.automation_id,
+        trigger_id=bucket.trigger_id,
+        bucketing_key=tuple(bucket.bucketing_key),
+        last_event=bucket.last_event,
+        start=bucket.start,
+        end=bucket.end,
+        count=bucket.count,
+        last_operation=bucket.last_operation,
+        triggered_at=bucket.triggered_at,
+    )
+
+
+@db_injector
+async def load_buckets(db: PrefectDBInterface, session: AsyncSession):
+    """Loads all buckets from the database into memory"""
+    result = await session.execute(sa.select(db.AutomationBucket))
+    bucket_cache.load(result.scalars().all())
+
+    logger.debug("Loaded %s automation buckets", len(bucket_cache))
+
 
 @db_injector
 async def remove_buckets_exceeding_threshold(
@@ -708,6 +1123,7 @@ async def remove_buckets_exceeding_threshold(
 ):
     """Deletes bucket where the count has already exceeded the threshold"""
     assert isinstance(trigger, EventTrigger), repr(trigger)
+    await bucket_cache.flush(session)
     await session.execute(
         sa.delete(db.AutomationBucket).where(
             db.AutomationBucket.automation_id == trigger.automation.id,
@@ -715,6 +1131,11 @@ async def remove_buckets_exceeding_threshold(
             db.AutomationBucket.count >= trigger.threshold,
         )
     )
+    bucket_cache.evict(
+        lambda bucket: (
+            bucket.trigger_id == trigger.id and bucket.count >= trigger.threshold
+        )
+    )
 
 
 @db_injector
@@ -725,6 +1146,8 @@ async def read_buckets_for_automation(
     batch_size: int = AUTOMATION_BUCKET_BATCH_SIZE,
 ) -> AsyncGenerator["ORMAutomationBucket", None]:
     """Yields buckets for the given automation and trigger in batches."""
+    await bucket_cache.flush(session)
+
     offset = 0
 
     while True:
@@ -751,20 +1174,15 @@ async def read_buckets_for_automation(
         offset += batch_size
 
 
-@db_injector
 async def read_bucket(
-    db: PrefectDBInterface,
     session: AsyncSession,
     trigger: Trigger,
     bucketing_key: Tuple[str, ...],
 ) -> Optional["ORMAutomationBucket"]:
     """Gets the bucket this event would fall into for the given Automation, if there is
     one currently"""
-    return await read_bucket_by_trigger_id(
-        session,
-        trigger.automation.id,
-        trigger.id,
-        bucketing_key,
+    return await bucket_cache.get(
+        BucketCache.key(trigger.automation.id, trigger.id, bucketing_key)
     )
 
 
@@ -776,8 +1194,8 @@ async def read_bucket_by_trigger_id(
     trigger_id: UUID,
     bucketing_key: Tuple[str, ...],
 ) -> Optional["ORMAutomationBucket"]:
-    """Gets the bucket this event would fall into for the given Automation, if there is
-    one currently"""
+    """Gets the bucket this event would fall into for the given Automation from the
+    database, if there is one currently"""
     query = sa.select(db.AutomationBucket).where(
         db.AutomationBucket.automation_id == automation_id,
         db.AutomationBucket.trigger_id == trigger_id,
@@ -800,39 +1218,27 @@ async def increment_bucket(
     last_event: Optional[ReceivedEvent],
 ) -> "ORMAutomationBucket":
     """Adds the given count to the bucket, returning the new bucket"""
-    additional_updates: dict = {"last_event": last_event} if last_event else {}
-    await session.execute(
-        db.queries.insert(db.AutomationBucket)
-        .values(
-            automation_id=bucket.automation_id,
-            trigger_id=bucket.trigger_id,
-            bucketing_key=bucket.bucketing_key,
-            start=bucket.start,
-            end=bucket.end,
-            count=count,
-            last_operation="increment_bucket[insert]",
-        )
-        .on_conflict_do_update(
-            index_elements=[
-                db.AutomationBucket.automation_id,
-                db.AutomationBucket.trigger_id,
-                db.AutomationBucket.bucketing_key,
-            ],
-            set_=dict(
-                count=db.AutomationBucket.count + count,
-                last_operation="increment_bucket[update]",
-                updated=pendulum.now("UTC"),
-                **additional_updates,
-            ),
-        )
+    current = await bucket_cache.get(
+        BucketCache.key(bucket.automation_id, bucket.trigger_id, bucket.bucketing_key),
     )
+    if not current:
+        return bucket_cache.put(
+            db.AutomationBucket(
+                automation_id=bucket.automation_id,
+                trigger_id=bucket.trigger_id,
+                bucketing_key=tuple(bucket.bucketing_key),
+                start=bucket.start,
+                end=bucket.end,
+                count=count,
+                last_operation="increment_bucket[insert]",
+            )
+        )
 
-    return await read_bucket_by_trigger_id(
-        session,
-        bucket.automation_id,
-        bucket.trigger_id,
-        bucket.bucketing_key,
-    )
+    current.count += count
+    current.last_operation = "increment_bucket[update]"
+    if last_event:
+        current.last_event = last_event
+    return bucket_cache.put(current)
 
 
 @db_injector
@@ -850,41 +1256,29 @@ async def start_new_bucket(
     returning the new bucket"""
     automation = trigger.automation
 
-    await session.execute(
-        db.queries.insert(db.AutomationBucket)
-        .values(
-            automation_id=automation.id,
-            trigger_id=trigger.id,
-            bucketing_key=bucketing_key,
-            start=start,
-            end=end,
-            count=count,
-            last_operation="start_new_bucket[insert]",
-            triggered_at=triggered_at,
-        )
-        .on_conflict_do_update(
-            index_elements=[
-                db.AutomationBucket.automation_id,
-                db.AutomationBucket.trigger_id,
-                db.AutomationBucket.bucketing_key,
-            ],
-            set_=dict(
+    current = await bucket_cache.get(
+        BucketCache.key(automation.id, trigger.id, bucketing_key)
+    )
+    if not current:
+        return bucket_cache.put(
+            db.AutomationBucket(
+                automation_id=automation.id,
+                trigger_id=trigger.id,
+                bucketing_key=tuple(bucketing_key),
                 start=start,
                 end=end,
                 count=count,
-                last_operation="start_new_bucket[update]",
-                updated=pendulum.now("UTC"),
+                last_operation="start_new_bucket[insert]",
                 triggered_at=triggered_at,
-            ),
+            )
         )
-    )
 
-    return await read_bucket_by_trigger_id(
-        session,
-        automation.id,
-        trigger.id,
-        bucketing_key,
-    )
+    current.start = start
+    current.end = end
+    current.count = count
+    current.last_operation = "start_new_bucket[update]"
+    current.triggered_at = triggered_at
+    return bucket_cache.put(current)
 
 
 @db_injector
@@ -901,43 +1295,38 @@ async def ensure_bucket(
     """Ensures that a bucket has been started for the given automation and key,
     returning the current bucket.  Will not modify the existing bucket."""
     automation = trigger.automation
-    additional_updates: dict = {"last_event": last_event} if last_event else {}
-    await session.execute(
-        db.queries.insert(db.AutomationBucket)
-        .values(
-            automation_id=automation.id,
-            trigger_id=trigger.id,
-            bucketing_key=bucketing_key,
-            last_event=last_event,
-            start=start,
-            end=end,
-            count=initial_count,
-            last_operation="ensure_bucket[insert]",
-        )
-        .on_conflict_do_update(
-            index_elements=[
-                db.AutomationBucket.automation_id,
-                db.AutomationBucket.trigger_id,
-                db.AutomationBucket.bucketing_key,
-            ],
-            set_=dict(
-                # no-op, but this counts as an update so the query returns a row
-                count=db.AutomationBucket.count,
-                **additional_updates,
-            ),
-        )
-    )
 
-    return await read_bucket_by_trigger_id(
-        session, automation.id, trigger.id, bucketing_key
+    current = await bucket_cache.get(
+        BucketCache.key(automation.id, trigger.id, bucketing_key)
     )
+    if not current:
+        return bucket_cache.put(
+            db.AutomationBucket(
+                automation_id=automation.id,
+                trigger_id=trigger.id,
+                bucketing_key=tuple(bucketing_key),
+                last_event=last_event,
+                start=start,
+                end=end,
+                count=initial_count,
+                last_operation="ensure_bucket[insert]",
+            )
+        )
+
+    if last_event:
+        current.last_event = last_event
+        bucket_cache.put(current)
+    return current
 
 
 @db_injector
 async def remove_bucket(
     db: PrefectDBInterface, session: AsyncSession, bucket: "ORMAutomationBucket"
 ):
-    """Removes the given bucket from the database"""
+    """Removes the given bucket from memory and from the database"""
+    bucket_cache.forget(
+        BucketCache.key(bucket.automation_id, bucket.trigger_id, bucket.bucketing_key)
+    )
     await session.execute(
         sa.delete(db.AutomationBucket).where(
             db.AutomationBucket.automation_id == bucket.automation_id,
@@ -951,21 +1340,26 @@ async def remove_bucket(
 async def sweep_closed_buckets(
     db: PrefectDBInterface, session: AsyncSession, older_than: DateTime
 ) -> None:
+    await bucket_cache.flush(session)
     await session.execute(
         sa.delete(db.AutomationBucket).where(db.AutomationBucket.end <= older_than)
     )
+    bucket_cache.evict(lambda bucket: bucket.end <= older_than)
 
 
 async def reset():
     """Resets the in-memory state of the service"""
+    global trigger_index
     reset_events_clock()
     automations_by_id.clear()
     triggers.clear()
+    trigger_index = TriggerIndex()
+    bucket_cache.clear()
     next_proactive_runs.clear()
 
 
 def causal_ordering() -> CausalOrdering:
-    return CausalOrdering(scope="")
+    return get_causal_ordering(scope="")
 
 
 @asynccontextmanager
@@ -974,7 +1368,20 @@ async def consumer(
 ) -> AsyncGenerator[MessageHandler, None]:
     """The `triggers.consumer` processes all Events arriving on the event bus to
     determine if they meet the automation criteria, queuing up a corresponding
-    `TriggeredAction` for the `actions` service if the automation criteria is met."""
+    `TriggeredAction` for the `actions` service if the automation criteria is met.
+
+    Only one consumer may run at a time across all servers sharing a database, since
+    automation buckets are kept in memory; others wait in `bucket_writer_lock` for it
+    to stop."""
+    async with bucket_writer_lock():
+        async with _consumer(periodic_granularity=periodic_granularity) as handler:
+            yield handler
+
+
+@asynccontextmanager
+async def _consumer(
+    periodic_granularity: timedelta,
+) -> AsyncGenerator[MessageHandler, None]:
     async with automations_session() as session:
         await load_automations(session)
 
@@ -1013,13 +1420,20 @@ async def consumer(
         try:
             await reactive_evaluation(event)
         except EventArrivedEarly:
-            pass  # it's fine to ACK this message, since it is safe in the DB
+            # it's fine to ACK this message, since the causal ordering has parked
+            # it to be reprocessed when the preceding event arrives; only the
+            # database ordering keeps it across restarts and server processes
+            pass
 
     try:
         logger.debug("Starting reactive evaluation task")
         yield message_handler
     finally:
         proactive_task.cancel()
+        if bucket_cache.dirty:
+            async with automations_session() as session:
+                await bucket_cache.flush(session)
+                await session.commit()
 
 
 async def proactive_evaluation(trigger: EventTrigger, as_of: DateTime) -> DateTime:
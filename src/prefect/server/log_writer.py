@@ -0,0 +1,193 @@
+"""
+Writes logs accepted through the bulk logs endpoint to the database in the
+background, so that requests can return as soon as their logs are validated.
+"""
+
+import asyncio
+from collections import deque
+from typing import ClassVar, Deque, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import DBAPIError
+
+from prefect.logging import get_logger
+from prefect.server.database import provide_database_interface
+from prefect.server.schemas.actions import LogCreate
+from prefect.settings import (
+    PREFECT_SERVER_API_LOGS_BULK_BATCH_SIZE,
+    PREFECT_SERVER_API_LOGS_BULK_MAX_QUEUE_SIZE,
+)
+
+logger = get_logger(__name__)
+
+# How long to wait before trying to write a batch of logs again after a failure
+RETRY_DELAY_SECONDS = 1.0
+
+# How many times to try writing a single log before giving up on it
+MAX_WRITE_ATTEMPTS = 3
+
+# How long to spend writing waiting logs when the writer is stopped
+SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+
+class LogWriter:
+    """
+    Holds logs waiting to be written and writes them to the database in batches of
+    up to `batch_size`.
+
+    At most `max_queue_size` logs wait at once; beyond that, `put` waits for logs to
+    be written before accepting more, which holds back the requests sending them.
+
+    Batches that fail to be written are put back at the front of the line and tried
+    again.  While the database can't be reached, they are tried again as they are;
+    otherwise they are split in half to find the logs that can't be written, which
+    are dropped after `MAX_WRITE_ATTEMPTS` attempts.
+    """
+
+    _instance: ClassVar[Optional["LogWriter"]] = None
+
+    def __init__(self, max_queue_size: int, batch_size: int):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+
+        self._pending: Deque[LogCreate] = deque()
+        # batches that failed to be written, with how many times each was tried
+        self._retrying: Deque[Tuple[List[LogCreate], int]] = deque()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._has_logs = asyncio.Event()
+        self._written = asyncio.Event()
+        self._written.set()
+
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._run())
+
+    @classmethod
+    def instance(cls) -> "LogWriter":
+        """The writer for the running event loop, started if it isn't already"""
+        instance = cls._instance
+        if (
+            instance is None
+            or instance._loop is not asyncio.get_running_loop()
+            or instance._task.done()
+        ):
+            instance = cls._instance = cls(
+                max_queue_size=PREFECT_SERVER_API_LOGS_BULK_MAX_QUEUE_SIZE.value(),
+                batch_size=PREFECT_SERVER_API_LOGS_BULK_BATCH_SIZE.value(),
+            )
+        return instance
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Writes any waiting logs and stops the writer, if there is one"""
+        instance, cls._instance = cls._instance, None
+        if instance is not None and instance._loop is asyncio.get_running_loop():
+            await instance.stop()
+
+    def __len__(self) -> int:
+        return len(self._pending) + sum(len(batch) for batch, _ in self._retrying)
+
+    async def put(self, logs: Sequence[LogCreate]) -> None:
+        """Accepts logs to be written, first waiting for space if too many logs are
+        already waiting"""
+        if not logs:
+            return
+
+        while len(self) >= self.max_queue_size:
+            self._has_space.clear()
+            await self._has_space.wait()
+
+        self._pending.extend(logs)
+        self._written.clear()
+        self._has_logs.set()
+
+    async def flush(self) -> None:
+        """Waits until every accepted log has been written"""
+        await self._written.wait()
+
+    async def stop(self) -> None:
+        try:
+            await asyncio.wait_for(self.flush(), timeout=SHUTDOWN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Stopped the log writer with %s logs that were not written",
+                len(self),
+            )
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        from prefect.server import models
+
+        db = provide_database_interface()
+
+        while True:
+            await self._has_logs.wait()
+
+            if self._retrying:
+                batch, attempts = self._retrying.popleft()
+            elif self._pending:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(len(self._pending), self.batch_size))
+                ]
+                attempts = 0
+            else:
+                self._has_logs.clear()
+                self._written.set()
+                continue
+
+            try:
+                async with db.session_context(begin_transaction=True) as session:
+                    await models.logs.copy_logs(session=session, logs=batch)
+            except Exception as exc:
+                if self._retry(batch, attempts + 1, exc):
+                    await asyncio.sleep(RETRY_DELAY_SECONDS)
+                continue
+
+            if len(self) < self.max_queue_size:
+                self._has_space.set()
+
+    def _retry(self, batch: List[LogCreate], attempts: int, exc: Exception) -> bool:
+        """Puts a batch that failed to be written back at the front of the line,
+        returning whether to wait before trying again"""
+        if _is_disconnect(exc):
+            logger.warning(
+                "Failed to write %s logs; trying again in %s seconds",
+                len(batch),
+                RETRY_DELAY_SECONDS,
+                exc_info=True,
+            )
+            self._retrying.appendleft((batch, attempts))
+            return True
+        elif len(batch) > 1:
+            logger.warning(
+                "Failed to write %s logs; trying again in smaller batches",
+                len(batch),
+                exc_info=True,
+            )
+            middle = len(batch) // 2
+            self._retrying.appendleft((batch[middle:], 0))
+            self._retrying.appendleft((batch[:middle], 0))
+            return False
+        elif attempts < MAX_WRITE_ATTEMPTS:
+            self._retrying.appendleft((batch, attempts))
+            return True
+        else:
+            logger.error(
+                "Dropping a log that failed to be written %s times: %r",
+                attempts,
+                batch[0],
+                exc_info=True,
+            )
+            return False
+
+
+def _is_disconnect(exc: Exception) -> bool:
+    """Whether an error writing logs means the database couldn't be reached"""
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated
+    return isinstance(exc, (OSError, asyncio.TimeoutError))
@@ -17,6 +17,7 @@ from . import (
     flows,
     logs,
     saved_searches,
+    scheduler_shard_leases,
     task_run_states,
     task_runs,
     task_workers,
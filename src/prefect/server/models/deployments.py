@@ -21,6 +21,7 @@ from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.events import deployment_status_event
 from prefect.server.schemas.statuses import DeploymentStatus
+from prefect.server.work_queue_waiters import WorkQueueWaiters
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_RUNS,
     PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
@@ -60,6 +61,17 @@ async def _delete_scheduled_runs(
 
     await session.execute(delete_query)
 
+    # the deleted runs will need to be scheduled again
+    await session.execute(
+        sa.update(db.DeploymentSchedule)
+        .where(
+            db.DeploymentSchedule.deployment_id == deployment_id,
+            db.DeploymentSchedule.scheduled_through.is_not(None),
+        )
+        # bookkeeping only, so leave the schedule's `updated` time untouched
+        .values(scheduled_through=None, updated=db.DeploymentSchedule.updated)
+    )
+
 
 @db_injector
 async def create_deployment(
@@ -696,50 +708,83 @@ async def _generate_scheduled_flow_runs(
     )
 
     for deployment_schedule in active_deployment_schedules:
-        dates: list[pendulum.DateTime] = []
-
-        # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
-        for dt in deployment_schedule.schedule._get_dates_generator(
-            n=max_runs, start=start_time, end=end_time
-        ):
-            dates.append(dt)
-
-            # at any point, if we satisfy both of the minimums, we can stop
-            if len(dates) >= min_runs and dt >= (start_time + min_time):
-                break
-
-        tags = deployment.tags
-        if auto_scheduled:
-            tags = ["auto-scheduled"] + tags
-
-        for date in dates:
-            runs.append(
-                {
-                    "id": uuid4(),
-                    "flow_id": deployment.flow_id,
-                    "deployment_id": deployment_id,
-                    "deployment_version": deployment.version,
-                    "work_queue_name": deployment.work_queue_name,
-                    "work_queue_id": deployment.work_queue_id,
-                    "parameters": deployment.parameters,
-                    "infrastructure_document_id": deployment.infrastructure_document_id,
-                    "idempotency_key": f"scheduled {deployment.id} {date}",
-                    "tags": tags,
-                    "auto_scheduled": auto_scheduled,
-                    "state": schemas.states.Scheduled(
-                        scheduled_time=date,
-                        message="Flow run scheduled",
-                    ).model_dump(),
-                    "state_type": schemas.states.StateType.SCHEDULED,
-                    "state_name": "Scheduled",
-                    "next_scheduled_start_time": date,
-                    "expected_start_time": date,
-                }
-            )
+        dates = _generate_schedule_dates(
+            deployment_schedule.schedule,
+            start_time=start_time,
+            end_time=end_time,
+            min_time=min_time,
+            min_runs=min_runs,
+            max_runs=max_runs,
+        )
+        runs.extend(
+            _build_scheduled_flow_run(deployment, date, auto_scheduled=auto_scheduled)
+            for date in dates
+        )
 
     return runs
 
 
+def _generate_schedule_dates(
+    schedule: schemas.schedules.SCHEDULE_TYPES,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+) -> list[pendulum.DateTime]:
+    """
+    Generates the dates to schedule runs for from a single schedule, following the
+    rules described in `_generate_scheduled_flow_runs`.
+    """
+    dates: list[pendulum.DateTime] = []
+
+    # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
+    for dt in schedule._get_dates_generator(n=max_runs, start=start_time, end=end_time):
+        dates.append(dt)
+
+        # at any point, if we satisfy both of the minimums, we can stop
+        if len(dates) >= min_runs and dt >= (start_time + min_time):
+            break
+
+    return dates
+
+
+def _build_scheduled_flow_run(
+    deployment: orm_models.Deployment,
+    date: pendulum.DateTime,
+    auto_scheduled: bool = True,
+) -> dict[str, Any]:
+    """
+    Builds the dictionary representation of a deployment's flow run scheduled for
+    the given date, as inserted by `_insert_scheduled_flow_runs`.
+    """
+    tags = deployment.tags
+    if auto_scheduled:
+        tags = ["auto-scheduled"] + tags
+
+    return {
+        "id": uuid4(),
+        "flow_id": deployment.flow_id,
+        "deployment_id": deployment.id,
+        "deployment_version": deployment.version,
+        "work_queue_name": deployment.work_queue_name,
+        "work_queue_id": deployment.work_queue_id,
+        "parameters": deployment.parameters,
+        "infrastructure_document_id": deployment.infrastructure_document_id,
+        "idempotency_key": f"scheduled {deployment.id} {date}",
+        "tags": tags,
+        "auto_scheduled": auto_scheduled,
+        "state": schemas.states.Scheduled(
+            scheduled_time=date,
+            message="Flow run scheduled",
+        ).model_dump(),
+        "state_type": schemas.states.StateType.SCHEDULED,
+        "state_name": "Scheduled",
+        "next_scheduled_start_time": date,
+        "expected_start_time": date,
+    }
+
+
 @db_injector
 async def _insert_scheduled_flow_runs(
     db: PrefectDBInterface, session: AsyncSession, runs: list[dict[str, Any]]
@@ -802,6 +847,11 @@ async def _insert_scheduled_flow_runs(
 
         await session.execute(stmt)
 
+        WorkQueueWaiters.notify_on_commit(
+            session,
+            [r.get("work_queue_id") for r in runs if r["id"] in inserted_flow_run_ids],
+        )
+
     return inserted_flow_run_ids
 
 
@@ -961,7 +1011,8 @@ async def update_deployment_schedule(
                 db.DeploymentSchedule.deployment_id == deployment_id,
             )
         )
-        .values(**schedule.model_dump(exclude_none=True))
+        # the changed schedule needs to be scheduled again
+        .values(**schedule.model_dump(exclude_none=True), scheduled_through=None)
     )
 
     return result.rowcount > 0
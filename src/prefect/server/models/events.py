@@ -120,6 +120,95 @@ async def _flow_run_related_resources_from_orm(
     ) + _provenance_as_related_resources(flow_run.created_by)
 
 
+async def cache_flow_run_related_resources(
+    session: AsyncSession, flow_runs: List[ORMFlowRun]
+) -> None:
+    """
+    Reads the resources related to many flow runs with a query per kind of
+    resource and caches them for `flow_run_state_change_event`, rather than reading
+    them one flow run at a time when their events are built.
+    """
+    flow_runs = [
+        flow_run
+        for flow_run in flow_runs
+        if flow_run.id not in _flow_run_resource_data_cache
+    ]
+    if not flow_runs:
+        return
+
+    flows = {
+        flow.id: flow
+        for flow in await models.flows.read_flows(
+            session=session,
+            flow_filter=schemas.filters.FlowFilter(
+                id=schemas.filters.FlowFilterId(
+                    any_=list({flow_run.flow_id for flow_run in flow_runs})
+                )
+            ),
+        )
+    }
+
+    deployment_ids = {fr.deployment_id for fr in flow_runs if fr.deployment_id}
+    deployments_by_id: Dict[UUID, ORMDeployment] = {}
+    if deployment_ids:
+        deployments_by_id = {
+            deployment.id: deployment
+            for deployment in await deployments.read_deployments(
+                session=session,
+                deployment_filter=schemas.filters.DeploymentFilter(
+                    id=schemas.filters.DeploymentFilterId(any_=list(deployment_ids))
+                ),
+            )
+        }
+
+    work_queue_ids = {fr.work_queue_id for fr in flow_runs if fr.work_queue_id}
+    work_queues: Dict[UUID, ORMWorkQueue] = {}
+    if work_queue_ids:
+        work_queues = {
+            work_queue.id: work_queue
+            for work_queue in await models.work_queues.read_work_queues(
+                session=session,
+                work_queue_filter=schemas.filters.WorkQueueFilter(
+                    id=schemas.filters.WorkQueueFilterId(any_=list(work_queue_ids))
+                ),
+            )
+        }
+
+    task_run_ids = {fr.parent_task_run_id for fr in flow_runs if fr.parent_task_run_id}
+    task_runs: Dict[UUID, ORMTaskRun] = {}
+    if task_run_ids:
+        task_runs = {
+            task_run.id: task_run
+            for task_run in await models.task_runs.read_task_runs(
+                session=session,
+                task_run_filter=schemas.filters.TaskRunFilter(
+                    id=schemas.filters.TaskRunFilterId(any_=list(task_run_ids))
+                ),
+            )
+        }
+
+    for flow_run in flow_runs:
+        work_queue = (
+            work_queues.get(flow_run.work_queue_id) if flow_run.work_queue_id else None
+        )
+        _flow_run_resource_data_cache[flow_run.id] = _as_resource_data(
+            flow_run,
+            flows.get(flow_run.flow_id),
+            (
+                deployments_by_id.get(flow_run.deployment_id)
+                if flow_run.deployment_id
+                else None
+            ),
+            work_queue,
+            work_queue.work_pool if work_queue is not None else None,
+            (
+                task_runs.get(flow_run.parent_task_run_id)
+                if flow_run.parent_task_run_id
+                else None
+            ),
+        )
+
+
 def _as_resource_data(
     flow_run: ORMFlowRun,
     flow: Union[ORMFlow, schemas.core.Flow, None],
@@ -31,8 +31,13 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging.loggers import get_logger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
+from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
-from prefect.server.orchestration.core_policy import MinimalFlowPolicy
+from prefect.server.models.events import TRUNCATE_STATE_MESSAGES_AT
+from prefect.server.orchestration.core_policy import (
+    MarkLateRunsPolicy,
+    MinimalFlowPolicy,
+)
 from prefect.server.orchestration.global_policy import GlobalFlowPolicy
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import FlowOrchestrationContext
@@ -41,11 +46,13 @@ from prefect.server.schemas.graph import Graph
 from prefect.server.schemas.responses import OrchestrationResult, SetStateStatus
 from prefect.server.schemas.states import State
 from prefect.server.utilities.schemas import PrefectBaseModel
+from prefect.server.work_queue_waiters import WorkQueueWaiters
 from prefect.settings import (
     PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS,
     PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES,
 )
 from prefect.types import KeyValueLabels
+from prefect.utilities.text import truncated_to
 
 logger = get_logger("flow_runs")
 
@@ -592,9 +599,132 @@ async def set_flow_run_state(
             session=session, flow_run=run
         )
 
+        # wake any workers waiting on this run's work queue, which may now have a
+        # run to pick up or room for another one
+        validated_state = context.validated_state
+        if validated_state and (
+            validated_state.is_scheduled() or validated_state.is_final()
+        ):
+            WorkQueueWaiters.notify_on_commit(session, [run.work_queue_id])
+
     return result
 
 
+@db_injector
+async def mark_flow_runs_late(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run_ids: Sequence[UUID],
+) -> List[UUID]:
+    """
+    Marks many scheduled flow runs as late at once.
+
+    This makes the same transition as setting a `Late` state on each flow run with
+    the `MarkLateRunsPolicy`, but the flow runs are locked, their states are written,
+    and their state change events are emitted in bulk rather than one flow run at a
+    time. Flow runs that are no longer scheduled are skipped, as are flow runs that
+    are locked by another transaction. Subflow runs are orchestrated one at a time,
+    since their parent task runs follow their state.
+
+    Args:
+        session: a database session
+        flow_run_ids: the ids of the flow runs to mark as late
+
+    Returns:
+        The ids of the flow runs that were marked as late
+    """
+    if not flow_run_ids:
+        return []
+
+    result = await session.execute(
+        select(db.FlowRun)
+        .where(
+            db.FlowRun.id.in_(flow_run_ids),
+            db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+        )
+        .order_by(db.FlowRun.id)
+        # Lock the rows to prevent orchestration race conditions
+        .with_for_update(skip_locked=True)
+    )
+    flow_runs = result.scalars().all()
+
+    marked: List[UUID] = []
+    transitions: List[Tuple[orm_models.FlowRun, State, State]] = []
+    for run in flow_runs:
+        late_state = schemas.states.Late(scheduled_time=run.next_scheduled_start_time)
+
+        if run.parent_task_run_id is not None:
+            orchestration_result = await set_flow_run_state(
+                session=session,
+                flow_run_id=run.id,
+                state=late_state,
+                flow_policy=MarkLateRunsPolicy,
+            )
+            if orchestration_result.status == SetStateStatus.ACCEPT:
+                marked.append(run.id)
+            continue
+
+        assert run.state is not None
+        initial_state = run.state.as_state()
+        late_state.state_details.flow_run_id = run.id
+
+        state_payload = late_state.model_dump_for_orm()
+        state_payload.pop("data", None)
+        validated_orm_state = db.FlowRunState(flow_run_id=run.id, **state_payload)
+        session.add(validated_orm_state)
+        run.set_state(validated_orm_state)
+
+        # the global transforms that apply to a scheduled-to-scheduled transition
+        run.state_type = late_state.type
+        run.state_name = late_state.name
+        run.state_timestamp = late_state.timestamp
+        run.next_scheduled_start_time = late_state.state_details.scheduled_time
+        if not run.expected_start_time:
+            run.expected_start_time = late_state.state_details.scheduled_time
+
+        marked.append(run.id)
+        transitions.append((run, initial_state, late_state))
+
+    if not transitions:
+        return marked
+
+    # the states are inserted and the flow runs updated with a statement each
+    await session.flush()
+
+    has_notification_policies = (
+        await session.execute(
+            select(sa.exists().where(db.FlowRunNotificationPolicy.is_active.is_(True)))
+        )
+    ).scalar()
+    if has_notification_policies:
+        for run, _, _ in transitions:
+            await models.flow_run_notification_policies.queue_flow_run_notifications(
+                session=session, flow_run=run
+            )
+
+    await models.events.cache_flow_run_related_resources(
+        session=session, flow_runs=[run for run, _, _ in transitions]
+    )
+    async with PrefectServerEventsClient() as events:
+        for run, initial_state, late_state in transitions:
+            initial_state.message = truncated_to(
+                TRUNCATE_STATE_MESSAGES_AT, initial_state.message
+            )
+            await events.emit(
+                await models.events.flow_run_state_change_event(
+                    session=session,
+                    occurred=late_state.timestamp,
+                    flow_run=run,
+                    initial_state_id=initial_state.id,
+                    initial_state=initial_state,
+                    validated_state_id=late_state.id,
+                    validated_state=late_state,
+                )
+            )
+
+    return marked
+
+
 @db_injector
 async def read_flow_run_graph(
     db: PrefectDBInterface,
@@ -12,6 +12,8 @@ import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.schemas.actions import LogCreate
+from prefect.server.utilities.database import copy_rows, get_dialect
+from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
 from prefect.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -61,6 +63,39 @@ async def create_logs(
             raise
 
 
+@db_injector
+async def copy_logs(
+    db: PrefectDBInterface, session: AsyncSession, logs: Sequence[LogCreate]
+) -> None:
+    """
+    Creates new logs in bulk, with `COPY` on PostgreSQL and batched `INSERT`s
+    otherwise
+
+    Args:
+        session: a database session
+        logs: the logs to create
+
+    Returns:
+        None
+    """
+    if not logs:
+        return
+
+    if get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value()).name != "postgresql":
+        for batch in split_logs_into_batches(list(logs)):
+            await create_logs(session=session, logs=list(batch))
+        return
+
+    # `COPY` loads any number of logs at once, without the parameter limits of an
+    # `INSERT`
+    await copy_rows(
+        session,
+        db.Log.__table__,
+        db.Log.__tablename__,
+        [log.model_dump() for log in logs],
+    )
+
+
 @db_injector
 async def read_logs(
     db: PrefectDBInterface,
@@ -0,0 +1,130 @@
+"""
+Functions for interacting with scheduler shard lease ORM objects.
+Intended for internal use by the Prefect REST API.
+"""
+
+import datetime
+import math
+from collections import Counter
+from collections.abc import Sequence
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database import PrefectDBInterface, db_injector, orm_models
+
+
+@db_injector
+async def read_scheduler_shard_leases(
+    db: PrefectDBInterface, session: AsyncSession
+) -> Sequence[orm_models.SchedulerShardLease]:
+    """
+    Reads all scheduler shard leases, including expired ones.
+
+    Args:
+        session: A database session
+
+    Returns:
+        The shard leases, ordered by shard
+    """
+    result = await session.execute(
+        sa.select(db.SchedulerShardLease).order_by(db.SchedulerShardLease.shard)
+    )
+    return result.scalars().all()
+
+
+@db_injector
+async def claim_scheduler_shards(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    holder: str,
+    shard_count: int,
+    lease_duration: datetime.timedelta,
+) -> set[int]:
+    """
+    Claims a fair share of the scheduler's shards for a replica and renews the
+    leases it already holds.
+
+    A replica's fair share is the number of shards divided by the number of
+    replicas holding unexpired leases, including itself. Expired and unclaimed
+    shards are claimed first, then shards are taken from replicas holding at least
+    two more shards than the claiming replica. A replica holding more than its fair
+    share releases the excess, so shards are rebalanced as replicas come and go.
+
+    Args:
+        session: A database session
+        holder: A unique identifier of the replica claiming shards
+        shard_count: The total number of shards
+        lease_duration: How long the claimed leases last without being renewed
+
+    Returns:
+        The shards leased to the replica
+    """
+    now = pendulum.now("UTC")
+    expiration = now + lease_duration
+    lease = db.SchedulerShardLease
+
+    owners = {
+        shard_lease.shard: shard_lease.holder
+        for shard_lease in await read_scheduler_shard_leases(session=session)
+        if shard_lease.shard < shard_count and shard_lease.expiration > now
+    }
+    fair_share = math.ceil(shard_count / len(set(owners.values()) | {holder}))
+    held = sorted(shard for shard, owner in owners.items() if owner == holder)
+
+    released = held[fair_share:]
+    held = held[:fair_share]
+    if released:
+        await session.execute(
+            sa.delete(lease).where(lease.shard.in_(released), lease.holder == holder)
+        )
+    if held:
+        await session.execute(
+            sa.update(lease)
+            .where(lease.shard.in_(held), lease.holder == holder)
+            .values(expiration=expiration)
+        )
+
+    for shard in range(shard_count):
+        if len(held) >= fair_share:
+            break
+        if shard in owners:
+            continue
+        await session.execute(
+            db.queries.insert(lease)
+            .values(shard=shard, holder=holder, expiration=expiration)
+            .on_conflict_do_update(
+                index_elements=[lease.shard],
+                set_={"holder": holder, "expiration": expiration},
+                # another replica may have claimed the shard in the meantime
+                where=lease.expiration <= now,
+            )
+        )
+        held.append(shard)
+
+    held_by_owner = Counter(owners.values())
+    for shard, owner in sorted(owners.items()):
+        if len(held) >= fair_share:
+            break
+        # only take shards when that narrows the gap between replicas, so that
+        # replicas with uneven shares do not take shards back and forth
+        if owner == holder or held_by_owner[owner] <= len(held) + 1:
+            continue
+        result = await session.execute(
+            sa.update(lease)
+            .where(lease.shard == shard, lease.holder == owner)
+            .values(holder=holder, expiration=expiration)
+        )
+        if result.rowcount:
+            held_by_owner[owner] -= 1
+            held.append(shard)
+
+    result = await session.execute(
+        sa.select(lease.shard).where(
+            lease.holder == holder,
+            lease.expiration > now,
+            lease.shard < shard_count,
+        )
+    )
+    return set(result.scalars().all())
@@ -331,6 +331,43 @@ async def get_scheduled_flow_runs(
     )
 
 
+@db_injector
+async def read_next_scheduled_start_time(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    work_pool_id: UUID,
+    work_queue_ids: Optional[List[UUID]] = None,
+    scheduled_after: Optional[datetime.datetime] = None,
+) -> Optional[datetime.datetime]:
+    """
+    Get the earliest start time of the scheduled runs in a work pool.
+
+    Args:
+        session (AsyncSession): a database session
+        work_pool_id (UUID): a work pool id
+        work_queue_ids (List[UUID]): a list of work pool queue ids to limit the runs to
+        scheduled_after (datetime.datetime): only consider runs scheduled after this
+        db: a database interface
+
+    Returns:
+        datetime.datetime: the earliest start time, or None if there are no runs
+    """
+    query = (
+        sa.select(sa.func.min(db.FlowRun.next_scheduled_start_time))
+        .join(db.WorkQueue, db.FlowRun.work_queue_id == db.WorkQueue.id)
+        .where(
+            db.WorkQueue.work_pool_id == work_pool_id,
+            db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+        )
+    )
+    if work_queue_ids is not None:
+        query = query.where(db.FlowRun.work_queue_id.in_(work_queue_ids))
+    if scheduled_after is not None:
+        query = query.where(db.FlowRun.next_scheduled_start_time > scheduled_after)
+
+    return await session.scalar(query)
+
+
 # -----------------------------------------------------
 # --
 # --
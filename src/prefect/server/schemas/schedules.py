@@ -2,13 +2,26 @@
 Schedule schemas
 """
 
+import bisect
 import datetime
-from typing import Annotated, Any, ClassVar, Generator, List, Optional, Tuple, Union
+import functools
+import re
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    FrozenSet,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import dateutil
 import dateutil.rrule
 import pendulum
-import pytz
 from croniter import croniter
 from pydantic import AfterValidator, ConfigDict, Field, field_validator, model_validator
 
@@ -40,6 +53,248 @@ def _prepare_scheduling_start_and_end(
     return start, end
 
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_DAY = datetime.timedelta(days=1)
+
+# cron expressions made only of these characters are evaluated without croniter;
+# anything else (names, `L`, `W`, `#`, years) is left to croniter
+_SIMPLE_CRON_FIELD = re.compile(r"^[\d*,/?-]+$")
+
+# a cron expression that matches no day in this many consecutive days is handed to
+# croniter, which raises for expressions that never match; leap days can be eight
+# years apart
+_MAX_CRON_SCAN_DAYS = 9 * 366
+
+
+def _to_microseconds(delta: datetime.timedelta) -> int:
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _localize_wall_time(
+    wall_time: datetime.datetime, tz: datetime.tzinfo
+) -> pendulum.DateTime:
+    """
+    Attaches a timezone to a naive wall-clock time. Times skipped by a DST transition
+    are moved forward and the first of two repeated times is used, as pendulum does.
+    """
+    date = pendulum.DateTime(
+        wall_time.year,
+        wall_time.month,
+        wall_time.day,
+        wall_time.hour,
+        wall_time.minute,
+        wall_time.second,
+        wall_time.microsecond,
+        tzinfo=tz,
+    )
+    # the two folds only disagree on the offset around DST transitions
+    if tz.utcoffset(date) != tz.utcoffset(date.replace(fold=1)):
+        date = pendulum.instance(
+            datetime.datetime(
+                wall_time.year,
+                wall_time.month,
+                wall_time.day,
+                wall_time.hour,
+                wall_time.minute,
+                wall_time.second,
+                wall_time.microsecond,
+                tzinfo=tz,
+            )
+        )
+    return date
+
+
+def _iter_interval_dates(
+    anchor: pendulum.DateTime,
+    interval: datetime.timedelta,
+    start: pendulum.DateTime,
+) -> Generator[pendulum.DateTime, None, None]:
+    """
+    Yields the dates of an interval shorter than a day from the first one on or after
+    `start`. Such intervals are applied to UTC time, so every date is computed from
+    the anchor with integer arithmetic instead of from the previous date.
+    """
+    interval_us = _to_microseconds(interval)
+    anchor_us = _to_microseconds(anchor - _EPOCH)
+    # the first multiple of the interval that is not before the start
+    index = -((anchor_us - _to_microseconds(start - _EPOCH)) // interval_us)
+    tz = anchor.tzinfo
+    while True:
+        local = (
+            _EPOCH + datetime.timedelta(microseconds=anchor_us + index * interval_us)
+        ).astimezone(tz)
+        yield pendulum.DateTime(
+            local.year,
+            local.month,
+            local.day,
+            local.hour,
+            local.minute,
+            local.second,
+            local.microsecond,
+            tzinfo=tz,
+            fold=local.fold,
+        )
+        index += 1
+
+
+class _CompiledCron(NamedTuple):
+    """
+    The values accepted by each field of a cron expression, in the order croniter
+    uses for its fields.
+    """
+
+    minutes: List[int]
+    hours: List[int]
+    days: Optional[FrozenSet[int]]
+    months: Optional[FrozenSet[int]]
+    # 0 is Sunday
+    weekdays: Optional[FrozenSet[int]]
+    seconds: List[int]
+    # whether a day matching either the day of month or the day of week matches
+    either_day: bool
+    timezone: datetime.tzinfo
+
+    def matches_day(self, day: datetime.date) -> bool:
+        if self.months is not None and day.month not in self.months:
+            return False
+        if self.either_day:
+            assert self.days is not None and self.weekdays is not None
+            return day.day in self.days or day.isoweekday() % 7 in self.weekdays
+        return (self.days is None or day.day in self.days) and (
+            self.weekdays is None or day.isoweekday() % 7 in self.weekdays
+        )
+
+    def iter_wall_times(
+        self, after: datetime.datetime
+    ) -> Generator[datetime.datetime, None, None]:
+        """
+        Yields the naive wall-clock times matching the expression after the given
+        naive time, in order. Stops if no day matches for `_MAX_CRON_SCAN_DAYS` days.
+        """
+        day = after.date()
+        lower: Optional[Tuple[int, int, int]] = (after.hour, after.minute, after.second)
+        empty_days = 0
+        while empty_days <= _MAX_CRON_SCAN_DAYS:
+            if not self.matches_day(day):
+                empty_days += 1
+            else:
+                empty_days = 0
+                hours = self.hours
+                if lower:
+                    hours = hours[bisect.bisect_left(hours, lower[0]) :]
+                for hour in hours:
+                    minutes = self.minutes
+                    if lower and hour == lower[0]:
+                        minutes = minutes[bisect.bisect_left(minutes, lower[1]) :]
+                    for minute in minutes:
+                        seconds = self.seconds
+                        if lower and (hour, minute) == lower[:2]:
+                            seconds = seconds[bisect.bisect_right(seconds, lower[2]) :]
+                        for second in seconds:
+                            yield datetime.datetime(
+                                day.year, day.month, day.day, hour, minute, second
+                            )
+            lower = None
+            day += _ONE_DAY
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_cron(cron: str, timezone: str, day_or: bool) -> Optional[_CompiledCron]:
+    """
+    Compiles a cron expression for a timezone, or returns `None` if the expression
+    uses syntax that only croniter evaluates.
+    """
+    fields = cron.split()
+    if not cron.startswith("@") and not (
+        len(fields) in (5, 6) and all(_SIMPLE_CRON_FIELD.match(f) for f in fields)
+    ):
+        return None
+
+    expanded, nth_weekday_of_month = croniter.expand(cron)
+    if (
+        nth_weekday_of_month
+        or len(expanded) not in (5, 6)
+        or any(v != "*" and not isinstance(v, int) for f in expanded for v in f)
+    ):
+        return None
+
+    def values(field: List[Any], all_values: range) -> List[int]:
+        return list(all_values) if field == ["*"] else sorted(field)
+
+    def value_set(field: List[Any]) -> Optional[FrozenSet[int]]:
+        return None if field == ["*"] else frozenset(field)
+
+    minutes, hours, days, months, weekdays = expanded[:5]
+    return _CompiledCron(
+        minutes=values(minutes, range(60)),
+        hours=values(hours, range(24)),
+        days=value_set(days),
+        months=value_set(months),
+        weekdays=value_set(weekdays),
+        seconds=values(expanded[5], range(60)) if len(expanded) == 6 else [0],
+        # croniter joins the two day fields with OR only when both are restricted
+        either_day=day_or and days != ["*"] and weekdays != ["*"],
+        timezone=pendulum.timezone(timezone),
+    )
+
+
+def _iter_cron_dates(
+    cron: str, timezone: str, day_or: bool, after: datetime.datetime
+) -> Generator[pendulum.DateTime, None, None]:
+    """
+    Yields the dates matching a cron expression after the given naive wall-clock
+    time. Cron expressions are evaluated on wall-clock time and then localized, so
+    that schedules fire on every new schedule hour across DST transitions.
+    """
+    compiled = _compile_cron(cron, timezone, day_or)
+    if compiled is not None:
+        tz = compiled.timezone
+        for wall_time in compiled.iter_wall_times(after):
+            after = wall_time
+            yield _localize_wall_time(wall_time, tz)
+    else:
+        tz = pendulum.timezone(timezone)
+
+    cron_iter = croniter(cron, after, day_or=day_or)  # type: ignore
+    while True:
+        yield _localize_wall_time(cron_iter.get_next(datetime.datetime), tz)
+
+
+_RRULE_PERIODS = {
+    dateutil.rrule.WEEKLY: datetime.timedelta(weeks=1),
+    dateutil.rrule.DAILY: datetime.timedelta(days=1),
+    dateutil.rrule.HOURLY: datetime.timedelta(hours=1),
+    dateutil.rrule.MINUTELY: datetime.timedelta(minutes=1),
+    dateutil.rrule.SECONDLY: datetime.timedelta(seconds=1),
+}
+
+
+def _advance_rrule(
+    rrule: dateutil.rrule.rrule, start: datetime.datetime
+) -> dateutil.rrule.rrule:
+    """
+    Moves the `dtstart` of a rule forward by whole periods to shortly before `start`,
+    so that iterating the rule does not walk every occurrence since `dtstart`.
+    Occurrences are unchanged because the rule repeats every period. Rules with a
+    `COUNT`, or that repeat monthly or yearly, are returned as is.
+    """
+    period = _RRULE_PERIODS.get(rrule._freq)
+    if period is None or rrule._count is not None:
+        return rrule
+    period *= rrule._interval
+
+    dtstart = rrule._dtstart
+    start_wall_time = datetime.datetime.fromtimestamp(
+        start.timestamp(), dtstart.tzinfo
+    ).replace(tzinfo=None)
+    # leave a day of room, since wall-clock time and elapsed time diverge across
+    # DST transitions
+    periods = (start_wall_time - _ONE_DAY - dtstart.replace(tzinfo=None)) // period
+    if periods <= 0:
+        return rrule
+    return rrule.replace(dtstart=dtstart + periods * period)
+
+
 class IntervalSchedule(PrefectBaseModel):
     """
     A schedule formed by adding `interval` increments to an `anchor_date`. If no
@@ -141,6 +396,37 @@ class IntervalSchedule(PrefectBaseModel):
         anchor_tz = self.anchor_date.in_tz(self.timezone)
         start, end = _prepare_scheduling_start_and_end(start, end, self.timezone)
 
+        if self.interval.days:
+            next_dates = self._iter_dst_aware_dates(anchor_tz, start)
+        else:
+            next_dates = _iter_interval_dates(anchor_tz, self.interval, start)
+
+        counter = 0
+        dates = set()
+
+        for next_date in next_dates:
+            # if the end date was exceeded, exit
+            if end and next_date > end:
+                break
+
+            # ensure no duplicates; weird things can happen with DST
+            if next_date not in dates:
+                dates.add(next_date)
+                yield next_date
+
+            # if enough dates have been collected or enough attempts were made, exit
+            if len(dates) >= n or counter > MAX_ITERATIONS:
+                break
+
+            counter += 1
+
+    def _iter_dst_aware_dates(
+        self, anchor_tz: pendulum.DateTime, start: pendulum.DateTime
+    ) -> Generator[pendulum.DateTime, None, None]:
+        """
+        Yields the dates of an interval of a day or more from the first one on or
+        after `start`, keeping the clock-hour constant across DST boundaries.
+        """
         # compute the offset between the anchor date and the start date to jump to the
         # next date
         offset = (start - anchor_tz).total_seconds() / self.interval.total_seconds()
@@ -160,25 +446,8 @@ class IntervalSchedule(PrefectBaseModel):
         while next_date < start:
             next_date = next_date.add(days=interval_days, seconds=interval_seconds)
 
-        counter = 0
-        dates = set()
-
         while True:
-            # if the end date was exceeded, exit
-            if end and next_date > end:
-                break
-
-            # ensure no duplicates; weird things can happen with DST
-            if next_date not in dates:
-                dates.add(next_date)
-                yield next_date
-
-            # if enough dates have been collected or enough attempts were made, exit
-            if len(dates) >= n or counter > MAX_ITERATIONS:
-                break
-
-            counter += 1
-
+            yield next_date
             next_date = next_date.add(days=interval_days, seconds=interval_seconds)
 
 
@@ -296,33 +565,16 @@ class CronSchedule(PrefectBaseModel):
         if start.microsecond > 0:
             start += datetime.timedelta(seconds=1)
 
-        # croniter's DST logic interferes with all other datetime libraries except pytz
-        start_localized = pytz.timezone(start.tz.name).localize(
-            datetime.datetime(
-                year=start.year,
-                month=start.month,
-                day=start.day,
-                hour=start.hour,
-                minute=start.minute,
-                second=start.second,
-                microsecond=start.microsecond,
-            )
+        # croniter does not handle DST properly when the start time is in and around
+        # when the actual shift occurs. To work around this, cron dates are computed
+        # on naive wall-clock times and localized afterwards.
+        next_dates = _iter_cron_dates(
+            self.cron, start.tz.name, self.day_or, start.naive()
         )
-        start_naive_tz = start.naive()
-
-        cron = croniter(self.cron, start_naive_tz, day_or=self.day_or)  # type: ignore
         dates = set()
         counter = 0
 
-        while True:
-            # croniter does not handle DST properly when the start time is
-            # in and around when the actual shift occurs. To work around this,
-            # we use the naive start time to get the next cron date delta, then
-            # add that time to the original scheduling anchor.
-            next_time = cron.get_next(datetime.datetime)
-            delta = next_time - start_naive_tz
-            next_date = pendulum.instance(start_localized + delta)
-
+        for next_date in next_dates:
             # if the end date was exceeded, exit
             if end and next_date > end:
                 break
@@ -531,12 +783,19 @@ class RRuleSchedule(PrefectBaseModel):
             else:
                 n = 1
 
+        rrule = self.to_rrule()
+        if isinstance(rrule, dateutil.rrule.rruleset):
+            rrule._rrule = [_advance_rrule(rr, start) for rr in rrule._rrule]
+            rrule._exrule = [_advance_rrule(exr, start) for exr in rrule._exrule]
+        else:
+            rrule = _advance_rrule(rrule, start)
+
         dates = set()
         counter = 0
 
         # pass count = None to account for discrepancies with duplicates around DST
         # boundaries
-        for next_date in self.to_rrule().xafter(start, count=None, inc=True):
+        for next_date in rrule.xafter(start, count=None, inc=True):
             next_date = pendulum.instance(next_date).in_tz(self.timezone)
 
             # if the end date was exceeded, exit
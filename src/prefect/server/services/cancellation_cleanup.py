@@ -3,16 +3,18 @@ The CancellationCleanup service. Responsible for cancelling tasks and subflows t
 """
 
 import asyncio
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 import pendulum
 import sqlalchemy as sa
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import or_
 
 import prefect.server.models as models
-from prefect.server.database import PrefectDBInterface, inject_db, orm_models
-from prefect.server.schemas import filters, states
+from prefect.server.database import PrefectDBInterface, inject_db
+from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.schemas import states
 from prefect.server.services.loop_service import LoopService
 from prefect.settings import PREFECT_API_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS
 
@@ -50,43 +52,56 @@ class CancellationCleanup(LoopService):
         self.logger.info("Finished cleaning up cancelled flow runs.")
 
     async def clean_up_cancelled_flow_run_task_runs(self, db: PrefectDBInterface):
+        high_water_mark = UUID(int=0)
         while True:
             cancelled_flow_query = (
-                sa.select(db.FlowRun)
+                sa.select(db.FlowRun.id)
                 .where(
                     db.FlowRun.state_type == states.StateType.CANCELLED,
                     db.FlowRun.end_time.is_not(None),
                     db.FlowRun.end_time >= (pendulum.now("UTC").subtract(days=1)),
+                    db.FlowRun.id > high_water_mark,
                 )
+                .order_by(db.FlowRun.id)
                 .limit(self.batch_size)
             )
 
             async with db.session_context() as session:
                 flow_run_result = await session.execute(cancelled_flow_query)
-            flow_runs = flow_run_result.scalars().all()
+            flow_run_ids = flow_run_result.scalars().all()
 
-            for run in flow_runs:
-                await self._cancel_child_runs(db=db, flow_run=run)
+            if flow_run_ids:
+                await self._cancel_child_runs(db=db, flow_run_ids=flow_run_ids)
+                high_water_mark = flow_run_ids[-1]
 
             # if no relevant flows were found, exit the loop
-            if len(flow_runs) < self.batch_size:
+            if len(flow_run_ids) < self.batch_size:
                 break
 
     async def clean_up_cancelled_subflow_runs(self, db: PrefectDBInterface):
         high_water_mark = UUID(int=0)
+        parent_task_run = aliased(db.TaskRun)
+        containing_flow_run = aliased(db.FlowRun)
         while True:
+            # active subflow runs whose parent flow run is cancelled, found with a
+            # single query rather than reading each subflow run's parents in turn
             subflow_query = (
-                sa.select(db.FlowRun)
+                sa.select(db.FlowRun.id, db.FlowRun.deployment_id)
+                .join(
+                    parent_task_run,
+                    parent_task_run.id == db.FlowRun.parent_task_run_id,
+                )
+                .outerjoin(
+                    containing_flow_run,
+                    containing_flow_run.id == parent_task_run.flow_run_id,
+                )
                 .where(
+                    db.FlowRun.state_type.in_(NON_TERMINAL_STATES),
+                    db.FlowRun.id > high_water_mark,
                     or_(
-                        db.FlowRun.state_type == states.StateType.PENDING,
-                        db.FlowRun.state_type == states.StateType.SCHEDULED,
-                        db.FlowRun.state_type == states.StateType.RUNNING,
-                        db.FlowRun.state_type == states.StateType.PAUSED,
-                        db.FlowRun.state_type == states.StateType.CANCELLING,
+                        containing_flow_run.id.is_(None),
+                        containing_flow_run.state_type == states.StateType.CANCELLED,
                     ),
-                    db.FlowRun.id > high_water_mark,
-                    db.FlowRun.parent_task_run_id.is_not(None),
                 )
                 .order_by(db.FlowRun.id)
                 .limit(self.batch_size)
@@ -94,80 +109,80 @@ class CancellationCleanup(LoopService):
 
             async with db.session_context() as session:
                 subflow_run_result = await session.execute(subflow_query)
-            subflow_runs = subflow_run_result.scalars().all()
+            subflow_runs = subflow_run_result.all()
 
-            for subflow_run in subflow_runs:
-                await self._cancel_subflow(db=db, flow_run=subflow_run)
-                high_water_mark = max(high_water_mark, subflow_run.id)
+            if subflow_runs:
+                await self._cancel_subflows(db=db, subflow_runs=subflow_runs)
+                high_water_mark = subflow_runs[-1].id
 
             # if no relevant flows were found, exit the loop
             if len(subflow_runs) < self.batch_size:
                 break
 
     async def _cancel_child_runs(
-        self, db: PrefectDBInterface, flow_run: orm_models.FlowRun
+        self, db: PrefectDBInterface, flow_run_ids: Sequence[UUID]
     ) -> None:
-        async with db.session_context() as session:
-            child_task_runs = await models.task_runs.read_task_runs(
-                session,
-                flow_run_filter=filters.FlowRunFilter(id={"any_": [flow_run.id]}),
-                task_run_filter=filters.TaskRunFilter(
-                    state={"type": {"any_": NON_TERMINAL_STATES}}
-                ),
-                limit=100,
-            )
-
-        for task_run in child_task_runs:
+        """
+        Cancels the active task runs of a batch of flow runs, with a transaction for
+        each batch of task runs rather than for each task run.
+        """
+        high_water_mark = UUID(int=0)
+        while True:
             async with db.session_context(begin_transaction=True) as session:
-                await models.task_runs.set_task_run_state(
-                    session=session,
-                    task_run_id=task_run.id,
-                    state=states.Cancelled(
-                        message="The parent flow run was cancelled."
-                    ),
-                    force=True,
+                child_task_run_result = await session.execute(
+                    sa.select(db.TaskRun.id)
+                    .where(
+                        db.TaskRun.flow_run_id.in_(flow_run_ids),
+                        db.TaskRun.state_type.in_(NON_TERMINAL_STATES),
+                        db.TaskRun.id > high_water_mark,
+                    )
+                    .order_by(db.TaskRun.id)
+                    .limit(self.batch_size)
                 )
+                child_task_run_ids = child_task_run_result.scalars().all()
+
+                for task_run_id in child_task_run_ids:
+                    try:
+                        await models.task_runs.set_task_run_state(
+                            session=session,
+                            task_run_id=task_run_id,
+                            state=states.Cancelled(
+                                message="The parent flow run was cancelled."
+                            ),
+                            force=True,
+                        )
+                    except ObjectNotFoundError:
+                        continue  # task run was deleted, ignore it
+
+            if len(child_task_run_ids) < self.batch_size:
+                break
+            high_water_mark = child_task_run_ids[-1]
 
-    async def _cancel_subflow(
-        self, db: PrefectDBInterface, flow_run: orm_models.FlowRun
-    ) -> Optional[bool]:
-        if not flow_run.parent_task_run_id:
-            return False
-
-        if flow_run.state.type in states.TERMINAL_STATES:
-            return False
-
-        async with db.session_context() as session:
-            parent_task_run = await models.task_runs.read_task_run(
-                session, task_run_id=flow_run.parent_task_run_id
-            )
-
-            if not parent_task_run:
-                # Global orchestration policy will prevent further orchestration
-                return False
-
-            containing_flow_run = await models.flow_runs.read_flow_run(
-                session, flow_run_id=parent_task_run.flow_run_id
-            )
-
-            if (
-                containing_flow_run
-                and containing_flow_run.state.type != states.StateType.CANCELLED
-            ):
-                # Nothing to do here; the parent is not cancelled
-                return False
-
-            if flow_run.deployment_id:
-                state = states.Cancelling(message="The parent flow run was cancelled.")
-            else:
-                state = states.Cancelled(message="The parent flow run was cancelled.")
-
+    async def _cancel_subflows(
+        self, db: PrefectDBInterface, subflow_runs: Sequence[sa.Row]
+    ) -> None:
+        """
+        Cancels a batch of subflow runs in a single transaction.
+        """
         async with db.session_context(begin_transaction=True) as session:
-            await models.flow_runs.set_flow_run_state(
-                session=session,
-                flow_run_id=flow_run.id,
-                state=state,
-            )
+            for subflow_run in subflow_runs:
+                if subflow_run.deployment_id:
+                    state = states.Cancelling(
+                        message="The parent flow run was cancelled."
+                    )
+                else:
+                    state = states.Cancelled(
+                        message="The parent flow run was cancelled."
+                    )
+
+                try:
+                    await models.flow_runs.set_flow_run_state(
+                        session=session,
+                        flow_run_id=subflow_run.id,
+                        state=state,
+                    )
+                except ObjectNotFoundError:
+                    continue  # flow run was deleted, ignore it
 
 
 if __name__ == "__main__":
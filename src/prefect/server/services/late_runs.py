@@ -5,7 +5,7 @@ The threshold for a late run can be configured by changing `PREFECT_API_SERVICES
 
 import asyncio
 import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 import pendulum
 import sqlalchemy as sa
@@ -68,9 +68,7 @@ class MarkLateRuns(LoopService):
                 result = await session.execute(query)
                 runs = result.all()
 
-                # mark each run as late
-                for run in runs:
-                    await self._mark_flow_run_as_late(session=session, flow_run=run)
+                await self._mark_flow_runs_as_late(session=session, flow_runs=runs)
 
                 # if no runs were found, exit the loop
                 if len(runs) < self.batch_size:
@@ -105,13 +103,33 @@ class MarkLateRuns(LoopService):
         )
         return query
 
+    async def _mark_flow_runs_as_late(
+        self, session: AsyncSession, flow_runs: Sequence[sa.Row]
+    ) -> None:
+        """
+        Mark a batch of flow runs as late, writing their states and emitting their
+        events in bulk.
+
+        Pass-through method for overrides. If a subclass overrides
+        `_mark_flow_run_as_late`, it is called for each flow run instead.
+        """
+        if type(self)._mark_flow_run_as_late is not MarkLateRuns._mark_flow_run_as_late:
+            for flow_run in flow_runs:
+                await self._mark_flow_run_as_late(session=session, flow_run=flow_run)
+            return
+
+        await models.flow_runs.mark_flow_runs_late(
+            session=session, flow_run_ids=[flow_run.id for flow_run in flow_runs]
+        )
+
     async def _mark_flow_run_as_late(
         self, session: AsyncSession, flow_run: PrefectDBInterface.FlowRun
     ) -> None:
         """
         Mark a flow run as late.
 
-        Pass-through method for overrides.
+        Pass-through method for overrides; batches are marked late one flow run at a
+        time with this method when it is overridden.
         """
         try:
             await models.flow_runs.set_flow_run_state(
@@ -4,15 +4,16 @@ The Scheduler service.
 
 import asyncio
 import datetime
-from typing import Dict, List, Optional
-from uuid import UUID
+import heapq
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from uuid import UUID, uuid4
 
 import pendulum
 import sqlalchemy as sa
 
 import prefect.server.models as models
 from prefect.server.database import PrefectDBInterface, inject_db
-from prefect.server.schemas.states import StateType
+from prefect.server.schemas.schedules import SCHEDULE_TYPES
 from prefect.server.services.loop_service import LoopService, run_multiple_services
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE,
@@ -22,14 +23,32 @@ from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
     PREFECT_API_SERVICES_SCHEDULER_MIN_RUNS,
     PREFECT_API_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME,
+    PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY,
+    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT,
+    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_LEASE_SECONDS,
 )
 from prefect.utilities.collections import batched_iterable
 
+# the number of distinct deployment IDs
+_DEPLOYMENT_ID_SPACE = 2**128
+
 
 class TryAgain(Exception):
     """Internal control-flow exception used to retry the Scheduler's main loop"""
 
 
+class ScheduleProgress(NamedTuple):
+    """The outcome of scheduling runs for a single deployment schedule"""
+
+    deployment_id: UUID
+    schedule_id: UUID
+    # the schedule's `scheduled_through` time before and after scheduling
+    previous: Optional[datetime.datetime]
+    scheduled_through: datetime.datetime
+    # when the schedule next needs more runs, if ever
+    next_due: Optional[datetime.datetime]
+
+
 class Scheduler(LoopService):
     """
     A loop service that schedules flow runs from deployments.
@@ -63,17 +82,91 @@ class Scheduler(LoopService):
             PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
         )
 
+        # deployments waiting for more runs, as a heap ordered by when they are next
+        # due; entries replaced in `_next_due` are skipped when popped
+        self._due_queue: List[Tuple[datetime.datetime, UUID]] = []
+        self._next_due: Dict[UUID, datetime.datetime] = {}
+        # the `scheduled_through` time of each schedule as last queued, used to
+        # find schedules that were scheduled by another scheduler since
+        self._scheduled_through: Dict[UUID, datetime.datetime] = {}
+
+        self.concurrency: int = PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY.value()
+        # deployments are divided into shards by ID, which replicas lease so that
+        # each deployment is only scheduled by one of them
+        self.shard_count: int = PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT.value()
+        self.shard_lease_duration = datetime.timedelta(
+            seconds=PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_LEASE_SECONDS.value()
+        )
+        self._shard_holder = str(uuid4())
+        # the shards leased to this replica, or `None` if sharding is disabled
+        self._shards: Optional[Set[int]] = None
+
     @inject_db
     async def run_once(self, db: PrefectDBInterface):
         """
         Schedule flow runs by:
 
-        - Querying for deployments with active schedules
-        - Generating the next set of flow runs based on each deployments schedule
-        - Inserting all scheduled flow runs into the database
+        - Querying for deployments whose schedules have not been scheduled since they
+          were created or changed
+        - Queueing deployments whose schedules were scheduled elsewhere since this
+          service last saw them
+        - Popping the deployments whose scheduled runs are about to run out from the
+          queue of next-due deployments
+        - Generating the flow runs after each schedule's `scheduled_through` time
+        - Inserting all scheduled flow runs into the database and advancing each
+          schedule's `scheduled_through` time
+
+        Every loop compares the `scheduled_through` times in the database with the
+        ones this service queued, so deployments scheduled by the
+        `RecentDeploymentsScheduler` or by other replicas are queued for when they
+        are next due, while deployments that have enough runs scheduled are not
+        touched again until they need more.
+
+        When sharding is enabled, the replica first claims its shards and only
+        schedules deployments in them.
+        """
+        if self.shard_count > 1:
+            async with db.session_context(begin_transaction=True) as session:
+                shards = await models.scheduler_shard_leases.claim_scheduler_shards(
+                    session=session,
+                    holder=self._shard_holder,
+                    shard_count=self.shard_count,
+                    lease_duration=self.shard_lease_duration,
+                )
+            if shards != self._shards:
+                # deployments of shards that were released are dropped from the
+                # queue as they come due, and must be queued again if their shard
+                # is claimed back
+                self._scheduled_through.clear()
+            self._shards = shards
+
+        await self._load_due_queue(shards=self._shards)
+
+        total_inserted_runs = await self._schedule_selected_deployments()
+
+        due_deployment_ids = [
+            deployment_id
+            for deployment_id in self._pop_due_deployments(pendulum.now("UTC"))
+            if self._in_shards(deployment_id)
+        ]
+        for batch in batched_iterable(due_deployment_ids, self.deployment_batch_size):
+            while True:
+                try:
+                    total_inserted_runs += await self._schedule_deployments(
+                        deployment_ids=list(batch)
+                    )
+                except TryAgain:
+                    continue
+                break
+
+        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
 
-        All inserted flow runs are committed to the database at the termination of the
-        loop.
+    @inject_db
+    async def _schedule_selected_deployments(self, db: PrefectDBInterface) -> int:
+        """
+        Schedule flow runs for the deployments selected by
+        `_get_select_deployments_to_schedule_query`, returning the number of
+        inserted runs.
         """
         total_inserted_runs = 0
 
@@ -86,24 +179,20 @@ class Scheduler(LoopService):
                 if last_id:
                     query = query.where(db.Deployment.id > last_id)
 
+                if self._shards is not None:
+                    query = query.where(
+                        self._shard_filter(db.Deployment.id, self._shards)
+                    )
+
                 result = await session.execute(query)
                 deployment_ids = result.scalars().unique().all()
 
-                # collect runs across all deployments
-                try:
-                    runs_to_insert = await self._collect_flow_runs(
-                        session=session, deployment_ids=deployment_ids
-                    )
-                except TryAgain:
-                    continue
-
-            # bulk insert the runs based on batch size setting
-            for batch in batched_iterable(runs_to_insert, self.insert_batch_size):
-                async with db.session_context(begin_transaction=True) as session:
-                    inserted_runs = await self._insert_scheduled_flow_runs(
-                        session=session, runs=batch
-                    )
-                    total_inserted_runs += len(inserted_runs)
+            try:
+                total_inserted_runs += await self._schedule_deployments(
+                    deployment_ids=deployment_ids
+                )
+            except TryAgain:
+                continue
 
             # if this is the last page of deployments, exit the loop
             if len(deployment_ids) < self.deployment_batch_size:
@@ -112,66 +201,103 @@ class Scheduler(LoopService):
                 # record the last deployment ID
                 last_id = deployment_ids[-1]
 
-        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+        return total_inserted_runs
+
+    @inject_db
+    async def _schedule_deployments(
+        self, deployment_ids: Sequence[UUID], db: PrefectDBInterface
+    ) -> int:
+        """
+        Schedule flow runs for the given deployments, advance the `scheduled_through`
+        time of their schedules, and queue the deployments for when they are next
+        due. Returns the number of inserted runs.
+        """
+        total_inserted_runs = 0
+
+        # deployments are queued again below if they have active schedules
+        for deployment_id in deployment_ids:
+            self._next_due.pop(deployment_id, None)
+
+        # collect runs across all deployments, split between concurrent sessions
+        async def collect(
+            deployment_ids: Sequence[UUID],
+        ) -> Tuple[List[Dict], List[ScheduleProgress]]:
+            async with db.session_context(begin_transaction=False) as session:
+                return await self._collect_flow_runs(
+                    session=session, deployment_ids=deployment_ids
+                )
+
+        concurrency = max(1, min(self.concurrency, len(deployment_ids)))
+        results = await asyncio.gather(
+            *(collect(deployment_ids[i::concurrency]) for i in range(concurrency)),
+            return_exceptions=True,
+        )
+        runs_to_insert: List[Dict] = []
+        progress: List[ScheduleProgress] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            runs_to_insert.extend(result[0])
+            progress.extend(result[1])
+
+        # bulk insert the runs based on batch size setting
+        for batch in batched_iterable(runs_to_insert, self.insert_batch_size):
+            async with db.session_context(begin_transaction=True) as session:
+                inserted_runs = await self._insert_scheduled_flow_runs(
+                    session=session, runs=batch
+                )
+                total_inserted_runs += len(inserted_runs)
+
+        if progress:
+            async with db.session_context(begin_transaction=True) as session:
+                await self._update_scheduled_through(session=session, progress=progress)
+            for schedule_progress in progress:
+                self._scheduled_through[schedule_progress.schedule_id] = (
+                    schedule_progress.scheduled_through
+                )
+
+        next_due: Dict[UUID, datetime.datetime] = {}
+        for schedule_progress in progress:
+            if schedule_progress.next_due is None:
+                continue
+            deployment_id = schedule_progress.deployment_id
+            next_due[deployment_id] = min(
+                next_due.get(deployment_id, schedule_progress.next_due),
+                schedule_progress.next_due,
+            )
+        for deployment_id, due in next_due.items():
+            self._enqueue(deployment_id, due)
+
+        return total_inserted_runs
 
     @inject_db
     def _get_select_deployments_to_schedule_query(self, db: PrefectDBInterface):
         """
         Returns a sqlalchemy query for selecting deployments to schedule.
 
-        The query gets the IDs of any deployments with:
-
-            - an active schedule
-            - EITHER:
-                - fewer than `min_runs` auto-scheduled runs
-                - OR the max scheduled time is less than `max_scheduled_time` in the future
+        The query gets the IDs of any unpaused deployments with an active schedule
+        that has not been scheduled since it was created or changed. Deployments that
+        have been scheduled before are tracked by the queue of next-due deployments.
         """
-        now = pendulum.now("UTC")
         query = (
             sa.select(db.Deployment.id)
             .select_from(db.Deployment)
-            # TODO: on Postgres, this could be replaced with a lateral join that
-            # sorts by `next_scheduled_start_time desc` and limits by
-            # `self.min_runs` for a ~ 50% speedup. At the time of writing,
-            # performance of this universal query appears to be fast enough that
-            # this optimization is not worth maintaining db-specific queries
-            .join(
-                db.FlowRun,
-                # join on matching deployments, only picking up future scheduled runs
-                sa.and_(
-                    db.Deployment.id == db.FlowRun.deployment_id,
-                    db.FlowRun.state_type == StateType.SCHEDULED,
-                    db.FlowRun.next_scheduled_start_time >= now,
-                    db.FlowRun.auto_scheduled.is_(True),
-                ),
-                isouter=True,
-            )
             .where(
                 sa.and_(
                     db.Deployment.paused.is_not(True),
                     (
-                        # Only include deployments that have at least one
-                        # active schedule.
                         sa.select(db.DeploymentSchedule.deployment_id)
                         .where(
                             sa.and_(
                                 db.DeploymentSchedule.deployment_id == db.Deployment.id,
                                 db.DeploymentSchedule.active.is_(True),
+                                db.DeploymentSchedule.scheduled_through.is_(None),
                             )
                         )
                         .exists()
                     ),
                 )
             )
-            .group_by(db.Deployment.id)
-            # having EITHER fewer than three runs OR runs not scheduled far enough out
-            .having(
-                sa.or_(
-                    sa.func.count(db.FlowRun.next_scheduled_start_time) < self.min_runs,
-                    sa.func.max(db.FlowRun.next_scheduled_start_time)
-                    < now + self.min_scheduled_time,
-                )
-            )
             .order_by(db.Deployment.id)
             .limit(self.deployment_batch_size)
         )
@@ -180,28 +306,31 @@ class Scheduler(LoopService):
     async def _collect_flow_runs(
         self,
         session: sa.orm.Session,
-        deployment_ids: List[UUID],
-    ) -> List[Dict]:
+        deployment_ids: Sequence[UUID],
+    ) -> Tuple[List[Dict], List[ScheduleProgress]]:
         runs_to_insert = []
+        progress = []
         for deployment_id in deployment_ids:
             now = pendulum.now("UTC")
             # guard against erroneously configured schedules
             try:
-                runs_to_insert.extend(
-                    await self._generate_scheduled_flow_runs(
-                        session=session,
-                        deployment_id=deployment_id,
-                        start_time=now,
-                        end_time=now + self.max_scheduled_time,
-                        min_time=self.min_scheduled_time,
-                        min_runs=self.min_runs,
-                        max_runs=self.max_runs,
-                    )
+                runs, deployment_progress = await self._generate_scheduled_flow_runs(
+                    session=session,
+                    deployment_id=deployment_id,
+                    start_time=now,
+                    end_time=now + self.max_scheduled_time,
+                    min_time=self.min_scheduled_time,
+                    min_runs=self.min_runs,
+                    max_runs=self.max_runs,
                 )
+                runs_to_insert.extend(runs)
+                progress.extend(deployment_progress)
             except Exception:
                 self.logger.exception(
                     f"Error scheduling deployment {deployment_id!r}.",
                 )
+                # try again on the next loop
+                self._enqueue(deployment_id, now)
             finally:
                 connection = await session.connection()
                 if connection.invalidated:
@@ -222,7 +351,7 @@ class Scheduler(LoopService):
                     # session.begin() in the next loop iteration.
                     await session.rollback()
                     raise TryAgain()
-        return runs_to_insert
+        return runs_to_insert, progress
 
     @inject_db
     async def _generate_scheduled_flow_runs(
@@ -235,13 +364,11 @@ class Scheduler(LoopService):
         min_runs: int,
         max_runs: int,
         db: PrefectDBInterface,
-    ) -> List[Dict]:
+    ) -> Tuple[List[Dict], List[ScheduleProgress]]:
         """
         Given a `deployment_id` and schedule params, generates a list of flow run
-        objects and associated scheduled states that represent scheduled flow runs.
-
-        Pass-through method for overrides.
-
+        objects and associated scheduled states that represent scheduled flow runs,
+        along with the progress of each of the deployment's active schedules.
 
         Args:
             session: a database session
@@ -252,28 +379,66 @@ class Scheduler(LoopService):
             min_runs: a minimum amount of runs to schedule
             max_runs: a maximum amount of runs to schedule
 
-        This function will generate the minimum number of runs that satisfy the min
-        and max times, and the min and max counts. Specifically, the following order
-        will be respected:
-
-            - Runs will be generated starting on or after the `start_time`
-            - No more than `max_runs` runs will be generated
-            - No runs will be generated after `end_time` is reached
-            - At least `min_runs` runs will be generated
-            - Runs will be generated until at least `start_time + min_time` is reached
-
-        """
-        return await models.deployments._generate_scheduled_flow_runs(
-            db,
-            session=session,
-            deployment_id=deployment_id,
-            start_time=start_time,
-            end_time=end_time,
-            min_time=min_time,
-            min_runs=min_runs,
-            max_runs=max_runs,
+        Dates are generated as described in
+        `models.deployments._generate_scheduled_flow_runs`, but runs are only
+        generated for dates after each schedule's `scheduled_through` time, since
+        earlier runs have already been inserted.
+        """
+        deployment = await session.get(db.Deployment, deployment_id)
+        if not deployment or deployment.paused:
+            return [], []
+
+        result = await session.execute(
+            sa.select(db.DeploymentSchedule).where(
+                db.DeploymentSchedule.deployment_id == deployment_id,
+                db.DeploymentSchedule.active.is_(True),
+            )
         )
 
+        runs = []
+        progress = []
+        for deployment_schedule in result.scalars().all():
+            schedule = deployment_schedule.schedule
+            previous = deployment_schedule.scheduled_through
+            dates = models.deployments._generate_schedule_dates(
+                schedule,
+                start_time=start_time,
+                end_time=end_time,
+                min_time=min_time,
+                min_runs=min_runs,
+                max_runs=max_runs,
+            )
+            runs.extend(
+                models.deployments._build_scheduled_flow_run(deployment, date)
+                for date in dates
+                if previous is None or date > previous
+            )
+
+            if dates and (
+                len(dates) >= max_runs
+                or (len(dates) >= min_runs and dates[-1] >= start_time + min_time)
+            ):
+                # generation stopped at the last date
+                scheduled_through = dates[-1]
+            else:
+                # every date up to the end time was generated
+                scheduled_through = end_time
+            if previous is not None:
+                scheduled_through = max(scheduled_through, previous)
+
+            progress.append(
+                ScheduleProgress(
+                    deployment_id=deployment_id,
+                    schedule_id=deployment_schedule.id,
+                    previous=previous,
+                    scheduled_through=scheduled_through,
+                    next_due=self._get_next_due(
+                        schedule, scheduled_through, now=start_time
+                    ),
+                )
+            )
+        return runs, progress
+
     @inject_db
     async def _insert_scheduled_flow_runs(
         self,
@@ -292,6 +457,252 @@ class Scheduler(LoopService):
             session=session, runs=runs
         )
 
+    @inject_db
+    async def _update_scheduled_through(
+        self,
+        session: sa.orm.Session,
+        progress: List[ScheduleProgress],
+        db: PrefectDBInterface,
+    ) -> None:
+        """
+        Advances the `scheduled_through` time of schedules after their runs have
+        been inserted.
+        """
+        table = db.DeploymentSchedule.__table__
+        await session.execute(
+            sa.update(table)
+            .where(
+                table.c.id == sa.bindparam("_schedule_id"),
+                # a schedule that changed since it was read has had its
+                # `scheduled_through` reset and must be scheduled again
+                table.c.scheduled_through.is_not_distinct_from(
+                    sa.bindparam("_previous")
+                ),
+            )
+            # bookkeeping only, so leave the schedule's `updated` time untouched
+            .values(
+                scheduled_through=sa.bindparam("_scheduled_through"),
+                updated=table.c.updated,
+            ),
+            [
+                {
+                    "_schedule_id": schedule_progress.schedule_id,
+                    "_previous": schedule_progress.previous,
+                    "_scheduled_through": schedule_progress.scheduled_through,
+                }
+                for schedule_progress in progress
+            ],
+        )
+
+    def _get_next_due(
+        self,
+        schedule: SCHEDULE_TYPES,
+        scheduled_through: datetime.datetime,
+        now: datetime.datetime,
+    ) -> Optional[datetime.datetime]:
+        """
+        Returns when a schedule that has had runs scheduled through the given time
+        next needs more runs, or `None` if it will never produce more runs.
+
+        More runs are needed once fewer than `min_runs` scheduled runs remain or the
+        last scheduled run is less than `min_scheduled_time` away, but not before the
+        schedule's next date falls within `max_scheduled_time`.
+        """
+        following = next(
+            (
+                date
+                for date in schedule._get_dates_generator(n=2, start=scheduled_through)
+                if date > scheduled_through
+            ),
+            None,
+        )
+        if following is None:
+            return None
+
+        upcoming = list(
+            schedule._get_dates_generator(
+                n=self.max_runs, start=now, end=scheduled_through
+            )
+        )
+        if len(upcoming) >= self.min_runs:
+            next_due = min(
+                scheduled_through - self.min_scheduled_time,
+                upcoming[-self.min_runs],
+            )
+        else:
+            next_due = now
+
+        return max(next_due, following - self.max_scheduled_time)
+
+    @inject_db
+    async def _load_due_queue(
+        self, db: PrefectDBInterface, shards: Optional[Set[int]] = None
+    ) -> None:
+        """
+        Queues every deployment with an active schedule whose `scheduled_through`
+        time differs from the one this service last queued, limited to the
+        deployments in `shards` if given.
+
+        Only the `scheduled_through` times are read for every schedule; schedules
+        are loaded and their next due time computed only when they have changed, so
+        this is cheap enough to run on every loop.
+        """
+        now = pendulum.now("UTC")
+        changed: Dict[UUID, datetime.datetime] = {}
+        seen: Set[UUID] = set()
+
+        last_id = None
+        while True:
+            async with db.session_context() as session:
+                query = (
+                    sa.select(
+                        db.DeploymentSchedule.id,
+                        db.DeploymentSchedule.scheduled_through,
+                    )
+                    .join(
+                        db.Deployment,
+                        db.Deployment.id == db.DeploymentSchedule.deployment_id,
+                    )
+                    .where(
+                        db.Deployment.paused.is_not(True),
+                        db.DeploymentSchedule.active.is_(True),
+                        db.DeploymentSchedule.scheduled_through.is_not(None),
+                    )
+                    .order_by(db.DeploymentSchedule.id)
+                    .limit(self.deployment_batch_size)
+                )
+
+                # use cursor based pagination
+                if last_id:
+                    query = query.where(db.DeploymentSchedule.id > last_id)
+
+                if shards is not None:
+                    query = query.where(
+                        self._shard_filter(db.DeploymentSchedule.deployment_id, shards)
+                    )
+
+                rows = (await session.execute(query)).all()
+
+            for schedule_id, scheduled_through in rows:
+                seen.add(schedule_id)
+                if self._scheduled_through.get(schedule_id) != scheduled_through:
+                    changed[schedule_id] = scheduled_through
+
+            if len(rows) < self.deployment_batch_size:
+                break
+            last_id = rows[-1][0]
+
+        # forget schedules that were paused, deactivated or reset, so that they are
+        # queued again once they have been scheduled
+        for schedule_id in self._scheduled_through.keys() - seen:
+            del self._scheduled_through[schedule_id]
+
+        next_due: Dict[UUID, datetime.datetime] = {}
+        for batch in batched_iterable(list(changed), self.deployment_batch_size):
+            async with db.session_context() as session:
+                result = await session.execute(
+                    sa.select(db.DeploymentSchedule).where(
+                        db.DeploymentSchedule.id.in_(batch)
+                    )
+                )
+                schedules = result.scalars().all()
+
+            for deployment_schedule in schedules:
+                if deployment_schedule.scheduled_through is None:
+                    # reset since it was read, so it is scheduled from scratch
+                    continue
+                self._scheduled_through[deployment_schedule.id] = (
+                    deployment_schedule.scheduled_through
+                )
+                try:
+                    due = self._get_next_due(
+                        deployment_schedule.schedule,
+                        deployment_schedule.scheduled_through,
+                        now=now,
+                    )
+                except Exception:
+                    self.logger.exception(
+                        "Error scheduling deployment"
+                        f" {deployment_schedule.deployment_id!r}.",
+                    )
+                    due = now
+                if due is None:
+                    continue
+                deployment_id = deployment_schedule.deployment_id
+                next_due[deployment_id] = min(next_due.get(deployment_id, due), due)
+
+        for deployment_id, due in next_due.items():
+            # the deployment may already be queued for another of its schedules
+            queued = self._next_due.get(deployment_id)
+            self._enqueue(deployment_id, due if queued is None else min(queued, due))
+
+    def _shard_bounds(self, shard: int) -> Tuple[Optional[UUID], Optional[UUID]]:
+        """
+        Returns the inclusive lower and exclusive upper bounds of the deployment IDs
+        in a shard, where `None` means unbounded.
+        """
+        lower = -(-shard * _DEPLOYMENT_ID_SPACE // self.shard_count)
+        upper = -(-(shard + 1) * _DEPLOYMENT_ID_SPACE // self.shard_count)
+        return (
+            UUID(int=lower) if shard > 0 else None,
+            UUID(int=upper) if shard < self.shard_count - 1 else None,
+        )
+
+    def _shard_filter(
+        self, deployment_id: sa.ColumnElement[UUID], shards: Iterable[int]
+    ) -> sa.ColumnElement[bool]:
+        """
+        Returns a filter on a deployment ID column matching the deployments in the
+        given shards, with adjacent shards combined into a single range.
+        """
+        ranges: List[List[Optional[UUID]]] = []
+        for shard in sorted(shards):
+            lower, upper = self._shard_bounds(shard)
+            if ranges and ranges[-1][1] == lower:
+                ranges[-1][1] = upper
+            else:
+                ranges.append([lower, upper])
+
+        conditions = []
+        for lower, upper in ranges:
+            bounds = []
+            if lower is not None:
+                bounds.append(deployment_id >= lower)
+            if upper is not None:
+                bounds.append(deployment_id < upper)
+            conditions.append(sa.and_(sa.true(), *bounds))
+        return sa.or_(sa.false(), *conditions)
+
+    def _in_shards(self, deployment_id: UUID) -> bool:
+        """
+        Returns whether a deployment is in the shards leased to this replica, which
+        is always the case when sharding is disabled.
+        """
+        if self._shards is None:
+            return True
+        shard = deployment_id.int * self.shard_count // _DEPLOYMENT_ID_SPACE
+        return shard in self._shards
+
+    def _enqueue(self, deployment_id: UUID, due: datetime.datetime) -> None:
+        """
+        Queues a deployment for when it is next due, replacing any earlier entry.
+        """
+        self._next_due[deployment_id] = due
+        heapq.heappush(self._due_queue, (due, deployment_id))
+
+    def _pop_due_deployments(self, now: datetime.datetime) -> List[UUID]:
+        """
+        Removes and returns the queued deployments that are due by `now`.
+        """
+        deployment_ids = []
+        while self._due_queue and self._due_queue[0][0] <= now:
+            due, deployment_id = heapq.heappop(self._due_queue)
+            # skip entries that have been replaced by a later `_enqueue`
+            if self._next_due.get(deployment_id) == due:
+                del self._next_due[deployment_id]
+                deployment_ids.append(deployment_id)
+        return deployment_ids
+
 
 class RecentDeploymentsScheduler(Scheduler):
     """
@@ -303,11 +714,50 @@ class RecentDeploymentsScheduler(Scheduler):
     Note that scheduling is idempotent, so its ok for this scheduler to attempt
     to schedule the same deployments as the main scheduler. It's purpose is to
     accelerate scheduling for any deployments that users are interacting with.
+
+    When given the main `scheduler` running in the same process, this scheduler
+    only schedules deployments in the main scheduler's shards and queues them on
+    its queue of next-due deployments. Otherwise, the main scheduler picks up the
+    deployments it schedules from their `scheduled_through` times.
     """
 
     # this scheduler runs on a tight loop
     loop_seconds = 5
 
+    def __init__(
+        self,
+        loop_seconds: Optional[float] = None,
+        scheduler: Optional[Scheduler] = None,
+        **kwargs,
+    ):
+        super().__init__(loop_seconds=loop_seconds, **kwargs)
+        self._scheduler = scheduler
+        if scheduler is not None:
+            # share the main scheduler's queue of next-due deployments
+            self._due_queue = scheduler._due_queue
+            self._next_due = scheduler._next_due
+            self._scheduled_through = scheduler._scheduled_through
+
+    async def run_once(self):
+        """
+        Schedule flow runs for recently created or updated deployments.
+        """
+        if self._scheduler is not None:
+            if self._scheduler.shard_count > 1 and self._scheduler._shards is None:
+                # the main scheduler has not claimed its shards yet
+                return
+            self._shards = self._scheduler._shards
+
+        total_inserted_runs = await self._schedule_selected_deployments()
+        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+
+    def _enqueue(self, deployment_id: UUID, due: datetime.datetime) -> None:
+        """
+        Queues a deployment on the main scheduler's queue, if there is one.
+        """
+        if self._scheduler is not None:
+            super()._enqueue(deployment_id, due)
+
     @inject_db
     def _get_select_deployments_to_schedule_query(self, db: PrefectDBInterface):
         """
@@ -346,11 +796,12 @@ class RecentDeploymentsScheduler(Scheduler):
 
 
 if __name__ == "__main__":
+    scheduler = Scheduler(handle_signals=True)
     asyncio.run(
         run_multiple_services(
             [
-                Scheduler(handle_signals=True),
-                RecentDeploymentsScheduler(handle_signals=True),
+                scheduler,
+                RecentDeploymentsScheduler(handle_signals=True, scheduler=scheduler),
             ]
         )
     )
@@ -1,6 +1,18 @@
 import asyncio
+from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, Optional
+from datetime import timedelta
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 from uuid import UUID
 
 import pendulum
@@ -13,17 +25,26 @@ from prefect.server.database import (
     db_injector,
     provide_database_interface,
 )
-from prefect.server.events.ordering import CausalOrdering, EventArrivedEarly
+from prefect.server.events.ordering import (
+    CausalOrdering,
+    EventArrivedEarly,
+    get_causal_ordering,
+)
 from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.storage.database import get_max_query_parameters
 from prefect.server.schemas.core import TaskRun
 from prefect.server.schemas.states import State
 from prefect.server.utilities.messaging import Message, MessageHandler, create_consumer
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_BATCH_SIZE,
+    PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_FLUSH_INTERVAL,
+)
 
 logger = get_logger(__name__)
 
 
-def causal_ordering():
-    return CausalOrdering(
+def causal_ordering() -> CausalOrdering:
+    return get_causal_ordering(
         "task-run-recorder",
     )
 
@@ -93,6 +114,129 @@ async def _update_task_run_with_state(
     )
 
 
+def _in_parameter_batches(
+    rows: List[Dict[str, Any]],
+) -> Generator[List[Dict[str, Any]], None, None]:
+    """
+    Split rows for a multi-row insert so that each statement stays within the
+    database's limit on query parameters.
+    """
+    rows_per_batch = max(get_max_query_parameters() // max(len(rows[0]), 1), 1)
+    for start in range(0, len(rows), rows_per_batch):
+        yield rows[start : start + rows_per_batch]
+
+
+def _group_by_columns(
+    rows: Iterable[Dict[str, Any]],
+) -> Dict[FrozenSet[str], List[Dict[str, Any]]]:
+    groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        groups[frozenset(row)].append(row)
+    return groups
+
+
+@db_injector
+async def _bulk_insert_task_runs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    task_run_attributes: Dict[UUID, Dict[str, Any]],
+):
+    now = pendulum.now("UTC")
+    rows = [
+        {"created": now, **attributes} for attributes in task_run_attributes.values()
+    ]
+    for group in _group_by_columns(rows).values():
+        for batch in _in_parameter_batches(group):
+            await session.execute(
+                db.queries.insert(db.TaskRun)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=["id"])
+            )
+
+
+@db_injector
+async def _bulk_insert_task_run_states(
+    db: PrefectDBInterface, session: AsyncSession, task_runs: List[TaskRun]
+):
+    now = pendulum.now("UTC")
+    rows = list(
+        {
+            task_run.state.id: {
+                "created": now,
+                "task_run_id": task_run.id,
+                **task_run.state.model_dump(),
+            }
+            for task_run in task_runs
+            if task_run.state
+        }.values()
+    )
+    for batch in _in_parameter_batches(rows):
+        await session.execute(
+            db.queries.insert(db.TaskRunState)
+            .values(batch)
+            .on_conflict_do_nothing(index_elements=["id"])
+        )
+
+
+@db_injector
+async def _bulk_update_task_runs_with_states(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    task_run_attributes: Dict[UUID, Dict[str, Any]],
+    latest_states: Dict[UUID, State],
+):
+    now = pendulum.now("UTC")
+    table = db.TaskRun.__table__
+
+    # task runs with an older state take on the attributes and state of the events
+    rows = [
+        {
+            **task_run_attributes[task_run_id],
+            **_denormalized_state_attributes(state),
+            "updated": now,
+        }
+        for task_run_id, state in latest_states.items()
+    ]
+    for columns, group in _group_by_columns(rows).items():
+        await session.execute(
+            sa.update(table)
+            .where(
+                table.c.id == sa.bindparam("_id"),
+                table.c.state_timestamp < sa.bindparam("_state_timestamp"),
+            )
+            .values(
+                {column: sa.bindparam(f"_{column}") for column in columns - {"id"}}
+            ),
+            [{f"_{column}": value for column, value in row.items()} for row in group],
+        )
+
+    # task runs without a state, such as the ones just inserted, only take on the
+    # state of the events
+    await session.execute(
+        sa.update(table)
+        .where(
+            table.c.id == sa.bindparam("_id"),
+            table.c.state_timestamp.is_(None),
+        )
+        .values(
+            state_id=sa.bindparam("_state_id"),
+            state_type=sa.bindparam("_state_type"),
+            state_name=sa.bindparam("_state_name"),
+            state_timestamp=sa.bindparam("_state_timestamp"),
+        ),
+        [
+            {
+                "_id": task_run_id,
+                **{
+                    f"_{column}": value
+                    for column, value in _denormalized_state_attributes(state).items()
+                },
+            }
+            for task_run_id, state in latest_states.items()
+        ],
+    )
+
+
 def task_run_from_event(event: ReceivedEvent) -> TaskRun:
     task_run_id = event.resource.prefect_object_id("prefect.task-run")
 
@@ -121,10 +265,8 @@ def task_run_from_event(event: ReceivedEvent) -> TaskRun:
     )
 
 
-async def record_task_run_event(event: ReceivedEvent):
-    task_run = task_run_from_event(event)
-
-    task_run_attributes = task_run.model_dump_for_orm(
+def _task_run_attributes(task_run: TaskRun) -> Dict[str, Any]:
+    return task_run.model_dump_for_orm(
         exclude={
             "state_id",
             "state",
@@ -135,15 +277,25 @@ async def record_task_run_event(event: ReceivedEvent):
         exclude_unset=True,
     )
 
-    assert task_run.state
 
-    denormalized_state_attributes = {
-        "state_id": task_run.state.id,
-        "state_type": task_run.state.type,
-        "state_name": task_run.state.name,
-        "state_timestamp": task_run.state.timestamp,
+def _denormalized_state_attributes(state: State) -> Dict[str, Any]:
+    return {
+        "state_id": state.id,
+        "state_type": state.type,
+        "state_name": state.name,
+        "state_timestamp": state.timestamp,
     }
 
+
+async def record_task_run_event(event: ReceivedEvent):
+    task_run = task_run_from_event(event)
+
+    task_run_attributes = _task_run_attributes(task_run)
+
+    assert task_run.state
+
+    denormalized_state_attributes = _denormalized_state_attributes(task_run.state)
+
     db = provide_database_interface()
     async with db.session_context(begin_transaction=True) as session:
         await _insert_task_run(session, task_run, task_run_attributes)
@@ -167,8 +319,96 @@ async def record_task_run_event(event: ReceivedEvent):
     )
 
 
+async def record_task_run_events(events: List[ReceivedEvent]):
+    """
+    Record a batch of task run events in a single transaction.
+
+    Every event's state is recorded, but each task run is written once, with the
+    attributes of its events applied in the order that their states occurred and
+    the denormalized state of its latest event. As when recording events one at a
+    time, a task run that already has a newer state keeps its attributes and state.
+    """
+    transitions: List[Tuple[State, TaskRun]] = []
+    for event in events:
+        task_run = task_run_from_event(event)
+        assert task_run.state
+        transitions.append((task_run.state, task_run))
+    transitions.sort(key=lambda transition: transition[0].timestamp)
+
+    task_run_attributes: Dict[UUID, Dict[str, Any]] = {}
+    latest_states: Dict[UUID, State] = {}
+    for state, task_run in transitions:
+        task_run_attributes.setdefault(task_run.id, {}).update(
+            _task_run_attributes(task_run)
+        )
+        latest_states[task_run.id] = state
+
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await _bulk_insert_task_runs(session, task_run_attributes)
+        await _bulk_insert_task_run_states(
+            session, [task_run for _, task_run in transitions]
+        )
+        await _bulk_update_task_runs_with_states(
+            session, task_run_attributes, latest_states
+        )
+
+    logger.debug(
+        "Recorded %s task run state changes for %s task runs",
+        len(transitions),
+        len(latest_states),
+    )
+
+
 @asynccontextmanager
-async def consumer() -> AsyncGenerator[MessageHandler, None]:
+async def consumer(
+    batch_size: int = 1,
+    flush_every: timedelta = timedelta(seconds=0.5),
+) -> AsyncGenerator[MessageHandler, None]:
+    """
+    Set up a message handler that records task run events.
+
+    With a `batch_size` of one, each event is recorded as it is handled. Otherwise,
+    events are accumulated and recorded together every `batch_size` events, or every
+    `flush_every` interval to flush any remaining events. If a batch can't be
+    recorded, its events are recorded one at a time so that one bad event doesn't
+    prevent the rest from being recorded.
+    """
+    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue()
+    # batches are recorded one at a time so that they are applied in order
+    flush_lock = asyncio.Lock()
+
+    async def flush() -> None:
+        async with flush_lock:
+            batch: List[ReceivedEvent] = []
+            while queue.qsize() > 0:
+                batch.append(queue.get_nowait())
+
+            if not batch:
+                return
+
+            try:
+                await record_task_run_events(batch)
+            except Exception:
+                logger.debug(
+                    "Error recording task run events, recording them one at a time",
+                    exc_info=True,
+                )
+                for event in batch:
+                    try:
+                        await record_task_run_event(event)
+                    except Exception:
+                        logger.exception("Error recording task run event %s", event.id)
+
+    async def flush_periodically():
+        try:
+            while True:
+                await asyncio.sleep(flush_every.total_seconds())
+                if queue.qsize():
+                    await flush()
+        except asyncio.CancelledError:
+            return
+
     async def message_handler(message: Message):
         event: ReceivedEvent = ReceivedEvent.model_validate_json(message.data)
 
@@ -185,15 +425,33 @@ async def consumer() -> AsyncGenerator[MessageHandler, None]:
             event.resource.get("prefect.resource.id"),
         )
 
+        if batch_size > 1:
+            await queue.put(event)
+            if queue.qsize() >= batch_size:
+                await flush()
+            return
+
         try:
             await record_task_run_event(event)
         except EventArrivedEarly:
             # We're safe to ACK this message because it has been parked by the
             # causal ordering mechanism and will be reprocessed when the preceding
-            # event arrives.
+            # event arrives.  Only the database ordering keeps it across restarts
+            # and server processes.
             pass
 
-    yield message_handler
+    if batch_size <= 1:
+        yield message_handler
+        return
+
+    periodic_flush = asyncio.create_task(flush_periodically())
+
+    try:
+        yield message_handler
+    finally:
+        periodic_flush.cancel()
+        if queue.qsize():
+            await flush()
 
 
 class TaskRunRecorder:
@@ -220,7 +478,12 @@ class TaskRunRecorder:
         assert self.consumer_task is None, "TaskRunRecorder already started"
         self.consumer = create_consumer("events")
 
-        async with consumer() as handler:
+        async with consumer(
+            batch_size=PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_BATCH_SIZE.value(),
+            flush_every=timedelta(
+                seconds=PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_FLUSH_INTERVAL.value()
+            ),
+        ) as handler:
             self.consumer_task = asyncio.create_task(self.consumer.run(handler))
             logger.debug("TaskRunRecorder started")
             self.started_event.set()
@@ -31,6 +31,7 @@ from sqlalchemy.dialects.postgresql.operators import (
     HAS_ALL,  # type: ignore
     HAS_ANY,  # type: ignore
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import functions, schema
@@ -715,3 +716,37 @@ def get_dialect(obj: Union[str, Session, sa.Engine]) -> type[sa.Dialect]:
         url = sa.engine.url.make_url(obj)
 
     return url.get_dialect()
+
+
+async def copy_rows(
+    session: AsyncSession,
+    table: sa.Table,
+    target: str,
+    rows: list[dict[str, Any]],
+) -> None:
+    """
+    Load rows into the `target` table with Postgres' `COPY`, converting their values
+    the same way the columns of `table` would for an `INSERT`.
+
+    Columns missing from the rows are filled in by the `target` table's server
+    defaults.  Requires the `asyncpg` driver.
+    """
+    connection = await session.connection()
+    dialect = connection.dialect
+    columns = list(rows[0].keys())
+    processors = [
+        table.c[column].type.dialect_impl(dialect).bind_processor(dialect)
+        for column in columns
+    ]
+    records = [
+        tuple(
+            processor(row[column]) if processor else row[column]
+            for column, processor in zip(columns, processors)
+        )
+        for row in rows
+    ]
+
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        target, records=records, columns=columns
+    )
@@ -0,0 +1,105 @@
+"""
+Implements in-memory registries of requests that are waiting for flow runs to be
+scheduled into work queues, so that workers polling for scheduled flow runs can be
+answered as soon as there is work for them.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, Generator, Iterable, List, Optional, Set
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class WorkQueueWaiter:
+    """A single request waiting for flow runs in one or more work queues"""
+
+    def __init__(self, work_queue_ids: Iterable[UUID]):
+        self.work_queue_ids: List[UUID] = list(work_queue_ids)
+        self._loop = asyncio.get_running_loop()
+        self._woken = asyncio.Event()
+
+    def wake(self) -> None:
+        running_loop: Optional[asyncio.AbstractEventLoop]
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        # commits may happen on another thread's event loop, such as the services'
+        if running_loop is self._loop:
+            self._woken.set()
+        else:
+            self._loop.call_soon_threadsafe(self._woken.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """Waits until this waiter is woken or the timeout passes, returning whether
+        it was woken"""
+        try:
+            await asyncio.wait_for(self._woken.wait(), timeout=max(timeout, 0.0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._woken.clear()
+
+
+class WorkQueueWaiters:
+    _waiters: Dict[UUID, Set[WorkQueueWaiter]] = {}
+
+    @classmethod
+    def reset(cls) -> None:
+        """A unit testing utility to reset the state of the waiters"""
+        cls._waiters.clear()
+
+    @classmethod
+    def waiting_on(cls, work_queue_id: UUID) -> int:
+        """The number of requests waiting on the given work queue"""
+        return len(cls._waiters.get(work_queue_id, ()))
+
+    @classmethod
+    @contextmanager
+    def waiting(
+        cls, work_queue_ids: Iterable[UUID]
+    ) -> Generator[WorkQueueWaiter, None, None]:
+        """Registers a waiter on each of the given work queues for as long as the
+        context is open.  Flow runs scheduled while the context is open wake the
+        waiter, even if it isn't waiting at that moment."""
+        waiter = WorkQueueWaiter(work_queue_ids)
+        for work_queue_id in waiter.work_queue_ids:
+            cls._waiters.setdefault(work_queue_id, set()).add(waiter)
+
+        try:
+            yield waiter
+        finally:
+            for work_queue_id in waiter.work_queue_ids:
+                waiters = cls._waiters.get(work_queue_id)
+                if waiters is None:
+                    continue
+                waiters.discard(waiter)
+                if not waiters:
+                    del cls._waiters[work_queue_id]
+
+    @classmethod
+    def notify(cls, work_queue_ids: Iterable[UUID]) -> None:
+        """Wakes every waiter on the given work queues"""
+        for work_queue_id in set(work_queue_ids):
+            for waiter in list(cls._waiters.get(work_queue_id, ())):
+                waiter.wake()
+
+    @classmethod
+    def notify_on_commit(
+        cls, session: AsyncSession, work_queue_ids: Iterable[UUID]
+    ) -> None:
+        """Wakes every waiter on the given work queues once the session's transaction
+        is committed, so that they don't look for flow runs before they're visible"""
+        work_queue_ids = {id for id in work_queue_ids if id is not None}
+        if not work_queue_ids:
+            return
+
+        def notification(session, **kwargs):
+            cls.notify(work_queue_ids)
+
+        sa.event.listen(session.sync_session, "after_commit", notification, once=True)
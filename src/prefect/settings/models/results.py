@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import ClassVar, Optional
+from typing import ClassVar, Literal, Optional
 
 from pydantic import AliasChoices, AliasPath, ConfigDict, Field
 
@@ -18,6 +18,35 @@ class ResultsSettings(PrefectBaseSettings):
         description="The default serializer to use when not otherwise specified.",
     )
 
+    record_format: Literal["json", "binary"] = Field(
+        default="json",
+        description="""
+        The format used when writing result records to storage.
+
+        - "json": Write the record as a single JSON document. Readable by all versions of Prefect.
+        - "binary": Write a small binary header followed by the raw serialized result. Avoids
+          embedding large payloads in JSON and streams results to and from storage that
+          supports it; requires a version of Prefect that supports the binary format to read.
+
+        Records written in either format can always be read.
+        """,
+    )
+
+    memory_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="The maximum estimated size in bytes of the result records held in memory by each result store.",
+    )
+
+    local_cache_max_bytes: int = Field(
+        default=0,
+        description="The maximum size in bytes of the local disk cache of result records read from remote result storage. Set to 0 to disable the disk cache. Cached records are not revalidated against remote storage, so only enable the cache when result records are not overwritten.",
+    )
+
+    local_cache_path: Optional[Path] = Field(
+        default=None,
+        description="The path to a directory to cache result records read from remote result storage in. Defaults to $PREFECT_HOME/results-cache.",
+    )
+
     persist_by_default: bool = Field(
         default=False,
         description="The default setting for persisting results when not otherwise specified.",
@@ -198,6 +198,9 @@ class Settings(PrefectBaseSettings):
         if self.results.local_storage_path is None:
             self.results.local_storage_path = Path(f"{self.home}/storage")
             self.results.__pydantic_fields_set__.remove("local_storage_path")
+        if self.results.local_cache_path is None:
+            self.results.local_cache_path = Path(f"{self.home}/results-cache")
+            self.results.__pydantic_fields_set__.remove("local_cache_path")
         if self.server.memo_store_path is None:
             self.server.memo_store_path = Path(f"{self.home}/memo_store.toml")
             self.server.__pydantic_fields_set__.remove("memo_store_path")
@@ -1,9 +1,10 @@
-from typing import ClassVar, Optional
+from functools import partial
+from typing import Annotated, ClassVar, Optional, Union
 
-from pydantic import ConfigDict, Field
+from pydantic import BeforeValidator, ConfigDict, Field
 
 from prefect.settings.base import PrefectBaseSettings, _build_settings_config
-from prefect.types import LogLevel
+from prefect.types import LogLevel, validate_set_T_from_delim_string
 
 
 class RunnerServerSettings(PrefectBaseSettings):
@@ -62,6 +63,27 @@ class RunnerSettings(PrefectBaseSettings):
         ge=30,
     )
 
+    warm_process_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Number of interpreters, with Prefect already imported, a runner should keep"
+            " started and ready to execute flow runs. Set to 0 to start a new process"
+            " for each flow run."
+        ),
+    )
+
+    warm_process_preload: Annotated[
+        Union[str, list[str], None],
+        BeforeValidator(partial(validate_set_T_from_delim_string, type_=str)),
+    ] = Field(
+        default=None,
+        description=(
+            "Modules or Python files containing flows to import into a runner's ready"
+            " interpreters before they are handed flow runs."
+        ),
+    )
+
     server: RunnerServerSettings = Field(
         default_factory=RunnerServerSettings,
         description="Settings for controlling runner server behavior",
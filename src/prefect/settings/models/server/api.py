@@ -134,3 +134,63 @@ class ServerAPISettings(PrefectBaseSettings):
             "prefect_server_cors_allowed_headers",
         ),
     )
+
+    concurrency_slot_max_wait_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="""
+        The longest time a request to acquire global concurrency slots may wait on the
+        server for slots to be released before it is told to retry.
+
+        Waiting requests are woken in the order they arrived as slots are released.
+        Set this to `0` to have requests that can't acquire slots return immediately.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("concurrency_slot_max_wait_seconds"),
+            "prefect_server_api_concurrency_slot_max_wait_seconds",
+        ),
+    )
+
+    logs_bulk_max_queue_size: int = Field(
+        default=100_000,
+        gt=0,
+        description="""
+        The most logs accepted through the bulk logs endpoint that may be waiting to be
+        written to the database.  Once this many are waiting, further requests wait for
+        logs to be written before they are accepted.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("logs_bulk_max_queue_size"),
+            "prefect_server_api_logs_bulk_max_queue_size",
+        ),
+    )
+
+    logs_bulk_batch_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="""
+        The most logs accepted through the bulk logs endpoint that are written to the
+        database in a single transaction.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("logs_bulk_batch_size"),
+            "prefect_server_api_logs_bulk_batch_size",
+        ),
+    )
+
+    scheduled_flow_runs_max_wait_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="""
+        The longest time a worker's request for scheduled flow runs may wait on the
+        server for flow runs to be scheduled into its work queues when there are none
+        to return.
+
+        Waiting requests are answered as soon as flow runs are scheduled.  Set this to
+        `0` to have requests return immediately when there are no scheduled flow runs.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("scheduled_flow_runs_max_wait_seconds"),
+            "prefect_server_api_scheduled_flow_runs_max_wait_seconds",
+        ),
+    )
@@ -137,6 +137,15 @@ class ServerEventsSettings(PrefectBaseSettings):
         ),
     )
 
+    causal_ordering: str = Field(
+        default="prefect.server.events.ordering.db",
+        description="Which causal ordering implementation to use for the events system, should point to a module that exports a CausalOrdering class. `prefect.server.events.ordering.memory` holds events that arrive early in memory, so it should only be used with a single server process.",
+        validation_alias=AliasChoices(
+            AliasPath("causal_ordering"),
+            "prefect_server_events_causal_ordering",
+        ),
+    )
+
     maximum_event_name_length: int = Field(
         default=1024,
         gt=0,
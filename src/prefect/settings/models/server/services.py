@@ -77,6 +77,36 @@ class ServerServicesEventPersisterSettings(PrefectBaseSettings):
         ),
     )
 
+    max_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The largest number of events the event persister will insert in one batch when it has a backlog of events to insert.",
+        validation_alias=AliasChoices(
+            AliasPath("max_batch_size"),
+            "prefect_server_services_event_persister_max_batch_size",
+        ),
+    )
+
+    max_queue_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="The number of events the event persister will hold before it stops receiving events until they have been inserted.",
+        validation_alias=AliasChoices(
+            AliasPath("max_queue_size"),
+            "prefect_server_services_event_persister_max_queue_size",
+        ),
+    )
+
+    concurrency: int = Field(
+        default=1,
+        gt=0,
+        description="The number of batches of events the event persister will insert concurrently.",
+        validation_alias=AliasChoices(
+            AliasPath("concurrency"),
+            "prefect_server_services_event_persister_concurrency",
+        ),
+    )
+
 
 class ServerServicesFlowRunNotificationsSettings(PrefectBaseSettings):
     """
@@ -347,6 +377,46 @@ class ServerServicesSchedulerSettings(PrefectBaseSettings):
         ),
     )
 
+    concurrency: int = Field(
+        default=1,
+        description="""
+        The number of deployments the scheduler will generate runs for
+        concurrently, each with its own database session. Defaults to `1`.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("concurrency"),
+            "prefect_server_services_scheduler_concurrency",
+        ),
+    )
+
+    shard_count: int = Field(
+        default=1,
+        description="""
+        The number of shards deployments are divided into by ID so that
+        scheduling can be split between scheduler replicas. Each replica claims a
+        fair share of the shards through leases stored in the database and only
+        schedules deployments in its shards. Set to `1` to disable sharding.
+        Defaults to `1`.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("shard_count"),
+            "prefect_server_services_scheduler_shard_count",
+        ),
+    )
+
+    shard_lease_seconds: float = Field(
+        default=180,
+        description="""
+        How long a scheduler replica's claim on a shard lasts without being
+        renewed. Replicas renew their leases every loop, so this should be longer
+        than `loop_seconds`. Defaults to `180`.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("shard_lease_seconds"),
+            "prefect_server_services_scheduler_shard_lease_seconds",
+        ),
+    )
+
 
 class ServerServicesPauseExpirationsSettings(PrefectBaseSettings):
     """
@@ -403,6 +473,26 @@ class ServerServicesTaskRunRecorderSettings(PrefectBaseSettings):
         ),
     )
 
+    batch_size: int = Field(
+        default=100,
+        gt=0,
+        description="The number of task run events the task run recorder will attempt to record in one batch.",
+        validation_alias=AliasChoices(
+            AliasPath("batch_size"),
+            "prefect_server_services_task_run_recorder_batch_size",
+        ),
+    )
+
+    flush_interval: float = Field(
+        default=0.5,
+        gt=0.0,
+        description="The maximum number of seconds between flushes of the task run recorder.",
+        validation_alias=AliasChoices(
+            AliasPath("flush_interval"),
+            "prefect_server_services_task_run_recorder_flush_interval",
+        ),
+    )
+
 
 class ServerServicesTriggersSettings(PrefectBaseSettings):
     """
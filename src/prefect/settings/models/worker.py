@@ -1,8 +1,10 @@
-from typing import ClassVar
+from functools import partial
+from typing import Annotated, ClassVar, Union
 
-from pydantic import ConfigDict, Field
+from pydantic import BeforeValidator, ConfigDict, Field
 
 from prefect.settings.base import PrefectBaseSettings, _build_settings_config
+from prefect.types import validate_set_T_from_delim_string
 
 
 class WorkerWebserverSettings(PrefectBaseSettings):
@@ -37,6 +39,27 @@ class WorkerSettings(PrefectBaseSettings):
         description="The number of seconds into the future a worker should query for scheduled work.",
     )
 
+    warm_process_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Number of interpreters, with Prefect already imported, a process worker"
+            " should keep started and ready to execute flow runs. Set to 0 to start a"
+            " new process for each flow run."
+        ),
+    )
+
+    warm_process_preload: Annotated[
+        Union[str, list[str], None],
+        BeforeValidator(partial(validate_set_T_from_delim_string, type_=str)),
+    ] = Field(
+        default=None,
+        description=(
+            "Modules or Python files containing flows to import into a process"
+            " worker's ready interpreters before they are handed flow runs."
+        ),
+    )
+
     webserver: WorkerWebserverSettings = Field(
         default_factory=WorkerWebserverSettings,
         description="Settings for a worker's webserver",
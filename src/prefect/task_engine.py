@@ -16,6 +16,7 @@ from typing import (
     Coroutine,
     Generator,
     Generic,
+    Iterable,
     Literal,
     Optional,
     Sequence,
@@ -30,6 +31,14 @@ import pendulum
 from opentelemetry import trace
 from typing_extensions import ParamSpec
 
+from prefect.cache_policies import (
+    CachePolicy,
+    CompoundCachePolicy,
+    FlowParameters,
+    Inputs,
+    RunId,
+    TaskSource,
+)
 from prefect.client.orchestration import PrefectClient, SyncPrefectClient, get_client
 from prefect.client.schemas import TaskRun
 from prefect.client.schemas.objects import State, TaskRunInput
@@ -52,6 +61,7 @@ from prefect.exceptions import (
     TerminationSignal,
     UpstreamTaskError,
 )
+from prefect.futures import PrefectFuture
 from prefect.logging.loggers import get_logger, patch_print, task_run_logger
 from prefect.results import (
     ResultRecord,
@@ -78,10 +88,10 @@ from prefect.states import (
 from prefect.telemetry.run_telemetry import RunTelemetry
 from prefect.transactions import IsolationLevel, Transaction, transaction
 from prefect.utilities._engine import get_hook_name
-from prefect.utilities.annotations import NotSet
+from prefect.utilities.annotations import NotSet, quote
 from prefect.utilities.asyncutils import run_coro_as_sync
 from prefect.utilities.callables import call_with_parameters, parameters_to_args_kwargs
-from prefect.utilities.collections import visit_collection
+from prefect.utilities.collections import StopVisiting, visit_collection
 from prefect.utilities.engine import (
     emit_task_run_state_change_event,
     link_state_to_result,
@@ -1564,3 +1574,111 @@ def run_task(
         return run_task_async(**kwargs)
     else:
         return run_task_sync(**kwargs)
+
+
+# cache policies whose keys can be computed before the task runs they apply to exist
+_PREFETCHABLE_CACHE_POLICIES = (Inputs, TaskSource, FlowParameters, RunId)
+
+
+class _UpstreamReference(Exception):
+    """
+    Raised when task parameters cannot be resolved without waiting on upstream runs.
+    """
+
+
+def _supports_prefetch(policy: CachePolicy) -> bool:
+    if isinstance(policy, CompoundCachePolicy):
+        return all(_supports_prefetch(p) for p in policy.policies)
+    return type(policy) in _PREFETCHABLE_CACHE_POLICIES
+
+
+def _resolve_static_parameters(parameters: dict[str, Any]) -> dict[str, Any]:
+    """
+    Resolve task parameters the way the engine does, without waiting on upstream
+    futures or states.
+
+    Raises:
+        _UpstreamReference: If the parameters reference an upstream future or state.
+    """
+
+    def visit_fn(expr: Any, context: dict[str, Any]) -> Any:
+        if isinstance(context.get("annotation"), quote):
+            raise StopVisiting()
+        if isinstance(expr, (PrefectFuture, State)):
+            raise _UpstreamReference()
+        return expr
+
+    return {
+        name: visit_collection(
+            value,
+            visit_fn=visit_fn,
+            return_data=True,
+            max_depth=-1,
+            remove_annotations=True,
+            context={},
+        )
+        for name, value in parameters.items()
+    }
+
+
+def prefetch_cached_results(
+    task: "Task[P, R]", parameters_list: Iterable[dict[str, Any]]
+) -> None:
+    """
+    Check for the cached results of many runs of a task at once.
+
+    Used when mapping a task in threads so that the result store checks whether the
+    cache keys of every mapped run exist in one batch, instead of each run's
+    transaction making its own request when it starts. Cached results are still
+    read by each run. Runs whose cache keys cannot be computed up front,
+    such as runs with upstream futures in their parameters, are skipped.
+    """
+    policy = task.cache_policy
+    if (
+        not isinstance(policy, CachePolicy)
+        or not _supports_prefetch(policy)
+        # locked records are looked up by each run while holding the lock
+        or policy.isolation_level is not None
+    ):
+        return
+
+    overwrite = (
+        task.refresh_cache
+        if task.refresh_cache is not None
+        else PREFECT_TASKS_REFRESH_CACHE.value()
+    )
+    flow_run_context = FlowRunContext.get()
+    if overwrite or flow_run_context is None or flow_run_context.flow_run is None:
+        return
+
+    # The keys of the supported policies only depend on the task and the flow run
+    task_ctx = TaskRunContext.model_construct(
+        task=task,
+        task_run=TaskRun.model_construct(flow_run_id=flow_run_context.flow_run.id),
+    )
+    keys: list[str] = []
+    try:
+        for parameters in parameters_list:
+            try:
+                inputs = _resolve_static_parameters(parameters)
+            except _UpstreamReference:
+                continue
+            key = policy.compute_key(
+                task_ctx=task_ctx,
+                inputs=inputs,
+                flow_parameters=flow_run_context.parameters,
+            )
+            if key is not None:
+                keys.append(key)
+
+        if not keys:
+            return
+        store = get_result_store().update_for_task(task, _sync=True)
+        if store.lock_manager is not None:
+            return
+        store.prefetch(keys)
+    except Exception:
+        # each run will look up its own cached result instead
+        get_logger("engine").debug(
+            "Failed to prefetch cached results for task %r", task.name, exc_info=True
+        )
@@ -1,9 +1,13 @@
 import abc
 import asyncio
+import inspect
+import multiprocessing
+import multiprocessing.util
+import os
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextvars import copy_context
 from typing import (
     TYPE_CHECKING,
@@ -20,6 +24,14 @@ from typing import (
 
 from typing_extensions import ParamSpec, Self, TypeVar
 
+from prefect._internal.shared_memory import (
+    SHARED_MEMORY_MIN_SIZE,
+    OutOfBandBytes,
+    SharedMemoryPickle,
+    dump_to_shared_memory,
+    load_from_shared_memory,
+    release_segments,
+)
 from prefect.client.schemas.objects import TaskRunInput
 from prefect.exceptions import MappingLengthMismatch, MappingMissingIterable
 from prefect.futures import (
@@ -27,16 +39,18 @@ from prefect.futures import (
     PrefectDistributedFuture,
     PrefectFuture,
     PrefectFutureList,
+    PrefectProcessFuture,
 )
 from prefect.logging.loggers import get_logger, get_run_logger
 from prefect.settings import PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS
+from prefect.states import State
 from prefect.utilities.annotations import allow_failure, quote, unmapped
 from prefect.utilities.callables import (
     collapse_variadic_parameters,
     explode_variadic_parameter,
     get_parameter_defaults,
 )
-from prefect.utilities.collections import isiterable
+from prefect.utilities.collections import StopVisiting, isiterable, visit_collection
 
 if TYPE_CHECKING:
     from prefect.tasks import Task
@@ -46,6 +60,30 @@ T = TypeVar("T")
 R = TypeVar("R")
 F = TypeVar("F", bound=PrefectFuture, default=PrefectConcurrentFuture)
 
+# The cached results of mapped runs are checked in chunks that start at this size
+# and double up to the maximum, see `ThreadPoolTaskRunner._submit_mapped`
+MAPPED_PREFETCH_MIN_CHUNK_SIZE = 16
+MAPPED_PREFETCH_MAX_CHUNK_SIZE = 1024
+
+
+def _has_upstream_references(expr: Any) -> bool:
+    """
+    Check if an expression contains any futures or states that would be resolved
+    when passed as a task parameter.
+    """
+    found = False
+
+    def visit_fn(expr: Any, context: Dict[str, Any]) -> Any:
+        nonlocal found
+        if isinstance(context.get("annotation"), quote):
+            raise StopVisiting()
+        if isinstance(expr, (PrefectFuture, State)):
+            found = True
+            raise StopVisiting()
+
+    visit_collection(expr, visit_fn=visit_fn, return_data=False, context={})
+    return found
+
 
 class TaskRunner(abc.ABC, Generic[F]):
     """
@@ -172,18 +210,33 @@ class TaskRunner(abc.ABC, Generic[F]):
 
         map_length = list(lengths)[0]
 
-        futures: List[PrefectFuture] = []
+        # Static parameters are shared by every mapped call. If they do not reference
+        # any upstream futures or states, quote them so that each mapped task run does
+        # not walk them again to resolve inputs and collect dependencies.
+        for key, value in static_parameters.items():
+            if key not in annotated_parameters and not _has_upstream_references(value):
+                static_parameters[key] = quote(value)
+
+        # The set of parameter names is the same for every mapped call, so defaults
+        # and variadic keyword arguments are inspected once
+        parameter_defaults = get_parameter_defaults(task.fn)
+        parameter_names = (
+            set(iterable_parameters) | set(static_parameters) | set(parameter_defaults)
+        )
+        collapse_variadic = bool(
+            parameter_names - set(inspect.signature(task.fn).parameters)
+        )
+
+        call_parameters_list: List[Dict[str, Any]] = []
         for i in range(map_length):
             call_parameters = {
                 key: value[i] for key, value in iterable_parameters.items()
             }
-            call_parameters.update(
-                {key: value for key, value in static_parameters.items()}
-            )
+            call_parameters.update(static_parameters)
 
             # Add default values for parameters; these are skipped earlier since they should
             # not be mapped over
-            for key, value in get_parameter_defaults(task.fn).items():
+            for key, value in parameter_defaults.items():
                 call_parameters.setdefault(key, value)
 
             # Re-apply annotations to each key again
@@ -191,18 +244,40 @@ class TaskRunner(abc.ABC, Generic[F]):
                 call_parameters[key] = annotation.rewrap(call_parameters[key])
 
             # Collapse any previously exploded kwargs
-            call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
-
-            futures.append(
-                self.submit(
-                    task=task,
-                    parameters=call_parameters,
-                    wait_for=wait_for,
-                    dependencies=task_inputs,
-                )
+            if collapse_variadic:
+                call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
+
+            call_parameters_list.append(call_parameters)
+
+        return PrefectFutureList(
+            self._submit_mapped(
+                task=task,
+                call_parameters_list=call_parameters_list,
+                wait_for=wait_for,
+                dependencies=task_inputs,
             )
+        )
 
-        return PrefectFutureList(futures)
+    def _submit_mapped(
+        self,
+        task: "Task",
+        call_parameters_list: List[Dict[str, Any]],
+        wait_for: Optional[Iterable[PrefectFuture]],
+        dependencies: Dict[str, Set[TaskRunInput]],
+    ) -> List[F]:
+        """
+        Submit the calls of a mapped task. Task runners can override this to submit
+        the calls in bulk.
+        """
+        return [
+            self.submit(
+                task=task,
+                parameters=call_parameters,
+                wait_for=wait_for,
+                dependencies=dependencies,
+            )
+            for call_parameters in call_parameters_list
+        ]
 
     def __enter__(self):
         if self._started:
@@ -273,7 +348,63 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         if not self._started or self._executor is None:
             raise RuntimeError("Task runner is not started")
 
+        self._log_submission(f"Submitting task {task.name} to thread pool executor...")
+        return self._submit(task, parameters, wait_for, dependencies)
+
+    def _submit_mapped(
+        self,
+        task: "Task",
+        call_parameters_list: List[Dict[str, Any]],
+        wait_for: Optional[Iterable[PrefectFuture]],
+        dependencies: Dict[str, Set[TaskRunInput]],
+    ) -> List[PrefectConcurrentFuture]:
+        if not self._started or self._executor is None:
+            raise RuntimeError("Task runner is not started")
+
+        from prefect.task_engine import prefetch_cached_results
+
+        self._log_submission(
+            f"Submitting {len(call_parameters_list)} runs of task {task.name} to"
+            " thread pool executor..."
+        )
+
+        # Check for the cached results of mapped runs in batches rather than once per
+        # run as each run starts; runs in other runners don't share this process's
+        # result store. Each chunk is submitted as soon as it has been checked, and
+        # chunks grow so that the first runs start quickly while later checks are
+        # made in large batches as earlier runs execute.
+        futures: List[PrefectConcurrentFuture] = []
+        chunk_size = MAPPED_PREFETCH_MIN_CHUNK_SIZE
+        start = 0
+        while start < len(call_parameters_list):
+            chunk = call_parameters_list[start : start + chunk_size]
+            prefetch_cached_results(task, chunk)
+            futures.extend(
+                self._submit(task, call_parameters, wait_for, dependencies)
+                for call_parameters in chunk
+            )
+            start += len(chunk)
+            chunk_size = min(chunk_size * 2, MAPPED_PREFETCH_MAX_CHUNK_SIZE)
+        return futures
+
+    def _log_submission(self, message: str) -> None:
         from prefect.context import FlowRunContext
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(message)
+        else:
+            self.logger.debug(message)
+
+    def _submit(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]],
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]],
+    ) -> PrefectConcurrentFuture:
+        assert self._executor is not None
+
         from prefect.task_engine import run_task_async, run_task_sync
 
         task_run_id = uuid.uuid4()
@@ -281,14 +412,6 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         self._cancel_events[task_run_id] = cancel_event
         context = copy_context()
 
-        flow_run_ctx = FlowRunContext.get()
-        if flow_run_ctx:
-            get_run_logger(flow_run_ctx).debug(
-                f"Submitting task {task.name} to thread pool executor..."
-            )
-        else:
-            self.logger.debug(f"Submitting task {task.name} to thread pool executor...")
-
         submit_kwargs = dict(
             task=task,
             task_run_id=task_run_id,
@@ -375,6 +498,261 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
 ConcurrentTaskRunner = ThreadPoolTaskRunner
 
 
+def _initialize_process_worker() -> None:
+    # load the full `prefect` namespace so that models are fully defined and logging
+    # is configured before any task runs
+    import prefect.main  # noqa: F401
+
+    # worker processes exit without running `atexit` hooks, so flush any logs and
+    # events still queued by task runs when the pool shuts the worker down
+    multiprocessing.util.Finalize(None, _flush_process_worker, exitpriority=10)
+
+
+def _flush_process_worker() -> None:
+    from prefect.events.worker import EventsWorker
+    from prefect.logging.handlers import APILogWorker
+
+    APILogWorker.drain_all(timeout=5)
+    EventsWorker.drain_all(timeout=5)
+
+
+def _run_task_in_process(payload: SharedMemoryPickle) -> SharedMemoryPickle:
+    """
+    Run a task in a process pool worker and return its final state.
+    """
+    from prefect.task_engine import run_task_async, run_task_sync
+
+    submit_kwargs = load_from_shared_memory(payload)
+    if submit_kwargs["task"].isasync:
+        state = asyncio.run(run_task_async(**submit_kwargs))
+    else:
+        state = run_task_sync(**submit_kwargs)
+
+    # the parent process unlinks the segments once it has loaded the state
+    result, segments = dump_to_shared_memory(state)
+    release_segments(segments, unlink=False)
+    return result
+
+
+class ProcessPoolTaskRunner(TaskRunner[PrefectProcessFuture]):
+    """
+    A task runner that executes tasks in a pool of worker processes.
+
+    Worker processes are started on first use and reused for every task submitted
+    while the task runner is running, so CPU-bound tasks can use all available cores.
+    Tasks, their parameters, and their results must be serializable with
+    `cloudpickle`. Large NumPy arrays and `bytes` parameters, and large NumPy array
+    results, are passed between processes through shared memory rather than through
+    the process pipes.
+
+    Args:
+        max_workers: The maximum number of worker processes. Defaults to the number
+            of CPUs.
+        shared_memory_min_size: Buffers of at least this many bytes are passed
+            through shared memory.
+
+    Example:
+        ```python
+        from prefect import flow, task
+        from prefect.task_runners import ProcessPoolTaskRunner
+
+        @task
+        def crunch(n: int) -> int:
+            return sum(i * i for i in range(n))
+
+        @flow(task_runner=ProcessPoolTaskRunner())
+        def my_flow():
+            return crunch.map([10_000_000] * 8).result()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        shared_memory_min_size: int = SHARED_MEMORY_MIN_SIZE,
+    ):
+        super().__init__()
+        self._max_workers = (
+            max_workers if max_workers is not None else os.cpu_count() or 1
+        )
+        self._shared_memory_min_size = shared_memory_min_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # dispatches submissions to the pool once their upstream futures resolve
+        self._dispatcher: Optional[ThreadPoolExecutor] = None
+
+    def duplicate(self) -> "ProcessPoolTaskRunner":
+        return type(self)(
+            max_workers=self._max_workers,
+            shared_memory_min_size=self._shared_memory_min_size,
+        )
+
+    @overload
+    def submit(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> PrefectProcessFuture[R]:
+        ...
+
+    @overload
+    def submit(
+        self,
+        task: "Task[Any, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> PrefectProcessFuture[R]:
+        ...
+
+    def submit(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ):
+        """
+        Submit a task to the task run engine running in a worker process.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A future object that can be used to wait for the task to complete and
+            retrieve the result.
+        """
+        if not self._started or self._executor is None or self._dispatcher is None:
+            raise RuntimeError("Task runner is not started")
+
+        from prefect.context import FlowRunContext, serialize_context
+
+        task_run_id = uuid.uuid4()
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+        else:
+            self.logger.debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+
+        submit_kwargs = dict(
+            task=task,
+            task_run_id=task_run_id,
+            parameters=parameters,
+            wait_for=wait_for,
+            return_type="state",
+            dependencies=dependencies,
+            context=serialize_context(),
+        )
+        future = self._dispatcher.submit(self._run_in_pool, submit_kwargs)
+        return PrefectProcessFuture(task_run_id=task_run_id, wrapped_future=future)
+
+    def _run_in_pool(self, submit_kwargs: Dict[str, Any]) -> Any:
+        assert self._executor is not None
+
+        # futures cannot be sent to another process, so wait for them here and pass
+        # their final states instead; the task run engine resolves states the same
+        # way it resolves futures
+        submit_kwargs["parameters"] = self._prepare_for_transfer(
+            submit_kwargs["parameters"]
+        )
+        submit_kwargs["wait_for"] = self._prepare_for_transfer(
+            submit_kwargs["wait_for"]
+        )
+
+        payload, segments = dump_to_shared_memory(
+            submit_kwargs, min_size=self._shared_memory_min_size
+        )
+        try:
+            result = self._executor.submit(_run_task_in_process, payload).result()
+        finally:
+            release_segments(segments, unlink=True)
+        return load_from_shared_memory(result, unlink=True)
+
+    def _prepare_for_transfer(self, expr: Any) -> Any:
+        def visit_fn(expr: Any, context: Dict[str, Any]) -> Any:
+            if isinstance(expr, PrefectFuture) and not isinstance(
+                context.get("annotation"), quote
+            ):
+                expr.wait()
+                return expr.state
+            if isinstance(expr, bytes) and len(expr) >= self._shared_memory_min_size:
+                return OutOfBandBytes(expr)
+            return expr
+
+        return visit_collection(
+            expr, visit_fn=visit_fn, return_data=True, context={}, max_depth=-1
+        )
+
+    @overload
+    def map(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+    ) -> PrefectFutureList[PrefectProcessFuture[R]]:
+        ...
+
+    @overload
+    def map(
+        self,
+        task: "Task[Any, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+    ) -> PrefectFutureList[PrefectProcessFuture[R]]:
+        ...
+
+    def map(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+    ):
+        return super().map(task, parameters, wait_for)
+
+    def cancel_all(self):
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=False, cancel_futures=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        super().__enter__()
+        # worker processes are spawned rather than forked, since forking a process
+        # with running threads and event loops is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_process_worker,
+        )
+        self._dispatcher = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(cancel_futures=True)
+            self._dispatcher = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ProcessPoolTaskRunner):
+            return False
+        return (
+            self._max_workers == value._max_workers
+            and self._shared_memory_min_size == value._shared_memory_min_size
+        )
+
+
 class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture]):
     def __init__(self):
         super().__init__()
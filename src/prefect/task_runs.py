@@ -2,7 +2,7 @@ import asyncio
 import atexit
 import threading
 import uuid
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 import anyio
 from cachetools import TTLCache
@@ -74,7 +74,7 @@ class TaskRunWaiter:
             maxsize=10000, ttl=600
         )
         self._completion_events: Dict[uuid.UUID, asyncio.Event] = {}
-        self._completion_callbacks: Dict[uuid.UUID, Callable] = {}
+        self._completion_callbacks: Dict[uuid.UUID, List[Callable[[], None]]] = {}
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._observed_completed_task_runs_lock = threading.Lock()
         self._completion_events_lock = threading.Lock()
@@ -136,8 +136,9 @@ class TaskRunWaiter:
                         # so the waiter can wake up the waiting coroutine
                         if task_run_id in self._completion_events:
                             self._completion_events[task_run_id].set()
-                        if task_run_id in self._completion_callbacks:
-                            self._completion_callbacks[task_run_id]()
+                        callbacks = self._completion_callbacks.pop(task_run_id, [])
+                    for callback in callbacks:
+                        callback()
                 except Exception as exc:
                     self.logger.error(f"Error processing event: {exc}")
 
@@ -208,15 +209,20 @@ class TaskRunWaiter:
             callback: The callback to call when the task run finishes.
         """
         instance = cls.instance()
-        with instance._observed_completed_task_runs_lock:
-            if task_run_id in instance._observed_completed_task_runs:
-                callback()
+        with instance._completion_events_lock:
+            # Check for an observed completion while holding the lock so that a
+            # completion observed after the check will still find the callback
+            with instance._observed_completed_task_runs_lock:
+                observed = task_run_id in instance._observed_completed_task_runs
+            if not observed:
+                # Cache the callback for the task run ID so the consumer can call it
+                # when the event is received
+                instance._completion_callbacks.setdefault(task_run_id, []).append(
+                    callback
+                )
                 return
 
-        with instance._completion_events_lock:
-            # Cache the event for the task run ID so the consumer can set it
-            # when the event is received
-            instance._completion_callbacks[task_run_id] = callback
+        callback()
 
     @classmethod
     def instance(cls):
@@ -4,7 +4,7 @@ import os
 import socket
 import sys
 from contextlib import contextmanager
-from typing import AsyncGenerator, Generator, List, Optional, Union
+from typing import AsyncGenerator, Generator, List, Optional, Sequence, Union
 from unittest import mock
 from uuid import UUID
 
@@ -13,11 +13,13 @@ import httpx
 import pendulum
 import pytest
 from starlette.status import WS_1008_POLICY_VIOLATION
+from websockets import Subprotocol
 from websockets.exceptions import ConnectionClosed
 from websockets.legacy.server import WebSocketServer, WebSocketServerProtocol, serve
 
 from prefect.events import Event
 from prefect.events.clients import (
+    EVENT_BATCHES_SUBPROTOCOL,
     AssertingEventsClient,
     AssertingPassthroughEventsClient,
 )
@@ -250,6 +252,7 @@ def mock_anyio_sleep(monkeypatch):
 class Recorder:
     connections: int
     path: Optional[str]
+    frames: int
     events: List[Event]
     token: Optional[str]
     filter: Optional[EventFilter]
@@ -257,6 +260,7 @@ class Recorder:
     def __init__(self):
         self.connections = 0
         self.path = None
+        self.frames = 0
         self.events = []
 
 
@@ -266,6 +270,7 @@ class Puppeteer:
     hard_auth_failure: bool
     refuse_any_further_connections: bool
     hard_disconnect_after: Optional[UUID]
+    accept_event_batches: bool
 
     outgoing_events: List[Event]
 
@@ -273,6 +278,7 @@ class Puppeteer:
         self.hard_auth_failure = False
         self.refuse_any_further_connections = False
         self.hard_disconnect_after = None
+        self.accept_event_batches = False
         self.outgoing_events = []
 
 
@@ -312,10 +318,15 @@ async def events_server(
             except ConnectionClosed:
                 return
 
-            event = Event.model_validate_json(message)
-            recorder.events.append(event)
+            recorder.frames += 1
+            if socket.subprotocol == EVENT_BATCHES_SUBPROTOCOL:
+                events = [Event.model_validate(e) for e in json.loads(message)]
+            else:
+                events = [Event.model_validate_json(message)]
 
-            if puppeteer.hard_disconnect_after == event.id:
+            recorder.events.extend(events)
+
+            if any(puppeteer.hard_disconnect_after == event.id for event in events):
                 raise ValueError("zonk")
 
     async def outgoing_events(socket: WebSocketServerProtocol):
@@ -353,7 +364,24 @@ async def events_server(
                 puppeteer.hard_disconnect_after = None
                 raise ValueError("zonk")
 
-    async with serve(handler, host="localhost", port=unused_tcp_port) as server:
+    def select_subprotocol(
+        client_subprotocols: Sequence[Subprotocol],
+        server_subprotocols: Sequence[Subprotocol],
+    ) -> Optional[Subprotocol]:
+        if (
+            puppeteer.accept_event_batches
+            and EVENT_BATCHES_SUBPROTOCOL in client_subprotocols
+        ):
+            return EVENT_BATCHES_SUBPROTOCOL
+        return None
+
+    async with serve(
+        handler,
+        host="localhost",
+        port=unused_tcp_port,
+        subprotocols=[EVENT_BATCHES_SUBPROTOCOL],
+        select_subprotocol=select_subprotocol,
+    ) as server:
         yield server
 
 
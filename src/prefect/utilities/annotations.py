@@ -22,6 +22,10 @@ class BaseAnnotation(tuple[T]):
     # use itemgetter to minimise overhead, just like namedtuple generated code would
     value: T = cast(T, property(itemgetter(0)))
 
+    def __getnewargs__(self) -> tuple[T]:  # type: ignore[override]
+        # pickle passes these to `__new__`, which wraps its argument in a tuple
+        return (self[0],)
+
     def unwrap(self) -> T:
         return self[0]
 
@@ -1,14 +1,35 @@
+import dataclasses
 import hashlib
-from functools import partial
+import re
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial, singledispatch
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
+from uuid import UUID
 
 import cloudpickle  # type: ignore  # no stubs available
+from pydantic import BaseModel
 
 from prefect.exceptions import HashError
 from prefect.serializers import JSONSerializer
+from prefect.utilities.importtools import to_qualified_name
 
 _md5 = partial(hashlib.md5, usedforsecurity=False)
+_blake2b = partial(hashlib.blake2b, digest_size=16)
+
+# strings and buffers at least this large are hashed as a nested digest so that the
+# digest can be reused by a `HashMemo`
+_MEMO_MIN_SIZE = 64 * 1024
+
+# at most this many bytes of objects that cannot be weakly referenced (strings and
+# bytes) are kept alive by a `HashMemo`
+_MEMO_MAX_HELD_BYTES = 32 * 1024 * 1024
+
+# types whose instances are always memoized, see `register_hash_memo_type`
+_memo_types: set[type] = set()
 
 
 def stable_hash(*args: Union[str, bytes], hash_algo: Callable[..., Any] = _md5) -> str:
@@ -89,3 +110,421 @@ def hash_objects(
         raise HashError(msg)
 
     return None
+
+
+class HashMemo:
+    """
+    Identity-keyed memo of object digests computed by `structural_hash`.
+
+    Large immutable objects (strings, bytes, and read-only buffers over read-only
+    memory, such as NumPy arrays with `writeable=False` that own their data or view
+    bytes) and instances of types registered with
+    `register_hash_memo_type` have their digest stored on first use, so hashing the
+    same object again is a dictionary lookup. Entries are dropped when the object is
+    garbage collected. Objects that do not support weak references, such as strings
+    and bytes, are held by the memo; the least recently used of them are dropped once
+    they take up more than `_MEMO_MAX_HELD_BYTES`.
+
+    Instances of registered mutable types must be invalidated with `invalidate`
+    after they are modified, otherwise their stale digest is reused.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[int, Callable[..., Any]], tuple[Any, bytes]] = {}
+        # sizes of the entries holding their object, least recently used first
+        self._held: OrderedDict[tuple[int, Callable[..., Any]], int] = OrderedDict()
+        self._held_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, obj: Any, hash_algo: Callable[..., Any]) -> Optional[bytes]:
+        key = (id(obj), hash_algo)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        ref, digest = entry
+        if isinstance(ref, weakref.ref):
+            return digest if ref() is obj else None
+        if ref is not obj:
+            return None
+        with self._lock:
+            if key in self._held:
+                self._held.move_to_end(key)
+        return digest
+
+    def set(self, obj: Any, hash_algo: Callable[..., Any], digest: bytes) -> None:
+        key = (id(obj), hash_algo)
+        try:
+            ref: Any = weakref.ref(obj, lambda _: self._discard(key))
+        except TypeError:
+            size = sys.getsizeof(obj)
+            if size > _MEMO_MAX_HELD_BYTES:
+                return
+            with self._lock:
+                self._forget(key)
+                self._entries[key] = (obj, digest)
+                self._held[key] = size
+                self._held_bytes += size
+                while self._held_bytes > _MEMO_MAX_HELD_BYTES:
+                    self._forget(next(iter(self._held)))
+            return
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = (ref, digest)
+
+    def invalidate(self, obj: Any) -> None:
+        """
+        Forget any digests stored for an object, e.g. after mutating it.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == id(obj)]:
+                self._forget(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._held.clear()
+            self._held_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self) -> tuple[type["HashMemo"], tuple[()]]:
+        # digests are keyed on object identity, so copies start out empty
+        return (HashMemo, ())
+
+    def _discard(self, key: tuple[int, Callable[..., Any]]) -> None:
+        with self._lock:
+            self._forget(key)
+
+    def _forget(self, key: tuple[int, Callable[..., Any]]) -> None:
+        # callers must hold `self._lock`
+        self._entries.pop(key, None)
+        self._held_bytes -= self._held.pop(key, 0)
+
+
+class _StructuralHasher:
+    """
+    Feeds a type-tagged, length-prefixed encoding of an object graph into a hash.
+
+    Containers are walked recursively; objects supporting the buffer protocol (bytes,
+    NumPy arrays, etc.) are hashed directly from their memory; other objects are
+    reduced with a registered reducer or, as a last resort, pickled individually.
+    """
+
+    def __init__(self, hash_algo: Callable[..., Any], memo: Optional[HashMemo] = None):
+        self._hash_algo = hash_algo
+        self._memo = memo
+        # ids of the containers currently being walked, used to detect cycles
+        self._active: dict[int, int] = {}
+
+    def hexdigest(self, obj: Any) -> str:
+        h = self._hash_algo()
+        self.update(h, obj)
+        return h.hexdigest()
+
+    def digest(self, obj: Any) -> bytes:
+        h = self._hash_algo()
+        self.update(h, obj)
+        return h.digest()
+
+    def update(self, h: Any, obj: Any) -> None:
+        if _memo_types and isinstance(obj, tuple(_memo_types)):
+            self.update_nested(h, obj, True, lambda inner: _hash_into(obj, inner, self))
+        else:
+            _hash_into(obj, h, self)
+
+    def update_nested(
+        self, h: Any, obj: Any, memoize: bool, walk: Callable[[Any], None]
+    ) -> None:
+        """
+        Feed the digest of a nested hash of `obj`, reusing a memoized digest if allowed.
+
+        The encoding does not depend on whether a memo is in use, so keys are stable
+        across memoized and unmemoized calls.
+        """
+        memo = self._memo if memoize else None
+        digest = memo.get(obj, self._hash_algo) if memo is not None else None
+        if digest is None:
+            inner = self._hash_algo()
+            walk(inner)
+            digest = inner.digest()
+            if memo is not None:
+                memo.set(obj, self._hash_algo, digest)
+        _feed(h, b"h", digest)
+
+    def update_container(self, h: Any, obj: Any, walk: Callable[[], None]) -> None:
+        obj_id = id(obj)
+        if obj_id in self._active:
+            _feed(h, b"R", str(self._active[obj_id]).encode())
+            return
+        self._active[obj_id] = len(self._active)
+        try:
+            walk()
+        finally:
+            del self._active[obj_id]
+
+
+def _feed(h: Any, tag: bytes, data: Any) -> None:
+    h.update(tag)
+    h.update(memoryview(data).nbytes.to_bytes(8, "little"))
+    h.update(data)
+
+
+@singledispatch
+def _hash_into(obj: Any, h: Any, hasher: _StructuralHasher) -> None:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        _feed(h, b"c", to_qualified_name(type(obj)).encode())
+        hasher.update_container(
+            h,
+            obj,
+            lambda: hasher.update(
+                h,
+                tuple((f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj)),
+            ),
+        )
+        return
+
+    try:
+        view = memoryview(obj)
+    except (TypeError, ValueError):
+        pass
+    else:
+        with view:
+            # buffers of Python objects or pointers hold addresses rather than data,
+            # so they are pickled below instead
+            if _is_plain_format(view.format):
+                _feed(h, b"a", to_qualified_name(type(obj)).encode())
+                _feed(h, b"f", view.format.encode())
+                _feed(h, b"s", repr(view.shape).encode())
+                data = view if view.c_contiguous else view.tobytes()
+                if view.nbytes >= _MEMO_MIN_SIZE:
+                    hasher.update_nested(
+                        h,
+                        obj,
+                        _is_immutable_buffer(obj),
+                        lambda inner: _feed(inner, b"y", data),
+                    )
+                else:
+                    _feed(h, b"y", data)
+                return
+
+    try:
+        data = cloudpickle.dumps(obj)  # type: ignore[reportUnknownMemberType]
+    except Exception as exc:
+        raise HashError(
+            "Unable to create hash - objects could not be serialized.\n"
+            f"  Unhashable type: {type(obj)!r}\n"
+            f"  Pickle error: {exc}"
+        ) from exc
+    _feed(h, b"p", data)
+
+
+def _is_plain_format(format: str) -> bool:
+    """
+    Whether a buffer format only describes plain data, such as numbers or characters.
+    """
+    # field names of structured formats may contain any character
+    return not any(code in "OP" for code in re.sub(r":[^:]*:", "", format))
+
+
+def _is_immutable_buffer(obj: Any) -> bool:
+    """
+    Whether the memory behind a buffer can never change, so its digest can be reused.
+
+    Read-only views, such as NumPy arrays with `writeable=False`, may be views of
+    writeable memory, so every object the memory is borrowed from must be read-only.
+    """
+    while obj is not None:
+        if isinstance(obj, bytes):
+            return True
+        if isinstance(obj, memoryview):
+            if not obj.readonly:
+                return False
+            obj = obj.obj
+            continue
+        flags = getattr(obj, "flags", None)
+        if flags is None or getattr(flags, "writeable", True):
+            return False
+        obj = getattr(obj, "base", None)
+    return True
+
+
+@_hash_into.register(type(None))
+def _(obj: None, h: Any, hasher: _StructuralHasher) -> None:
+    h.update(b"n")
+
+
+@_hash_into.register(bool)
+def _(obj: bool, h: Any, hasher: _StructuralHasher) -> None:
+    h.update(b"T" if obj else b"F")
+
+
+@_hash_into.register(int)
+def _(obj: int, h: Any, hasher: _StructuralHasher) -> None:
+    _feed(h, b"i", str(int(obj)).encode())
+
+
+@_hash_into.register(float)
+def _(obj: float, h: Any, hasher: _StructuralHasher) -> None:
+    _feed(h, b"d", float(obj).hex().encode())
+
+
+@_hash_into.register(str)
+def _(obj: str, h: Any, hasher: _StructuralHasher) -> None:
+    if len(obj) >= _MEMO_MIN_SIZE:
+        hasher.update_nested(
+            h,
+            obj,
+            True,
+            lambda inner: _feed(inner, b"u", obj.encode("utf-8", "surrogatepass")),
+        )
+    else:
+        _feed(h, b"u", obj.encode("utf-8", "surrogatepass"))
+
+
+@_hash_into.register(bytes)
+@_hash_into.register(bytearray)
+def _(obj: Union[bytes, bytearray], h: Any, hasher: _StructuralHasher) -> None:
+    if len(obj) >= _MEMO_MIN_SIZE:
+        hasher.update_nested(
+            h, obj, isinstance(obj, bytes), lambda inner: _feed(inner, b"y", obj)
+        )
+    else:
+        _feed(h, b"y", obj)
+
+
+@_hash_into.register(UUID)
+def _(obj: UUID, h: Any, hasher: _StructuralHasher) -> None:
+    _feed(h, b"U", obj.bytes)
+
+
+@_hash_into.register(list)
+@_hash_into.register(tuple)
+def _(
+    obj: Union[list[Any], tuple[Any, ...]], h: Any, hasher: _StructuralHasher
+) -> None:
+    def walk() -> None:
+        _feed(
+            h, b"l" if isinstance(obj, list) else b"t", len(obj).to_bytes(8, "little")
+        )
+        for item in obj:
+            hasher.update(h, item)
+
+    hasher.update_container(h, obj, walk)
+
+
+@_hash_into.register(dict)
+def _(obj: dict[Any, Any], h: Any, hasher: _StructuralHasher) -> None:
+    # dictionaries hash the same regardless of insertion order
+    def walk() -> None:
+        _feed(h, b"m", len(obj).to_bytes(8, "little"))
+        if all(isinstance(key, str) for key in obj):
+            for key in sorted(obj):
+                hasher.update(h, key)
+                hasher.update(h, obj[key])
+        else:
+            h.update(b"*")
+            for item_digest in sorted(hasher.digest(item) for item in obj.items()):
+                h.update(item_digest)
+
+    hasher.update_container(h, obj, walk)
+
+
+@_hash_into.register(set)
+@_hash_into.register(frozenset)
+def _(obj: Union[set[Any], frozenset[Any]], h: Any, hasher: _StructuralHasher) -> None:
+    def walk() -> None:
+        _feed(h, b"e", len(obj).to_bytes(8, "little"))
+        for item_digest in sorted(hasher.digest(item) for item in obj):
+            h.update(item_digest)
+
+    hasher.update_container(h, obj, walk)
+
+
+@_hash_into.register(BaseModel)
+def _(obj: BaseModel, h: Any, hasher: _StructuralHasher) -> None:
+    _feed(h, b"c", to_qualified_name(type(obj)).encode())
+    hasher.update_container(h, obj, lambda: hasher.update(h, dict(obj)))
+
+
+def register_hash_reducer(type_: type, reducer: Callable[[Any], Any]) -> None:
+    """
+    Register a function that reduces objects of a type to a value for `structural_hash`.
+
+    The reduced value is hashed in place of the object, so it should be cheap to
+    compute and fully determined by the object's contents. Reducers apply to
+    subclasses of the registered type as well.
+
+    Example:
+        Hash pandas DataFrames by their contents without pickling them:
+        ```python
+        import pandas as pd
+        from prefect.utilities.hashing import register_hash_reducer
+
+        register_hash_reducer(
+            pd.DataFrame,
+            lambda df: (
+                list(df.columns),
+                [str(dtype) for dtype in df.dtypes],
+                pd.util.hash_pandas_object(df).to_numpy(),
+            ),
+        )
+        ```
+
+    Args:
+        type_: The type to register the reducer for.
+        reducer: A callable that accepts an instance of `type_` and returns a value
+            to hash in its place.
+    """
+    qualified_name = to_qualified_name(type_).encode()
+
+    def hash_reduced(obj: Any, h: Any, hasher: _StructuralHasher) -> None:
+        _feed(h, b"r", qualified_name)
+        hasher.update(h, reducer(obj))
+
+    _hash_into.register(type_, hash_reduced)
+
+
+def register_hash_memo_type(type_: type) -> None:
+    """
+    Opt a type into digest memoization by `HashMemo`.
+
+    Instances of the type (and its subclasses) are hashed once per memo and the
+    digest is reused for as long as the object is alive. If instances are mutated
+    after being hashed, call `HashMemo.invalidate` on them so the change is picked up.
+
+    Args:
+        type_: The type to memoize.
+    """
+    _memo_types.add(type_)
+
+
+def structural_hash(
+    *args: Any,
+    hash_algo: Callable[..., Any] = _blake2b,
+    memo: Optional[HashMemo] = None,
+    **kwargs: Any,
+) -> str:
+    """
+    Hash objects by walking their structure rather than serializing them.
+
+    Built-in scalars and containers are encoded directly, objects that support the
+    buffer protocol (such as `bytes` and NumPy arrays) are hashed from memory
+    without copying, and dataclasses and Pydantic models are hashed field by field.
+    Types can be customized with `register_hash_reducer`; any other object is pickled
+    on its own.
+
+    Args:
+        *args: Positional arguments to hash
+        hash_algo: Hash algorithm to use
+        memo: An optional `HashMemo` used to reuse the digests of large immutable
+            objects across calls
+        **kwargs: Keyword arguments to hash
+
+    Returns:
+        A hex hash.
+
+    Raises:
+        HashError: If an object cannot be hashed
+    """
+    return _StructuralHasher(hash_algo, memo).hexdigest((args, kwargs))
@@ -0,0 +1,292 @@
+"""
+A pool of interpreters that have already imported Prefect, and optionally user code,
+which are handed flow runs to execute instead of starting a fresh `python -m
+prefect.engine` process for each one.
+
+Each interpreter in the pool runs a single flow run and then exits, so flow runs are
+just as isolated from each other as they are when their processes are started cold, and
+they can be cancelled by signalling their PID in the same way.
+"""
+
+import importlib
+import json
+import os
+import runpy
+import subprocess
+import sys
+from collections import deque
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import anyio
+import anyio.abc
+
+from prefect.logging import get_logger
+from prefect.utilities.processutils import (
+    TextSink,
+    consume_process_output,
+    get_sys_executable,
+    run_process,
+)
+
+T = TypeVar("T")
+
+logger = get_logger("warm_processes")
+
+
+class WarmProcessPool:
+    """
+    Keeps `size` interpreters started and ready to execute flow runs.
+
+    Interpreters are started with the environment of the pool and are handed the
+    complete environment and working directory of each flow run when it is assigned to
+    them.  If there are no ready interpreters when a flow run is submitted, it is run
+    in a freshly started process instead.
+
+    Example:
+        ```python
+        async with WarmProcessPool(size=2, preload=["my_flows"]) as pool:
+            process = await pool.run_process(env=env, cwd=working_dir)
+        ```
+    """
+
+    def __init__(
+        self,
+        size: int,
+        preload: Iterable[str] = (),
+        env: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            size: the number of interpreters to keep ready
+            preload: modules (`my_package.flows`) or Python files
+                (`path/to/flows.py`, optionally with a `:flow_function` suffix) to
+                import into each interpreter before it is handed a flow run
+            env: the environment to start the interpreters with; defaults to the
+                environment of this process
+            **kwargs: additional keyword arguments passed when opening each process
+        """
+        self.size = size
+        self.preload: List[str] = list(preload)
+        self.env: Dict[str, str] = dict(env if env is not None else os.environ)
+        self._process_kwargs = kwargs
+
+        self._ready: Deque[anyio.abc.Process] = deque()
+        self._starting = 0
+        self._task_group: Optional[anyio.abc.TaskGroup] = None
+
+    @property
+    def ready(self) -> int:
+        """The number of interpreters ready to be handed a flow run"""
+        return len(self._ready)
+
+    def _command(self) -> List[str]:
+        return [get_sys_executable(), "-m", __name__, *self.preload]
+
+    async def __aenter__(self) -> "WarmProcessPool":
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._replenish()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        assert self._task_group is not None
+        self._task_group.cancel_scope.cancel()
+        await self._task_group.__aexit__(None, None, None)
+        self._task_group = None
+
+        while self._ready:
+            await self._discard(self._ready.popleft())
+
+    def _replenish(self) -> None:
+        if self._task_group is None:
+            return
+
+        while len(self._ready) + self._starting < self.size:
+            self._starting += 1
+            self._task_group.start_soon(self._start_process)
+
+    async def _start_process(self) -> None:
+        try:
+            process = await anyio.open_process(
+                self._command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=self.env,
+                **self._process_kwargs,
+            )
+        except Exception:
+            logger.exception("Failed to start a warm process")
+            return
+        finally:
+            self._starting -= 1
+
+        self._ready.append(process)
+
+    async def _discard(self, process: anyio.abc.Process) -> None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        with anyio.CancelScope(shield=True):
+            await process.aclose()
+
+    async def _take(self) -> Optional[anyio.abc.Process]:
+        while self._ready:
+            process = self._ready.popleft()
+            if process.returncode is None:
+                return process
+
+            logger.warning(
+                "Warm process %s exited with status code %s before it was used",
+                process.pid,
+                process.returncode,
+            )
+            await self._discard(process)
+
+        return None
+
+    async def run_process(
+        self,
+        env: Mapping[str, str],
+        cwd: Optional[Union[str, Path]] = None,
+        stream_output: Union[
+            bool, Tuple[Optional[TextSink[str]], Optional[TextSink[str]]]
+        ] = False,
+        task_status: Optional[anyio.abc.TaskStatus[T]] = None,
+        task_status_handler: Optional[Callable[[anyio.abc.Process], T]] = None,
+    ) -> anyio.abc.Process:
+        """
+        Runs a flow run in one of the ready interpreters, as though it had been started
+        with `python -m prefect.engine`, and returns the process once it has exited.
+
+        Mirrors `prefect.utilities.processutils.run_process`, including reporting the
+        PID (or the result of `task_status_handler`) to `task_status` once the flow
+        run has been handed to its process.
+        """
+        if stream_output is True:
+            stream_output = (sys.stdout, sys.stderr)
+
+        process = await self._take()
+        self._replenish()
+
+        if process is None:
+            logger.debug("No warm processes are ready; starting a new process")
+            return await run_process(
+                [get_sys_executable(), "-m", "prefect.engine"],
+                stream_output=stream_output,
+                task_status=task_status,
+                task_status_handler=task_status_handler,
+                env=dict(env),
+                cwd=cwd,
+                **self._process_kwargs,
+            )
+
+        try:
+            assert process.stdin is not None
+            instructions = {
+                "env": {key: value for key, value in env.items() if value is not None},
+                "cwd": str(cwd) if cwd else None,
+            }
+            await process.stdin.send(json.dumps(instructions).encode() + b"\n")
+            await process.stdin.aclose()
+
+            if task_status is not None:
+                value: T = cast(T, process.pid)
+                if task_status_handler:
+                    value = task_status_handler(process)
+                task_status.started(value)
+
+            if stream_output:
+                await consume_process_output(
+                    process, stdout_sink=stream_output[0], stderr_sink=stream_output[1]
+                )
+            else:
+                await consume_process_output(process)
+
+            await process.wait()
+        finally:
+            try:
+                process.terminate()
+            except OSError:
+                # Occurs if the process is already terminated
+                pass
+
+            with anyio.CancelScope(shield=True):
+                await process.aclose()
+
+        return process
+
+
+def _preload(target: str) -> None:
+    """Imports a module by name, or a Python file by path, into this interpreter"""
+    from prefect.utilities.importtools import load_script_as_module
+
+    path, _, _ = target.partition(":")
+    if path.endswith(".py") or os.sep in path or "/" in path:
+        load_script_as_module(path)
+    else:
+        importlib.import_module(path)
+
+
+def _run_when_assigned(preload: List[str]) -> None:
+    """
+    Prepares this interpreter to execute a flow run, then waits to be handed the
+    environment and working directory of one on standard input before running the
+    engine exactly as `python -m prefect.engine` would.
+    """
+    # Importing the engine's dependencies up front is most of the work saved.  The
+    # engine itself is left to `runpy` so that it only runs once, as `__main__`.
+    import prefect.flow_engine  # noqa: F401
+
+    for target in preload:
+        try:
+            _preload(target)
+        except Exception as exc:
+            print(f"Unable to preload {target!r}: {exc!r}", file=sys.stderr)
+
+    line = sys.stdin.readline()
+    if not line:
+        # The pool was closed before this process was used
+        return
+
+    instructions = json.loads(line)
+
+    os.environ.clear()
+    os.environ.update(instructions["env"])
+
+    if cwd := instructions.get("cwd"):
+        os.chdir(cwd)
+    # `python -m` puts the working directory the interpreter started in at the front of
+    # the path, so put the flow run's working directory there instead
+    sys.path[0] = os.getcwd()
+
+    # Settings and logging were configured from the pool's environment when Prefect
+    # was imported, so configure them again from the flow run's environment
+    import prefect.context
+    from prefect.logging.configuration import setup_logging
+
+    prefect.context.GLOBAL_SETTINGS_CONTEXT = prefect.context.root_settings_context()
+    setup_logging()
+
+    sys.argv = sys.argv[:1]
+    runpy.run_module("prefect.engine", run_name="__main__", alter_sys=True)
+
+
+if __name__ == "__main__":
+    _run_when_assigned(sys.argv[1:])
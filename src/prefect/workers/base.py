@@ -1,9 +1,21 @@
 import abc
 import asyncio
 import threading
+import time
 from contextlib import AsyncExitStack
 from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
 from uuid import UUID, uuid4
 
 import anyio
@@ -40,6 +52,7 @@ from prefect.logging.loggers import (
 )
 from prefect.plugins import load_prefect_collections
 from prefect.settings import (
+    PREFECT_API_REQUEST_TIMEOUT,
     PREFECT_API_URL,
     PREFECT_TEST_MODE,
     PREFECT_WORKER_HEARTBEAT_SECONDS,
@@ -71,6 +84,13 @@ if TYPE_CHECKING:
         WorkerFlowRunResponse,
     )
 
+# The longest we'll ask the server to hold a poll for scheduled flow runs open while it
+# waits for flow runs to be scheduled; the server may cap this further
+MAX_SERVER_WAIT_SECONDS = 30.0
+
+# How long to wait between polls for scheduled flow runs when the server holds them open
+LONG_POLL_INTERVAL_SECONDS = 1.0
+
 
 class BaseJobConfiguration(BaseModel):
     command: Optional[str] = Field(
@@ -441,6 +461,7 @@ class BaseWorker(abc.ABC):
         self._runs_task_group: Optional[anyio.abc.TaskGroup] = None
         self._client: Optional[PrefectClient] = None
         self._last_polled_time: pendulum.DateTime = pendulum.now("utc")
+        self._server_wait_seconds: float = 0.0
         self._limit = limit
         self._limiter: Optional[anyio.CapacityLimiter] = None
         self._submitting_flow_run_ids = set()
@@ -551,14 +572,7 @@ class BaseWorker(abc.ABC):
                 # schedule the scheduled flow run polling loop
                 async with anyio.create_task_group() as loops_task_group:
                     loops_task_group.start_soon(
-                        partial(
-                            critical_service_loop,
-                            workload=self.get_and_submit_flow_runs,
-                            interval=PREFECT_WORKER_QUERY_SECONDS.value(),
-                            run_once=run_once,
-                            jitter_range=0.3,
-                            backoff=4,  # Up to ~1 minute interval during backoff
-                        )
+                        self._scheduled_flow_runs_loop(run_once=run_once)
                     )
                     # schedule the sync loop
                     loops_task_group.start_soon(
@@ -685,11 +699,56 @@ class BaseWorker(abc.ABC):
         return is_still_polling
 
     async def get_and_submit_flow_runs(self):
+        started = time.monotonic()
         runs_response = await self._get_scheduled_flow_runs()
 
         self._last_polled_time = pendulum.now("utc")
 
-        return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
+        already_submitting = set(self._submitting_flow_run_ids)
+        submitted = await self._submit_scheduled_flow_runs(
+            flow_run_response=runs_response
+        )
+
+        if self._server_wait_seconds and all(
+            run.id in already_submitting for run in submitted
+        ):
+            # Nothing new was submitted, either because the server didn't wait for
+            # flow runs to be scheduled or because this worker is at its limit, so
+            # don't poll again any sooner than usual
+            await anyio.sleep(
+                started + PREFECT_WORKER_QUERY_SECONDS.value() - time.monotonic()
+            )
+
+        return submitted
+
+    def _scheduled_flow_runs_loop(
+        self, run_once: bool = False
+    ) -> Callable[[], Awaitable[Any]]:
+        """The loop that polls for and submits scheduled flow runs.
+
+        Unless only polling once, the server is asked to hold each poll open until
+        flow runs are scheduled and the worker polls again soon after each returns.
+        """
+        self._server_wait_seconds = 0.0 if run_once else self._get_server_wait_seconds()
+        return partial(
+            critical_service_loop,
+            workload=self.get_and_submit_flow_runs,
+            interval=(
+                LONG_POLL_INTERVAL_SECONDS
+                if self._server_wait_seconds
+                else PREFECT_WORKER_QUERY_SECONDS.value()
+            ),
+            run_once=run_once,
+            jitter_range=0.3,
+            backoff=4,  # Up to ~1 minute interval during backoff
+        )
+
+    def _get_server_wait_seconds(self) -> float:
+        """How long to ask the server to wait for flow runs to be scheduled on each
+        poll, leaving room for the request to come back within its timeout"""
+        if self._client is None or self._client.server_type == ServerType.CLOUD:
+            return 0.0
+        return min(MAX_SERVER_WAIT_SECONDS, PREFECT_API_REQUEST_TIMEOUT.value() / 2)
 
     async def _update_local_work_pool_info(self):
         try:
@@ -844,6 +903,7 @@ class BaseWorker(abc.ABC):
                     work_pool_name=self._work_pool_name,
                     scheduled_before=scheduled_before,
                     work_queue_names=list(self._work_queues),
+                    wait_seconds=self._server_wait_seconds or None,
                 )
             )
             self._logger.debug(
@@ -50,9 +50,10 @@ from prefect.exceptions import (
     InfrastructureNotFound,
     ObjectNotFound,
 )
-from prefect.settings import PREFECT_WORKER_QUERY_SECONDS
+from prefect.settings import PREFECT_WORKER_QUERY_SECONDS, get_current_settings
 from prefect.utilities.processutils import get_sys_executable, run_process
 from prefect.utilities.services import critical_service_loop
+from prefect.utilities.warm_processes import WarmProcessPool
 from prefect.workers.base import (
     BaseJobConfiguration,
     BaseVariables,
@@ -147,6 +148,8 @@ class ProcessWorker(BaseWorker):
     _documentation_url = "https://docs.prefect.io/latest/get-started/quickstart"
     _logo_url = "https://cdn.sanity.io/images/3ugk85nk/production/356e6766a91baf20e1d08bbe16e8b5aaef4d8643-48x48.png"
 
+    _warm_process_pool: Optional[WarmProcessPool] = None
+
     async def start(
         self,
         run_once: bool = False,
@@ -179,14 +182,7 @@ class ProcessWorker(BaseWorker):
                 # schedule the scheduled flow run polling loop
                 async with anyio.create_task_group() as loops_task_group:
                     loops_task_group.start_soon(
-                        partial(
-                            critical_service_loop,
-                            workload=self.get_and_submit_flow_runs,
-                            interval=PREFECT_WORKER_QUERY_SECONDS.value(),
-                            run_once=run_once,
-                            jitter_range=0.3,
-                            backoff=4,  # Up to ~1 minute interval during backoff
-                        )
+                        self._scheduled_flow_runs_loop(run_once=run_once)
                     )
                     # schedule the sync loop
                     loops_task_group.start_soon(
@@ -237,6 +233,27 @@ class ProcessWorker(BaseWorker):
 
         printer(f"Worker {worker.name!r} stopped!")
 
+    async def setup(self):
+        await super().setup()
+
+        settings = get_current_settings()
+        self._warm_process_pool = None
+        if settings.worker.warm_process_pool_size:
+            # We must add creationflags to a dict so it is only passed as a function
+            # parameter on Windows, because the presence of creationflags causes
+            # errors on Unix even if set to None
+            kwargs: Dict[str, object] = {}
+            if sys.platform == "win32":
+                kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+
+            self._warm_process_pool = await self._exit_stack.enter_async_context(
+                WarmProcessPool(
+                    size=settings.worker.warm_process_pool_size,
+                    preload=sorted(settings.worker.warm_process_preload or []),
+                    **kwargs,
+                )
+            )
+
     async def run(
         self,
         flow_run: FlowRun,
@@ -267,15 +284,27 @@ class ProcessWorker(BaseWorker):
             flow_run_logger.debug(
                 f"Process running command: {command} in {working_dir}"
             )
-            process = await run_process(
-                command.split(" "),
-                stream_output=configuration.stream_output,
-                task_status=task_status,
-                task_status_handler=_infrastructure_pid_from_process,
-                cwd=working_dir,
-                env=configuration.env,
-                **kwargs,
-            )
+            if (
+                self._warm_process_pool is not None
+                and command == f"{get_sys_executable()} -m prefect.engine"
+            ):
+                process = await self._warm_process_pool.run_process(
+                    env=configuration.env,
+                    cwd=working_dir,
+                    stream_output=configuration.stream_output,
+                    task_status=task_status,
+                    task_status_handler=_infrastructure_pid_from_process,
+                )
+            else:
+                process = await run_process(
+                    command.split(" "),
+                    stream_output=configuration.stream_output,
+                    task_status=task_status,
+                    task_status_handler=_infrastructure_pid_from_process,
+                    cwd=working_dir,
+                    env=configuration.env,
+                    **kwargs,
+                )
 
         # Use the pid for display if no name was given
         display_name = f" {process.pid}"
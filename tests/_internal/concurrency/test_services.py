@@ -404,6 +404,23 @@ def test_batched_queue_service():
     )
 
 
+def test_batched_queue_service_wait_until_empty():
+    class IntervalMockBatchedService(MockBatchedService):
+        _min_interval = 0.01
+
+    instance = IntervalMockBatchedService.instance()
+    instance.send(1)
+    instance.send(2)
+    instance.send(3)
+
+    instance.wait_until_empty()
+
+    IntervalMockBatchedService.mock.assert_has_calls(
+        [call(instance, [1, 2]), call(instance, [3])]
+    )
+    assert instance._queue.empty()
+
+
 def test_batched_queue_service_min_interval():
     event = threading.Event()
 
@@ -421,6 +438,75 @@ def test_batched_queue_service_min_interval():
     )
 
 
+def test_batched_queue_service_holds_items_that_would_overfill_a_batch():
+    class SizedMockBatchedService(MockBatchedService):
+        _max_batch_size = 5
+
+        def _get_size(self, item: int) -> int:
+            return item
+
+    instance = SizedMockBatchedService.instance()
+    instance.send(3)
+    instance.send(3)
+    instance.send(2)
+    instance.send(6)
+    instance.drain()
+    SizedMockBatchedService.mock.assert_has_calls(
+        [call(instance, [3]), call(instance, [3, 2]), call(instance, [6])]
+    )
+
+
+def test_batched_queue_service_grows_batches_under_load():
+    class AdaptiveMockBatchedService(MockBatchedService):
+        _max_batch_size = 4
+        _min_batch_size = 1
+
+    instance = AdaptiveMockBatchedService.instance()
+    for i in range(1, 12):
+        instance.send(i)
+    instance.drain()
+    AdaptiveMockBatchedService.mock.assert_has_calls(
+        [
+            call(instance, [1]),
+            call(instance, [2, 3]),
+            call(instance, [4, 5, 6, 7]),
+            call(instance, [8, 9, 10, 11]),
+        ]
+    )
+
+
+def test_batched_queue_service_does_not_grow_batches_without_a_backlog():
+    class AdaptiveMockBatchedService(MockBatchedService):
+        _max_batch_size = 4
+        _min_batch_size = 1
+
+    instance = AdaptiveMockBatchedService.instance()
+    instance.send(1)
+    instance.wait_until_empty()
+    instance.send(2)
+    instance.send(3)
+    instance.drain()
+    assert AdaptiveMockBatchedService.mock.call_args_list[:2] == [
+        call(instance, [1]),
+        call(instance, [2]),
+    ]
+
+
+def test_batched_queue_service_shrinks_batches_when_idle():
+    class AdaptiveMockBatchedService(MockBatchedService):
+        _max_batch_size = 8
+        _min_batch_size = 2
+
+    instance = AdaptiveMockBatchedService()
+    assert instance._next_target_size(2, filled=True) == 4
+    assert instance._next_target_size(8, filled=True) == 8
+    assert instance._next_target_size(8, filled=False) == 4
+    assert instance._next_target_size(2, filled=False) == 2
+
+    # Services without a minimum batch size always fill batches to the maximum
+    assert MockBatchedService()._next_target_size(2, filled=False) == 2
+
+
 @pytest.mark.parametrize(
     "level,expected", [("DEBUG", True), ("INFO", False), ("WARNING", False)]
 )
@@ -475,8 +561,7 @@ def test_queue_service_start_failure_contains_traceback_only_at_debug(
     class ExceptionOnHandleService(QueueService[int]):
         exception_msg = "Oh no!"
 
-        async def _handle(self):
-            ...
+        async def _handle(self): ...
 
         async def _main_loop(self):
             raise Exception(self.exception_msg)
@@ -0,0 +1,110 @@
+import numpy as np
+
+from prefect._internal.result_cache import (
+    LocalDiskCache,
+    SizedLRUCache,
+    estimate_size,
+)
+
+
+class TestEstimateSize:
+    def test_buffers_are_measured_by_data_size(self):
+        assert estimate_size(b"x" * 1000) == 1000
+        assert estimate_size(memoryview(b"x" * 1000)) == 1000
+        assert estimate_size(np.zeros(1000, dtype=np.float64)) == 8000
+
+    def test_containers_include_their_items(self):
+        data = {"a": b"x" * 1000, "b": [b"y" * 1000]}
+        assert estimate_size(data) > 2000
+
+
+class TestSizedLRUCache:
+    def test_evicts_least_recently_used_values_by_size(self):
+        cache = SizedLRUCache(max_bytes=2500)
+        cache["a"] = b"a" * 1000
+        cache["b"] = b"b" * 1000
+        cache.get("a")
+        cache["c"] = b"c" * 1000
+
+        assert set(cache) == {"a", "c"}
+
+    def test_does_not_store_values_larger_than_the_cache(self):
+        cache = SizedLRUCache(max_bytes=100)
+        cache["a"] = b"a" * 10
+        cache["a"] = b"a" * 1000
+
+        assert "a" not in cache
+
+    def test_counts_hits_and_misses(self):
+        cache = SizedLRUCache(max_bytes=100)
+        cache["a"] = b"a"
+
+        assert cache.get("a") == b"a"
+        assert cache.get("b") is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+class TestLocalDiskCache:
+    def test_put_and_get(self, tmp_path):
+        cache = LocalDiskCache(tmp_path, max_bytes=1000)
+        assert cache.get("key") is None
+
+        cache.put("key", b"data")
+
+        assert cache.get("key").read_bytes() == b"data"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_put_stream(self, tmp_path):
+        cache = LocalDiskCache(tmp_path, max_bytes=1000)
+        source = tmp_path / "source"
+        source.write_bytes(b"data")
+
+        with open(source, "rb") as stream:
+            path = cache.put_stream("key", stream)
+
+        assert path.read_bytes() == b"data"
+
+    def test_evicts_least_recently_used_entries(self, tmp_path):
+        cache = LocalDiskCache(tmp_path, max_bytes=250)
+        cache.put("a", b"a" * 100)
+        cache.put("b", b"b" * 100)
+        cache.get("a")
+        cache.put("c", b"c" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size == 200
+
+    def test_keeps_the_newest_entry_when_larger_than_the_cache(self, tmp_path):
+        cache = LocalDiskCache(tmp_path, max_bytes=10)
+        path = cache.put("a", b"a" * 100)
+
+        assert path.read_bytes() == b"a" * 100
+
+    def test_invalidate(self, tmp_path):
+        cache = LocalDiskCache(tmp_path, max_bytes=1000)
+        cache.put("key", b"data")
+
+        cache.invalidate("key")
+
+        assert cache.get("key") is None
+        assert cache.size == 0
+
+    def test_shares_entries_between_instances(self, tmp_path):
+        LocalDiskCache(tmp_path, max_bytes=1000).put("key", b"data")
+
+        cache = LocalDiskCache(tmp_path, max_bytes=1000)
+
+        assert len(cache) == 1
+        assert cache.get("key").read_bytes() == b"data"
+
+    def test_clear(self, tmp_path):
+        cache = LocalDiskCache(tmp_path, max_bytes=1000)
+        cache.put("a", b"a")
+        cache.put("b", b"b")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
@@ -0,0 +1,92 @@
+import pickle
+import threading
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from prefect._internal.shared_memory import (
+    OutOfBandBytes,
+    dump_to_shared_memory,
+    load_from_shared_memory,
+    release_segments,
+)
+
+
+def test_large_buffers_are_moved_to_shared_memory():
+    data = {"array": np.arange(10_000), "small": np.arange(10)}
+
+    payload, segments = dump_to_shared_memory(data, min_size=1024)
+    try:
+        assert len(segments) == 1
+        assert len(payload.data) < 1024
+
+        loaded = load_from_shared_memory(payload)
+    finally:
+        release_segments(segments, unlink=True)
+
+    np.testing.assert_array_equal(loaded["array"], data["array"])
+    np.testing.assert_array_equal(loaded["small"], data["small"])
+    # loaded buffers are copies, so they can be modified
+    loaded["array"][0] = 42
+
+
+def test_large_bytes_are_moved_to_shared_memory_when_wrapped():
+    data = b"x" * 10_000
+
+    payload, segments = dump_to_shared_memory([OutOfBandBytes(data)], min_size=1024)
+    try:
+        assert len(segments) == 1
+        assert load_from_shared_memory(payload) == [data]
+    finally:
+        release_segments(segments, unlink=True)
+
+
+def test_wrapped_bytes_pickle_in_band():
+    data = b"x" * 10_000
+
+    assert pickle.loads(pickle.dumps(OutOfBandBytes(data))) == data
+    assert pickle.loads(pickle.dumps(OutOfBandBytes(data), protocol=5)) == data
+
+
+def test_load_can_unlink_segments():
+    payload, segments = dump_to_shared_memory(np.arange(10_000), min_size=1024)
+    release_segments(segments, unlink=False)
+
+    load_from_shared_memory(payload, unlink=True)
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=payload.segments[0][0])
+
+
+def test_load_unlinks_remaining_segments_if_loading_fails():
+    payload, segments = dump_to_shared_memory(
+        [np.arange(10_000), np.arange(10_000), np.arange(10_000)], min_size=1024
+    )
+    release_segments(segments[:1] + segments[2:], unlink=False)
+    release_segments(segments[1:2], unlink=True)
+
+    with pytest.raises(FileNotFoundError):
+        load_from_shared_memory(payload, unlink=True)
+
+    for name, _ in payload.segments:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+
+def test_segments_are_released_if_pickling_fails(monkeypatch):
+    created = []
+    original_init = SharedMemory.__init__
+
+    def record(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        created.append(self.name)
+
+    monkeypatch.setattr(SharedMemory, "__init__", record)
+
+    with pytest.raises(TypeError):
+        dump_to_shared_memory([np.arange(10_000), threading.Lock()], min_size=1024)
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0])
@@ -1487,6 +1487,29 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_create_logs_accepts_encoded_logs(prefect_client, flow_run):
+    log = LogCreate(
+        name="prefect.flow_runs",
+        level=20,
+        message="Already encoded",
+        timestamp=DateTime.now(),
+        flow_run_id=flow_run.id,
+    )
+
+    await prefect_client.create_logs(
+        [
+            json.dumps(log.model_dump(mode="json")).encode(),
+            log.model_dump(mode="json"),
+            log,
+        ]
+    )
+
+    logs = await prefect_client.read_logs(
+        log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run.id]))
+    )
+    assert [log.message for log in logs] == ["Already encoded"] * 3
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
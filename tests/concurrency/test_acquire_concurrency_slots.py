@@ -5,6 +5,7 @@ from httpx import Response
 
 from prefect.client.schemas.responses import MinimalConcurrencyLimitResponse
 from prefect.concurrency._asyncio import aacquire_concurrency_slots
+from prefect.concurrency.services import MAX_SERVER_WAIT_SECONDS
 
 
 async def test_calls_increment_client_method():
@@ -29,6 +30,7 @@ async def test_calls_increment_client_method():
             slots=1,
             mode="concurrency",
             create_if_missing=None,
+            wait_seconds=MAX_SERVER_WAIT_SECONDS,
         )
 
 
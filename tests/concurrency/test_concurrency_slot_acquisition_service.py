@@ -5,7 +5,10 @@ import pytest
 from httpx import HTTPStatusError, Request, Response
 
 from prefect.client.orchestration import get_client
-from prefect.concurrency.services import ConcurrencySlotAcquisitionService
+from prefect.concurrency.services import (
+    MAX_SERVER_WAIT_SECONDS,
+    ConcurrencySlotAcquisitionService,
+)
 
 
 @pytest.fixture
@@ -51,9 +54,35 @@ async def test_returns_successful_response(mocked_client):
         slots=expected_slots,
         mode=expected_mode,
         create_if_missing=True,
+        wait_seconds=MAX_SERVER_WAIT_SECONDS,
     )
 
 
+async def test_asks_server_to_wait_no_longer_than_the_timeout(mocked_client):
+    mocked_method = mocked_client.client.increment_concurrency_slots
+    mocked_method.return_value = Response(200)
+
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(["api"]))
+    future = service.send((1, "concurrency", 5.0, True, None))
+    await service.drain()
+    await asyncio.wrap_future(future)
+
+    wait_seconds = mocked_method.call_args.kwargs["wait_seconds"]
+    assert 0 < wait_seconds <= 5.0
+
+
+async def test_asks_server_not_to_wait_without_retries(mocked_client):
+    mocked_method = mocked_client.client.increment_concurrency_slots
+    mocked_method.return_value = Response(200)
+
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(["api"]))
+    future = service.send((1, "concurrency", None, True, 0))
+    await service.drain()
+    await asyncio.wrap_future(future)
+
+    assert mocked_method.call_args.kwargs["wait_seconds"] == 0.0
+
+
 async def test_retries_failed_call_respects_retry_after_header(mocked_client):
     responses = [
         HTTPStatusError(
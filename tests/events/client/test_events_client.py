@@ -1,6 +1,7 @@
 import logging
 from typing import Type
 from unittest import mock
+from uuid import uuid4
 
 import pytest
 from websockets.exceptions import ConnectionClosed
@@ -141,6 +142,94 @@ async def test_cloud_client_can_connect_and_emit(
     assert recorder.events == [example_event_1]
 
 
+async def test_sends_one_frame_per_event_without_batches(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+):
+    async with Client() as client:
+        await client.emit_many([example_event_1, example_event_2, example_event_3])
+
+    assert recorder.frames == 3
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+
+
+async def test_sends_batched_frames_when_the_server_accepts_them(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    puppeteer.accept_event_batches = True
+
+    async with Client() as client:
+        await client.emit_many([example_event_1, example_event_2, example_event_3])
+        await client.emit(example_event_1)
+
+    assert recorder.frames == 2
+    assert recorder.events == [
+        example_event_1,
+        example_event_2,
+        example_event_3,
+        example_event_1,
+    ]
+
+
+async def test_splits_large_batches_into_several_frames(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    puppeteer.accept_event_batches = True
+    event_size = len(example_event_1.model_dump_json())
+    monkeypatch.setattr(
+        "prefect.events.clients.MAX_EVENT_BATCH_FRAME_SIZE", 2 * event_size + 10
+    )
+
+    events = [example_event_1.model_copy(update={"id": uuid4()}) for _ in range(5)]
+    async with Client() as client:
+        await client.emit_many(events)
+
+    assert recorder.frames == 3
+    assert recorder.events == events
+
+
+async def test_reconnects_and_resends_after_hard_disconnect_with_batches(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    example_event_4: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    puppeteer.accept_event_batches = True
+
+    client = Client(checkpoint_every=1)
+    async with client:
+        await client.emit(example_event_1)
+
+        puppeteer.hard_disconnect_after = example_event_2.id
+        await client.emit_many([example_event_2, example_event_3])
+
+        await client.emit(example_event_4)
+
+    assert recorder.connections == 2
+    assert recorder.events == [
+        example_event_1,
+        example_event_2,
+        example_event_3,
+        example_event_4,
+        example_event_4,  # resent due to the hard disconnect after the batch
+    ]
+
+
 async def test_reconnects_and_resends_after_hard_disconnect(
     Client: Type[PrefectEventsClient],
     example_event_1: Event,
@@ -34,6 +34,23 @@ def test_emits_event_via_client(asserting_events_worker: EventsWorker, event: Ev
     assert asserting_events_worker._client.events == [event]
 
 
+def test_emits_events_in_batches(asserting_events_worker: EventsWorker):
+    events = [
+        Event(
+            event="vogon.poetry.read",
+            resource={"prefect.resource.id": f"poem.{uuid.uuid4()}"},
+        )
+        for _ in range(3)
+    ]
+    for event in events:
+        asserting_events_worker.send(event)
+
+    asserting_events_worker.drain()
+
+    assert isinstance(asserting_events_worker._client, AssertingEventsClient)
+    assert asserting_events_worker._client.events == events
+
+
 def test_worker_instance_server_client_non_cloud_api_url():
     with temporary_settings(updates={PREFECT_API_URL: "http://localhost:8080/api"}):
         worker = EventsWorker.instance()
@@ -63,6 +63,37 @@ def test_stream_events_in(
     stream_publish.assert_has_awaits([mock.call(event) for event in server_events])
 
 
+def test_stream_events_in_batches(
+    test_client: TestClient,
+    frozen_time: pendulum.DateTime,
+    event1: Event,
+    event2: Event,
+    stream_publish: mock.AsyncMock,
+):
+    websocket: WebSocketTestSession
+    with test_client.websocket_connect(
+        "/api/events/in", subprotocols=["prefect-event-batches"]
+    ) as websocket:
+        assert websocket.accepted_subprotocol == "prefect-event-batches"
+        websocket.send_text(
+            "[" + ",".join([event1.model_dump_json(), event2.model_dump_json()]) + "]"
+        )
+        websocket.send_text(event1.model_dump_json())
+
+    server_events = [
+        event1.receive(received=frozen_time),
+        event2.receive(received=frozen_time),
+        event1.receive(received=frozen_time),
+    ]
+    stream_publish.assert_has_awaits([mock.call(event) for event in server_events])
+
+
+def test_stream_events_in_without_batches(test_client: TestClient):
+    websocket: WebSocketTestSession
+    with test_client.websocket_connect("/api/events/in") as websocket:
+        assert websocket.accepted_subprotocol is None
+
+
 def test_post_events(
     test_client: TestClient,
     frozen_time: pendulum.DateTime,
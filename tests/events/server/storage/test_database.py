@@ -165,6 +165,81 @@ class TestWriteEvents:
                 )
                 assert len(list(results)) == len(event.related) + 1
 
+    async def test_write_events_on_postgres(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        event: ReceivedEvent,
+        other_events: List[ReceivedEvent],
+    ):
+        if db.database_config.connection_url.startswith("sqlite"):
+            pytest.skip("Events are copied into a temporary table only on Postgres")
+
+        event.follows = uuid4()
+        event.payload = {"nested": {"values": [1, 2.5, None, "\u2603"]}}
+
+        # the event appears twice in one batch and again in a later batch
+        async with session as session:
+            await write_events(
+                session=session, events=[event, *other_events[:10], event]
+            )
+            await session.commit()
+
+        async with session as session:
+            await write_events(session=session, events=[event, *other_events[10:20]])
+            await session.commit()
+
+        async with session as session:
+            count = await session.scalar(
+                sa.select(sa.func.count()).select_from(db.Event)
+            )
+            assert count == 21
+
+            count = await session.scalar(
+                sa.select(sa.func.count())
+                .select_from(db.EventResource)
+                .where(db.EventResource.event_id == event.id)
+            )
+            assert count == len(event.related) + 1
+
+            resources = (
+                await session.scalars(
+                    sa.select(db.EventResource)
+                    .where(db.EventResource.event_id == event.id)
+                    .order_by(db.EventResource.resource_id)
+                )
+            ).all()
+            assert [
+                (resource.resource_id, resource.resource_role) for resource in resources
+            ] == [
+                ("my.resource.id", ""),
+                ("related-1", "role-1"),
+                ("related-2", "role-1"),
+                ("related-3", "role-2"),
+            ]
+            assert all(resource.occurred == event.occurred for resource in resources)
+
+        async with session as session:
+            events = await read_events(
+                session=session,
+                events_filter=EventFilter(
+                    id=EventIDFilter(id=[event.id]),
+                    occurred=EventOccurredFilter(
+                        since=pendulum.now("UTC").subtract(days=1)
+                    ),
+                ),
+            )
+
+        assert len(events) == 1
+        written = ReceivedEvent.model_validate(events[0], from_attributes=True)
+        assert written.id == event.id
+        assert written.follows == event.follows
+        assert written.occurred == event.occurred
+        assert written.received == event.received
+        assert written.resource == event.resource
+        assert written.related == event.related
+        assert written.payload == event.payload
+
 
 class TestReadEvents:
     @pytest.fixture
@@ -332,3 +332,117 @@ async def test_trims_messages_periodically(
     assert len(remaining_events) == 5
 
     assert all(event.occurred >= five_days_ago for event in remaining_events)
+
+
+async def test_writes_batches_concurrently(
+    event: ReceivedEvent,
+    session: AsyncSession,
+):
+    async with event_persister.create_handler(
+        batch_size=3,
+        flush_every=timedelta(days=100),
+        concurrency=4,
+    ) as handler:
+        for _ in range(25):
+            event.id = uuid4()
+            message = CapturedMessage(
+                data=event.model_dump_json().encode(),
+                attributes={},
+            )
+            await handler(message)
+
+    assert (await get_event_count(session)) == 25
+
+
+async def test_holds_back_messages_while_the_queue_is_full(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    writes_started = 0
+    finish_writing = asyncio.Event()
+
+    async def slow_write_events(session: AsyncSession, events: list[ReceivedEvent]):
+        nonlocal writes_started
+        writes_started += 1
+        await finish_writing.wait()
+        await write_events(session=session, events=events)
+
+    monkeypatch.setattr(event_persister, "write_events", slow_write_events)
+
+    async def send_event(handler: MessageHandler):
+        event.id = uuid4()
+        await handler(
+            CapturedMessage(data=event.model_dump_json().encode(), attributes={})
+        )
+
+    async with event_persister.create_handler(
+        batch_size=2,
+        flush_every=timedelta(days=100),
+        max_queue_size=2,
+        concurrency=2,
+    ) as handler:
+        # keep both writers busy with a batch each...
+        for expected_writes in (1, 2):
+            for _ in range(2):
+                await send_event(handler)
+            while writes_started < expected_writes:
+                await asyncio.sleep(0.01)
+
+        # ...then fill the queue
+        for _ in range(2):
+            await send_event(handler)
+
+        held_back = asyncio.create_task(send_event(handler))
+        await asyncio.sleep(0.1)
+        assert not held_back.done()
+
+        finish_writing.set()
+        await asyncio.wait_for(held_back, timeout=5)
+
+    assert (await get_event_count(session)) == 7
+
+
+async def test_keeps_events_when_writing_fails(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    failures = 1
+
+    async def flaky_write_events(session: AsyncSession, events: list[ReceivedEvent]):
+        nonlocal failures
+        if failures:
+            failures -= 1
+            raise ValueError("database went away")
+        await write_events(session=session, events=events)
+
+    monkeypatch.setattr(event_persister, "write_events", flaky_write_events)
+
+    async with event_persister.create_handler(
+        batch_size=4,
+        flush_every=timedelta(days=100),
+    ) as handler:
+        for _ in range(4):
+            event.id = uuid4()
+            await handler(
+                CapturedMessage(data=event.model_dump_json().encode(), attributes={})
+            )
+
+        assert (await get_event_count(session)) == 0
+
+    assert (await get_event_count(session)) == 4
+
+
+async def test_records_persisted_events_and_lag(
+    event: ReceivedEvent,
+    event_persister_handler: MessageHandler,
+    message: Message,
+):
+    before = event_persister.EVENTS_PERSISTED._value.get()
+
+    await event_persister_handler(message)
+
+    assert event_persister.EVENTS_PERSISTED._value.get() == before + 1
+    assert event_persister.EVENT_PERSISTER_QUEUE_SIZE._value.get() == 0
+    assert event_persister.EVENT_PERSISTER_LAG._value.get() > 0
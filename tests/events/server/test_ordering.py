@@ -8,14 +8,31 @@ import pytest
 from prefect.server.events.ordering import (
     MAX_DEPTH_OF_PRECEDING_EVENT,
     CausalOrdering,
+    CausalOrderingModule,
     EventArrivedEarly,
     MaxDepthExceeded,
+    get_causal_ordering,
 )
+from prefect.server.events.ordering import db as db_ordering
+from prefect.server.events.ordering import memory as memory_ordering
 from prefect.server.events.schemas.events import ReceivedEvent, Resource
+from prefect.settings import PREFECT_SERVER_EVENTS_CAUSAL_ORDERING, temporary_settings
 
 pytestmark = pytest.mark.usefixtures("cleared_automations")
 
 
+@pytest.fixture(autouse=True)
+def forget_everything_in_memory():
+    memory_ordering.CausalOrdering.forget_everything()
+    yield
+    memory_ordering.CausalOrdering.forget_everything()
+
+
+@pytest.fixture(params=[db_ordering, memory_ordering], ids=["db", "memory"])
+def ordering_module(request: pytest.FixtureRequest) -> CausalOrderingModule:
+    return request.param
+
+
 @pytest.fixture
 def resource() -> Resource:
     return Resource({"prefect.resource.id": "any.thing"})
@@ -108,8 +125,8 @@ def example(request: pytest.FixtureRequest) -> Sequence[ReceivedEvent]:
 
 
 @pytest.fixture
-def causal_ordering() -> CausalOrdering:
-    return CausalOrdering(scope="unit-tests")
+def causal_ordering(ordering_module: CausalOrderingModule) -> CausalOrdering:
+    return ordering_module.CausalOrdering(scope="unit-tests")
 
 
 async def test_ordering_is_correct(
@@ -232,7 +249,7 @@ async def test_returns_lost_followers_in_occurred_order(
 
     # setting to a negative duration here simulates moving into the future
     monkeypatch.setattr(
-        "prefect.server.events.ordering.PRECEDING_EVENT_LOOKBACK",
+        f"{type(causal_ordering).__module__}.PRECEDING_EVENT_LOOKBACK",
         timedelta(minutes=-1),
     )
 
@@ -242,6 +259,7 @@ async def test_returns_lost_followers_in_occurred_order(
 
 
 async def test_two_instances_do_not_interfere(
+    ordering_module: CausalOrderingModule,
     event_one: ReceivedEvent,
     event_two: ReceivedEvent,
 ):
@@ -249,8 +267,8 @@ async def test_two_instances_do_not_interfere(
     # other.  This does not test every piece of functionality, but illustrates that
     # prefixes are used.
 
-    ordering_one = CausalOrdering(scope="one")
-    ordering_two = CausalOrdering(scope="two")
+    ordering_one = ordering_module.CausalOrdering(scope="one")
+    ordering_two = ordering_module.CausalOrdering(scope="two")
 
     await ordering_one.record_event_as_seen(event_one)
     assert await ordering_one.event_has_been_seen(event_one)
@@ -275,3 +293,95 @@ async def test_two_instances_do_not_interfere(
     await ordering_two.forget_follower(event_two)
     assert await ordering_one.get_followers(event_one) == []
     assert await ordering_two.get_followers(event_one) == []
+
+
+@pytest.mark.parametrize("module", [db_ordering, memory_ordering])
+def test_causal_ordering_is_configurable(module: CausalOrderingModule):
+    with temporary_settings({PREFECT_SERVER_EVENTS_CAUSAL_ORDERING: module.__name__}):
+        assert isinstance(get_causal_ordering("unit-tests"), module.CausalOrdering)
+
+
+async def test_memory_ordering_writes_followers_to_the_database_past_a_threshold(
+    event_one: ReceivedEvent,
+    event_two: ReceivedEvent,
+    event_three_a: ReceivedEvent,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(memory_ordering, "MAX_FOLLOWERS_IN_MEMORY", 1)
+
+    in_memory = memory_ordering.CausalOrdering(scope="unit-tests")
+    in_database = db_ordering.CausalOrdering(scope="unit-tests")
+
+    await in_memory.record_follower(event_two)
+    await in_memory.record_follower(event_three_a)
+
+    assert await in_database.get_followers(event_one) == []
+    assert await in_database.get_followers(event_two) == [event_three_a]
+
+    assert await in_memory.get_followers(event_one) == [event_two]
+    assert await in_memory.get_followers(event_two) == [event_three_a]
+
+    await in_memory.forget_follower(event_three_a)
+    assert await in_database.get_followers(event_two) == []
+    assert await in_memory.get_followers(event_two) == []
+
+
+async def test_memory_ordering_picks_up_lost_followers_from_the_database(
+    event_two: ReceivedEvent,
+    event_three_a: ReceivedEvent,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # a follower left behind in the database, like by a previous run of the server
+    await db_ordering.CausalOrdering(scope="unit-tests").record_follower(event_two)
+
+    in_memory = memory_ordering.CausalOrdering(scope="unit-tests")
+    await in_memory.record_follower(event_three_a)
+
+    for module in (db_ordering, memory_ordering):
+        monkeypatch.setattr(module, "PRECEDING_EVENT_LOOKBACK", timedelta(minutes=-1))
+
+    assert await in_memory.get_lost_followers() == [event_two, event_three_a]
+    assert await in_memory.get_lost_followers() == []
+
+
+def test_seen_events_expire_a_partition_at_a_time(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr(memory_ordering.time, "monotonic", lambda: now)
+
+    seen = memory_ordering.SeenEvents()
+    first, second = uuid4(), uuid4()
+
+    seen.add(first)
+    now += memory_ordering.SEEN_PARTITION_DURATION.total_seconds()
+    seen.add(second)
+    assert first in seen and second in seen
+    assert len(seen) == 2
+
+    now += memory_ordering.SEEN_EXPIRATION.total_seconds()
+    assert first in seen
+
+    now += memory_ordering.SEEN_PARTITION_DURATION.total_seconds()
+    assert first not in seen
+    assert second in seen
+    assert len(seen) == 1
+
+
+def test_seen_events_forget_the_oldest_partitions_past_their_size(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    now = 1000.0
+    monkeypatch.setattr(memory_ordering.time, "monotonic", lambda: now)
+
+    seen = memory_ordering.SeenEvents(max_size=3)
+    oldest = [uuid4(), uuid4()]
+    for id in oldest:
+        seen.add(id)
+
+    now += memory_ordering.SEEN_PARTITION_DURATION.total_seconds()
+    newest = [uuid4(), uuid4()]
+    for id in newest:
+        seen.add(id)
+
+    assert all(id not in seen for id in oldest)
+    assert all(id in seen for id in newest)
+    assert len(seen) == 2
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Set, Union
 from unittest import mock
 from uuid import uuid4
 
@@ -119,6 +119,108 @@ def test_does_not_match(expected: str, value: Optional[str]):
     assert not matches(expected, value)
 
 
+def indexed_automation(
+    expect: Set[str], match: Dict[str, Union[str, List[str]]], after: Set[str] = set()
+) -> Automation:
+    return Automation(
+        name="Indexed",
+        trigger=EventTrigger(
+            expect=expect,
+            after=after,
+            match=match,
+            posture=Posture.Reactive,
+            threshold=1,
+        ),
+        actions=[actions.DoNothing()],
+    )
+
+
+def some_event(event: str, resource: Dict[str, str]) -> ReceivedEvent:
+    return ReceivedEvent(
+        occurred=DateTime.now("UTC"),
+        event=event,
+        resource={"prefect.resource.id": "some.resource", **resource},
+        id=uuid4(),
+    )
+
+
+def test_interested_triggers_are_the_triggers_that_cover_an_event(
+    arachnophobia: Automation,
+    my_poor_lilies: Automation,
+    animal_lover: Automation,
+    chonk_party: Automation,
+):
+    for automation in [
+        arachnophobia,
+        my_poor_lilies,
+        animal_lover,
+        chonk_party,
+        indexed_automation({"animal.*"}, {}),
+        indexed_automation({"animal.walk*"}, {"prefect.resource.id": "spot"}),
+        indexed_automation({"animal.ate"}, {"prefect.resource.id": ["spot", "rex"]}),
+        indexed_automation({"animal.slept"}, {"prefect.resource.id": "!spot"}),
+        indexed_automation({"animal.ate"}, {"species": "can*"}, after={"plant.*"}),
+        indexed_automation({"plant.grew"}, {"prefect.resource.id": "tree.*"}),
+    ]:
+        triggers.load_automation(automation)
+
+    events = [
+        some_event("animal.walked", {"prefect.resource.id": "spot"}),
+        some_event("animal.walked", {"class": "Arachnida", "order": "Araneae"}),
+        some_event("animal.ate", {"prefect.resource.id": "rex", "species": "canis"}),
+        some_event("animal.ate", {"species": "felis"}),
+        some_event("animal.slept", {"prefect.resource.id": "spot"}),
+        some_event("animal.slept", {"prefect.resource.id": "rex"}),
+        some_event("plant.grew", {"prefect.resource.id": "tree.oak"}),
+        some_event("plant.grew", {"species": "canis"}),
+        some_event("mineral.formed", {}),
+    ]
+    for event in events:
+        assert triggers.find_interested_triggers(event) == [
+            trigger for trigger in triggers.triggers.values() if trigger.covers(event)
+        ]
+
+
+def test_interested_triggers_only_checks_indexed_candidates(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    for i in range(100):
+        triggers.load_automation(
+            indexed_automation({f"animal.walked.{i}"}, {"prefect.resource.id": "spot"})
+        )
+        triggers.load_automation(
+            indexed_automation({"animal.walked.*"}, {"prefect.resource.id": f"dog.{i}"})
+        )
+
+    checked = []
+    original_covers = EventTrigger.covers
+
+    def covers(self: EventTrigger, event: ReceivedEvent) -> bool:
+        checked.append(self)
+        return original_covers(self, event)
+
+    monkeypatch.setattr(EventTrigger, "covers", covers)
+
+    interested = triggers.find_interested_triggers(
+        some_event("animal.walked.42", {"prefect.resource.id": "dog.42"})
+    )
+
+    # only one trigger both expects the event and matches the resource
+    assert len(checked) == 1
+    assert interested == checked
+
+
+def test_forgotten_triggers_are_removed_from_the_index(arachnophobia: Automation):
+    event = some_event("animal.walked", {"class": "Arachnida", "order": "Araneae"})
+
+    triggers.load_automation(arachnophobia)
+    assert triggers.find_interested_triggers(event) == [arachnophobia.trigger]
+
+    triggers.forget_automation(arachnophobia.id)
+    assert triggers.find_interested_triggers(event) == []
+    assert len(triggers.trigger_index) == 0
+
+
 @pytest.fixture
 async def effective_automations(
     cleared_buckets: None,
@@ -292,6 +394,102 @@ async def test_reactive_automation_does_not_trigger_if_threshold_not_met(
     act.assert_not_awaited()
 
 
+async def read_bucket_from_database(
+    session: AsyncSession, automation: Automation, event: ReceivedEvent
+):
+    return await triggers.read_bucket_by_trigger_id(
+        session,
+        automation.id,
+        automation.trigger.id,
+        automation.trigger.bucketing_key(event),
+    )
+
+
+async def test_bucket_counts_are_written_to_the_database_in_batches(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+):
+    await triggers.reactive_evaluation(woodchonk_walked)
+    woodchonk_walked.occurred += timedelta(seconds=1)
+    await triggers.reactive_evaluation(woodchonk_walked)
+
+    assert triggers.bucket_cache.dirty
+    assert not await read_bucket_from_database(
+        automations_session, chonk_party, woodchonk_walked
+    )
+
+    await triggers.bucket_cache.flush(automations_session)
+    await automations_session.commit()
+
+    assert triggers.bucket_cache.dirty == 0
+    bucket = await read_bucket_from_database(
+        automations_session, chonk_party, woodchonk_walked
+    )
+    assert bucket
+    assert bucket.count == 2
+
+
+async def test_buckets_are_restored_from_the_database(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+):
+    await triggers.reactive_evaluation(woodchonk_walked)
+    woodchonk_walked.occurred += timedelta(seconds=1)
+    await triggers.reactive_evaluation(woodchonk_walked)
+    await triggers.bucket_cache.flush(automations_session)
+    await automations_session.commit()
+
+    triggers.bucket_cache.clear()
+    await triggers.load_buckets(automations_session)
+    assert (
+        triggers.bucket_cache.key(
+            chonk_party.id,
+            chonk_party.trigger.id,
+            chonk_party.trigger.bucketing_key(woodchonk_walked),
+        )
+        in triggers.bucket_cache._buckets
+    )
+
+    woodchonk_walked.occurred += timedelta(seconds=1)
+    await triggers.reactive_evaluation(woodchonk_walked)
+    act.assert_awaited_once()
+
+
+async def test_firing_removes_the_bucket_from_the_database_immediately(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+):
+    await triggers.reactive_evaluation(woodchonk_walked)
+    woodchonk_walked.occurred += timedelta(seconds=1)
+    await triggers.reactive_evaluation(woodchonk_walked)
+    await triggers.bucket_cache.flush(automations_session)
+    await automations_session.commit()
+
+    woodchonk_walked.occurred += timedelta(seconds=1)
+    await triggers.reactive_evaluation(woodchonk_walked)
+    act.assert_awaited_once()
+
+    # the next bucket is only in memory, but the one that fired is gone
+    assert not await read_bucket_from_database(
+        automations_session, chonk_party, woodchonk_walked
+    )
+    bucket = await triggers.read_bucket(
+        automations_session,
+        chonk_party.trigger,
+        chonk_party.trigger.bucketing_key(woodchonk_walked),
+    )
+    assert bucket
+    assert bucket.count == 0
+
+
 async def test_reactive_automation_triggers_immediately_even_if_event_matches_after(
     effective_automations,
     woodchonk_table_for_one: ReceivedEvent,
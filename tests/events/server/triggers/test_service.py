@@ -485,3 +485,36 @@ async def test_offset_is_resilient_to_low_volume(
     mock_now.return_value = base_time + timedelta(seconds=10)
     assert await triggers.get_events_clock() == event.occurred.float_timestamp
     assert await triggers.get_events_clock_offset() == -42.0
+
+
+async def test_consumer_holds_the_bucket_writer_lock(effective_automations):
+    async with triggers.consumer():
+        assert triggers.holds_bucket_writer_lock()
+
+
+async def test_only_one_process_writes_buckets_at_a_time(
+    db, monkeypatch: pytest.MonkeyPatch
+):
+    if db.database_config.connection_url.startswith("sqlite"):
+        pytest.skip("SQLite databases are only used by a single server")
+
+    monkeypatch.setattr(
+        "prefect.server.events.triggers.BUCKET_WRITER_LOCK_RETRY_SECONDS", 0.01
+    )
+
+    acquired = asyncio.Event()
+
+    async def another_server():
+        # the lock belongs to a database connection, so this waits for it too
+        async with triggers.bucket_writer_lock():
+            acquired.set()
+
+    async with triggers.bucket_writer_lock():
+        assert triggers.holds_bucket_writer_lock()
+
+        waiting = asyncio.create_task(another_server())
+        await asyncio.sleep(0.1)
+        assert not acquired.is_set()
+
+    await asyncio.wait_for(waiting, timeout=5)
+    assert acquired.is_set()
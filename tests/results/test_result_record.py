@@ -1,10 +1,23 @@
+import io
+import mmap
+import struct
+
+import cloudpickle
 import pytest
 from pydantic import ValidationError
 
-from prefect.filesystems import NullFileSystem
+from prefect.filesystems import LocalFileSystem, NullFileSystem
 from prefect.results import ResultRecord, ResultRecordMetadata, ResultStore
-from prefect.serializers import JSONSerializer
-from prefect.settings import PREFECT_LOCAL_STORAGE_PATH
+from prefect.serializers import (
+    CompressedPickleSerializer,
+    JSONSerializer,
+    PickleSerializer,
+)
+from prefect.settings import (
+    PREFECT_LOCAL_STORAGE_PATH,
+    PREFECT_RESULTS_RECORD_FORMAT,
+    temporary_settings,
+)
 
 
 class TestResultRecord:
@@ -20,6 +33,132 @@ class TestResultRecord:
         deserialized = ResultRecord.deserialize(serialized)
         assert deserialized.result == "The results are in..."
 
+    @pytest.mark.parametrize("serializer", [JSONSerializer(), PickleSerializer()])
+    def test_deserialize_binary_record(self, serializer):
+        record = ResultRecord(
+            result={"the": "results"},
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=serializer
+            ),
+        )
+
+        serialized = record.serialize(format="binary")
+        assert serialized.startswith(b"\x00PFRR")
+        # the binary serializer output is stored as-is after the metadata
+        assert serialized.endswith(serializer.dumps_binary(record.result))
+
+        deserialized = ResultRecord.deserialize(serialized)
+        assert deserialized == record
+
+    def test_binary_record_stores_pickles_without_base64(self):
+        record = ResultRecord(
+            result=b"x" * 10_000,
+            metadata=ResultRecordMetadata(serializer=PickleSerializer()),
+        )
+
+        serialized = record.serialize(format="binary")
+        assert serialized.endswith(cloudpickle.dumps(record.result))
+        assert len(serialized) < len(record.serialize_result())
+
+    def test_deserialize_text_safe_binary_record(self):
+        # version 1 binary records stored the serializer's base64 `dumps` output
+        record = ResultRecord(
+            result={"the": "results"},
+            metadata=ResultRecordMetadata(serializer=PickleSerializer()),
+        )
+        metadata = record.serialize_metadata()
+        serialized = (
+            struct.pack(">5sBI", b"\x00PFRR", 1, len(metadata))
+            + metadata
+            + record.serialize_result()
+        )
+
+        assert ResultRecord.deserialize(serialized) == record
+        assert ResultRecord.deserialize_from_stream(io.BytesIO(serialized)) == record
+
+    def test_deserialize_binary_record_from_mmap(self, tmp_path):
+        record = ResultRecord(
+            result=b"x" * 10_000,
+            metadata=ResultRecordMetadata(storage_key="my-storage-key"),
+        )
+        path = tmp_path / "record"
+        path.write_bytes(record.serialize(format="binary"))
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            view = memoryview(mapped)
+            try:
+                deserialized = ResultRecord.deserialize(view)
+            finally:
+                view.release()
+
+        assert deserialized == record
+
+    def test_deserialize_binary_record_with_unsupported_version(self):
+        record = ResultRecord(result="hi", metadata=ResultRecordMetadata())
+        serialized = bytearray(record.serialize(format="binary"))
+        serialized[5] = 255
+
+        with pytest.raises(ValueError, match="version 255 is not supported"):
+            ResultRecord.deserialize(bytes(serialized))
+
+    def test_deserialize_truncated_binary_record(self):
+        record = ResultRecord(result="hi", metadata=ResultRecordMetadata())
+        truncated = record.serialize(format="binary")[:20]
+
+        with pytest.raises(ValueError, match="Binary result record is truncated"):
+            ResultRecord.deserialize(truncated)
+
+        with pytest.raises(ValueError, match="Binary result record is truncated"):
+            ResultRecord.deserialize_metadata(truncated)
+
+        with pytest.raises(ValueError, match="Binary result record is truncated"):
+            ResultRecord.deserialize_from_stream(io.BytesIO(truncated))
+
+    @pytest.mark.parametrize("format", ["json", "binary"])
+    def test_deserialize_metadata(self, format):
+        record = ResultRecord(
+            result="The results are in...",
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=JSONSerializer()
+            ),
+        )
+
+        metadata = ResultRecord.deserialize_metadata(record.serialize(format=format))
+        assert metadata == record.metadata
+
+    @pytest.mark.parametrize(
+        "serializer",
+        [JSONSerializer(), PickleSerializer(), CompressedPickleSerializer()],
+    )
+    def test_stream_roundtrip(self, serializer):
+        record = ResultRecord(
+            result={"the": "results"},
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=serializer
+            ),
+        )
+        file = io.BytesIO()
+        record.serialize_to_stream(file)
+
+        assert file.getvalue() == record.serialize(format="binary")
+        file.seek(0)
+        assert ResultRecord.deserialize_from_stream(file) == record
+        file.seek(0)
+        assert ResultRecord.deserialize_metadata_from_stream(file) == record.metadata
+
+    def test_deserialize_json_record_from_stream(self):
+        record = ResultRecord(
+            result="The results are in...",
+            metadata=ResultRecordMetadata(serializer=JSONSerializer()),
+        )
+
+        file = io.BytesIO(record.serialize())
+        assert ResultRecord.deserialize_from_stream(file) == record
+        file.seek(0)
+        assert ResultRecord.deserialize_metadata_from_stream(file) == record.metadata
+
     def test_deserialize_with_result_only(self):
         serialized = JSONSerializer().dumps("The results are in...")
 
@@ -58,3 +197,58 @@ class TestResultRecord:
             )
             == "The results are in..."
         )
+
+
+class TestResultStoreRecordFormat:
+    def test_record_format_defaults_to_setting(self):
+        assert ResultStore().record_format == "json"
+        with temporary_settings({PREFECT_RESULTS_RECORD_FORMAT: "binary"}):
+            assert ResultStore().record_format == "binary"
+
+    @pytest.mark.parametrize("format", ["json", "binary"])
+    async def test_persist_and_read_record(self, format):
+        store = ResultStore(record_format=format, cache_result_in_memory=False)
+        result_record = store.create_result_record({"a": 1}, "the-key")
+        await store.apersist_result_record(result_record)
+
+        content = (PREFECT_LOCAL_STORAGE_PATH.value() / "the-key").read_bytes()
+        assert content.startswith(b"\x00PFRR") == (format == "binary")
+
+        assert await store.aexists("the-key")
+        loaded = await store.aread("the-key")
+        assert loaded.result == {"a": 1}
+
+    async def test_binary_store_reads_json_records(self):
+        json_store = ResultStore(record_format="json", cache_result_in_memory=False)
+        await json_store.awrite(obj="old", key="old-key")
+
+        binary_store = ResultStore(record_format="binary", cache_result_in_memory=False)
+        loaded = await binary_store.aread("old-key")
+        assert loaded.result == "old"
+
+    @pytest.mark.parametrize("separate_metadata", [True, False])
+    async def test_binary_records_are_streamed(
+        self, monkeypatch, tmp_path, separate_metadata
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError("The serialized result should not be materialized")
+
+        monkeypatch.setattr(PickleSerializer, "dumps", fail)
+        monkeypatch.setattr(PickleSerializer, "loads", fail)
+
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path / "results")),
+            metadata_storage=(
+                LocalFileSystem(basepath=str(tmp_path / "metadata"))
+                if separate_metadata
+                else None
+            ),
+            serializer=PickleSerializer(),
+            record_format="binary",
+            cache_result_in_memory=False,
+        )
+        await store.awrite(obj={"a": b"x" * 100_000}, key="the-key")
+
+        assert await store.aexists("the-key")
+        loaded = await store.aread("the-key")
+        assert loaded.result == {"a": b"x" * 100_000}
@@ -1,12 +1,14 @@
+import uuid
 from unittest import mock
 
+import fsspec
 import pytest
 
 import prefect.exceptions
 import prefect.results
 from prefect import flow, task
 from prefect.context import FlowRunContext, get_run_context
-from prefect.filesystems import LocalFileSystem
+from prefect.filesystems import LocalFileSystem, RemoteFileSystem
 from prefect.locking.memory import MemoryLockManager
 from prefect.results import (
     ResultRecord,
@@ -17,7 +19,10 @@ from prefect.serializers import JSONSerializer, PickleSerializer
 from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
+    PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES,
+    PREFECT_RESULTS_LOCAL_CACHE_PATH,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
+    PREFECT_RESULTS_RECORD_FORMAT,
     PREFECT_TASKS_DEFAULT_PERSIST_RESULT,
     temporary_settings,
 )
@@ -885,6 +890,185 @@ async def test_supports_isolation_level():
     )
 
 
+class TestLocalResultCache:
+    @pytest.fixture
+    def local_cache_path(self, tmp_path):
+        with temporary_settings(
+            {
+                PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES: 1024 * 1024,
+                PREFECT_RESULTS_LOCAL_CACHE_PATH: tmp_path / "cache",
+            }
+        ):
+            yield tmp_path / "cache"
+
+    @pytest.fixture
+    def remote_basepath(self):
+        basepath = f"memory://results-{uuid.uuid4().hex}"
+        yield basepath
+        fs = fsspec.filesystem("memory")
+        if fs.exists(basepath):
+            fs.rm(basepath, recursive=True)
+
+    @pytest.mark.parametrize("record_format", ["json", "binary"])
+    async def test_reads_remote_results_through_local_cache(
+        self, local_cache_path, remote_basepath, record_format
+    ):
+        with temporary_settings({PREFECT_RESULTS_RECORD_FORMAT: record_format}):
+            store = ResultStore(
+                result_storage=RemoteFileSystem(basepath=remote_basepath),
+                cache_result_in_memory=False,
+            )
+        await store.awrite(key="test", obj="value")
+
+        assert (await store.aread(key="test")).result == "value"
+        local_cache = prefect.results.get_local_result_cache()
+        assert (local_cache.stats.hits, local_cache.stats.misses) == (0, 1)
+
+        # the remote record is no longer needed
+        fsspec.filesystem("memory").rm(remote_basepath, recursive=True)
+
+        assert (await store.aread(key="test")).result == "value"
+        assert (local_cache.stats.hits, local_cache.stats.misses) == (1, 1)
+
+    async def test_writes_invalidate_local_cache(
+        self, local_cache_path, remote_basepath
+    ):
+        store = ResultStore(
+            result_storage=RemoteFileSystem(basepath=remote_basepath),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(key="test", obj="old")
+        assert (await store.aread(key="test")).result == "old"
+
+        await store.awrite(key="test", obj="new")
+
+        assert (await store.aread(key="test")).result == "new"
+
+    async def test_does_not_cache_local_results_on_disk(
+        self, local_cache_path, tmp_path
+    ):
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=tmp_path / "results"),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(key="test", obj="value")
+
+        assert (await store.aread(key="test")).result == "value"
+        assert not local_cache_path.exists()
+
+    async def test_local_cache_is_disabled_by_default(self):
+        assert prefect.results.get_local_result_cache() is None
+
+    async def test_memory_cache_counts_hits_and_misses(self, tmp_path):
+        store = ResultStore(result_storage=LocalFileSystem(basepath=tmp_path))
+        record = store.create_result_record("value", key="test")
+        await store.apersist_result_record(record)
+        store.cache.clear()
+
+        await store.aread(key="test")
+        await store.aread(key="test")
+
+        assert (store.cache.stats.hits, store.cache.stats.misses) == (1, 1)
+
+
+class TestBatchedLookups:
+    @pytest.fixture
+    def remote_basepath(self):
+        basepath = f"memory://results-{uuid.uuid4().hex}"
+        yield basepath
+        fs = fsspec.filesystem("memory")
+        if fs.exists(basepath):
+            fs.rm(basepath, recursive=True)
+
+    async def test_exists_many(self, tmp_path):
+        store = ResultStore(result_storage=LocalFileSystem(basepath=tmp_path))
+        await store.awrite(key="a", obj=1)
+        await store.awrite(key="b", obj=2)
+
+        expected = {"a": True, "b": True, "c": False}
+        assert await store.aexists_many(["a", "b", "c"]) == expected
+        assert store.exists_many(["a", "b", "c"]) == expected
+
+    async def test_exists_many_with_metadata_storage(self, tmp_path):
+        store = ResultStore(
+            metadata_storage=LocalFileSystem(basepath=tmp_path / "metadata"),
+            result_storage=LocalFileSystem(basepath=tmp_path / "results"),
+        )
+        await store.awrite(key="a", obj=1)
+        await store.awrite(key="b", obj=2)
+        (tmp_path / "metadata" / "b").unlink()
+
+        assert await store.aexists_many(["a", "b"]) == {"a": True, "b": False}
+
+    async def test_exists_many_lists_remote_storage(self, remote_basepath):
+        store = ResultStore(result_storage=RemoteFileSystem(basepath=remote_basepath))
+        await store.awrite(key="a", obj=1)
+        await store.awrite(key="b", obj=2)
+
+        assert await store.aexists_many(["a", "b", "c", "d"]) == {
+            "a": True,
+            "b": True,
+            "c": False,
+            "d": False,
+        }
+
+        # records missing from the listing are not read
+        with mock.patch.object(
+            ResultStore, "_exists", mock.AsyncMock(return_value=True)
+        ) as exists:
+            await store.aexists_many(["a", "b", "c", "d"])
+        assert sorted(call.kwargs["key"] for call in exists.call_args_list) == [
+            "a",
+            "b",
+        ]
+
+    async def test_read_many(self, tmp_path):
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=tmp_path),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(key="a", obj=1)
+        await store.awrite(key="b", obj=2)
+
+        records = await store.aread_many(["b", "a"])
+
+        assert list(records) == ["b", "a"]
+        assert records["a"].result == 1
+        assert records["b"].result == 2
+        assert {
+            key: record.result for key, record in store.read_many(["a"]).items()
+        } == {"a": 1}
+
+    async def test_prefetch_does_not_read_records(self, tmp_path):
+        store = ResultStore(result_storage=LocalFileSystem(basepath=tmp_path))
+        await store.awrite(key="a", obj=1)
+        store.cache.clear()
+
+        await store.aprefetch(["a", "b"])
+
+        assert not store.cache
+        assert await store.aexists(key="a")
+        assert not await store.aexists(key="b")
+
+    async def test_prefetched_existence_is_used_once(self, tmp_path):
+        store = ResultStore(result_storage=LocalFileSystem(basepath=tmp_path))
+        await store.awrite(key="a", obj=1)
+
+        await store.aprefetch(["a"])
+        (tmp_path / "a").unlink()
+
+        assert await store.aexists(key="a")
+        assert not await store.aexists(key="a")
+
+    async def test_writes_discard_prefetched_existence(self, tmp_path):
+        store = ResultStore(result_storage=LocalFileSystem(basepath=tmp_path))
+
+        await store.aprefetch(["a"])
+        await store.awrite(key="a", obj=1)
+
+        assert await store.aexists(key="a")
+
+
 class TestResultStoreEmitsEvents:
     async def test_result_store_emits_write_event(
         self, tmp_path, enable_lineage_events
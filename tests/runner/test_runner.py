@@ -51,6 +51,7 @@ from prefect.settings import (
     PREFECT_RUNNER_POLL_FREQUENCY,
     PREFECT_RUNNER_PROCESS_LIMIT,
     PREFECT_RUNNER_SERVER_ENABLE,
+    PREFECT_RUNNER_WARM_PROCESS_POOL_SIZE,
     temporary_settings,
 )
 from prefect.testing.utilities import AsyncMock
@@ -860,6 +861,35 @@ class TestRunner:
             },
         ]
 
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    async def test_runner_executes_flow_runs_in_warm_processes(
+        self, prefect_client: PrefectClient
+    ):
+        deployment_id = await (await dummy_flow_1.to_deployment(__file__)).apply()
+
+        with temporary_settings({PREFECT_RUNNER_WARM_PROCESS_POOL_SIZE: 1}):
+            async with Runner() as runner:
+                pool = runner._warm_process_pool
+                assert pool is not None
+
+                with anyio.fail_after(10):
+                    while not pool.ready:
+                        await anyio.sleep(0.01)
+                warm_pid = pool._ready[0].pid
+
+                flow_run = await prefect_client.create_flow_run_from_deployment(
+                    deployment_id=deployment_id
+                )
+                await runner.execute_flow_run(flow_run.id)
+
+                assert warm_pid not in [process.pid for process in pool._ready]
+
+        assert runner._warm_process_pool is None
+
+        flow_run = await prefect_client.read_flow_run(flow_run_id=flow_run.id)
+        assert flow_run.state
+        assert flow_run.state.is_completed()
+
     @pytest.mark.usefixtures("use_hosted_api_server")
     async def test_runner_respects_set_limit(
         self, prefect_client: PrefectClient, caplog
@@ -6,6 +6,7 @@ order. This is purely so that we can test sorting by flow run and
 task run ID with a stable order across test machines.
 """
 
+import json
 from datetime import timedelta
 from unittest import mock
 from uuid import uuid1
@@ -15,12 +16,14 @@ import pytest
 from sqlalchemy.orm.exc import FlushError
 
 from prefect.server import models
+from prefect.server.log_writer import LogWriter
 from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
 
 NOW = pendulum.now("UTC")
 CREATE_LOGS_URL = "/logs/"
+BULK_LOGS_URL = "/logs/bulk"
 READ_LOGS_URL = "/logs/filter"
 
 
@@ -106,6 +109,68 @@ class TestCreateLogs:
             assert response.status_code == 500
 
 
+class TestCreateLogsInBulk:
+    async def test_create_logs_from_ndjson(
+        self, session, client, log_data, flow_run_id
+    ):
+        response = await client.post(
+            BULK_LOGS_URL,
+            content="\n".join(json.dumps(log) for log in log_data),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 202
+
+        await LogWriter.instance().flush()
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert [
+            Log.model_validate(log, from_attributes=True).model_dump(
+                mode="json", exclude={"created", "id", "updated"}
+            )
+            for log in logs
+        ] == log_data
+
+    async def test_create_logs_from_json_array(
+        self, session, client, log_data, flow_run_id
+    ):
+        response = await client.post(BULK_LOGS_URL, json=log_data)
+        assert response.status_code == 202
+
+        await LogWriter.instance().flush()
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert len(logs) == 2
+
+    async def test_ndjson_ignores_blank_lines(self, client, log_data):
+        response = await client.post(
+            BULK_LOGS_URL,
+            content="\n".join(json.dumps(log) for log in log_data) + "\n\n",
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 202
+
+    async def test_invalid_logs_are_rejected(self, client, log_data):
+        log_data[1]["level"] = "not a level"
+
+        response = await client.post(
+            BULK_LOGS_URL,
+            content="\n".join(json.dumps(log) for log in log_data),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 422
+        assert response.json()["exception_detail"][0]["loc"][:2] == ["body", 1]
+
+    async def test_malformed_json_is_rejected(self, client):
+        response = await client.post(
+            BULK_LOGS_URL,
+            content='{"name": "prefect.flow_run", ',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 422
+
+
 class TestReadLogs:
     @pytest.fixture()
     async def logs(self, client, log_data):
@@ -3,7 +3,7 @@ from uuid import uuid4
 
 import pendulum
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from prefect.server import models
 from prefect.server.schemas.actions import LogCreate
@@ -77,6 +77,62 @@ class TestCreateLogs:
             )
 
 
+class TestCopyLogs:
+    async def test_copy_logs_succeeds(self, session, flow_run_id, log_data, db):
+        await models.logs.copy_logs(session=session, logs=log_data)
+
+        query = select(db.Log).order_by(db.Log.timestamp.asc())
+        result = await session.execute(query)
+        read_logs = result.scalars().unique().all()
+
+        assert [
+            Log.model_validate(log, from_attributes=True).model_dump(
+                exclude={"created", "id", "updated"},
+            )
+            for log in read_logs
+        ] == [log.model_dump() for log in log_data]
+        assert all(log.id and log.created for log in read_logs)
+
+    async def test_copy_logs_beyond_the_insert_batch_size(
+        self, session, flow_run_id, db
+    ):
+        count = models.logs.LOG_BATCH_SIZE + 1
+        await models.logs.copy_logs(
+            session=session,
+            logs=[
+                LogCreate(
+                    name="prefect.flow_run",
+                    level=20,
+                    message=f"Log {i}",
+                    timestamp=NOW,
+                    flow_run_id=flow_run_id,
+                )
+                for i in range(count)
+            ],
+        )
+
+        result = await session.execute(select(func.count()).select_from(db.Log))
+        assert result.scalar() == count
+
+    async def test_copy_logs_rejects_null_characters(self, session, flow_run_id, db):
+        if db.database_config.connection_url.startswith("sqlite"):
+            pytest.skip("SQLite accepts null characters in text")
+
+        with pytest.raises(Exception):
+            await models.logs.copy_logs(
+                session=session,
+                logs=[
+                    LogCreate(
+                        name="prefect.flow_run",
+                        level=20,
+                        message="before\x00after",
+                        timestamp=NOW,
+                        flow_run_id=flow_run_id,
+                    )
+                ],
+            )
+
+
 class TestReadLogs:
     async def test_read_logs_timestamp_after_inclusive(self, session, logs, log_data):
         after = log_data[1].timestamp
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import models
+from prefect.server.database import orm_models
+
+LEASE_DURATION = timedelta(minutes=3)
+
+
+async def claim(session: AsyncSession, holder: str, shard_count: int = 4) -> set:
+    return await models.scheduler_shard_leases.claim_scheduler_shards(
+        session=session,
+        holder=holder,
+        shard_count=shard_count,
+        lease_duration=LEASE_DURATION,
+    )
+
+
+class TestClaimSchedulerShards:
+    async def test_single_replica_claims_every_shard(self, session: AsyncSession):
+        assert await claim(session, "a") == {0, 1, 2, 3}
+
+        leases = await models.scheduler_shard_leases.read_scheduler_shard_leases(
+            session=session
+        )
+        assert [lease.shard for lease in leases] == [0, 1, 2, 3]
+        assert {lease.holder for lease in leases} == {"a"}
+
+    async def test_claiming_again_renews_leases(self, session: AsyncSession):
+        await claim(session, "a")
+        await session.execute(
+            sa.update(orm_models.SchedulerShardLease).values(
+                expiration=pendulum.now("UTC").add(seconds=5)
+            )
+        )
+
+        assert await claim(session, "a") == {0, 1, 2, 3}
+
+        leases = await models.scheduler_shard_leases.read_scheduler_shard_leases(
+            session=session
+        )
+        assert all(
+            lease.expiration > pendulum.now("UTC").add(minutes=2) for lease in leases
+        )
+
+    async def test_replicas_split_shards_fairly(self, session: AsyncSession):
+        assert await claim(session, "a") == {0, 1, 2, 3}
+
+        b_shards = await claim(session, "b")
+        a_shards = await claim(session, "a")
+
+        assert len(a_shards) == len(b_shards) == 2
+        assert a_shards.isdisjoint(b_shards)
+
+        c_shards = await claim(session, "c")
+        a_shards = await claim(session, "a")
+        b_shards = await claim(session, "b")
+
+        assert len(a_shards) + len(b_shards) + len(c_shards) == 4
+        assert all(0 < len(shards) <= 2 for shards in (a_shards, b_shards, c_shards))
+        assert not (a_shards & b_shards or a_shards & c_shards or b_shards & c_shards)
+
+    async def test_expired_leases_are_claimed(self, session: AsyncSession):
+        await claim(session, "a")
+        await claim(session, "b")
+        await session.execute(
+            sa.update(orm_models.SchedulerShardLease)
+            .where(orm_models.SchedulerShardLease.holder == "b")
+            .values(expiration=pendulum.now("UTC").subtract(seconds=1))
+        )
+
+        assert await claim(session, "a") == {0, 1, 2, 3}
+
+    async def test_ignores_shards_beyond_shard_count(self, session: AsyncSession):
+        await claim(session, "a", shard_count=8)
+
+        assert await claim(session, "a", shard_count=2) == {0, 1}
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 import pytest
@@ -5,6 +6,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.client import schemas as client_schemas
+from prefect.server.concurrency_waiters import ConcurrencySlotWaiters
 from prefect.server.database import PrefectDBInterface
 from prefect.server.models.concurrency_limits_v2 import (
     bulk_update_denied_slots,
@@ -12,6 +14,10 @@ from prefect.server.models.concurrency_limits_v2 import (
     read_concurrency_limit,
 )
 from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_SERVER_API_CONCURRENCY_SLOT_MAX_WAIT_SECONDS,
+    temporary_settings,
+)
 
 
 @pytest.fixture
@@ -410,6 +416,144 @@ async def test_increment_concurrency_limit_with_decay_locked_retry_after_header(
     assert response.headers["Retry-After"] == str(expected_retry_after)
 
 
+@pytest.fixture
+async def slowly_released_concurrency_limit(
+    session: AsyncSession,
+) -> ConcurrencyLimitV2:
+    concurrency_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(
+            name="slowly_released_limit",
+            limit=2,
+            active_slots=2,
+            avg_slot_occupancy_seconds=60.0,
+        ),
+    )
+    await session.commit()
+
+    return ConcurrencyLimitV2.model_validate(concurrency_limit)
+
+
+async def wait_for_waiters(limit_id: uuid.UUID, count: int):
+    while ConcurrencySlotWaiters.waiting_on(limit_id) < count:
+        await asyncio.sleep(0.01)
+
+
+async def test_increment_concurrency_limit_waits_for_released_slots(
+    slowly_released_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+    session: AsyncSession,
+    ignore_prefect_deprecation_warnings,
+):
+    limit = slowly_released_concurrency_limit
+
+    waiting = asyncio.create_task(
+        client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [limit.name], "slots": 1, "wait_seconds": 30},
+        )
+    )
+    await asyncio.wait_for(wait_for_waiters(limit.id, 1), timeout=10)
+
+    response = await client.post(
+        "/v2/concurrency_limits/decrement",
+        json={"names": [limit.name], "slots": 1},
+    )
+    assert response.status_code == 200
+
+    # the waiting request is woken by the release rather than its retry interval
+    response = await asyncio.wait_for(waiting, timeout=10)
+    assert response.status_code == 200
+    assert ConcurrencySlotWaiters.waiting_on(limit.id) == 0
+
+    refreshed_limit = await read_concurrency_limit(
+        session=session, concurrency_limit_id=limit.id
+    )
+    assert refreshed_limit
+    assert refreshed_limit.active_slots == refreshed_limit.limit
+
+
+async def test_increment_concurrency_limit_wakes_waiters_in_order(
+    slowly_released_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+    ignore_prefect_deprecation_warnings,
+):
+    limit = slowly_released_concurrency_limit
+
+    first = asyncio.create_task(
+        client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [limit.name], "slots": 1, "wait_seconds": 30},
+        )
+    )
+    await asyncio.wait_for(wait_for_waiters(limit.id, 1), timeout=10)
+
+    second = asyncio.create_task(
+        client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [limit.name], "slots": 1, "wait_seconds": 30},
+        )
+    )
+    await asyncio.wait_for(wait_for_waiters(limit.id, 2), timeout=10)
+
+    await client.post(
+        "/v2/concurrency_limits/decrement",
+        json={"names": [limit.name], "slots": 1},
+    )
+
+    response = await asyncio.wait_for(first, timeout=10)
+    assert response.status_code == 200
+    assert not second.done()
+
+    await client.post(
+        "/v2/concurrency_limits/decrement",
+        json={"names": [limit.name], "slots": 1},
+    )
+
+    response = await asyncio.wait_for(second, timeout=10)
+    assert response.status_code == 200
+
+
+async def test_increment_concurrency_limit_wait_expires(
+    slowly_released_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+    session: AsyncSession,
+):
+    limit = slowly_released_concurrency_limit
+
+    response = await client.post(
+        "/v2/concurrency_limits/increment",
+        json={"names": [limit.name], "slots": 1, "wait_seconds": 0.2},
+    )
+    assert response.status_code == 423
+    assert float(response.headers["Retry-After"]) > 0
+    assert ConcurrencySlotWaiters.waiting_on(limit.id) == 0
+
+    refreshed_limit = await read_concurrency_limit(
+        session=session, concurrency_limit_id=limit.id
+    )
+    assert refreshed_limit
+    assert refreshed_limit.active_slots == refreshed_limit.limit
+
+
+async def test_increment_concurrency_limit_wait_is_capped_by_setting(
+    slowly_released_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+):
+    limit = slowly_released_concurrency_limit
+
+    with temporary_settings({PREFECT_SERVER_API_CONCURRENCY_SLOT_MAX_WAIT_SECONDS: 0}):
+        response = await asyncio.wait_for(
+            client.post(
+                "/v2/concurrency_limits/increment",
+                json={"names": [limit.name], "slots": 1, "wait_seconds": 30},
+            ),
+            timeout=10,
+        )
+
+    assert response.status_code == 423
+
+
 async def test_increment_concurrency_limit_slot_request_higher_than_limit(
     concurrency_limit: ConcurrencyLimitV2,
     client: AsyncClient,
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from datetime import timedelta
 from typing import List
 
@@ -11,8 +13,14 @@ import prefect.server
 from prefect.client.schemas.actions import WorkPoolCreate
 from prefect.client.schemas.objects import WorkPool, WorkQueue
 from prefect.server import models, schemas
+from prefect.server.database import provide_database_interface
 from prefect.server.events.clients import AssertingEventsClient
 from prefect.server.schemas.statuses import DeploymentStatus, WorkQueueStatus
+from prefect.server.work_queue_waiters import WorkQueueWaiters
+from prefect.settings import (
+    PREFECT_SERVER_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS,
+    temporary_settings,
+)
 from prefect.utilities.pydantic import parse_obj_as
 
 RESERVED_POOL_NAMES = [
@@ -1990,3 +1998,117 @@ class TestGetScheduledRuns:
         updated_deployment_response = await client.get(f"/deployments/{deployment.id}")
         assert updated_deployment_response.status_code == status.HTTP_200_OK
         assert updated_deployment_response.json()["status"] == "READY"
+
+
+class TestWaitForScheduledRuns:
+    @pytest.fixture(autouse=True)
+    def reset_waiters(self):
+        WorkQueueWaiters.reset()
+        yield
+        WorkQueueWaiters.reset()
+
+    async def schedule_run(self, flow, work_queue, scheduled_time=None):
+        db = provide_database_interface()
+        async with db.session_context(begin_transaction=True) as session:
+            return await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=prefect.server.schemas.states.Scheduled(
+                        scheduled_time=scheduled_time or pendulum.now("UTC")
+                    ),
+                    work_queue_id=work_queue.id,
+                ),
+            )
+
+    async def test_returns_immediately_without_wait_seconds(
+        self, client, work_pool, work_queue_1
+    ):
+        started = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert time.monotonic() - started < 1
+
+    async def test_returns_empty_after_waiting(self, client, work_pool, work_queue_1):
+        started = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json={"wait_seconds": 0.5},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert time.monotonic() - started >= 0.5
+
+    async def test_returns_as_soon_as_a_run_is_scheduled(
+        self, client, work_pool, work_queue_1, flow
+    ):
+        request = asyncio.create_task(
+            client.post(
+                f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+                json={"wait_seconds": 30, "scheduled_before": str(pendulum.now("UTC"))},
+            )
+        )
+        while not WorkQueueWaiters.waiting_on(work_queue_1.id):
+            await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        flow_run = await self.schedule_run(flow, work_queue_1)
+
+        response = await asyncio.wait_for(request, timeout=10)
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert time.monotonic() - started < 5
+        assert not WorkQueueWaiters.waiting_on(work_queue_1.id)
+
+    async def test_only_woken_by_runs_in_its_queues(
+        self, client, work_pool, work_queue_1, work_queue_2, flow
+    ):
+        request = asyncio.create_task(
+            client.post(
+                f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+                json={"wait_seconds": 1, "work_queue_names": [work_queue_1.name]},
+            )
+        )
+        while not WorkQueueWaiters.waiting_on(work_queue_1.id):
+            await asyncio.sleep(0.01)
+
+        await self.schedule_run(flow, work_queue_2)
+
+        response = await asyncio.wait_for(request, timeout=10)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    async def test_returns_when_a_run_becomes_due(
+        self, client, work_pool, work_queue_1, flow
+    ):
+        flow_run = await self.schedule_run(
+            flow, work_queue_1, scheduled_time=pendulum.now("UTC").add(seconds=1)
+        )
+        await self.schedule_run(
+            flow, work_queue_1, scheduled_time=pendulum.now("UTC").add(hours=1)
+        )
+
+        started = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json={"wait_seconds": 10, "scheduled_before": str(pendulum.now("UTC"))},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert 0.5 < time.monotonic() - started < 5
+
+    async def test_wait_is_capped_by_the_server(self, client, work_pool, work_queue_1):
+        with temporary_settings(
+            {PREFECT_SERVER_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS: 0}
+        ):
+            started = time.monotonic()
+            response = await client.post(
+                f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+                json={"wait_seconds": 30},
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert time.monotonic() - started < 1
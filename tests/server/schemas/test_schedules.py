@@ -6,6 +6,7 @@ from unittest import mock
 import dateutil
 import pendulum
 import pytest
+from croniter import CroniterBadDateError
 from dateutil import rrule
 from packaging import version
 from pendulum import datetime, now
@@ -182,6 +183,16 @@ class TestIntervalSchedule:
             datetime(2021, 7, 1, 7, 24).add(hours=i * 17) for i in range(5)
         ]
 
+    async def test_get_dates_with_fractional_interval(self):
+        clock = IntervalSchedule(
+            interval=timedelta(seconds=1, microseconds=1),
+            anchor_date=datetime(2020, 1, 1),
+        )
+        dates = await clock.get_dates(n=3, start=datetime(2021, 1, 1))
+        # 31,622,369 intervals are needed to reach the start from the anchor
+        expected = datetime(2020, 1, 1).add(seconds=31_622_369, microseconds=31_622_369)
+        assert dates == [expected.add(seconds=i, microseconds=i) for i in range(3)]
+
     async def test_get_dates_from_offset_naive_anchor(self):
         # Regression test for https://github.com/PrefectHQ/orion/issues/2466
         clock = IntervalSchedule(
@@ -327,6 +338,59 @@ class TestCronSchedule:
         dates = await clock.get_dates(start=datetime(2018, 1, 1, 6))
         assert dates == [datetime(2018, 1, 2)]
 
+    @pytest.mark.parametrize(
+        "cron_string,expected_days",
+        [
+            # last day of the month
+            ("0 0 L * *", [31, 29, 31]),
+            # second Friday of the month
+            ("0 0 * * 5#2", [12, 9, 8]),
+            # nearest weekday to the 15th
+            ("0 0 15W * *", [15, 15, 15]),
+            ("0 0 1 jan,feb,mar *", [1, 1, 1]),
+        ],
+    )
+    async def test_expressions_only_croniter_evaluates(
+        self, cron_string, expected_days
+    ):
+        clock = CronSchedule(cron=cron_string)
+        dates = await clock.get_dates(n=3, start=datetime(2024, 1, 1))
+        assert [d.day for d in dates] == expected_days
+        assert [d.month for d in dates] == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "day_or,expected",
+        [
+            (
+                True,
+                [datetime(2024, 9, 6), datetime(2024, 9, 13), datetime(2024, 9, 20)],
+            ),
+            (
+                False,
+                [datetime(2024, 9, 13), datetime(2024, 12, 13), datetime(2025, 6, 13)],
+            ),
+        ],
+    )
+    async def test_day_or(self, day_or, expected):
+        clock = CronSchedule(cron="0 0 13 * 5", day_or=day_or)
+        dates = await clock.get_dates(n=3, start=datetime(2024, 9, 1))
+        assert dates == expected
+
+    async def test_seconds_field(self):
+        clock = CronSchedule(cron="*/20 * * * * 15,45")
+        dates = await clock.get_dates(n=4, start=datetime(2021, 1, 1, 0, 0, 15, 1))
+        assert dates == [
+            datetime(2021, 1, 1, 0, 0, 45),
+            datetime(2021, 1, 1, 0, 20, 15),
+            datetime(2021, 1, 1, 0, 20, 45),
+            datetime(2021, 1, 1, 0, 40, 15),
+        ]
+
+    async def test_expression_that_never_matches(self):
+        clock = CronSchedule(cron="0 0 31 2 *")
+        with pytest.raises(CroniterBadDateError):
+            await clock.get_dates(n=1, start=datetime(2021, 1, 1))
+
 
 class TestIntervalScheduleDaylightSavingsTime:
     async def test_interval_schedule_always_has_the_right_offset(self):
@@ -663,6 +727,36 @@ class TestRRuleSchedule:
         dates = await s.get_dates(5, start=pendulum.now("UTC"))
         assert dates == [pendulum.datetime(2030, 1, 1).add(days=i) for i in range(5)]
 
+    async def test_rrule_long_after_dtstart(self):
+        s = RRuleSchedule(
+            rrule="DTSTART:20200101T000500\nRRULE:FREQ=MINUTELY;INTERVAL=7",
+            timezone="America/New_York",
+        )
+        dates = await s.get_dates(3, start=pendulum.datetime(2030, 1, 1, tz="UTC"))
+        # the 751,431st interval of 7 minutes is the first on or after the start
+        first = pendulum.datetime(2020, 1, 1, 0, 5, tz="America/New_York").add(
+            minutes=7 * 751_431
+        )
+        assert dates == [first.add(minutes=7 * i) for i in range(3)]
+        assert all(d.tz.name == "America/New_York" for d in dates)
+
+    async def test_rruleset_long_after_dtstart(self):
+        s = RRuleSchedule(
+            rrule=(
+                "DTSTART:20200101T000000\n"
+                "RRULE:FREQ=HOURLY;INTERVAL=6\n"
+                "EXRULE:FREQ=DAILY;BYHOUR=12"
+            ),
+            timezone="UTC",
+        )
+        dates = await s.get_dates(4, start=pendulum.datetime(2030, 1, 1))
+        assert dates == [
+            pendulum.datetime(2030, 1, 1, 0),
+            pendulum.datetime(2030, 1, 1, 6),
+            pendulum.datetime(2030, 1, 1, 18),
+            pendulum.datetime(2030, 1, 2, 0),
+        ]
+
     async def test_rrule_validates_rrule_str(self):
         # generic validation error
         with pytest.raises(ValidationError):
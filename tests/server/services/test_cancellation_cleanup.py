@@ -233,3 +233,54 @@ async def test_service_leaves_terminal_runs_alone(
     assert orphaned_task_run.state.type == state_constructor[0]
     assert orphaned_subflow_run.state.type == state_constructor[0]
     assert orphaned_subflow_run_from_deployment.state.type == state_constructor[0]
+
+
+async def test_service_cleans_up_more_runs_than_the_batch_size(
+    session,
+    flow,
+    orphaned_task_run_maker,
+    orphaned_subflow_run_maker,
+):
+    cancelled_flow_runs = []
+    for _ in range(5):
+        async with session.begin():
+            cancelled_flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id, state=states.Cancelled(), end_time=THE_PAST
+                    ),
+                )
+            )
+
+    orphaned_task_runs = [
+        await orphaned_task_run_maker(flow_run, states.Running)
+        for flow_run in cancelled_flow_runs
+    ]
+    orphaned_subflow_runs = [
+        await orphaned_subflow_run_maker(flow_run, states.Running)
+        for flow_run in cancelled_flow_runs
+    ]
+
+    service = CancellationCleanup()
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    for run in orphaned_task_runs + orphaned_subflow_runs:
+        await session.refresh(run)
+        assert run.state.type == "CANCELLED"
+
+
+async def test_service_leaves_subflows_of_active_flow_runs_alone(
+    session, flow_run, orphaned_subflow_run_maker
+):
+    async with session.begin():
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=states.Running()
+        )
+    subflow_run = await orphaned_subflow_run_maker(flow_run, states.Running)
+
+    await CancellationCleanup().start(loops=1)
+
+    await session.refresh(subflow_run)
+    assert subflow_run.state.type == "RUNNING"
@@ -4,10 +4,13 @@ from uuid import UUID
 
 import pendulum
 import pytest
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.server import models, schemas
+from prefect.server.database import PrefectDBInterface
 from prefect.server.events.clients import AssertingEventsClient
+from prefect.server.orchestration.core_policy import MarkLateRunsPolicy
 from prefect.server.services.late_runs import MarkLateRuns
 from prefect.settings import (
     PREFECT_API_SERVICES_LATE_RUNS_AFTER_SECONDS,
@@ -265,3 +268,205 @@ async def test_mark_late_runs_ignores_missing_runs(late_run: "ORMFlowRun"):
             await service.run_once()
         finally:
             await service._on_stop()
+
+
+async def test_mark_late_runs_emits_events_for_a_batch_with_one_client(
+    session, late_run, late_run_2
+):
+    await MarkLateRuns().start(loops=1)
+
+    assert AssertingEventsClient.last
+    assert {event.resource.id for event in AssertingEventsClient.last.events} == {
+        f"prefect.flow-run.{late_run.id}",
+        f"prefect.flow-run.{late_run_2.id}",
+    }
+
+
+async def test_mark_late_runs_marks_more_runs_than_the_batch_size(session, flow):
+    async with session.begin():
+        runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=schemas.states.Scheduled(
+                        scheduled_time=pendulum.now("UTC").subtract(minutes=1)
+                    ),
+                ),
+            )
+            for _ in range(7)
+        ]
+
+    service = MarkLateRuns()
+    service.batch_size = 3
+    await service.start(loops=1)
+
+    for run in runs:
+        await session.refresh(run)
+        assert run.state_name == "Late"
+        assert run.state.state_details.flow_run_id == run.id
+        assert run.expected_start_time == run.state.state_details.scheduled_time
+
+
+async def test_mark_late_runs_marks_subflow_runs_and_their_parent_task_runs(
+    session, flow, flow_run
+):
+    async with session.begin():
+        parent_task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id, task_key="subflow", dynamic_key="0"
+            ),
+        )
+        subflow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                parent_task_run_id=parent_task_run.id,
+                state=schemas.states.Scheduled(
+                    scheduled_time=pendulum.now("UTC").subtract(minutes=1)
+                ),
+            ),
+        )
+
+    await MarkLateRuns().start(loops=1)
+
+    await session.refresh(subflow_run)
+    await session.refresh(parent_task_run)
+    assert subflow_run.state_name == "Late"
+    assert parent_task_run.state_name == "Late"
+
+
+async def test_mark_flow_runs_late_skips_runs_that_are_no_longer_scheduled(
+    session, late_run, pending_run
+):
+    async with session.begin():
+        marked = await models.flow_runs.mark_flow_runs_late(
+            session=session, flow_run_ids=[late_run.id, pending_run.id]
+        )
+
+    assert marked == [late_run.id]
+    await session.refresh(pending_run)
+    assert pending_run.state_name == "Pending"
+
+
+async def test_mark_late_runs_uses_overridden_single_run_method(
+    session, late_run, late_run_2
+):
+    marked = []
+
+    class CustomMarkLateRuns(MarkLateRuns):
+        async def _mark_flow_run_as_late(self, session, flow_run):
+            marked.append(flow_run.id)
+
+    await CustomMarkLateRuns().start(loops=1)
+
+    assert sorted(marked) == sorted([late_run.id, late_run_2.id])
+    await session.refresh(late_run)
+    assert late_run.state_name == "Scheduled"
+
+
+async def test_mark_flow_runs_late_matches_the_mark_late_runs_policy(
+    session: AsyncSession, db: PrefectDBInterface, flow, notifier_block
+):
+    scheduled_time = pendulum.now("UTC").subtract(minutes=1)
+    async with session.begin():
+        await models.flow_run_notification_policies.create_flow_run_notification_policy(
+            session=session,
+            flow_run_notification_policy=schemas.core.FlowRunNotificationPolicy(
+                state_names=["Late"],
+                tags=[],
+                block_document_id=notifier_block._block_document_id,
+            ),
+        )
+        bulk_run, policy_run = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    name=name,
+                    tags=["a-tag"],
+                    state=schemas.states.Scheduled(scheduled_time=scheduled_time),
+                ),
+            )
+            for name in ("bulk", "policy")
+        ]
+
+    async with session.begin():
+        await models.flow_runs.mark_flow_runs_late(
+            session=session, flow_run_ids=[bulk_run.id]
+        )
+    assert AssertingEventsClient.last
+    (bulk_event,) = AssertingEventsClient.last.events
+
+    async with session.begin():
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=policy_run.id,
+            state=schemas.states.Late(scheduled_time=scheduled_time),
+            flow_policy=MarkLateRunsPolicy,  # type: ignore
+        )
+    assert AssertingEventsClient.last
+    (policy_event,) = AssertingEventsClient.last.events
+
+    session.expunge_all()
+    runs = []
+    for run_id in (bulk_run.id, policy_run.id):
+        run = await models.flow_runs.read_flow_run(session, run_id)
+        assert run
+        runs.append(run)
+    bulk, policy = runs
+
+    # every field of the flow runs and their states matches, apart from those that
+    # identify the run or record when it was written
+    def comparable_run(run):
+        return schemas.core.FlowRun.model_validate(
+            run, from_attributes=True
+        ).model_dump(
+            exclude={
+                "id",
+                "name",
+                "created",
+                "updated",
+                "state_id",
+                "state",
+                "estimated_start_time_delta",
+            }
+        )
+
+    def comparable_state(run):
+        state = run.state.as_state().model_dump(exclude={"id", "timestamp"})
+        state["state_details"].pop("flow_run_id")
+        return state
+
+    assert comparable_run(bulk) == comparable_run(policy)
+    assert comparable_state(bulk) == comparable_state(policy)
+    assert bulk.state.state_details.flow_run_id == bulk.id
+    assert bulk.state_timestamp == bulk.state.timestamp
+
+    # the same state change events are emitted
+    def comparable_event(event):
+        resource = event.resource.root | {
+            "prefect.resource.id": "run",
+            "prefect.resource.name": "run",
+            "prefect.state-timestamp": "timestamp",
+        }
+        return event.model_dump(
+            mode="json", exclude={"id", "occurred", "received", "follows", "resource"}
+        ) | {"resource": resource}
+
+    assert comparable_event(bulk_event) == comparable_event(policy_event)
+    assert bulk_event.id == bulk.state_id
+    assert bulk_event.resource["prefect.state-timestamp"] == (
+        bulk.state.timestamp.isoformat()
+    )
+    assert policy_event.id == policy.state_id
+
+    # and the same notifications are queued
+    queued = await session.execute(
+        sa.select(db.FlowRunState.flow_run_id, db.FlowRunState.name).join(
+            db.FlowRunNotificationQueue,
+            db.FlowRunNotificationQueue.flow_run_state_id == db.FlowRunState.id,
+        )
+    )
+    assert sorted(queued.all()) == sorted([(bulk.id, "Late"), (policy.id, "Late")])
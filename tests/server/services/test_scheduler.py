@@ -9,6 +9,9 @@ from prefect.server.services.scheduler import RecentDeploymentsScheduler, Schedu
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE,
     PREFECT_API_SERVICES_SCHEDULER_MIN_RUNS,
+    PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY,
+    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT,
+    temporary_settings,
 )
 
 
@@ -369,6 +372,353 @@ async def test_only_looks_at_deployments_with_active_schedules(
     assert deployment_ids[0] == deployment_with_active_schedules.id
 
 
+class TestIncrementalScheduling:
+    async def read_scheduled_through(self, session, db, deployment_id):
+        result = await session.execute(
+            sa.select(db.DeploymentSchedule.scheduled_through).where(
+                db.DeploymentSchedule.deployment_id == deployment_id
+            )
+        )
+        return result.scalar_one()
+
+    async def read_scheduled_times(self, session, deployment_id):
+        runs = await models.flow_runs.read_flow_runs(
+            session,
+            flow_run_filter=schemas.filters.FlowRunFilter(
+                deployment_id=dict(any_=[deployment_id])
+            ),
+        )
+        return sorted(r.state.state_details.scheduled_time for r in runs)
+
+    async def test_records_scheduled_through(self, deployment, session, db):
+        assert await self.read_scheduled_through(session, db, deployment.id) is None
+
+        await Scheduler().start(loops=1)
+
+        scheduled_times = await self.read_scheduled_times(session, deployment.id)
+        assert len(scheduled_times) == 3
+        assert (
+            await self.read_scheduled_through(session, db, deployment.id)
+            == scheduled_times[-1]
+        )
+
+    async def test_does_not_revisit_deployments_with_enough_runs(
+        self, deployment, session, monkeypatch
+    ):
+        service = Scheduler()
+        await service.start(loops=1)
+
+        generated = []
+        original = Scheduler._generate_scheduled_flow_runs
+
+        async def spy(self, *args, **kwargs):
+            generated.append(kwargs["deployment_id"])
+            return await original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Scheduler, "_generate_scheduled_flow_runs", spy)
+
+        await service.start(loops=1)
+        await Scheduler().start(loops=1)
+
+        assert generated == []
+        assert len(await self.read_scheduled_times(session, deployment.id)) == 3
+
+    async def test_schedules_runs_after_scheduled_through(
+        self, deployment, session, db
+    ):
+        await Scheduler().start(loops=1)
+        scheduled_times = await self.read_scheduled_times(session, deployment.id)
+
+        # pretend only the first run was scheduled, leaving too few runs
+        await session.execute(
+            sa.delete(db.FlowRun).where(
+                db.FlowRun.deployment_id == deployment.id,
+                db.FlowRun.next_scheduled_start_time > scheduled_times[0],
+            )
+        )
+        await session.execute(
+            sa.update(db.DeploymentSchedule)
+            .where(db.DeploymentSchedule.deployment_id == deployment.id)
+            .values(scheduled_through=scheduled_times[0])
+        )
+        await session.commit()
+
+        await Scheduler().start(loops=1)
+
+        assert await self.read_scheduled_times(session, deployment.id) == (
+            scheduled_times
+        )
+        assert (
+            await self.read_scheduled_through(session, db, deployment.id)
+            == scheduled_times[-1]
+        )
+
+    async def test_changing_a_schedule_schedules_it_again(
+        self, deployment, session, db
+    ):
+        service = Scheduler()
+        await service.start(loops=1)
+
+        deployment_schedule = (
+            await models.deployments.read_deployment_schedules(
+                session=session, deployment_id=deployment.id
+            )
+        )[0]
+        await models.deployments.update_deployment_schedule(
+            session=session,
+            deployment_id=deployment.id,
+            deployment_schedule_id=deployment_schedule.id,
+            schedule=schemas.actions.DeploymentScheduleUpdate(
+                schedule=schemas.schedules.IntervalSchedule(
+                    interval=datetime.timedelta(hours=1)
+                )
+            ),
+        )
+        await models.deployments._delete_scheduled_runs(
+            session=session, deployment_id=deployment.id, auto_scheduled_only=True
+        )
+        await session.commit()
+        assert await self.read_scheduled_through(session, db, deployment.id) is None
+
+        await service.start(loops=1)
+
+        scheduled_times = await self.read_scheduled_times(session, deployment.id)
+        assert len(scheduled_times) == 3
+        assert scheduled_times[1] - scheduled_times[0] == datetime.timedelta(hours=1)
+
+    async def test_deleting_scheduled_runs_resets_scheduled_through(
+        self, deployment, session, db
+    ):
+        await Scheduler().start(loops=1)
+        assert await self.read_scheduled_through(session, db, deployment.id)
+
+        await models.deployments.update_deployment(
+            session=session,
+            deployment_id=deployment.id,
+            deployment=schemas.actions.DeploymentUpdate(paused=True),
+        )
+        await session.commit()
+
+        assert await self.read_scheduled_through(session, db, deployment.id) is None
+
+    async def test_schedules_deployments_created_after_the_first_loop(
+        self, flow, session, monkeypatch
+    ):
+        service = Scheduler()
+        await service.start(loops=1)
+
+        # a schedule that needs more runs on every loop
+        deployment = await models.deployments.create_deployment(
+            session=session,
+            deployment=schemas.core.Deployment(
+                name="created-later",
+                flow_id=flow.id,
+                schedules=[
+                    schemas.core.DeploymentSchedule(
+                        schedule=schemas.schedules.IntervalSchedule(
+                            interval=datetime.timedelta(seconds=1)
+                        ),
+                        active=True,
+                    )
+                ],
+            ),
+        )
+        await session.commit()
+
+        # the recent deployments scheduler gets to it first
+        await RecentDeploymentsScheduler().start(loops=1)
+        assert await self.read_scheduled_times(session, deployment.id)
+
+        generated = []
+        original = Scheduler._generate_scheduled_flow_runs
+
+        async def spy(self, *args, **kwargs):
+            generated.append(kwargs["deployment_id"])
+            return await original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Scheduler, "_generate_scheduled_flow_runs", spy)
+
+        await service.start(loops=1)
+        await service.start(loops=1)
+
+        assert generated.count(deployment.id) == 2
+
+    async def test_recent_deployments_scheduler_shares_the_queue(
+        self, deployment, session
+    ):
+        service = Scheduler()
+        await RecentDeploymentsScheduler(scheduler=service).start(loops=1)
+
+        assert deployment.id in service._next_due
+        assert len(await self.read_scheduled_times(session, deployment.id)) == 3
+
+    async def test_unpausing_a_deployment_queues_it_again(
+        self, deployment, session, db
+    ):
+        service = Scheduler()
+        await service.start(loops=1)
+        assert deployment.id in service._next_due
+
+        # pause without resetting `scheduled_through`
+        await session.execute(
+            sa.update(db.Deployment)
+            .where(db.Deployment.id == deployment.id)
+            .values(paused=True)
+        )
+        await session.commit()
+        await service.start(loops=1)
+        service._next_due.clear()
+        service._due_queue.clear()
+
+        await session.execute(
+            sa.update(db.Deployment)
+            .where(db.Deployment.id == deployment.id)
+            .values(paused=False)
+        )
+        await session.commit()
+        await service.start(loops=1)
+
+        assert deployment.id in service._next_due
+
+    async def test_next_due_respects_min_runs_and_min_time(self):
+        service = Scheduler()
+        now = pendulum.now("UTC")
+        schedule = schemas.schedules.IntervalSchedule(
+            interval=datetime.timedelta(days=1), anchor_date=now
+        )
+        scheduled_through = now.add(days=3)
+
+        # more runs are needed once fewer than `min_runs` remain
+        assert service._get_next_due(schedule, scheduled_through, now=now) == now.add(
+            days=1
+        )
+
+
+class TestShardedScheduling:
+    @pytest.fixture
+    async def deployments(self, flow, session):
+        deployments = []
+        for i in range(8):
+            deployments.append(
+                await models.deployments.create_deployment(
+                    session=session,
+                    deployment=schemas.core.Deployment(
+                        name=f"sharded-{i}",
+                        flow_id=flow.id,
+                        schedules=[
+                            schemas.core.DeploymentSchedule(
+                                schedule=schemas.schedules.IntervalSchedule(
+                                    interval=datetime.timedelta(hours=1)
+                                ),
+                                active=True,
+                            )
+                        ],
+                    ),
+                )
+            )
+        await session.commit()
+        return deployments
+
+    @pytest.fixture
+    def sharded(self):
+        with temporary_settings({PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT: 4}):
+            yield
+
+    async def scheduled_deployment_ids(self, session, db):
+        result = await session.execute(sa.select(db.FlowRun.deployment_id).distinct())
+        return set(result.scalars().all())
+
+    async def test_shard_filter_matches_shard_membership(
+        self, deployments, session, db
+    ):
+        service = Scheduler()
+        service.shard_count = 4
+        deployment_ids = {deployment.id for deployment in deployments}
+
+        for shards in ({0}, {3}, {1, 2}, {0, 2}, {0, 1, 2, 3}):
+            service._shards = shards
+            result = await session.execute(
+                sa.select(db.Deployment.id).where(
+                    service._shard_filter(db.Deployment.id, shards)
+                )
+            )
+            assert set(result.scalars().all()) == {
+                deployment_id
+                for deployment_id in deployment_ids
+                if service._in_shards(deployment_id)
+            }
+
+    async def test_replicas_schedule_disjoint_shards(
+        self, sharded, deployments, session, db
+    ):
+        first, second = Scheduler(), Scheduler()
+
+        # let the replicas divide the shards between them before deployments exist
+        await session.execute(sa.delete(db.DeploymentSchedule))
+        await session.commit()
+        await first.start(loops=1)
+        await second.start(loops=1)
+        await first.start(loops=1)
+        assert len(first._shards) == len(second._shards) == 2
+        assert first._shards.isdisjoint(second._shards)
+
+        for deployment in deployments:
+            await models.deployments.create_deployment_schedules(
+                session=session,
+                deployment_id=deployment.id,
+                schedules=[
+                    schemas.actions.DeploymentScheduleCreate(
+                        schedule=schemas.schedules.IntervalSchedule(
+                            interval=datetime.timedelta(hours=1)
+                        ),
+                        active=True,
+                    )
+                ],
+            )
+        await session.commit()
+
+        await first.start(loops=1)
+        scheduled = await self.scheduled_deployment_ids(session, db)
+        assert scheduled == {
+            deployment.id
+            for deployment in deployments
+            if first._in_shards(deployment.id)
+        }
+
+        await second.start(loops=1)
+        scheduled = await self.scheduled_deployment_ids(session, db)
+        assert scheduled == {deployment.id for deployment in deployments}
+
+    async def test_recent_deployments_scheduler_respects_shards(
+        self, sharded, deployments, session, db
+    ):
+        service = Scheduler()
+        recent = RecentDeploymentsScheduler(scheduler=service)
+
+        # nothing is scheduled until the main scheduler has claimed its shards
+        await recent.start(loops=1)
+        assert await self.scheduled_deployment_ids(session, db) == set()
+
+        service._shards = {0, 1}
+        await recent.start(loops=1)
+        in_shards = {
+            deployment.id
+            for deployment in deployments
+            if service._in_shards(deployment.id)
+        }
+        assert await self.scheduled_deployment_ids(session, db) == in_shards
+        assert set(service._next_due) == in_shards
+
+    async def test_concurrent_collection(self, deployments, session, db):
+        with temporary_settings({PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY: 3}):
+            service = Scheduler()
+        await service.start(loops=1)
+
+        assert await models.flow_runs.count_flow_runs(session) == (
+            len(deployments) * service.min_runs
+        )
+
+
 class TestRecentDeploymentsScheduler:
     async def test_tight_loop_by_default(self):
         assert RecentDeploymentsScheduler().loop_seconds == 5
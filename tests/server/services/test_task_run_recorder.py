@@ -3,6 +3,7 @@ from datetime import timedelta
 from itertools import permutations
 from pathlib import Path
 from typing import AsyncGenerator
+from unittest import mock
 from uuid import UUID
 
 import pendulum
@@ -21,6 +22,10 @@ from prefect.server.schemas.states import StateDetails, StateType
 from prefect.server.services import task_run_recorder
 from prefect.server.utilities.messaging import MessageHandler, create_publisher
 from prefect.server.utilities.messaging.memory import MemoryMessage
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_BATCH_SIZE,
+    temporary_settings,
+)
 
 
 async def test_start_and_stop_service():
@@ -770,8 +775,9 @@ async def test_task_run_recorder_sends_repeated_failed_messages_to_dead_letter(
 
     service = task_run_recorder.TaskRunRecorder()
 
-    service_task = asyncio.create_task(service.start())
-    await service.started_event.wait()
+    with temporary_settings({PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_BATCH_SIZE: 1}):
+        service_task = asyncio.create_task(service.start())
+        await service.started_event.wait()
     service.consumer.subscription.dead_letter_queue_path = tmp_path / "dlq"
 
     async with create_publisher("events") as publisher:
@@ -800,3 +806,147 @@ async def test_task_run_recorder_sends_repeated_failed_messages_to_dead_letter(
         await service_task
     except asyncio.CancelledError:
         pass
+
+
+@pytest.fixture
+async def batched_task_run_recorder_handler() -> AsyncGenerator[MessageHandler, None]:
+    async with task_run_recorder.consumer(
+        batch_size=3, flush_every=timedelta(hours=1)
+    ) as handler:
+        yield handler
+
+
+@pytest.mark.parametrize(
+    "event_order",
+    list(permutations(["PENDING", "RUNNING", "COMPLETED"])),
+    ids=lambda x: "->".join(x),
+)
+async def test_batch_of_events_collapses_to_the_latest_state(
+    session: AsyncSession,
+    pending_event: ReceivedEvent,
+    running_event: ReceivedEvent,
+    completed_event: ReceivedEvent,
+    batched_task_run_recorder_handler: MessageHandler,
+    event_order: tuple,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # the batch should be recorded in bulk, not by the fallback to single events
+    monkeypatch.setattr(
+        task_run_recorder,
+        "record_task_run_event",
+        mock.AsyncMock(side_effect=AssertionError),
+    )
+
+    event_map = {
+        "PENDING": pending_event,
+        "RUNNING": running_event,
+        "COMPLETED": completed_event,
+    }
+
+    # the batch is recorded once it is full
+    for event_name in event_order:
+        await batched_task_run_recorder_handler(message(event_map[event_name]))
+
+    task_run = await read_task_run(
+        session=session,
+        task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+    )
+
+    assert task_run
+    assert task_run.state_id == UUID("33333333-3333-3333-3333-333333333333")
+    assert task_run.state_type == StateType.COMPLETED
+    assert task_run.state_name == "Completed"
+    assert task_run.state_timestamp == completed_event.occurred
+
+    # attributes are applied in the order the states occurred, so the completed
+    # event's attributes don't erase the others
+    assert task_run.run_count == 8
+    assert task_run.total_run_time == timedelta(seconds=9)
+    assert task_run.expected_start_time == pending_event.occurred
+    assert task_run.start_time == running_event.occurred
+    assert task_run.end_time == completed_event.occurred
+
+    states = await read_task_run_states(session, task_run.id)
+    assert {state.type for state in states} == {
+        StateType.PENDING,
+        StateType.RUNNING,
+        StateType.COMPLETED,
+    }
+
+
+async def test_batch_of_events_flushes_remaining_events_on_exit(
+    session: AsyncSession,
+    pending_event: ReceivedEvent,
+):
+    async with task_run_recorder.consumer(
+        batch_size=10, flush_every=timedelta(hours=1)
+    ) as handler:
+        await handler(message(pending_event))
+
+        assert not await read_task_run(
+            session=session,
+            task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+        )
+
+    task_run = await read_task_run(
+        session=session,
+        task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+    )
+    assert task_run
+    assert task_run.state_type == StateType.PENDING
+
+
+async def test_batch_of_events_does_not_overwrite_a_newer_state(
+    session: AsyncSession,
+    pending_event: ReceivedEvent,
+    running_event: ReceivedEvent,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+):
+    await task_run_recorder_handler(message(completed_event))
+
+    async with task_run_recorder.consumer(
+        batch_size=10, flush_every=timedelta(hours=1)
+    ) as handler:
+        await handler(message(pending_event))
+        await handler(message(running_event))
+
+    task_run = await read_task_run(
+        session=session,
+        task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+    )
+    assert task_run
+    assert task_run.state_id == UUID("33333333-3333-3333-3333-333333333333")
+    assert task_run.state_type == StateType.COMPLETED
+    assert task_run.end_time == completed_event.occurred
+
+    states = await read_task_run_states(session, task_run.id)
+    assert len(states) == 3
+
+
+async def test_batch_with_a_bad_event_records_the_other_events(
+    session: AsyncSession,
+    pending_event: ReceivedEvent,
+    running_event: ReceivedEvent,
+):
+    # an event for the same task run and timestamp as another event, but with a
+    # different id, can't be recorded
+    duplicate_pending_event = pending_event.model_copy()
+    duplicate_pending_event.id = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+
+    async with task_run_recorder.consumer(
+        batch_size=10, flush_every=timedelta(hours=1)
+    ) as handler:
+        await handler(message(pending_event))
+        await handler(message(duplicate_pending_event))
+        await handler(message(running_event))
+
+    task_run = await read_task_run(
+        session=session,
+        task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+    )
+    assert task_run
+    assert task_run.state_type == StateType.RUNNING
+
+    states = await read_task_run_states(session, task_run.id)
+    assert {state.id for state in states} == {pending_event.id, running_event.id}
@@ -0,0 +1,175 @@
+import asyncio
+from typing import List
+from unittest import mock
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server import models
+from prefect.server.log_writer import MAX_WRITE_ATTEMPTS, LogWriter
+from prefect.server.schemas.actions import LogCreate
+from prefect.server.schemas.filters import LogFilter
+
+
+def make_logs(count: int) -> List[LogCreate]:
+    flow_run_id = uuid4()
+    return [
+        LogCreate(
+            name="prefect.flow_run",
+            level=20,
+            message=f"Log {i}",
+            timestamp=pendulum.now("UTC"),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+async def writer():
+    writer = LogWriter(max_queue_size=10, batch_size=3)
+    try:
+        yield writer
+    finally:
+        await writer.stop()
+
+
+async def test_writes_logs_in_batches(writer: LogWriter, session):
+    logs = make_logs(7)
+
+    with mock.patch(
+        "prefect.server.models.logs.copy_logs", wraps=models.logs.copy_logs
+    ) as copy_logs:
+        await writer.put(logs)
+        await writer.flush()
+
+    assert [len(call.kwargs["logs"]) for call in copy_logs.call_args_list] == [
+        3,
+        3,
+        1,
+    ]
+
+    written = await models.logs.read_logs(
+        session=session,
+        log_filter=LogFilter(flow_run_id={"any_": [logs[0].flow_run_id]}),
+    )
+    assert sorted(log.message for log in written) == sorted(log.message for log in logs)
+
+
+async def test_put_waits_for_space(writer: LogWriter):
+    release = asyncio.Event()
+
+    async def copy_logs(session, logs):
+        await release.wait()
+
+    with mock.patch("prefect.server.models.logs.copy_logs", copy_logs):
+        await writer.put(make_logs(10))
+        await asyncio.sleep(0.1)
+
+        # the first batch of 3 is being written, which makes room for 3 more
+        await writer.put(make_logs(3))
+        assert len(writer) == 10
+
+        put = asyncio.create_task(writer.put(make_logs(1)))
+        await asyncio.sleep(0.1)
+        assert not put.done()
+
+        release.set()
+        await asyncio.wait_for(put, timeout=5)
+        await writer.flush()
+
+    assert len(writer) == 0
+
+
+async def test_failed_batches_are_tried_again(
+    writer: LogWriter, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("prefect.server.log_writer.RETRY_DELAY_SECONDS", 0)
+
+    written: List[LogCreate] = []
+    failures = 0
+
+    async def copy_logs(session, logs):
+        nonlocal failures
+        if failures < 2:
+            failures += 1
+            raise RuntimeError("the log could not be written")
+        written.extend(logs)
+
+    logs = make_logs(5)
+    with mock.patch("prefect.server.models.logs.copy_logs", copy_logs):
+        await writer.put(logs)
+        await asyncio.wait_for(writer.flush(), timeout=5)
+
+    assert written == logs
+
+
+async def test_batches_are_tried_again_whole_while_disconnected(
+    writer: LogWriter, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("prefect.server.log_writer.RETRY_DELAY_SECONDS", 0)
+
+    batches: List[int] = []
+
+    async def copy_logs(session, logs):
+        batches.append(len(logs))
+        if len(batches) <= MAX_WRITE_ATTEMPTS + 1:
+            raise ConnectionRefusedError("the database is unavailable")
+
+    with mock.patch("prefect.server.models.logs.copy_logs", copy_logs):
+        await writer.put(make_logs(3))
+        await asyncio.wait_for(writer.flush(), timeout=5)
+
+    assert batches == [3] * (MAX_WRITE_ATTEMPTS + 2)
+
+
+async def test_logs_that_cannot_be_written_are_dropped(
+    writer: LogWriter, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("prefect.server.log_writer.RETRY_DELAY_SECONDS", 0)
+
+    written: List[LogCreate] = []
+    attempts = 0
+
+    async def copy_logs(session, logs):
+        nonlocal attempts
+        if any(log.message == "Log 4" for log in logs):
+            attempts += len(logs) == 1
+            raise ValueError("invalid log")
+        written.extend(logs)
+
+    logs = make_logs(7)
+    with mock.patch("prefect.server.models.logs.copy_logs", copy_logs):
+        await writer.put(logs)
+        await asyncio.wait_for(writer.flush(), timeout=5)
+
+    assert written == logs[:4] + logs[5:]
+    assert attempts == MAX_WRITE_ATTEMPTS
+    assert len(writer) == 0
+
+
+async def test_logs_with_null_characters_are_dropped(writer: LogWriter, session, db):
+    if db.database_config.connection_url.startswith("sqlite"):
+        pytest.skip("SQLite accepts null characters in text")
+
+    logs = make_logs(3)
+    logs[1].message = "before\x00after"
+    await writer.put(logs)
+    await asyncio.wait_for(writer.flush(), timeout=10)
+
+    written = await models.logs.read_logs(
+        session=session,
+        log_filter=LogFilter(flow_run_id={"any_": [logs[0].flow_run_id]}),
+    )
+    assert sorted(log.message for log in written) == ["Log 0", "Log 2"]
+
+
+async def test_instance_is_restarted_after_shutdown():
+    writer = LogWriter.instance()
+    assert LogWriter.instance() is writer
+
+    await LogWriter.shutdown()
+
+    assert LogWriter.instance() is not writer
+    await LogWriter.shutdown()
@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from typing import Callable
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from prefect import flow, task
 from prefect.cache_policies import (
     DEFAULT,
     CachePolicy,
@@ -14,7 +16,7 @@ from prefect.cache_policies import (
     TaskSource,
     _None,
 )
-from prefect.context import TaskRunContext
+from prefect.context import FlowRunContext, TaskRunContext
 
 
 class TestBaseClass:
@@ -93,6 +95,55 @@ class TestInputsPolicy:
             )
             assert new_key == key
 
+    def test_key_does_not_depend_on_input_order(self):
+        policy = Inputs()
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": 42, "y": "foo"}, flow_parameters=None
+        )
+        other_key = policy.compute_key(
+            task_ctx=None, inputs={"y": "foo", "x": 42}, flow_parameters=None
+        )
+        assert key == other_key
+
+    def test_key_varies_on_array_contents(self):
+        policy = Inputs()
+
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": np.zeros(1000)}, flow_parameters=None
+        )
+        same_key = policy.compute_key(
+            task_ctx=None, inputs={"x": np.zeros(1000)}, flow_parameters=None
+        )
+        other_key = policy.compute_key(
+            task_ctx=None, inputs={"x": np.ones(1000)}, flow_parameters=None
+        )
+
+        assert key == same_key
+        assert key != other_key
+
+    def test_large_inputs_are_memoized_within_a_flow_run(self):
+        data = np.zeros(100_000)
+        data.flags.writeable = False
+        policy = Inputs()
+
+        @flow
+        def compute_keys():
+            keys = [
+                policy.compute_key(
+                    task_ctx=None, inputs={"x": data, "i": i}, flow_parameters=None
+                )
+                for i in range(3)
+            ]
+            return keys, len(FlowRunContext.get().hash_memo)
+
+        keys, memo_size = compute_keys()
+
+        assert len(set(keys)) == 3
+        assert memo_size == 1
+        assert keys[0] == policy.compute_key(
+            task_ctx=None, inputs={"x": data, "i": 0}, flow_parameters=None
+        )
+
     def test_subtraction_results_in_new_policy(self):
         policy = Inputs()
         new_policy = policy - "foo"
@@ -222,6 +273,26 @@ class TestTaskSourcePolicy:
             assert fallback_key_a and fallback_key_b
             assert fallback_key_a != fallback_key_b
 
+    def test_source_is_hashed_once_per_function(self):
+        policy = TaskSource()
+
+        def my_func():
+            pass
+
+        task_ctx = TaskRunContext.model_construct(task=task(my_func))
+        key = policy.compute_key(task_ctx=task_ctx, inputs=None, flow_parameters=None)
+
+        other_ctx = TaskRunContext.model_construct(
+            task=task(my_func).with_options(name="other")
+        )
+        with patch("inspect.getsource") as getsource:
+            new_key = policy.compute_key(
+                task_ctx=other_ctx, inputs=None, flow_parameters=None
+            )
+
+        getsource.assert_not_called()
+        assert new_key == key
+
 
 class TestDefaultPolicy:
     def test_changing_the_inputs_busts_the_cache(self):
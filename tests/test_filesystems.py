@@ -73,6 +73,32 @@ class TestLocalFileSystem:
         with pytest.raises(ValueError, match="not a file"):
             await fs.read_path(tmp_path / "folder")
 
+    def test_read_write_stream_roundtrip(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        with fs.write_stream("folder/test.txt") as f:
+            f.write(b"hello ")
+            f.write(b"world")
+
+        assert (tmp_path / "folder" / "test.txt").read_bytes() == b"hello world"
+        with fs.read_stream("folder/test.txt") as f:
+            assert f.read(5) == b"hello"
+            assert f.read() == b" world"
+
+    def test_write_stream_removes_partial_file_on_failure(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        with pytest.raises(RuntimeError, match="oops"):
+            with fs.write_stream("test.txt") as f:
+                f.write(b"hello")
+                raise RuntimeError("oops")
+
+        assert not (tmp_path / "test.txt").exists()
+
+    def test_read_stream_fails_for_missing_file(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        with pytest.raises(ValueError, match="does not exist"):
+            with fs.read_stream("test.txt"):
+                pass
+
     async def test_resolve_path(self, tmp_path):
         fs = LocalFileSystem(basepath=str(tmp_path))
 
@@ -275,6 +301,35 @@ class TestRemoteFileSystem:
         with pytest.raises(FileNotFoundError):
             await fs.read_path("foo/bar")
 
+    def test_read_write_stream_roundtrip(self):
+        fs = RemoteFileSystem(basepath="memory://root")
+        with fs.write_stream("folder/test.txt") as f:
+            f.write(b"hello ")
+            f.write(b"world")
+
+        with fs.read_stream("folder/test.txt") as f:
+            assert f.read(5) == b"hello"
+            assert f.read() == b" world"
+
+    def test_write_stream_removes_partial_file_on_failure(self):
+        fs = RemoteFileSystem(basepath="memory://root")
+        with pytest.raises(RuntimeError, match="oops"):
+            with fs.write_stream("test.txt") as f:
+                f.write(b"hello")
+                raise RuntimeError("oops")
+
+        assert not fs.filesystem.exists("memory://root/test.txt")
+
+    async def test_existing_paths(self):
+        fs = RemoteFileSystem(basepath="memory://existing-paths")
+        await fs.write_path("a", content=b"a")
+        await fs.write_path("b", content=b"b")
+        await fs.write_path("nested/c", content=b"c")
+
+        assert fs.existing_paths(
+            ["a", "b", "missing", "nested/c", "nested/missing", "absent/d"]
+        ) == {"a", "b", "nested/c"}
+
     async def test_resolve_path(self):
         base = "memory://root"
         fs = RemoteFileSystem(basepath=base)
@@ -4,12 +4,15 @@ from collections import OrderedDict
 from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import Any, List, Optional
+from unittest.mock import patch
 
 import pytest
 
 from prefect import task
+from prefect.client.orchestration import SyncPrefectClient
 from prefect.exceptions import MissingResult
 from prefect.futures import (
+    FutureSet,
     PrefectConcurrentFuture,
     PrefectDistributedFuture,
     PrefectFuture,
@@ -161,6 +164,89 @@ class TestUtilityFunctions:
             assert results == timings
 
 
+class TestFutureSet:
+    def test_as_completed_yields_futures_as_they_complete(self):
+        wrapped_futures = [Future() for _ in range(3)]
+        futures = [PrefectConcurrentFuture(uuid.uuid4(), f) for f in wrapped_futures]
+        wrapped_futures[2].set_result(Completed(data=2))
+        completed = FutureSet(futures).as_completed()
+
+        assert next(completed) is futures[2]
+        wrapped_futures[0].set_result(Completed(data=0))
+        assert next(completed) is futures[0]
+        wrapped_futures[1].set_result(Completed(data=1))
+        assert next(completed) is futures[1]
+
+    def test_as_completed_yields_duplicates_once(self):
+        future = MockFuture()
+        future_set = FutureSet([future, future])
+
+        assert len(future_set) == 1
+        assert list(future_set.as_completed()) == [future]
+
+    @pytest.mark.timeout(method="thread")
+    def test_as_completed_with_timeout(self):
+        futures = [MockFuture(), PrefectConcurrentFuture(uuid.uuid4(), Future())]
+
+        with pytest.raises(TimeoutError, match="1 \\(of 2\\) futures unfinished"):
+            for _ in FutureSet(futures).as_completed(timeout=0.01):
+                pass
+
+    def test_wait_sets_final_states(self):
+        wrapped_future = Future()
+        wrapped_future.set_result(Completed(data=1))
+        future = PrefectConcurrentFuture(uuid.uuid4(), wrapped_future)
+
+        done, not_done = FutureSet([future]).wait()
+
+        assert done == {future}
+        assert not_done == set()
+        assert future._final_state.is_completed()
+
+    def test_result_preserves_order_and_duplicates(self):
+        futures = [MockFuture(data=i) for i in range(3)]
+
+        assert FutureSet(futures + futures[:1]).result() == [0, 1, 2, 0]
+
+    @pytest.mark.timeout(method="thread")
+    def test_result_with_timeout(self):
+        futures = [MockFuture(), PrefectConcurrentFuture(uuid.uuid4(), Future())]
+
+        with pytest.raises(TimeoutError, match="Timed out waiting for all futures"):
+            FutureSet(futures).result(timeout=0.01)
+
+    async def test_reads_distributed_states_in_batches(self, events_pipeline):
+        @task
+        async def my_task(x):
+            return x
+
+        futures = []
+        for i in range(5):
+            task_run = await my_task.create_run(parameters={"x": i})
+            await run_task_async(
+                task=my_task,
+                task_run_id=task_run.id,
+                task_run=task_run,
+                parameters={"x": i},
+                return_type="state",
+            )
+            futures.append(PrefectDistributedFuture(task_run_id=task_run.id))
+
+        await events_pipeline.process_events()
+
+        with patch("prefect.futures.STATE_READ_BATCH_SIZE", 2), patch(
+            "prefect.client.orchestration.SyncPrefectClient.read_task_runs",
+            autospec=True,
+            side_effect=SyncPrefectClient.read_task_runs,
+        ) as read_task_runs:
+            done, not_done = FutureSet(futures).wait()
+
+        assert done == set(futures)
+        assert not_done == set()
+        assert read_task_runs.call_count == 3
+        assert all(future.state.is_completed() for future in futures)
+
+
 class TestPrefectConcurrentFuture:
     def test_wait_with_timeout(self):
         wrapped_future = Future()
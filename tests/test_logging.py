@@ -303,7 +303,7 @@ class TestAPILogHandler:
             message="test-task",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected["__payload__"] = ANY  # Tested separately
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -319,7 +319,7 @@ class TestAPILogHandler:
             message="test-flow",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected["__payload__"] = ANY  # Tested separately
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -344,7 +344,7 @@ class TestAPILogHandler:
             message="test-task",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected["__payload__"] = ANY  # Tested separately
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -370,7 +370,7 @@ class TestAPILogHandler:
             message="test-task",
         ).model_dump(mode="json")
         expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected["__payload__"] = ANY  # Tested separately
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -830,6 +830,48 @@ class TestAPILogWorker:
 
         assert mock_create_logs.call_count == 3
 
+    async def test_send_logs_holds_logs_that_would_overfill_a_batch(
+        self, log_dict, monkeypatch
+    ):
+        mock_create_logs = AsyncMock()
+        monkeypatch.setattr(
+            "prefect.client.orchestration.PrefectClient.create_logs", mock_create_logs
+        )
+
+        log_size = APILogHandler()._get_payload_size(log_dict)
+
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: 2 * log_size + 1,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log_size,
+            }
+        ):
+            worker = APILogWorker.instance()
+            for _ in range(5):
+                worker.send(log_dict)
+            await worker.drain()
+
+        assert sum(len(call.args[0]) for call in mock_create_logs.call_args_list) == 5
+        assert all(len(call.args[0]) <= 2 for call in mock_create_logs.call_args_list)
+
+    async def test_send_logs_reuses_encoded_payloads(self, monkeypatch):
+        mock_create_logs = AsyncMock()
+        monkeypatch.setattr(
+            "prefect.client.orchestration.PrefectClient.create_logs", mock_create_logs
+        )
+        record = logging.LogRecord(
+            "test.logger", logging.INFO, "", 0, "hello", (), None
+        )
+        record.flow_run_id = uuid.uuid4()
+        log = APILogHandler().prepare(record)
+
+        worker = APILogWorker.instance()
+        worker.send(log)
+        await worker.drain()
+
+        mock_create_logs.assert_awaited_once_with([log["__payload__"]])
+        assert json.loads(log["__payload__"])["message"] == "hello"
+
     async def test_logs_are_sent_immediately_when_stopped(
         self, log_dict, prefect_client
     ):
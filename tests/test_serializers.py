@@ -1,4 +1,5 @@
 import base64
+import io
 import json
 import uuid
 from dataclasses import dataclass
@@ -162,6 +163,44 @@ class TestPickleSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    @pytest.mark.parametrize("picklelib", ["cloudpickle", "pickle"])
+    def test_stream_roundtrip(self, data, picklelib):
+        serializer = PickleSerializer(picklelib=picklelib)
+        file = io.BytesIO()
+        serializer.dump(data, file)
+
+        # streamed output is interchangeable with `dumps`
+        assert file.getvalue() == serializer.dumps(data)
+        file.seek(0)
+        assert serializer.load(file) == data
+
+    def test_stream_roundtrip_spans_multiple_chunks(self):
+        serializer = PickleSerializer()
+        data = {"payload": bytes(range(256)) * 10_000, "values": list(range(50_000))}
+        file = io.BytesIO()
+        serializer.dump(data, file)
+
+        assert file.getvalue() == serializer.dumps(data)
+        file.seek(0)
+        assert serializer.load(file) == data
+
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    @pytest.mark.parametrize("picklelib", ["cloudpickle", "pickle"])
+    def test_binary_roundtrip(self, data, picklelib):
+        serializer = PickleSerializer(picklelib=picklelib)
+        blob = serializer.dumps_binary(data)
+
+        # binary output is the pickle itself, without the base64 wrapper
+        assert blob == base64.decodebytes(serializer.dumps(data))
+        assert serializer.loads_binary(memoryview(blob)) == data
+
+        file = io.BytesIO()
+        serializer.dump_binary(data, file)
+        assert file.getvalue() == blob
+        file.seek(0)
+        assert serializer.load_binary(file) == data
+
     def test_picklelib_must_be_string(self):
         import pickle
 
@@ -228,6 +267,14 @@ class TestJSONSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_stream_roundtrip(self, data):
+        serializer = JSONSerializer()
+        file = io.BytesIO()
+        serializer.dump(data, file)
+        file.seek(0)
+        assert serializer.load(file) == data
+
     def test_allows_orjson(self):
         # orjson does not support hooks
         serializer = JSONSerializer(
@@ -331,6 +378,18 @@ class TestCompressedSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_binary_roundtrip(self, data):
+        serializer = CompressedSerializer(serializer="pickle")
+        blob = serializer.dumps_binary(data)
+        assert len(blob) < len(serializer.dumps(data))
+        assert serializer.loads_binary(memoryview(blob)) == data
+
+        file = io.BytesIO()
+        serializer.dump_binary(data, file)
+        file.seek(0)
+        assert serializer.load_binary(file) == data
+
     @pytest.mark.parametrize("lib", ["bz2", "lzma", "zlib"])
     def test_allows_stdlib_compression_libraries(self, lib):
         serializer = CompressedSerializer(compressionlib=lib, serializer="pickle")
@@ -267,8 +267,12 @@ SUPPORTED_SETTINGS = {
     "PREFECT_PROFILES_PATH": {"test_value": Path("/path/to/profiles.toml")},
     "PREFECT_RESULTS_DEFAULT_SERIALIZER": {"test_value": "serializer"},
     "PREFECT_RESULTS_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
+    "PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES": {"test_value": 1024},
+    "PREFECT_RESULTS_LOCAL_CACHE_PATH": {"test_value": Path("/path/to/cache")},
     "PREFECT_RESULTS_LOCAL_STORAGE_PATH": {"test_value": Path("/path/to/storage")},
+    "PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES": {"test_value": 1024},
     "PREFECT_RESULTS_PERSIST_BY_DEFAULT": {"test_value": True},
+    "PREFECT_RESULTS_RECORD_FORMAT": {"test_value": "binary"},
     "PREFECT_RUNNER_HEARTBEAT_FREQUENCY": {"test_value": 30},
     "PREFECT_RUNNER_POLL_FREQUENCY": {"test_value": 10},
     "PREFECT_RUNNER_PROCESS_LIMIT": {"test_value": 10},
@@ -277,9 +281,12 @@ SUPPORTED_SETTINGS = {
     "PREFECT_RUNNER_SERVER_LOG_LEVEL": {"test_value": "INFO"},
     "PREFECT_RUNNER_SERVER_MISSED_POLLS_TOLERANCE": {"test_value": 10},
     "PREFECT_RUNNER_SERVER_PORT": {"test_value": 8080},
+    "PREFECT_RUNNER_WARM_PROCESS_POOL_SIZE": {"test_value": 2},
+    "PREFECT_RUNNER_WARM_PROCESS_PRELOAD": {"test_value": ["my_flows"]},
     "PREFECT_SERVER_ALLOW_EPHEMERAL_MODE": {"test_value": True, "legacy": True},
     "PREFECT_SERVER_API_AUTH_STRING": {"test_value": "admin:admin"},
     "PREFECT_SERVER_ANALYTICS_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_API_CONCURRENCY_SLOT_MAX_WAIT_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_API_CORS_ALLOWED_HEADERS": {"test_value": "foo"},
     "PREFECT_SERVER_API_CORS_ALLOWED_METHODS": {"test_value": "foo"},
     "PREFECT_SERVER_API_CORS_ALLOWED_ORIGINS": {"test_value": "foo"},
@@ -288,7 +295,10 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_API_DEFAULT_LIMIT": {"test_value": 10},
     "PREFECT_SERVER_API_HOST": {"test_value": "host"},
     "PREFECT_SERVER_API_KEEPALIVE_TIMEOUT": {"test_value": 10},
+    "PREFECT_SERVER_API_LOGS_BULK_BATCH_SIZE": {"test_value": 100},
+    "PREFECT_SERVER_API_LOGS_BULK_MAX_QUEUE_SIZE": {"test_value": 1000},
     "PREFECT_SERVER_API_PORT": {"test_value": 4200},
+    "PREFECT_SERVER_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_CORS_ALLOWED_HEADERS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_METHODS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_ORIGINS": {"test_value": "foo", "legacy": True},
@@ -314,6 +324,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_DEPLOYMENT_SCHEDULE_MAX_SCHEDULED_RUNS": {"test_value": 10},
     "PREFECT_SERVER_EPHEMERAL_ENABLED": {"test_value": True},
     "PREFECT_SERVER_EPHEMERAL_STARTUP_TIMEOUT_SECONDS": {"test_value": 10},
+    "PREFECT_SERVER_EVENTS_CAUSAL_ORDERING": {"test_value": "ordering"},
     "PREFECT_SERVER_EVENTS_EXPIRED_BUCKET_BUFFER": {
         "test_value": timedelta(seconds=60)
     },
@@ -344,8 +355,11 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_CANCELLATION_CLEANUP_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_BATCH_SIZE": {"test_value": 10},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_CONCURRENCY": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE": {"test_value": 10},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_FOREMAN_DEPLOYMENT_LAST_POLLED_TIMEOUT_SECONDS": {
         "test_value": 10
@@ -366,6 +380,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_LATE_RUNS_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_SCHEDULER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_SCHEDULER_INSERT_BATCH_SIZE": {"test_value": 10},
@@ -378,7 +393,11 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME": {
         "test_value": timedelta(minutes=10)
     },
+    "PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT": {"test_value": 10},
+    "PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_LEASE_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_FLUSH_INTERVAL": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_TRIGGERS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_TASKS_MAX_CACHE_KEY_LENGTH": {"test_value": 10},
     "PREFECT_SERVER_TASKS_SCHEDULING_MAX_RETRY_QUEUE_SIZE": {"test_value": 10},
@@ -442,6 +461,8 @@ SUPPORTED_SETTINGS = {
     "PREFECT_WORKER_HEARTBEAT_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_PREFETCH_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_QUERY_SECONDS": {"test_value": 10.0},
+    "PREFECT_WORKER_WARM_PROCESS_POOL_SIZE": {"test_value": 2},
+    "PREFECT_WORKER_WARM_PROCESS_PRELOAD": {"test_value": ["my_flows"]},
     "PREFECT_WORKER_WEBSERVER_HOST": {"test_value": "host"},
     "PREFECT_WORKER_WEBSERVER_PORT": {"test_value": 8080},
     "PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5, "legacy": True},
@@ -1,16 +1,19 @@
+import os
 import time
 import uuid
 from concurrent.futures import Future
 from typing import Any, Iterable, Optional
+from unittest.mock import patch
 from uuid import UUID
 
+import numpy as np
 import pytest
 
 from prefect.client.orchestration import PrefectClient
 from prefect.context import TagsContext, tags
 from prefect.filesystems import LocalFileSystem
 from prefect.flows import flow
-from prefect.futures import PrefectFuture, PrefectWrappedFuture
+from prefect.futures import PrefectFuture, PrefectProcessFuture, PrefectWrappedFuture
 from prefect.results import _default_storages
 from prefect.settings import (
     PREFECT_DEFAULT_RESULT_STORAGE_BLOCK,
@@ -19,9 +22,14 @@ from prefect.settings import (
     temporary_settings,
 )
 from prefect.states import Completed, Running
-from prefect.task_runners import PrefectTaskRunner, ThreadPoolTaskRunner
+from prefect.task_runners import (
+    PrefectTaskRunner,
+    ProcessPoolTaskRunner,
+    ThreadPoolTaskRunner,
+)
 from prefect.task_worker import TaskWorker
 from prefect.tasks import task
+from prefect.utilities.annotations import quote, unmapped
 
 
 @task
@@ -34,6 +42,16 @@ async def my_test_async_task(param1, param2):
     return param1, param2
 
 
+@task
+def array_stats(data):
+    return data.sum(), data * 2
+
+
+@task
+def get_pid():
+    return os.getpid()
+
+
 @task
 def context_matters(param1=None, param2=None):
     return TagsContext.get().current_tags
@@ -207,6 +225,74 @@ class TestThreadPoolTaskRunner:
             results = [future.result() for future in futures]
             assert results == [(1, 1), (2, 2), (3, 3)]
 
+    def test_map_with_unmapped_parameters(self):
+        with ThreadPoolTaskRunner() as runner:
+            shared = {"values": list(range(1000))}
+            futures = runner.map(
+                my_test_task, {"param1": [1, 2, 3], "param2": unmapped(shared)}
+            )
+            results = [future.result() for future in futures]
+
+        assert results == [(1, shared), (2, shared), (3, shared)]
+
+    def test_map_quotes_static_parameters_without_upstream_references(self):
+        upstream = MockFuture(data=42)
+        with ThreadPoolTaskRunner() as runner:
+            with patch.object(runner, "_submit", wraps=runner._submit) as submit:
+                futures = runner.map(
+                    my_test_task,
+                    {"param1": [1, 2], "param2": unmapped([1, 2, upstream])},
+                )
+                futures.wait()
+                parameters = [call.args[1] for call in submit.call_args_list]
+                assert all(not isinstance(p["param2"], quote) for p in parameters)
+
+                futures = runner.map(
+                    my_test_task, {"param1": [1, 2], "param2": unmapped([1, 2, 3])}
+                )
+                futures.wait()
+                parameters = [call.args[1] for call in submit.call_args_list[2:]]
+                assert all(isinstance(p["param2"], quote) for p in parameters)
+
+        assert [future.result() for future in futures] == [
+            (1, [1, 2, 3]),
+            (2, [1, 2, 3]),
+        ]
+
+    def test_map_prefetches_cached_results_in_growing_chunks(self, monkeypatch):
+        monkeypatch.setattr("prefect.task_runners.MAPPED_PREFETCH_MIN_CHUNK_SIZE", 2)
+        monkeypatch.setattr("prefect.task_runners.MAPPED_PREFETCH_MAX_CHUNK_SIZE", 4)
+
+        with ThreadPoolTaskRunner() as runner:
+            events = []
+            submit = runner._submit
+
+            def record_submit(task, parameters, *args):
+                events.append(("submit", parameters["param1"]))
+                return submit(task, parameters, *args)
+
+            def record_prefetch(task, parameters_list):
+                events.append(("prefetch", [p["param1"] for p in parameters_list]))
+
+            monkeypatch.setattr(runner, "_submit", record_submit)
+            with patch("prefect.task_engine.prefetch_cached_results", record_prefetch):
+                futures = runner.map(
+                    my_test_task, {"param1": list(range(7)), "param2": unmapped(0)}
+                )
+            results = [future.result() for future in futures]
+
+        assert results == [(i, 0) for i in range(7)]
+        # each chunk is submitted before the next one is checked
+        assert events == [
+            ("prefetch", [0, 1]),
+            ("submit", 0),
+            ("submit", 1),
+            ("prefetch", [2, 3, 4, 5]),
+            *[("submit", i) for i in range(2, 6)],
+            ("prefetch", [6]),
+            ("submit", 6),
+        ]
+
     def test_handles_recursively_submitted_tasks(self):
         """
         Regression test for https://github.com/PrefectHQ/prefect/issues/14194.
@@ -232,6 +318,103 @@ class TestThreadPoolTaskRunner:
         assert test_flow().result() == 0
 
 
+class TestProcessPoolTaskRunner:
+    @pytest.fixture(autouse=True)
+    def default_storage_setting(self, tmp_path):
+        name = str(uuid.uuid4())
+        LocalFileSystem(basepath=tmp_path).save(name)
+        with temporary_settings(
+            {
+                PREFECT_DEFAULT_RESULT_STORAGE_BLOCK: f"local-file-system/{name}",
+                PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK: f"local-file-system/{name}",
+            }
+        ):
+            yield
+
+    def test_duplicate(self):
+        runner = ProcessPoolTaskRunner(max_workers=4, shared_memory_min_size=1024)
+        duplicate_runner = runner.duplicate()
+        assert isinstance(duplicate_runner, ProcessPoolTaskRunner)
+        assert duplicate_runner is not runner
+        assert duplicate_runner == runner
+
+    def test_runner_must_be_started(self):
+        runner = ProcessPoolTaskRunner()
+        with pytest.raises(RuntimeError, match="Task runner is not started"):
+            runner.submit(my_test_task, {})
+
+    def test_set_max_workers(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            assert runner._executor._max_workers == 2
+
+    def test_submit_sync_task(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            parameters = {"param1": 1, "param2": 2}
+            future = runner.submit(my_test_task, parameters)
+            assert isinstance(future, PrefectProcessFuture)
+            assert isinstance(future.task_run_id, UUID)
+            assert isinstance(future.wrapped_future, Future)
+
+            assert future.result() == (1, 2)
+
+    def test_submit_async_task(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            parameters = {"param1": 1, "param2": 2}
+            future = runner.submit(my_test_async_task, parameters)
+            assert future.result() == (1, 2)
+
+    def test_submit_task_receives_context(self):
+        with tags("tag1", "tag2"):
+            with ProcessPoolTaskRunner(max_workers=1) as runner:
+                future = runner.submit(context_matters, {})
+                assert future.result() == {"tag1", "tag2"}
+
+    def test_runs_tasks_in_reused_worker_processes(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            pids = [runner.submit(get_pid, {}).result() for _ in range(3)]
+
+        assert os.getpid() not in pids
+        assert len(set(pids)) == 1
+
+    def test_map_with_upstream_futures(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            upstream = runner.submit(my_test_task, {"param1": 1, "param2": 2})
+            futures = runner.map(
+                my_test_task, {"param1": [1, 2, 3], "param2": unmapped(upstream)}
+            )
+            results = [future.result() for future in futures]
+
+        assert results == [(1, (1, 2)), (2, (1, 2)), (3, (1, 2))]
+
+    def test_map_with_unmapped_parameters(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            futures = runner.map(
+                my_test_task, {"param1": [1, 2], "param2": unmapped(3)}
+            )
+            results = [future.result() for future in futures]
+
+        assert results == [(1, 3), (2, 3)]
+
+    def test_map_does_not_prefetch_cached_results(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            with patch("prefect.task_engine.prefetch_cached_results") as prefetch:
+                futures = runner.map(my_test_task, {"param1": [1, 2], "param2": [3, 4]})
+                results = [future.result() for future in futures]
+
+        prefetch.assert_not_called()
+        assert results == [(1, 3), (2, 4)]
+
+    def test_large_arguments_and_results_use_shared_memory(self):
+        data = np.arange(1_000_000, dtype="int64")
+        with ProcessPoolTaskRunner(
+            max_workers=1, shared_memory_min_size=1024
+        ) as runner:
+            total, doubled = runner.submit(array_stats, {"data": data}).result()
+
+        assert total == data.sum()
+        np.testing.assert_array_equal(doubled, data * 2)
+
+
 class TestPrefectTaskRunner:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
@@ -119,3 +119,29 @@ class TestTaskRunWaiter:
 
         assert task_run_1.state.is_completed()
         assert task_run_2.state.is_completed()
+
+    def test_add_done_callback_calls_callback_for_observed_task_run(self):
+        instance = TaskRunWaiter.instance()
+        task_run_id = uuid.uuid4()
+        instance._observed_completed_task_runs[task_run_id] = True
+
+        calls = []
+        TaskRunWaiter.add_done_callback(task_run_id, lambda: calls.append(1))
+
+        assert calls == [1]
+        assert task_run_id not in instance._completion_callbacks
+
+    def test_add_done_callback_keeps_every_callback(self):
+        instance = TaskRunWaiter.instance()
+        task_run_id = uuid.uuid4()
+
+        def first():
+            pass
+
+        def second():
+            pass
+
+        TaskRunWaiter.add_done_callback(task_run_id, first)
+        TaskRunWaiter.add_done_callback(task_run_id, second)
+
+        assert instance._completion_callbacks[task_run_id] == [first, second]
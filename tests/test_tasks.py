@@ -8,7 +8,7 @@ from asyncio import Event, sleep
 from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from unittest.mock import ANY, MagicMock, call
+from unittest.mock import ANY, MagicMock, call, patch
 from uuid import UUID, uuid4
 
 import anyio
@@ -1893,6 +1893,33 @@ class TestTaskCaching:
             not in caplog.text
         )
 
+    async def test_mapped_tasks_prefetch_cached_results(self, tmp_path):
+        block = LocalFileSystem(basepath=str(tmp_path))
+        await block.save("test-mapped-tasks-prefetch-cached-results")
+
+        @task(cache_policy=INPUTS, result_storage=block, persist_result=True)
+        def foo(x):
+            return x
+
+        @flow
+        def bar():
+            first = foo.map([1, 2, 3]).result()
+            with patch.object(
+                ResultStore, "prefetch", autospec=True, side_effect=ResultStore.prefetch
+            ) as prefetch:
+                second = foo.map([1, 2, 3])
+                second.wait()
+            states = [future.state for future in second]
+            return first, states, prefetch
+
+        first, states, prefetch = bar()
+
+        assert first == [1, 2, 3]
+        assert [state.name for state in states] == ["Cached"] * 3
+        assert [await state.result() for state in states] == [1, 2, 3]
+        prefetch.assert_called_once()
+        assert len(list(prefetch.call_args.args[1])) == 3
+
     def test_cache_policy_storage_path(self, tmp_path):
         cache_policy = Inputs().configure(key_storage=tmp_path)
         expected_cache_key = cache_policy.compute_key(
@@ -1997,10 +2024,7 @@ class TestTaskCaching:
 
         # Then we see the original HashError details
         assert "Unable to create hash - objects could not be serialized." in error_msg
-        assert (
-            "JSON error: Unable to serialize unknown type: <class '_thread.lock'>"
-            in error_msg
-        )
+        assert "Unhashable type: <class '_thread.lock'>" in error_msg
         assert "Pickle error: cannot pickle '_thread.lock' object" in error_msg
 
     async def test_unhashable_input_workarounds(self):
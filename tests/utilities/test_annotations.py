@@ -1,6 +1,9 @@
+import pickle
 import random
 
-from prefect.utilities.annotations import unmapped
+import pytest
+
+from prefect.utilities.annotations import allow_failure, quote, unmapped
 
 
 class TestUnmapped:
@@ -9,3 +12,13 @@ class TestUnmapped:
 
         for _ in range(10):
             assert thing[random.randint(0, 100)] == "hello"
+
+
+@pytest.mark.parametrize("annotation", [unmapped, quote, allow_failure])
+def test_annotations_survive_pickling(annotation):
+    thing = annotation([1, 2, 3])
+
+    restored = pickle.loads(pickle.dumps(thing))
+
+    assert type(restored) is annotation
+    assert restored.unwrap() == [1, 2, 3]
@@ -1,11 +1,24 @@
+import copy
 import hashlib
 import threading
+import uuid
+from dataclasses import dataclass
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
+from pydantic import BaseModel
 
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import file_hash, hash_objects, stable_hash
+from prefect.utilities.hashing import (
+    HashMemo,
+    file_hash,
+    hash_objects,
+    register_hash_memo_type,
+    register_hash_reducer,
+    stable_hash,
+    structural_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -83,3 +96,255 @@ class TestHashObjects:
         assert "Unable to create hash" in error_msg
         assert "JSON error" in error_msg
         assert "Pickle error" in error_msg
+
+
+@dataclass
+class MyDataclass:
+    x: int
+    y: str
+
+
+class MyModel(BaseModel):
+    x: int
+    y: str
+
+
+class Opaque:
+    def __init__(self, value):
+        self.value = value
+        self.lock = threading.Lock()
+
+
+class TestStructuralHash:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            None,
+            True,
+            1,
+            1.5,
+            "hello",
+            b"hello",
+            [1, "a", None],
+            (1, 2),
+            {"a": 1, "b": [1, 2]},
+            {1, 2, 3},
+            uuid.UUID("a53e3495-d681-4a53-84b8-9d9542f7237c"),
+            MyDataclass(x=1, y="a"),
+            MyModel(x=1, y="a"),
+            np.arange(100),
+        ],
+    )
+    def test_hash_is_stable(self, obj):
+        assert structural_hash(obj) == structural_hash(obj)
+        assert len(structural_hash(obj)) == 32
+
+    @pytest.mark.parametrize(
+        "left,right",
+        [
+            (1, True),
+            (1, 1.0),
+            (1, "1"),
+            ("a", b"a"),
+            ([1, 2], (1, 2)),
+            ([1, 2], [2, 1]),
+            (["ab"], ["a", "b"]),
+            ({"a": 1}, {"a": 2}),
+            (MyDataclass(x=1, y="a"), MyDataclass(x=2, y="a")),
+            (MyModel(x=1, y="a"), MyModel(x=2, y="a")),
+            (np.arange(6), np.arange(6).reshape(2, 3)),
+            (np.arange(6, dtype="int64"), np.arange(6, dtype="int32")),
+        ],
+    )
+    def test_hash_varies_on_structure(self, left, right):
+        assert structural_hash(left) != structural_hash(right)
+
+    def test_dictionaries_hash_independently_of_order(self):
+        assert structural_hash({"a": 1, "b": 2}) == structural_hash({"b": 2, "a": 1})
+        assert structural_hash({1: "a", "b": 2}) == structural_hash({"b": 2, 1: "a"})
+
+    def test_sets_hash_independently_of_order(self):
+        assert structural_hash({"a", "b", "c"}) == structural_hash({"c", "b", "a"})
+
+    def test_args_and_kwargs_are_distinguished(self):
+        assert structural_hash(1, 2) != structural_hash(1, b=2)
+        assert structural_hash(a=1, b=2) == structural_hash(b=2, a=1)
+
+    def test_non_contiguous_arrays_hash_by_contents(self):
+        array = np.arange(10)
+        assert structural_hash(array[::2]) == structural_hash(array[::2].copy())
+        assert structural_hash(array[::2]) != structural_hash(array[1::2])
+
+    def test_arrays_are_not_pickled(self, monkeypatch):
+        import prefect.utilities.hashing
+
+        dumps = MagicMock(side_effect=AssertionError("should not pickle"))
+        monkeypatch.setattr(prefect.utilities.hashing.cloudpickle, "dumps", dumps)
+
+        structural_hash({"data": np.zeros((100, 100)), "other": [b"abc"]})
+        dumps.assert_not_called()
+
+    def test_object_arrays_hash_by_contents(self):
+        def make(value):
+            return np.array([{"a": value}], dtype=object)
+
+        assert structural_hash(make(1)) == structural_hash(make(1))
+        assert structural_hash(make(1)) != structural_hash(make(2))
+
+    def test_self_referencing_containers(self):
+        first = [1]
+        first.append(first)
+        second = [1]
+        second.append(second)
+
+        assert structural_hash(first) == structural_hash(second)
+        assert structural_hash(first) != structural_hash([1, [1]])
+
+    def test_unknown_objects_are_pickled(self):
+        assert structural_hash(uuid.uuid4) == structural_hash(uuid.uuid4)
+
+    def test_unhashable_objects_raise_helpful_error(self):
+        with pytest.raises(HashError) as exc:
+            structural_hash({"data": "hello", "lock": threading.Lock()})
+
+        error_msg = str(exc.value)
+        assert "Unable to create hash" in error_msg
+        assert "Unhashable type: <class '_thread.lock'>" in error_msg
+        assert "Pickle error" in error_msg
+
+    def test_registered_reducer_is_used(self):
+        with pytest.raises(HashError):
+            structural_hash(Opaque(1))
+
+        register_hash_reducer(Opaque, lambda obj: obj.value)
+
+        assert structural_hash(Opaque(1)) == structural_hash(Opaque(1))
+        assert structural_hash(Opaque(1)) != structural_hash(Opaque(2))
+        # reduced values do not collide with the value itself
+        assert structural_hash(Opaque(1)) != structural_hash(1)
+
+    def test_alternative_hash_algo(self):
+        assert len(structural_hash("hello", hash_algo=hashlib.sha256)) == 64
+
+
+class TestHashMemo:
+    def test_memoized_hash_matches_unmemoized_hash(self):
+        data = np.arange(100_000)
+        data.flags.writeable = False
+        memo = HashMemo()
+
+        assert structural_hash(data, memo=memo) == structural_hash(data)
+        assert structural_hash(data, memo=memo) == structural_hash(data)
+        assert len(memo) == 1
+
+    def test_large_immutable_objects_are_hashed_once(self):
+        hashed_bytes = []
+
+        def recording_md5():
+            h = hashlib.md5()
+            update = h.update
+
+            class Recorder:
+                def update(self, data):
+                    hashed_bytes.append(memoryview(data).nbytes)
+                    update(data)
+
+                def digest(self):
+                    return h.digest()
+
+                def hexdigest(self):
+                    return h.hexdigest()
+
+            return Recorder()
+
+        data = b"x" * 100_000
+        memo = HashMemo()
+        key = structural_hash(data, hash_algo=recording_md5, memo=memo)
+        assert sum(hashed_bytes) > 100_000
+
+        hashed_bytes.clear()
+        assert structural_hash(data, hash_algo=recording_md5, memo=memo) == key
+        assert sum(hashed_bytes) < 1_000
+
+    def test_small_and_writeable_objects_are_not_memoized(self):
+        memo = HashMemo()
+        structural_hash("small", np.arange(100_000), bytearray(100_000), memo=memo)
+        assert len(memo) == 0
+
+    def test_read_only_views_of_writeable_memory_are_not_memoized(self):
+        base = np.zeros(100_000)
+        array_view = base.view()
+        array_view.flags.writeable = False
+        buffer = bytearray(100_000)
+        buffer_view = memoryview(buffer).toreadonly()
+        memo = HashMemo()
+
+        key = structural_hash(array_view, buffer_view, memo=memo)
+        assert len(memo) == 0
+
+        base[0] = 1
+        buffer[0] = 1
+        assert structural_hash(array_view, buffer_view, memo=memo) != key
+        assert structural_hash(array_view, buffer_view, memo=memo) == structural_hash(
+            array_view, buffer_view
+        )
+
+    def test_read_only_views_of_immutable_memory_are_memoized(self):
+        array_view = np.frombuffer(b"x" * 100_000, dtype="uint8")[10:]
+        buffer_view = memoryview(b"y" * 100_000)
+        memo = HashMemo()
+
+        structural_hash(array_view, buffer_view, memo=memo)
+        assert len(memo) == 2
+
+    def test_entries_are_dropped_when_object_is_collected(self):
+        data = np.arange(100_000)
+        data.flags.writeable = False
+        memo = HashMemo()
+        structural_hash(data, memo=memo)
+        assert len(memo) == 1
+
+        del data
+        assert len(memo) == 0
+
+    def test_strings_and_bytes_are_held_up_to_a_limit(self, monkeypatch):
+        monkeypatch.setattr("prefect.utilities.hashing._MEMO_MAX_HELD_BYTES", 250_000)
+        first, second, third = (bytes([i]) * 100_000 for i in range(3))
+        memo = HashMemo()
+
+        for data in (first, second, first, third):
+            structural_hash(data, hash_algo=hashlib.md5, memo=memo)
+
+        # the second object was the least recently used when the third was added
+        assert len(memo) == 2
+        assert memo.get(first, hashlib.md5) is not None
+        assert memo.get(second, hashlib.md5) is None
+        assert memo.get(third, hashlib.md5) is not None
+
+        structural_hash("x" * 300_000, hash_algo=hashlib.md5, memo=memo)
+        assert len(memo) == 2
+
+    def test_registered_mutable_types_require_invalidation(self):
+        class Mutable:
+            def __init__(self, value):
+                self.value = value
+
+        register_hash_memo_type(Mutable)
+        register_hash_reducer(Mutable, lambda obj: obj.value)
+
+        obj = Mutable(1)
+        memo = HashMemo()
+        key = structural_hash(obj, memo=memo)
+        assert key == structural_hash(Mutable(1))
+
+        obj.value = 2
+        assert structural_hash(obj, memo=memo) == key
+
+        memo.invalidate(obj)
+        assert structural_hash(obj, memo=memo) == structural_hash(Mutable(2))
+
+    def test_copies_are_empty(self):
+        memo = HashMemo()
+        structural_hash(b"x" * 100_000, memo=memo)
+
+        assert len(copy.deepcopy(memo)) == 0
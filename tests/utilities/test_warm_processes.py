@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+
+import anyio
+import pytest
+
+from prefect.utilities.warm_processes import WarmProcessPool
+
+
+async def wait_until_ready(pool: WarmProcessPool, count: int):
+    with anyio.fail_after(10):
+        while pool.ready < count:
+            await anyio.sleep(0.01)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX-style environment")
+class TestWarmProcessPool:
+    async def test_keeps_processes_ready(self):
+        async with WarmProcessPool(size=2) as pool:
+            await wait_until_ready(pool, 2)
+            assert pool.ready == 2
+
+        assert pool.ready == 0
+
+    async def test_runs_engine_in_a_ready_process(self):
+        env = {key: value for key, value in os.environ.items()}
+        env.pop("PREFECT__FLOW_RUN_ID", None)
+        stderr = io.StringIO()
+
+        async with WarmProcessPool(size=1) as pool:
+            await wait_until_ready(pool, 1)
+            ready_pid = pool._ready[0].pid
+
+            async with anyio.create_task_group() as tg:
+                pid = await tg.start(
+                    lambda task_status: pool.run_process(
+                        env=env,
+                        stream_output=(None, stderr),
+                        task_status=task_status,
+                    )
+                )
+
+            assert pid == ready_pid
+
+            # the pool replaces the process it handed out
+            await wait_until_ready(pool, 1)
+            assert pool._ready[0].pid != ready_pid
+
+        # without a flow run ID, the engine exits early and says why
+        assert "Invalid flow run id" in stderr.getvalue()
+
+    async def test_starts_a_new_process_when_none_are_ready(self):
+        env = {key: value for key, value in os.environ.items()}
+        env.pop("PREFECT__FLOW_RUN_ID", None)
+        stderr = io.StringIO()
+
+        async with WarmProcessPool(size=0) as pool:
+            process = await pool.run_process(env=env, stream_output=(None, stderr))
+
+        assert process.returncode == 1
+        assert "Invalid flow run id" in stderr.getvalue()
+
+    async def test_failed_preloads_do_not_stop_the_process(self):
+        env = {key: value for key, value in os.environ.items()}
+        env.pop("PREFECT__FLOW_RUN_ID", None)
+        stderr = io.StringIO()
+
+        async with WarmProcessPool(size=1, preload=["not_a_real_module"]) as pool:
+            await wait_until_ready(pool, 1)
+            process = await pool.run_process(env=env, stream_output=(None, stderr))
+
+        assert process.returncode == 1
+        assert "Unable to preload 'not_a_real_module'" in stderr.getvalue()
+        assert "Invalid flow run id" in stderr.getvalue()
@@ -1,3 +1,5 @@
+import asyncio
+import time
 import uuid
 from typing import Any, Dict, Optional, Type
 from unittest import mock
@@ -27,9 +29,11 @@ from prefect.server.schemas.actions import WorkPoolUpdate as ServerWorkPoolUpdat
 from prefect.server.schemas.core import Deployment, Flow, WorkPool
 from prefect.server.schemas.responses import DeploymentResponse
 from prefect.settings import (
+    PREFECT_API_REQUEST_TIMEOUT,
     PREFECT_API_URL,
     PREFECT_TEST_MODE,
     PREFECT_WORKER_PREFETCH_SECONDS,
+    PREFECT_WORKER_QUERY_SECONDS,
     get_current_settings,
     temporary_settings,
 )
@@ -483,6 +487,56 @@ async def test_worker_with_work_pool_and_limit(
         )
 
 
+async def test_worker_asks_server_to_wait_for_flow_runs(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        worker._submit_run = AsyncMock()  # don't run anything
+        worker._server_wait_seconds = 10
+
+        polling = asyncio.create_task(worker.get_and_submit_flow_runs())
+        await asyncio.sleep(0.5)
+        assert not polling.done()
+
+        flow_run = await prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id, state=Scheduled()
+        )
+
+        submitted_flow_runs = await asyncio.wait_for(polling, timeout=5)
+        assert [run.id for run in submitted_flow_runs] == [flow_run.id]
+
+
+async def test_worker_does_not_poll_sooner_than_usual_when_nothing_is_submitted(
+    work_pool,
+):
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        worker._server_wait_seconds = 10
+        worker._client.get_scheduled_flow_runs_for_work_pool = AsyncMock(
+            return_value=[]
+        )
+
+        with temporary_settings({PREFECT_WORKER_QUERY_SECONDS: 0.5}):
+            started = time.monotonic()
+            assert await worker.get_and_submit_flow_runs() == []
+            assert time.monotonic() - started >= 0.5
+
+        worker._client.get_scheduled_flow_runs_for_work_pool.assert_awaited_once()
+        call = worker._client.get_scheduled_flow_runs_for_work_pool.await_args
+        assert call.kwargs["wait_seconds"] == 10
+
+
+async def test_worker_server_wait_seconds(work_pool):
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        with temporary_settings({PREFECT_API_REQUEST_TIMEOUT: 20}):
+            assert worker._get_server_wait_seconds() == 10
+
+        with temporary_settings({PREFECT_API_REQUEST_TIMEOUT: 120}):
+            assert worker._get_server_wait_seconds() == 30
+
+        worker._client.server_type = ServerType.CLOUD
+        assert worker._get_server_wait_seconds() == 0
+
+
 async def test_worker_calls_run_with_expected_arguments(
     prefect_client: PrefectClient, worker_deployment_wq1, work_pool, monkeypatch
 ):
@@ -27,9 +27,11 @@ from prefect.server.schemas.actions import (
     DeploymentUpdate,
     WorkPoolCreate,
 )
+from prefect.settings import PREFECT_WORKER_WARM_PROCESS_POOL_SIZE, temporary_settings
 from prefect.states import Cancelled, Cancelling, Completed, Pending, Running, Scheduled
 from prefect.testing.utilities import AsyncMock, MagicMock
 from prefect.types import DateTime
+from prefect.workers.base import LONG_POLL_INTERVAL_SECONDS
 from prefect.workers.process import (
     ProcessWorker,
     ProcessWorkerResult,
@@ -557,6 +559,89 @@ async def test_process_worker_command_override(
         assert mock.call_args.args == (override_command.split(" "),)
 
 
+async def test_process_worker_asks_server_to_wait_for_flow_runs(
+    process_work_pool, monkeypatch
+):
+    loops = []
+
+    async def critical_service_loop(workload, interval, **kwargs):
+        loops.append((workload.__name__, interval))
+
+    monkeypatch.setattr(
+        "prefect.workers.base.critical_service_loop", critical_service_loop
+    )
+    monkeypatch.setattr(
+        "prefect.workers.process.critical_service_loop", critical_service_loop
+    )
+
+    worker = ProcessWorker(work_pool_name=process_work_pool.name)
+    await worker.start(printer=lambda *args: None)
+
+    assert worker._server_wait_seconds > 0
+    assert ("get_and_submit_flow_runs", LONG_POLL_INTERVAL_SECONDS) in loops
+
+
+@pytest.fixture
+def patch_warm_process_pool(monkeypatch):
+    mock_run_process = AsyncMock()
+    mock_run_process.return_value.returncode = 0
+    mock_run_process.return_value.pid = 1000
+    monkeypatch.setattr(
+        prefect.workers.process.WarmProcessPool, "run_process", mock_run_process
+    )
+
+    with temporary_settings({PREFECT_WORKER_WARM_PROCESS_POOL_SIZE: 1}):
+        yield mock_run_process
+
+
+async def test_process_worker_runs_flow_runs_in_warm_processes(
+    flow_run,
+    patch_run_process,
+    patch_warm_process_pool,
+    process_work_pool,
+    monkeypatch,
+):
+    mock: AsyncMock = patch_run_process()
+    patch_client(monkeypatch)
+
+    async with ProcessWorker(work_pool_name=process_work_pool.name) as worker:
+        worker._work_pool = process_work_pool
+        result = await worker.run(
+            flow_run=flow_run,
+            configuration=await worker._get_configuration(flow_run),
+        )
+
+        assert isinstance(result, ProcessWorkerResult)
+        assert result.status_code == 0
+
+    mock.assert_not_awaited()
+    patch_warm_process_pool.assert_awaited_once()
+    env = patch_warm_process_pool.call_args.kwargs["env"]
+    assert env["PREFECT__FLOW_RUN_ID"] == str(flow_run.id)
+
+
+async def test_process_worker_does_not_run_command_overrides_in_warm_processes(
+    flow_run,
+    patch_run_process,
+    patch_warm_process_pool,
+    process_work_pool,
+    monkeypatch,
+):
+    mock: AsyncMock = patch_run_process()
+    override_command = "echo hello world"
+    patch_client(monkeypatch, overrides={"command": override_command})
+
+    async with ProcessWorker(work_pool_name=process_work_pool.name) as worker:
+        worker._work_pool = process_work_pool
+        await worker.run(
+            flow_run=flow_run,
+            configuration=await worker._get_configuration(flow_run),
+        )
+
+    patch_warm_process_pool.assert_not_awaited()
+    assert mock.call_args.args == (override_command.split(" "),)
+
+
 async def test_task_status_receives_infrastructure_pid(
     process_work_pool, patch_run_process, monkeypatch, flow_run
 ):